@@ -1,285 +1,364 @@
+import argparse
+
 import paths
 import files
 import strings
 import frames
+import rows
+import pipeline
+from pipeline import frame_stage, column_stage
 from src.enumeration import SourceFileType, OutputFileType, BomTempVer
 
 
-def sequence_cbom_for_cost_walk() -> None:
-
-    source_file_type = SourceFileType.CB
-    output_file_type = OutputFileType.CW
+# *** Stage functions shared by the sequences; each takes the frame and the pipeline context ***
 
-    # *** read Excel data file ***
+def read_source_sheet(_df, context):
     # get path to input data folder
     folder_path = paths.get_path_to_input_file_folder()
     # get Excel file name to process
-    file_name = paths.get_selected_excel_file_name(folder_path)
+    if context.get('file_name') is None:
+        context['file_name'] = paths.get_selected_excel_file_name(folder_path)
     # read excel file data
-    excel_data = files.read_raw_excel_file_data(folder_path, file_name)
-
-    # *** Extract cbom sheet to process ***
+    excel_data = files.read_raw_excel_file_data(folder_path, context['file_name'])
+    # identify the file content so checkpoints of this run are not resumed with another file
+    context['source_fingerprint'] = files.get_file_fingerprint(folder_path, context['file_name'])
+
+    sheet_name = context.get('sheet_name')
+    if sheet_name is None and context.get('headless'):
+        # without a console, the workbook must have a single sheet unless the sheet is named
+        if len(excel_data.sheet_names) > 1:
+            raise ValueError(f"Sheet name is required for workbooks with multiple sheets {excel_data.sheet_names}.")
+        sheet_name = excel_data.sheet_names[0]
     # extract user selected Excel file sheet
-    df = files.get_user_selected_excel_file_sheet(excel_data)
-    # only keep cost data for build on interest
-    df = frames.select_build(df)
-
-    # *** Extract cbom table ***
-    # drop rows above BOM header and set top row as header
-    df = frames.search_and_set_bom_header(df)
-    # determine version of BOM template as it will determine how BOM cleanup will happen
-    bom_temp_ver = frames.get_bom_template_version(df, BomTempVer)
-    # get source BOM header labels as they are different depending upon BOM template version and source BOM type
-    source_bom_header = frames.get_source_bom_header_labels(bom_temp_ver, BomTempVer, source_file_type, SourceFileType)
-    # extract columns from source data
-    df = frames.get_bom_columns(df, source_bom_header)
-
-    # delete empty rows and columns
-    df = frames.delete_empty_rows(df)
-    df = frames.delete_empty_columns(df)
-    # set datatype for columns
-    df = frames.set_bom_column_datatype(df)
-    # primary component should be first
-    df = frames.primary_above_alternative(df, bom_temp_ver, BomTempVer)
-    # merge alternative components to one row
-    df = frames.merge_alternative(df)
-
-    # *** Clean up data ***
-    # remove zero quantity data
-    df = frames.drop_item_with_zero_quantity(df)
-    # remove unwanted characters from designators
-    df = frames.cleanup_designators(df)
-    # unpack designator series
-    df = frames.unpack_ref_des_series(df)
-    # check reference designator format
-    df = strings.check_ref_des_name(df)
-    # check for duplicate reference designators
-    strings.check_duplicate_ref_des(df)
-    # check qty matches reference designator count
-    frames.check_qty_matched_ref_des_count(df)
-
-    # split multiple quantity to separate rows
-    df = frames.split_multiple_quantity(df)
-
-    # *** write cBOM data to file ***
-    # get output BOM header labels as they are different depending upon BOM template version and output file format
-    output_bom_header = frames.get_output_bom_header_labels(bom_temp_ver, BomTempVer, output_file_type, OutputFileType)
-    # keep only the columns needed based on cBOM cost walk
-    df = frames.get_bom_columns(df, output_bom_header)
-    # get path to output data folder
-    folder_path = paths.get_path_to_outputs_folder()
-    # Set Excel file name
-    file_name = OutputFileType.CW.value + file_name
-    # write Excel file data
-    files.write_single_sheet_excel_file_data(folder_path, file_name, df)
-
-    return None
-
-
-def sequence_cbom_for_db_upload() -> None:
+    return files.get_user_selected_excel_file_sheet(excel_data, sheet_name)
 
-    source_file_type = SourceFileType.CB
-    output_file_type = OutputFileType.dB_CB
-
-    # *** read cBOM Excel data file ***
-    # get path to input data folder
-    folder_path = paths.get_path_to_input_file_folder()
-    # get Excel file name to process
-    file_name = paths.get_selected_excel_file_name(folder_path)
-    # read excel file data
-    excel_data = files.read_raw_excel_file_data(folder_path, file_name)
 
-    # *** Extract sheet to process ***
-    df = files.get_user_selected_excel_file_sheet(excel_data)
+def select_build(df, context):
+    build_name = context.get('build_name')
+    if build_name is None and context.get('headless'):
+        # without a console, the file must hold a single build unless the build is named
+        build_names = list(rows.get_build_name_and_column(df))
+        if len(build_names) > 1:
+            raise ValueError(f"Build name is required for files with multiple builds {build_names}.")
     # only keep cost data for build on interest
-    df = frames.select_build(df)
+    return frames.select_build(df, build_name)
 
-    # *** Extract cbom data ***
-    # drop rows above BOM header and set top row as header
-    df = frames.search_and_set_bom_header(df)
+
+def determine_bom_headers(df, context):
     # determine version of BOM template as it will determine how BOM cleanup will happen
     bom_temp_ver = frames.get_bom_template_version(df, BomTempVer)
+    context['bom_temp_ver'] = bom_temp_ver
     # get source BOM header labels as they are different depending upon BOM template version and source BOM type
-    source_bom_header = frames.get_source_bom_header_labels(bom_temp_ver, BomTempVer, source_file_type, SourceFileType)
-    # extract columns from source data
-    df = frames.get_bom_columns(df, source_bom_header)
-    # delete empty rows and columns
-    df = frames.delete_empty_rows(df)
-    df = frames.delete_empty_columns(df)
-    # set datatype for columns
-    df = frames.set_bom_column_datatype(df)
-
-    # fill empty item cells.
-    df = frames.fill_empty_item_cells(df)
-    # fill empty cells with data using alternative of the same components
-    df = frames.fill_empty_cell_using_data_from_above_alternative(df)
-    # replace alternative with data
-    df = frames.replace_alternative_label_with_data_from_above_alternative(df)
-
-    # primary component should be first
-    df = frames.primary_above_alternative(df, bom_temp_ver, BomTempVer)
-    # merge alternative components to one row
-    df = frames.merge_alternative(df)
-
-    # *** Clean up cbom data ***
-    # remove empty designator data
-    df = frames.drop_items_with_empty_designator(df)
-    # remove zero quantity data
-    df = frames.drop_item_with_zero_quantity(df)
-    # remove less than one quantity
-    df = frames.drop_item_with_quantity_less_than_one(df)
-
-    # clean up description column data
-    df = frames.cleanup_description(df)
-    # remove rows that have unwanted description items
-    df = frames.drop_unwanted_db_cbom_description(df)
-
-    # normalize component type labels
-    df = frames.normalize_component_type_label(df)
-    # remove rows that have unwanted component type items
-    df = frames.drop_unwanted_db_cbom_component(df)
-
-    # remove unwanted characters from designators
-    df = frames.cleanup_designators(df)
-    # unpack designator series
-    df = frames.unpack_ref_des_series(df)
-    # check reference designator format
-    df = strings.check_ref_des_name(df)
-    # check for duplicate reference designators
-    strings.check_duplicate_ref_des(df)
-    # check qty matches reference designator count
-    frames.check_qty_matched_ref_des_count(df)
-
-    # separate manufacturers to separate rows
-    df = frames.split_manufacturers_to_separate_rows(df, bom_temp_ver, BomTempVer, source_file_type, SourceFileType)
-    # clean up manufacturer name
-    df = frames.cleanup_manufacturer(df)
-
-    # clean up part number
-    df = frames.cleanup_part_number(df)
-
-    # add type information to description. Note do this before removing P/N from description or nan cell causes issue
-    # df = frames.merge_type_data_with_description(df, bom_temp_ver)
-    # remove part number from description
-    # df = frames.remove_part_number_from_description(df)
-
-    # *** write scrubbed cBOM data to file ***
+    context['source_header'] = frames.get_source_bom_header_labels(
+        bom_temp_ver, BomTempVer, context['source_file_type'], SourceFileType)
     # get output BOM header labels as they are different depending upon BOM template version and output file format
-    output_bom_header = frames.get_output_bom_header_labels(bom_temp_ver, BomTempVer, output_file_type, OutputFileType)
-    # keep only the columns needed based on cBOM upload to dB
-    df = frames.get_bom_columns(df, output_bom_header)
-    # get path to output data folder
-    folder_path = paths.get_path_to_outputs_folder()
-    # Set Excel file name
-    file_name = OutputFileType.dB_CB.value + file_name
-    # write Excel file data
-    files.write_single_sheet_excel_file_data(folder_path, file_name, df)
+    context['output_header'] = frames.get_output_bom_header_labels(
+        bom_temp_ver, BomTempVer, context['output_file_type'], OutputFileType)
 
-    return None
 
-
-def sequence_ebom_for_db_upload():
-
-    source_file_type = SourceFileType.EB
-    output_file_type = OutputFileType.db_EB
-
-    # *** read Excel data file ***
-    # get path to input data folder
-    folder_path = paths.get_path_to_input_file_folder()
-    # get Excel file name to process
-    file_name = paths.get_selected_excel_file_name(folder_path)
-    # read excel file data
-    excel_data = files.read_raw_excel_file_data(folder_path, file_name)
-
-    # *** Extract cbom sheet to process ***
-    df = files.get_user_selected_excel_file_sheet(excel_data)
-    # only keep cost data for build on interest
-    df = frames.select_build(df)
-
-    # *** Extract ebom table ***
-    # drop rows above BOM header and set top row as header
-    df = frames.search_and_set_bom_header(df)
-    # determine version of BOM template as it will determine how BOM cleanup will happen
-    bom_temp_ver = frames.get_bom_template_version(df, BomTempVer)
-    # get source BOM header labels as they are different depending upon BOM template version and source BOM type
-    source_bom_header = frames.get_source_bom_header_labels(bom_temp_ver, BomTempVer, source_file_type, SourceFileType)
-    df = frames.get_bom_columns(df, source_bom_header)
-    # delete empty rows and columns
-    df = frames.delete_empty_rows(df)
-    df = frames.delete_empty_columns(df)
-    # set datatype for columns
-    df = frames.set_bom_column_datatype(df)
-
-    # fill empty cells with data from above cell.
-    df = frames.fill_empty_item_cells(df)
-    # fill empty cells with data using alternative of the same components
-    df = frames.fill_empty_cell_using_data_from_above_alternative(df)
-    # replace alternative with data
-    df = frames.replace_alternative_label_with_data_from_above_alternative(df)
-
-    # fill in designators when designator cells are merged
-    # df = frames.fill_merged_designators(df, bom_temp_ver, BomTempVer)
-
-    # primary component should be first
-    df = frames.primary_above_alternative(df, bom_temp_ver, BomTempVer)
-    # merge alternative components to one row
-    df = frames.merge_alternative(df)
-
-    # *** Clean up ebom table ***
-    # remove empty designator data
-    df = frames.drop_items_with_empty_designator(df)
-    # remove zero quantity data
-    df = frames.drop_item_with_zero_quantity(df)
-    # remove less than one quantity
-    df = frames.drop_item_with_quantity_less_than_one(df)
-
-    # clean up description column data
-    df = frames.cleanup_description(df)
-    # remove rows that have unwanted description items
-    df = frames.drop_unwanted_db_ebom_description(df)
-
-    # normalize component type labels
-    df = frames.normalize_component_type_label(df)
-    # remove rows that have unwanted component type items
-    df = frames.drop_unwanted_db_ebom_component(df)
-
-    # remove unwanted characters from designators
-    df = frames.cleanup_designators(df)
-    # unpack designator series
-    df = frames.unpack_ref_des_series(df)
-    # check reference designator format
-    df = strings.check_ref_des_name(df)
-    # check for duplicate reference designators
-    strings.check_duplicate_ref_des(df)
-    # check qty matches reference designator count
-    frames.check_qty_matched_ref_des_count(df)
-
-    # remove rows that have unwanted items
-    df = frames.drop_rows_with_unwanted_ebom_items(df)
-
-    # separate manufacturers to separate rows
-    df = frames.split_manufacturers_to_separate_rows(df, bom_temp_ver, BomTempVer, source_file_type, SourceFileType)
-    # clean up manufacturer name
-    df = frames.cleanup_manufacturer(df)
-
-    # clean up part number
-    df = frames.cleanup_part_number(df)
-
-    # add type information to description. Note do this before removing P/N from description or nan cell causes issue
-    # df = frames.merge_type_data_with_description(df, bom_temp_ver)
-    # remove part number from description
-    # df = frames.remove_part_number_from_description(df)
-
-    # *** write eBOM data to file ***
-    # get output BOM header labels as they are different depending upon BOM template version and output file format
-    output_bom_header = frames.get_output_bom_header_labels(bom_temp_ver, BomTempVer, output_file_type, OutputFileType)
-    # keep only the columns needed based on eBOM upload to dB
-    df = frames.get_bom_columns(df, output_bom_header)
+def write_output_file(df, context):
     # get path to output data folder
     folder_path = paths.get_path_to_outputs_folder()
     # Set Excel file name
-    file_name = OutputFileType.db_EB.value + file_name
+    file_name = context['output_file_type'].value + context['file_name']
     # write Excel file data
     files.write_single_sheet_excel_file_data(folder_path, file_name, df)
 
-    return None
+
+def extract_bom_table_stages() -> list[pipeline.Stage]:
+    """
+    Stages reading the selected sheet and extracting the BOM table with its standardized source columns.
+    """
+    return [
+        # *** read Excel data file and extract sheet to process ***
+        frame_stage('read source sheet', read_source_sheet),
+        frame_stage('select build', select_build),
+
+        # *** Extract bom table ***
+        # drop rows above BOM header and set top row as header
+        frame_stage('set bom header', lambda df, context: frames.search_and_set_bom_header(df)),
+        frame_stage('determine bom headers', determine_bom_headers),
+        # extract columns from source data
+        frame_stage('get source columns', lambda df, context: frames.get_bom_columns(df, context['source_header'])),
+        # delete empty rows and columns
+        frame_stage('delete empty rows', lambda df, context: frames.delete_empty_rows(df)),
+        frame_stage('delete empty columns', lambda df, context: frames.delete_empty_columns(df)),
+        # set datatype for columns
+        frame_stage('set column datatype', lambda df, context: frames.set_bom_column_datatype(df)),
+    ]
+
+
+def fill_alternative_stages() -> list[pipeline.Stage]:
+    """
+    Stages filling item and alternative cells from the rows above.
+    """
+    return [
+        # fill empty item cells.
+        frame_stage('fill empty item cells', lambda df, context: frames.fill_empty_item_cells(df)),
+        # fill empty cells with data using alternative of the same components
+        frame_stage('fill cells from above alternative',
+                    lambda df, context: frames.fill_empty_cell_using_data_from_above_alternative(df)),
+        # replace alternative with data
+        frame_stage('replace alternative label',
+                    lambda df, context: frames.replace_alternative_label_with_data_from_above_alternative(df)),
+    ]
+
+
+def merge_alternative_stages() -> list[pipeline.Stage]:
+    """
+    Stages merging alternative components into the row of their primary component.
+    """
+    return [
+        # primary component should be first
+        frame_stage('primary above alternative',
+                    lambda df, context: frames.primary_above_alternative(df, context['bom_temp_ver'], BomTempVer)),
+        # merge alternative components to one row
+        frame_stage('merge alternative', lambda df, context: frames.merge_alternative(df)),
+    ]
+
+
+def check_designator_stages() -> list[pipeline.Stage]:
+    """
+    Stages cleaning, unpacking and checking reference designators.
+    """
+    return [
+        # remove unwanted characters from designators
+        column_stage('clean up designators', frames.designatorHdr, frames.clean_designator_text),
+        # unpack designator series
+        frame_stage('unpack designator series', lambda df, context: frames.unpack_ref_des_series(df),
+                    reads={frames.designatorHdr}),
+        # check reference designator format
+        frame_stage('check designator format', lambda df, context: strings.check_ref_des_name(df),
+                    reads={frames.designatorHdr}),
+        # check for duplicate reference designators
+        frame_stage('check duplicate designators', lambda df, context: strings.check_duplicate_ref_des(df),
+                    reads={frames.designatorHdr}),
+        # check qty matches reference designator count
+        frame_stage('check qty matches designators', lambda df, context: frames.check_qty_matched_ref_des_count(df),
+                    reads={frames.itemHdr, frames.qtyHdr, frames.designatorHdr}),
+    ]
+
+
+def write_output_stages() -> list[pipeline.Stage]:
+    """
+    Stages keeping the output columns and writing the output Excel file.
+    """
+    return [
+        # keep only the columns needed based on output file format
+        frame_stage('get output columns', lambda df, context: frames.get_bom_columns(df, context['output_header']),
+                    reads=set()),
+        frame_stage('write output file', write_output_file, reads=set()),
+    ]
+
+
+def cbom_for_cost_walk_stages() -> list[pipeline.Stage]:
+    """
+    Stages of the cBOM cost walk sequence.
+    """
+    return [
+        *extract_bom_table_stages(),
+        *merge_alternative_stages(),
+
+        # *** Clean up data ***
+        # remove zero quantity data
+        frame_stage('drop zero quantity', lambda df, context: frames.drop_item_with_zero_quantity(df),
+                    reads={frames.qtyHdr}),
+        *check_designator_stages(),
+
+        # split multiple quantity to separate rows
+        frame_stage('split multiple quantity', lambda df, context: frames.split_multiple_quantity(df),
+                    reads={frames.qtyHdr, frames.designatorHdr}),
+
+        # *** write cBOM data to file ***
+        *write_output_stages(),
+    ]
+
+
+def db_upload_stages(unwanted_description_stage: pipeline.Stage, unwanted_component_stage: pipeline.Stage,
+                     extra_stages: list[pipeline.Stage]) -> list[pipeline.Stage]:
+    """
+    Stages of the cBOM and eBOM database upload sequences, which differ only in the rows they remove.
+    """
+    return [
+        *extract_bom_table_stages(),
+        *fill_alternative_stages(),
+        *merge_alternative_stages(),
+
+        # *** Clean up data ***
+        # remove empty designator data
+        frame_stage('drop empty designator', lambda df, context: frames.drop_items_with_empty_designator(df),
+                    reads={frames.designatorHdr}),
+        # remove zero quantity data
+        frame_stage('drop zero quantity', lambda df, context: frames.drop_item_with_zero_quantity(df),
+                    reads={frames.qtyHdr}),
+        # remove less than one quantity
+        frame_stage('drop quantity less than one', lambda df, context: frames.drop_item_with_quantity_less_than_one(df),
+                    reads={frames.qtyHdr}),
+
+        # clean up description column data
+        column_stage('clean up description', frames.descriptionHdr, frames.clean_description_text),
+        # remove rows that have unwanted description items
+        unwanted_description_stage,
+
+        # normalize component type labels
+        frame_stage('normalize component type', lambda df, context: frames.normalize_component_type_label(df),
+                    reads={frames.componentHdr}),
+        # remove rows that have unwanted component type items
+        unwanted_component_stage,
+
+        *check_designator_stages(),
+        *extra_stages,
+
+        # separate manufacturers to separate rows
+        frame_stage('split manufacturers',
+                    lambda df, context: frames.split_manufacturers_to_separate_rows(
+                        df, context['bom_temp_ver'], BomTempVer, context['source_file_type'], SourceFileType)),
+        # clean up manufacturer name
+        column_stage('clean up manufacturer', frames.manufacturerHdr, frames.clean_manufacturer_text),
+        # clean up part number
+        column_stage('clean up part number', frames.partNoHdr, frames.clean_part_number_text),
+
+        # add type information to description. Note do this before removing P/N from description or nan cell causes issue
+        # frame_stage('merge type with description',
+        #             lambda df, context: frames.merge_type_data_with_description(df, context['bom_temp_ver'])),
+        # remove part number from description
+        # frame_stage('remove part number from description',
+        #             lambda df, context: frames.remove_part_number_from_description(df)),
+
+        # *** write scrubbed BOM data to file ***
+        *write_output_stages(),
+    ]
+
+
+def cbom_for_db_upload_stages() -> list[pipeline.Stage]:
+    """
+    Stages of the cBOM database upload sequence.
+    """
+    return db_upload_stages(
+        frame_stage('drop unwanted descriptions', lambda df, context: frames.drop_unwanted_db_cbom_description(df),
+                    reads={frames.descriptionHdr}),
+        frame_stage('drop unwanted components', lambda df, context: frames.drop_unwanted_db_cbom_component(df),
+                    reads={frames.componentHdr}),
+        [])
+
+
+def ebom_for_db_upload_stages() -> list[pipeline.Stage]:
+    """
+    Stages of the eBOM database upload sequence.
+    """
+    return db_upload_stages(
+        frame_stage('drop unwanted descriptions', lambda df, context: frames.drop_unwanted_db_ebom_description(df),
+                    reads={frames.descriptionHdr}),
+        frame_stage('drop unwanted components', lambda df, context: frames.drop_unwanted_db_ebom_component(df),
+                    reads={frames.componentHdr}),
+        # remove rows that have unwanted items
+        [frame_stage('drop unwanted items', lambda df, context: frames.drop_rows_with_unwanted_ebom_items(df),
+                     reads={frames.descriptionHdr, frames.componentHdr})])
+
+
+# Context keys identifying a run; checkpoints are only resumed by a run with the same values
+RUN_MANIFEST_KEYS = ('sequence', 'source_fingerprint', 'sheet_name', 'build_name')
+
+
+def run_sequence(sequence: str,
+                 stages: list[pipeline.Stage],
+                 source_file_type: SourceFileType,
+                 output_file_type: OutputFileType,
+                 file_name: str | None = None,
+                 sheet_name: str | None = None,
+                 build_name: str | None = None,
+                 headless: bool = False,
+                 checkpoint_dir: str | None = None,
+                 resume_from: str | None = None) -> pipeline.PipelineResult:
+    """
+    Run a sequence's stages, prompting for missing selections unless headless.
+
+    Args:
+        sequence (str): Name of the sequence, recorded with the checkpoints.
+        stages (list[pipeline.Stage]): Stages of the sequence.
+        source_file_type (SourceFileType): Type of the source BOM.
+        output_file_type (OutputFileType): Type of the output file.
+        file_name (str | None): Excel file in the input folder; prompted for when None.
+        sheet_name (str | None): Sheet to process; prompted for when None.
+        build_name (str | None): Build to keep when the file holds several builds; prompted for when None.
+        headless (bool): Run without console output or prompts; the file name is then required unless resuming
+            after the first stage.
+        checkpoint_dir (str | None): Save the frame after every stage to this folder.
+        resume_from (str | None): Stage to resume from, using the frames saved in `checkpoint_dir`. When a file
+            name is given, the file must still have the content the checkpoints were made from.
+
+    Returns:
+        pipeline.PipelineResult: Output frame, context and per-stage timings.
+
+    Raises:
+        ValueError: If running headless without a file name, or the checkpoints do not belong to this run.
+    """
+    # the first stage reads the source file, so only a resumed run past it can do without the file name
+    if headless and file_name is None and resume_from in (None, stages[0].name):
+        raise ValueError("File name is required to run headless.")
+
+    context = {
+        'sequence': sequence,
+        'source_file_type': source_file_type,
+        'output_file_type': output_file_type,
+        'file_name': file_name,
+        'sheet_name': sheet_name,
+        'build_name': build_name,
+        'headless': headless,
+    }
+    if resume_from is not None and file_name is not None:
+        context['source_fingerprint'] = files.get_file_fingerprint(paths.get_path_to_input_file_folder(), file_name)
+
+    return pipeline.run_pipeline(stages, context=context, quiet=headless,
+                                 checkpoint_dir=checkpoint_dir, resume_from=resume_from,
+                                 manifest_keys=RUN_MANIFEST_KEYS)
+
+
+def sequence_cbom_for_cost_walk(**options) -> pipeline.PipelineResult:
+    # options: see run_sequence
+    return run_sequence('cost-walk', cbom_for_cost_walk_stages(), SourceFileType.CB, OutputFileType.CW, **options)
+
+
+def sequence_cbom_for_db_upload(**options) -> pipeline.PipelineResult:
+    # options: see run_sequence
+    return run_sequence('cbom-db', cbom_for_db_upload_stages(), SourceFileType.CB, OutputFileType.dB_CB, **options)
+
+
+def sequence_ebom_for_db_upload(**options) -> pipeline.PipelineResult:
+    # options: see run_sequence
+    return run_sequence('ebom-db', ebom_for_db_upload_stages(), SourceFileType.EB, OutputFileType.db_EB, **options)
+
+
+# Sequences by batch command name
+sequences = {
+    'cost-walk': sequence_cbom_for_cost_walk,
+    'cbom-db': sequence_cbom_for_db_upload,
+    'ebom-db': sequence_ebom_for_db_upload,
+}
+
+
+def main(argv=None) -> None:
+    """
+    Run one sequence headless from the command line, e.g. `python application.py cost-walk cbom.xlsx --sheet BOM`.
+    """
+    parser = argparse.ArgumentParser(description="Process a BOM Excel file from the input folder without prompts.")
+    parser.add_argument('sequence', choices=sorted(sequences))
+    parser.add_argument('file_name', help="Excel file name in the input folder")
+    parser.add_argument('--sheet', dest='sheet_name', help="sheet to process (required for multi-sheet workbooks)")
+    parser.add_argument('--build', dest='build_name', help="build to keep (required for multi-build files)")
+    parser.add_argument('--checkpoint-dir', help="save the frame after every stage to this folder")
+    parser.add_argument('--resume-from', help="stage name to resume from using the checkpoint folder")
+    args = vars(parser.parse_args(argv))
+
+    try:
+        result = sequences[args.pop('sequence')](headless=True, **args)
+    except ValueError as e:
+        # bad selections and BOM content errors are reported without a traceback
+        print('*** ERROR ***')
+        print(f"An error occurred: {e}")
+        raise SystemExit(1)
+    pipeline.print_timings(result.timings)
+
+
+if __name__ == '__main__':
+    main()
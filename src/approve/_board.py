@@ -0,0 +1,283 @@
+"""
+Board-level vectorized logic validators for the numeric BOM row columns.
+
+This module parses the quantity, unit price, and sub-total columns of a board once into NumPy float arrays with validity masks, then evaluates the arithmetic cross-field rules as array expressions instead of per-row function calls. The produced violations are identical to the ones raised by the per-row validators in `_logic`.
+
+Example Usage:
+    # Preferred usage via public package interface:
+    from src.approve import interfaces as approve
+    numerics = approve.parse_board_numerics(board.rows)
+    violations = approve.board_sub_total_calculation(numerics)
+
+    # Direct module usage (acceptable in unit tests or internal scripts only):
+    from src.approve import _board as board_logic
+    numerics = board_logic.parse_board_numerics(board.rows)
+    board_logic.board_material_cost_calculation(numerics, board.header)
+
+Dependencies:
+    - Python >= 3.10
+    - Standard Library: dataclasses
+    - External Packages: numpy (imported lazily)
+
+Notes:
+    - Skip-on-invalid: rows whose base fields cannot be parsed by `src.utils.parser.parse_to_float` are masked out (via `parse_many_to_float`, which accepts the same inputs), exactly like the per-row validators skip them.
+    - Equality: array comparisons use the `_common.floats_equal` precision and tolerance. Rows whose values sit on a rounding boundary, where NumPy and Python rounding may disagree, are re-checked with the scalar rule.
+    - Messages: violating rows are re-run through the matching `_logic` validator so the error text is identical to the per-row path.
+    - Material cost uses a sequential cumulative sum so the aggregate is bit-identical to the per-row accumulation loop.
+
+License:
+    - Internal Use Only
+"""
+
+from __future__ import annotations  # Keeps NumPy type hints from importing NumPy
+
+__all__ = []  # Internal-only; not part of public API. Star import from this module gets nothing
+
+from dataclasses import dataclass
+from typing import Callable
+
+import src.utils as utils
+from src.models import interfaces as model
+from src.approve import _common as common
+from src.approve import _logic as logic
+
+np = utils.lazy.lazy_import("numpy")  # Imported on the first board evaluation
+
+_SCALE: float = 10.0 ** common._DIGITS_OF_PRECISION  # Multiplier that maps the rounding precision onto integers
+
+_BOUNDARY_ULPS: float = 4.0  # Distance in ULPs from a rounding half-step that is treated as ambiguous
+
+
+@dataclass(frozen=True)
+class RowViolation:
+    """
+    A single rule violation detected on a board row.
+
+    Attributes:
+        row_index (int): Zero-based position of the row within the board rows.
+        rule (str): Name of the equivalent per-row validator (e.g., "sub_total_calculation").
+        message (str): Error text identical to the ValueError raised by the per-row validator.
+    """
+    row_index: int
+    rule: str
+    message: str
+
+
+@dataclass(frozen=True)
+class BoardNumerics:
+    """
+    Numeric columns of a board parsed once into float arrays with validity masks.
+
+    Invalid cells hold 0.0 in the value array and False in the matching mask.
+
+    Attributes:
+        rows (tuple[Row, ...]): Source rows, kept for message generation.
+        qty (np.ndarray): Parsed quantity values.
+        qty_valid (np.ndarray): True where quantity parsed as a finite float.
+        unit_price (np.ndarray): Parsed unit price values.
+        unit_price_valid (np.ndarray): True where unit price parsed as a finite float.
+        sub_total (np.ndarray): Parsed sub-total values.
+        sub_total_valid (np.ndarray): True where sub-total parsed as a finite float.
+    """
+    rows: tuple[model.Row, ...]
+    qty: np.ndarray
+    qty_valid: np.ndarray
+    unit_price: np.ndarray
+    unit_price_valid: np.ndarray
+    sub_total: np.ndarray
+    sub_total_valid: np.ndarray
+
+
+def _parse_float_column(values: list[str]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Parse a column of strings into a float array and a validity mask.
+
+    Args:
+        values (list[str]): Raw cell strings.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: Float values (0.0 where invalid) and a boolean validity mask.
+    """
+    # Invalid cells come back as 0.0 / invalid without raising; rules skip masked rows
+    parsed, valid = utils.parser.parse_many_to_float(values)
+    return np.array(parsed, dtype=np.float64), np.array(valid, dtype=bool)
+
+
+def parse_board_numerics(rows: tuple[model.Row, ...] | list[model.Row]) -> BoardNumerics:
+    """
+    Parse the quantity, unit price, and sub-total columns of a board once.
+
+    Args:
+        rows (tuple[Row, ...] | list[Row]): Board rows to parse.
+
+    Returns:
+        BoardNumerics: Float arrays and validity masks for the numeric columns.
+    """
+    rows = tuple(rows)
+    qty, qty_valid = _parse_float_column([row.qty for row in rows])
+    unit_price, unit_price_valid = _parse_float_column([row.unit_price for row in rows])
+    sub_total, sub_total_valid = _parse_float_column([row.sub_total for row in rows])
+
+    return BoardNumerics(
+        rows=rows,
+        qty=qty,
+        qty_valid=qty_valid,
+        unit_price=unit_price,
+        unit_price_valid=unit_price_valid,
+        sub_total=sub_total,
+        sub_total_valid=sub_total_valid,
+    )
+
+
+def _near_rounding_boundary(values: np.ndarray) -> np.ndarray:
+    """
+    Flag values whose scaled fraction lies within a few ULPs of a half-step.
+
+    NumPy rounds via scale-and-rint while Python `round` is correctly rounded; both agree everywhere except next to a half-step, so only these values need a scalar re-check.
+
+    Args:
+        values (np.ndarray): Values that will be rounded to `_DIGITS_OF_PRECISION` places.
+
+    Returns:
+        np.ndarray: Boolean mask of ambiguous values.
+    """
+    scaled = values * _SCALE
+    distance = np.abs(np.abs(scaled - np.trunc(scaled)) - 0.5)
+    return distance <= _BOUNDARY_ULPS * np.spacing(np.abs(scaled))
+
+
+def _floats_equal_array(value_a: np.ndarray, value_b: np.ndarray) -> np.ndarray:
+    """
+    Vectorized counterpart of `_common.floats_equal`.
+
+    Args:
+        value_a (np.ndarray): First values to compare.
+        value_b (np.ndarray): Second values to compare.
+
+    Returns:
+        np.ndarray: Boolean mask, True where the values are equal within precision and tolerance.
+    """
+    rounded_a = np.round(value_a, common._DIGITS_OF_PRECISION)
+    rounded_b = np.round(value_b, common._DIGITS_OF_PRECISION)
+    return np.abs(rounded_a - rounded_b) < common._EPSILON
+
+
+def _collect_violations(numerics: BoardNumerics, candidates: np.ndarray,
+                        fn: Callable[[model.Row], None]) -> tuple[RowViolation, ...]:
+    """
+    Confirm candidate rows with the per-row validator and collect the violations.
+
+    Args:
+        numerics (BoardNumerics): Parsed board columns.
+        candidates (np.ndarray): Boolean mask of rows that violate, or may violate, the rule.
+        fn (Callable[[Row], None]): Matching per-row validator from `_logic`.
+
+    Returns:
+        tuple[RowViolation, ...]: Violations in row order.
+    """
+    violations: list[RowViolation] = []
+    for idx in np.flatnonzero(candidates):
+        try:
+            fn(numerics.rows[idx])
+        except ValueError as error:
+            violations.append(RowViolation(row_index=int(idx), rule=fn.__name__, message=str(error)))
+
+    return tuple(violations)
+
+
+def board_unit_price_specified(numerics: BoardNumerics) -> tuple[RowViolation, ...]:
+    """
+    Validate the unit price is greater than zero when quantity is greater than zero, for all rows at once.
+
+    Rows with invalid base fields are skipped.
+
+    Args:
+        numerics (BoardNumerics): Parsed board columns.
+
+    Returns:
+        tuple[RowViolation, ...]: One violation per failing row, identical to `_logic.unit_price_specified`.
+    """
+    valid = numerics.qty_valid & numerics.unit_price_valid
+    # Rule: When quantity > 0, unit price > 0
+    candidates = valid & (numerics.qty > 0.0) & (numerics.unit_price <= 0.0)
+
+    return _collect_violations(numerics, candidates, logic.unit_price_specified)
+
+
+def board_subtotal_zero(numerics: BoardNumerics) -> tuple[RowViolation, ...]:
+    """
+    Validate the sub-total is zero when quantity is zero, for all rows at once.
+
+    Rows with invalid base fields are skipped.
+
+    Args:
+        numerics (BoardNumerics): Parsed board columns.
+
+    Returns:
+        tuple[RowViolation, ...]: One violation per failing row, identical to `_logic.subtotal_zero`.
+    """
+    valid = numerics.qty_valid & numerics.sub_total_valid
+    # Rule: When quantity is zero, sub-total must be zero
+    candidates = valid & (numerics.qty == 0.0) & (numerics.sub_total != 0.0)
+
+    return _collect_violations(numerics, candidates, logic.subtotal_zero)
+
+
+def board_sub_total_calculation(numerics: BoardNumerics) -> tuple[RowViolation, ...]:
+    """
+    Validate the sub-total is the product of quantity and unit price, for all rows at once.
+
+    Rows with invalid base fields are skipped.
+
+    Args:
+        numerics (BoardNumerics): Parsed board columns.
+
+    Returns:
+        tuple[RowViolation, ...]: One violation per failing row, identical to `_logic.sub_total_calculation`.
+    """
+    valid = numerics.qty_valid & numerics.unit_price_valid & numerics.sub_total_valid
+
+    # Overflowing products become inf and are always re-checked, so silence the NumPy warnings
+    with np.errstate(over="ignore", invalid="ignore"):
+        product = numerics.qty * numerics.unit_price
+
+        # Rule: sub-total must be the product of quantity and unit price
+        mismatch = ~_floats_equal_array(numerics.sub_total, product)
+        # Values on a rounding half-step are re-checked with the scalar rule
+        ambiguous = _near_rounding_boundary(numerics.sub_total) | _near_rounding_boundary(product)
+    candidates = valid & (mismatch | ambiguous)
+
+    return _collect_violations(numerics, candidates, logic.sub_total_calculation)
+
+
+def board_material_cost_calculation(numerics: BoardNumerics, header: model.Header) -> None:
+    """
+    Validate the material cost is the aggregate of all sub-totals using a single masked sum.
+
+    If no sub-total or the material cost cannot be parsed, the check is skipped.
+
+    Args:
+        numerics (BoardNumerics): Parsed board columns.
+        header (Header): BOM header containing the material cost to validate.
+
+    Returns:
+        None: Validation succeeds silently if the rule is satisfied.
+
+    Raises:
+        ValueError: If material cost is not the aggregate of sub-totals; identical to `_logic.material_cost_calculation`.
+    """
+    if not numerics.sub_total_valid.any():
+        return  # Skip logic validation if cell validation fails
+
+    # Cumulative sum keeps the left-to-right order of the per-row loop, so the total is bit-identical
+    aggregate_sub_totals = float(np.cumsum(numerics.sub_total[numerics.sub_total_valid])[-1])
+
+    # Validate cell value
+    material_cost = utils.parser.try_parse_to_float(header.material_cost)
+    if material_cost is None:
+        return  # Skip logic validation if cell validation fails
+
+    # Rule: material cost must add up to the aggregate of sub-totals
+    if not common.floats_equal(material_cost, aggregate_sub_totals):
+        # Let the per-row validator raise so the error text stays identical
+        logic.material_cost_calculation(numerics.rows, header)
@@ -23,7 +23,7 @@ Dependencies:
 
 Notes:
     - Fail-fast: raises ValueError with clear, field-referenced messages.
-    - Skip-on-invalid: if a base field cannot be parsed by `src.utils.parser.parse_to_*`, the check is skipped.
+    - Skip-on-invalid: if a base field cannot be parsed by `src.utils.parser.parse_to_*`, the check is skipped; fields are parsed with the non-raising `try_parse_to_*` variants, which accept exactly the same inputs.
     - Equality: uses `src.rules.approve._common.floats_equal` for monetary products/sums; provide normalized inputs.
     - Designators: simple comma-split; upstream normalization (trim, dedupe) is expected.
     - Scope: internal-only validators used by the BOM approval/review pipeline.
@@ -66,9 +66,8 @@ def quantity_zero(row: model.Row) -> None:
         ValueError: If item is blank and quantity is more than zero.
     """
     # Validate cell values
-    try:
-        qty = utils.parser.parse_to_float(row.qty)
-    except ValueError:
+    qty = utils.parser.try_parse_to_float(row.qty)
+    if qty is None:
         # Skip validation if base fields are invalid
         return
 
@@ -102,9 +101,8 @@ def designator_required(row: model.Row) -> None:
         ValueError: If designator is blank when quantity is an integer more than zero.
     """
     # Validate cell values
-    try:
-        qty = utils.parser.parse_to_integer(row.qty)
-    except ValueError:
+    qty = utils.parser.try_parse_to_integer(row.qty)
+    if qty is None:
         # Skip validation if base fields are invalid
         return
 
@@ -139,14 +137,12 @@ def designator_count(row: model.Row) -> None:
         ValueError: If designator count does not match integer quantity.
     """
     # Validate cell values
-    try:
-        integer_qty = utils.parser.parse_to_integer(row.qty)
-        designators = [d.strip() for d in row.designator.split(",") if d.strip()]
-        designator_count = len(designators)
-
-    except ValueError:
+    integer_qty = utils.parser.try_parse_to_integer(row.qty)
+    if integer_qty is None:
         # Skip validation if base fields are invalid
         return
+    designators = [d.strip() for d in row.designator.split(",") if d.strip()]
+    designator_count = len(designators)
 
     # Rule: For integer quantity, designator count must equal quantity
     if integer_qty > 0 and integer_qty != designator_count:
@@ -180,10 +176,9 @@ def unit_price_specified(row: model.Row):
         ValueError: If unit price is not more than zero when quantity is more than zero.
     """
     # Validate cell values
-    try:
-        qty = utils.parser.parse_to_float(row.qty)
-        unit_price = utils.parser.parse_to_float(row.unit_price)
-    except ValueError:
+    qty = utils.parser.try_parse_to_float(row.qty)
+    unit_price = utils.parser.try_parse_to_float(row.unit_price)
+    if qty is None or unit_price is None:
         # Skip validation if base fields are invalid
         return
 
@@ -218,10 +213,9 @@ def subtotal_zero(row: model.Row):
         ValueError: If sub-total is not zero when quantity is zero.
     """
     # Validate cell values
-    try:
-        qty = utils.parser.parse_to_float(row.qty)
-        sub_total = utils.parser.parse_to_float(row.sub_total)
-    except ValueError:
+    qty = utils.parser.try_parse_to_float(row.qty)
+    sub_total = utils.parser.try_parse_to_float(row.sub_total)
+    if qty is None or sub_total is None:
         # Skip validation if base fields are invalid
         return
 
@@ -256,11 +250,10 @@ def sub_total_calculation(row: model.Row) -> None:
         ValueError: If sub-total is not the product of quantity and unit price.
     """
     # Validate cell values
-    try:
-        qty = utils.parser.parse_to_float(row.qty)
-        unit_price = utils.parser.parse_to_float(row.unit_price)
-        sub_total = utils.parser.parse_to_float(row.sub_total)
-    except ValueError:
+    qty = utils.parser.try_parse_to_float(row.qty)
+    unit_price = utils.parser.try_parse_to_float(row.unit_price)
+    sub_total = utils.parser.try_parse_to_float(row.sub_total)
+    if qty is None or unit_price is None or sub_total is None:
         # Skip validation if base fields are invalid
         return
 
@@ -300,20 +293,18 @@ def material_cost_calculation(rows: list[model.Row], header: model.Header) -> No
     aggregate_sub_totals: float = 0.0
     parsed: bool = False
     for row in rows:
-        try:
-            sub_total = utils.parser.parse_to_float(row.sub_total)
-            aggregate_sub_totals += sub_total
-            parsed = True
-        except ValueError:
+        sub_total = utils.parser.try_parse_to_float(row.sub_total)
+        if sub_total is None:
             continue
+        aggregate_sub_totals += sub_total
+        parsed = True
 
     if not parsed:
         return  # Skip logic validation if cell validation fails
 
     # Validate cell value
-    try:
-        material_cost = utils.parser.parse_to_float(header.material_cost)
-    except ValueError:
+    material_cost = utils.parser.try_parse_to_float(header.material_cost)
+    if material_cost is None:
         return  # Skip logic validation if cell validation fails
 
     # Rule: material cost must add up to the aggregate of sub-totals
@@ -346,11 +337,10 @@ def total_cost_calculation(header: model.Header) -> None:
         ValueError: If total cost is not the sum of material cost and overhead cost.
     """
     # Validate cell values
-    try:
-        material_cost = utils.parser.parse_to_float(header.material_cost)
-        overhead_cost = utils.parser.parse_to_float(header.overhead_cost)
-        total_cost = utils.parser.parse_to_float(header.total_cost)
-    except ValueError:
+    material_cost = utils.parser.try_parse_to_float(header.material_cost)
+    overhead_cost = utils.parser.try_parse_to_float(header.overhead_cost)
+    total_cost = utils.parser.try_parse_to_float(header.total_cost)
+    if material_cost is None or overhead_cost is None or total_cost is None:
         # Skip validation if base fields are invalid
         return
 
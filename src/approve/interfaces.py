@@ -21,6 +21,7 @@ Notes:
     - Acts as a stable import target; internal module layout may change without breaking callers.
     - Only a curated subset is exported via __all__; private helpers remain internal.
     - Intended for use by parsers, validators, and reporting tools that need BOM approval semantics.
+    - Board-level validators (`board_*`) evaluate numeric rules for all rows at once and return violations instead of raising.
 
 License:
     - Internal Use Only
@@ -70,6 +71,17 @@ from src.approve._logic import (
     total_cost_calculation,
 )
 
+# noinspection PyProtectedMember
+from src.approve._board import (
+    BoardNumerics,
+    RowViolation,
+    parse_board_numerics,
+    board_unit_price_specified,
+    board_subtotal_zero,
+    board_sub_total_calculation,
+    board_material_cost_calculation,
+)
+
 __all__ = [
     # row 
     "item",
@@ -107,4 +119,13 @@ __all__ = [
     "material_cost_calculation",
     "total_cost_calculation",
 
+    # board
+    "BoardNumerics",
+    "RowViolation",
+    "parse_board_numerics",
+    "board_unit_price_specified",
+    "board_subtotal_zero",
+    "board_sub_total_calculation",
+    "board_material_cost_calculation",
+
 ]
@@ -69,7 +69,7 @@ def refactor_string_if_matched(df, string_column, match_column):
     return df
 
 
-def delete_columns_with_unwanted_build_data(df: pd.DataFrame, build_dict: dict) -> pd.DataFrame:
+def delete_columns_with_unwanted_build_data(df: pd.DataFrame, build_dict: dict, build_name: str | None = None) -> pd.DataFrame:
 
     # Get the value associated with the first key
     first_key = list(build_dict.keys())[0]
@@ -79,7 +79,12 @@ def delete_columns_with_unwanted_build_data(df: pd.DataFrame, build_dict: dict)
     columns_to_keep = list(range(0, first_value))
     # get the key for the build analyse
     selected_index = 0
-    if len(build_dict) > 1:
+    if build_name is not None:
+        # build selected up front (e.g., batch run)
+        if build_name not in build_dict:
+            raise ValueError(f"Build '{build_name}' not found. Available builds are {list(build_dict)}.")
+        selected_index = list(build_dict).index(build_name)
+    elif len(build_dict) > 1:
         # prompt user to select a build for analysis
         print()
         print("Data for multiple builds found: ")
@@ -12,6 +12,10 @@ Example Usage:
         required_keys=("app_version", "log_level"),
     )
     log_level = cache.get_value("log_level", str)
+    view = cache.get_data_map_view()  # Frozen, shared; no copy per call
+    if cache.reload_if_changed():  # Cheap stat check; reloads only when the file changed
+        version = cache.get_version()
+    cache.reload_if_due(1.0)  # Same check, at most once per second, for hot paths
 
     # Direct internal usage (tests or internal tooling only):
     from src.common._cache_read_only import CacheReadOnly
@@ -24,13 +28,17 @@ Example Usage:
 
 Dependencies:
     - Python >= 3.10
-    - Standard Library: copy, typing
-    - Internal Packages: src.utils (JSON file I/O, path and checksum helpers)
+    - Standard Library: copy, os, time, types, typing
+    - Internal Packages: src.utils (JSON file I/O, bundle I/O, path and checksum helpers)
 
 Notes:
     - Internal-only module; CacheReadOnly is re-exported from src.common for shared settings, configuration, and message catalogs.
     - Intended for read-only JSON resources that are loaded once at startup and reused across the application.
     - get_value enforces the expected type for each key and exposes keys and data via defensive copies.
+    - A fresh precompiled bundle next to the JSON file (see tools/tools_bundle_builder.py) is loaded instead of parsing and checksumming the JSON; stale or corrupt bundles fall back to JSON.
+    - JSON resources are read through json_io.load_json_packet_mapped: packets written by tools_json_builder are verified in place and parsed block by block, so the file text is never held in memory next to the parsed payload.
+    - Each load is version-stamped with the payload SHA-256 from the JSON metadata; reload_if_changed compares the file size and modification time with the loaded state and reloads in place, so long-lived processes pick up edited resources. reload_if_due throttles that check to once per interval for callers on hot paths.
+    - get_data_map_view exposes the data as a frozen structure (MappingProxyType over tuples) built once on first use, for hot paths where a deep copy per call is too costly.
 
 License:
     - Internal Use Only
@@ -39,14 +47,37 @@ License:
 __all__ = []  # Internal-only; not part of the public API.
 
 import copy
-from typing import Any, TypeVar, Type
+import os
+import time
+from types import MappingProxyType
+from typing import Any, Mapping, TypeVar, Type
 
+from src.utils import bundle_io
 from src.utils import file_path
 from src.utils import json_io
 
 T = TypeVar("T")  # dictionary value type
 
 
+def _freeze(value: Any) -> Any:
+    """
+    Recursively convert JSON data into immutable, shareable structures.
+
+    Dictionaries become read-only MappingProxyType views over frozen copies and lists become tuples; scalars are returned unchanged.
+
+    Args:
+        value (Any): JSON-compatible value.
+
+    Returns:
+        Any: Immutable equivalent of the value.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
 def _resolve_json_resource_path(resource_folder: str, resource_name: str) -> str:
     """
     Resolve the absolute path to a JSON resource file.
@@ -78,12 +109,49 @@ def _resolve_json_resource_path(resource_folder: str, resource_name: str) -> str
     return file_path.construct_file_path(resource_folder, target_filename)
 
 
+def _load_versioned_resource(resource_name: str, resource_path: str) -> tuple[dict[str, Any], str]:
+    """
+    Load, validate, and extract the payload and its version stamp from a shared JSON resource file.
+
+    Uses the precompiled bundle next to the JSON file when it is fresh; otherwise memory-maps the JSON document, verifies the payload checksum stored in metadata, and extracts the payload mapping. Either way the payload must not be empty. The version stamp is the payload SHA-256 recorded in the JSON metadata.
+
+    Args:
+        resource_name (str): Logical resource name used for error reporting.
+        resource_path (str): Absolute path to the JSON resource file on disk.
+
+    Returns:
+        tuple[dict[str, Any], str]: Mapping of keys to values extracted from the resource payload, and its version stamp.
+
+    Raises:
+        ValueError: If checksum validation fails or the payload mapping is empty.
+    """
+    # Prefer the precompiled bundle; it was built from a checksum-verified JSON that is unchanged since
+    loaded = bundle_io.load_bundle(bundle_io.bundle_path_for(resource_path), resource_path)
+
+    if loaded is not None and loaded[1]:
+        payload, version = loaded
+    else:
+        # Map the JSON package; the payload is parsed from the mapped bytes only after verification
+        with json_io.load_json_packet_mapped(resource_path) as json_package:
+            # Verify integrity of the payload via checksum in meta
+            if not json_package.verify_checksum():
+                raise ValueError(f"Checksum verification failed for JSON resource '{resource_name}' at '{resource_path}'.")
+
+            # Extract the payload (shallow copy); the verified checksum identifies this version of the data
+            payload = dict(json_package.payload)
+            version = json_package.payload_sha256
+
+    # Make sure data is not empty
+    if not payload:
+        raise ValueError(f"JSON resource '{resource_name}' at '{resource_path}' contains an empty payload.")
+
+    return payload, version
+
+
 def _load_json_resource(resource_name: str, resource_path: str) -> dict[str, Any]:
     """
     Load, validate, and extract the payload from a shared JSON resource file.
 
-    Reads the JSON document from disk, verifies the payload checksum stored in metadata, extracts the payload mapping, and ensures that it is not empty.
-
     Args:
         resource_name (str): Logical resource name used for error reporting.
         resource_path (str): Absolute path to the JSON resource file on disk.
@@ -94,21 +162,24 @@ def _load_json_resource(resource_name: str, resource_path: str) -> dict[str, Any
     Raises:
         ValueError: If checksum validation fails or the payload mapping is empty.
     """
-    # Load the JSON package
-    json_package = json_io.load_json_file(resource_path)
+    return _load_versioned_resource(resource_name, resource_path)[0]
 
-    # Verify integrity of the payload via checksum in meta
-    if not json_io.verify_json_payload_checksum(json_package):
-        raise ValueError(f"Checksum verification failed for JSON resource '{resource_name}' at '{resource_path}'.")
 
-    # Extract the payload (shallow copy)
-    payload = json_io.extract_payload(json_package)
+def _stat_stamp(resource_path: str) -> tuple[int, int] | None:
+    """
+    Return a cheap change stamp for a resource file.
 
-    # Make sure data is not empty
-    if not payload:
-        raise ValueError(f"JSON resource '{resource_name}' at '{resource_path}' contains an empty payload.")
+    Args:
+        resource_path (str): Absolute path to the resource file.
 
-    return payload
+    Returns:
+        tuple[int, int] | None: File size and modification time in nanoseconds, or None if the file cannot be inspected.
+    """
+    try:
+        stat = os.stat(resource_path)
+    except OSError:
+        return None
+    return stat.st_size, stat.st_mtime_ns
 
 
 def _assert_required_keys(key_value_map: dict[str, Any], required_keys: tuple[str, ...]) -> None:
@@ -190,14 +261,22 @@ class CacheReadOnly:
         # Initialize empty state; will be populated once loading succeeds.
         self._resource_name: str | None = None
         self._resource_path: str | None = None
+        self._required_keys: tuple[str, ...] = required_keys
         self._data_map: dict[str, Any] | None = None
+        self._data_view: Mapping[str, Any] | None = None
+        self._version: str = ""
+        self._source_stamp: tuple[int, int] | None = None
+        self._last_check_s: float = time.monotonic()  # Monotonic time of the last change check, see reload_if_due
 
         try:
             # Resolve the JSON resource path based on the runtime folder and logical name.
             resource_file_path = _resolve_json_resource_path(resource_folder, resource_name)
 
+            # Stamp before reading, so a change made during the load is seen by the next check.
+            source_stamp = _stat_stamp(resource_file_path)
+
             # Load and validate the payload mapping from disk.
-            data = _load_json_resource(resource_name, resource_file_path)
+            data, version = _load_versioned_resource(resource_name, resource_file_path)
 
             # Enforce required-key presence before exposing the mapping.
             _assert_required_keys(data, required_keys)
@@ -206,10 +285,85 @@ class CacheReadOnly:
             self._resource_name = resource_name
             self._resource_path = resource_file_path
             self._data_map = data
+            self._version = version
+            self._source_stamp = source_stamp
 
         except Exception as err:
             raise ImportError(f"Failed to initialize shared JSON resource cache for '{resource_name}'.") from err
 
+    def get_version(self) -> str:
+        """
+        Return the version stamp of the loaded data.
+
+        The stamp is the payload SHA-256 recorded in the resource metadata, so it changes exactly when the data does; dependent caches can store it and rebuild when it differs.
+
+        Returns:
+            str: Version stamp of the cached payload.
+        """
+        return self._version
+
+    def has_source_changed(self) -> bool:
+        """
+        Report whether the resource file changed on disk since it was loaded.
+
+        Only the file size and modification time are compared, so the check costs a single stat call. A missing or unreadable file is not reported as a change; the loaded data stays in use.
+
+        Returns:
+            bool: True if the file size or modification time differs from the loaded state.
+        """
+        stamp = _stat_stamp(self._resource_path)
+        return stamp is not None and stamp != self._source_stamp
+
+    def reload_if_changed(self) -> bool:
+        """
+        Reload the resource in place when its file changed on disk.
+
+        The new payload is validated like the initial load before it replaces the cached state. If it fails validation (e.g., a half-written or hand-edited file), the previous data stays in use and the file is not retried until it changes again.
+
+        Returns:
+            bool: True if new data with a different version stamp was loaded; False otherwise.
+        """
+        if not self.has_source_changed():
+            return False
+
+        # Stamp before reading, so a change made during the load is seen by the next check.
+        stamp = _stat_stamp(self._resource_path)
+        try:
+            data, version = _load_versioned_resource(self._resource_name, self._resource_path)
+            _assert_required_keys(data, self._required_keys)
+        except Exception:
+            self._source_stamp = stamp  # Keep serving the previous data until the file changes again
+            return False
+
+        self._source_stamp = stamp
+        if version == self._version:
+            return False  # Touched or rewritten with identical content
+
+        # Swap the state; the frozen view is rebuilt lazily from the new mapping
+        self._data_map = data
+        self._data_view = None
+        self._version = version
+        return True
+
+    def reload_if_due(self, interval_s: float) -> bool:
+        """
+        Run `reload_if_changed` at most once per interval.
+
+        Callers on hot paths can call this on every access; the file is inspected only when `interval_s` seconds have passed since the load or the previous check.
+
+        Args:
+            interval_s (float): Minimum seconds between checks of the resource file.
+
+        Returns:
+            bool: True if new data with a different version stamp was loaded; False otherwise, including when no check was due.
+        """
+        now = time.monotonic()
+        if now - self._last_check_s < interval_s:
+            return False
+
+        self._last_check_s = now
+        return self.reload_if_changed()
+
     def get_data_map_copy(self) -> dict[str, Any]:
         """
         Return a deep copy of the cached payload mapping.
@@ -222,6 +376,20 @@ class CacheReadOnly:
         # Return a deep copy so external mutations cannot corrupt the cache.
         return copy.deepcopy(self._data_map)
 
+    def get_data_map_view(self) -> Mapping[str, Any]:
+        """
+        Return a frozen, shareable view of the cached payload mapping.
+
+        The view is built once on first use: nested dictionaries are read-only mappings and lists are tuples, so callers cannot mutate the cache and no copy is made per call.
+
+        Returns:
+            Mapping[str, Any]: Read-only mapping of all keys to their frozen values.
+        """
+        # Build the frozen structure lazily so caches that never use it pay nothing
+        if self._data_view is None:
+            self._data_view = _freeze(self._data_map)
+        return self._data_view
+
     def get_keys(self) -> tuple[str, ...]:
         """
         Return a sorted tuple of keys from the loaded JSON data.
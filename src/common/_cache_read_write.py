@@ -5,6 +5,7 @@ This module provides:
     - A CacheReadWrite class that extends CacheReadOnly with JSON persistence support.
     - Automatic creation of a default JSON cache file when no valid resource exists.
     - Safe key-based updates that persist to disk and refresh the in-memory cache state.
+    - Batched updates (update_values, batch) and an optional debounced auto-flush that write the file once per burst of updates.
 
 Example Usage:
     # Preferred usage via higher-level settings interface:
@@ -24,13 +25,16 @@ Example Usage:
 
 Dependencies:
     - Python >= 3.10
-    - Standard Library: typing
+    - Standard Library: atexit, contextlib, threading, typing, weakref
     - External Packages: None
     - Internal Modules: src.utils.folder_path, src.utils.file_path, src.utils.json_io, src.common.CacheReadOnly
 
 Notes:
     - CacheReadWrite wraps the key/value map in a json_io metadata packet before persisting to disk.
     - Only keys declared in required_keys can be updated; unknown keys raise ValueError.
+    - Every write is atomic (temporary file + rename), so the file on disk is always a complete, checksummed packet.
+    - Inside `batch()` updates are staged in memory and written once on exit; an exception inside the block rolls them back.
+    - With flush_delay_seconds set, updates are written by a background timer after the last update of a burst, and at interpreter exit.
     - Missing or invalid JSON cache files are replaced with a default cache built from default_values and required_keys.
     - Intended for internal use by settings-like components that need small JSON-backed key/value state, not arbitrary large data.
 
@@ -39,7 +43,11 @@ License:
 """
 __all__ = []  # Internal-only; not part of public API. Star import from this module gets nothing.
 
-from typing import Final, Any
+import atexit
+import threading
+import weakref
+from contextlib import contextmanager
+from typing import Any, Final, Iterator, Mapping
 
 from src.utils import folder_path
 from src.utils import file_path
@@ -61,6 +69,7 @@ class CacheReadWrite(CacheReadOnly):
             resource_name: str,
             required_keys: tuple[str, ...],
             default_values: dict[str, Any],
+            flush_delay_seconds: float | None = None,
     ) -> None:
         """
         Initialize a read/write JSON cache and ensure the backing file exists.
@@ -72,6 +81,7 @@ class CacheReadWrite(CacheReadOnly):
             resource_name (str): Logical cache name, used as the base filename without extension.
             required_keys (tuple[str, ...]): Allowed keys that must be present in the cache.
             default_values (dict[str, Any]): Default values applied when creating a new cache file.
+            flush_delay_seconds (float | None): When set, updates outside a batch are written once this many seconds after the last update instead of immediately. Defaults to None (write on every update).
 
         Returns:
             None: The cache is ready for get_value and set_value operations when initialization completes.
@@ -85,6 +95,13 @@ class CacheReadWrite(CacheReadOnly):
         self._crw_folder_path: Final[str] = resource_folder_path
         self._crw_file_path: Final[str] = file_path.construct_file_path(self._crw_folder_path, self._crw_file_name)
         self._crw_default_values: Final[dict[str, Any]] = default_values
+        self._crw_flush_delay: Final[float | None] = flush_delay_seconds
+
+        # Pending-write state shared by batches, debounced updates, and flush()
+        self._crw_lock: Final[threading.RLock] = threading.RLock()
+        self._crw_dirty: bool = False  # In-memory map has updates not yet written to disk
+        self._crw_batch_depth: int = 0
+        self._crw_timer: threading.Timer | None = None
 
         # Attempt to load the existing resource through the base CacheReadOnly implementation
         try:
@@ -100,6 +117,10 @@ class CacheReadWrite(CacheReadOnly):
                     f"Unable to load cache '{self._crw_file_name}' from '{self._crw_folder_path}'.\n{exc}"
                 ) from exc
 
+        if self._crw_flush_delay is not None:
+            # Write pending debounced updates on interpreter exit; the weak reference keeps the cache collectable
+            atexit.register(_flush_at_exit, weakref.ref(self))
+
     def _create_default_cache_to_disk(self) -> None:
         """
         Create a new cache file populated with default values.
@@ -151,7 +172,8 @@ class CacheReadWrite(CacheReadOnly):
             json_packet = json_io.create_json_packet(settings_map, self._crw_file_name)
 
             # Persist the JSON packet to disk with indentation for readability
-            json_io.save_json_file(self._crw_file_path, json_packet, indent_spaces=4)
+            # Write-and-rename so an interrupted write never leaves a truncated cache file
+            json_io.save_json_file(self._crw_file_path, json_packet, indent_spaces=4, atomic=True)
         except Exception as exc:
             raise RuntimeError(
                 f"Failed to store cache to '{self._crw_file_name}' in '{self._crw_folder_path}'.\n{exc}"
@@ -161,7 +183,7 @@ class CacheReadWrite(CacheReadOnly):
         """
         Update a single cache value and persist the change to disk.
 
-        Validates that the key is part of the required_keys set, updates the in-memory map, writes the new payload to disk, and reloads the base CacheReadOnly state.
+        Validates that the key is part of the required_keys set and updates the in-memory map. Outside a batch and without a flush delay the new payload is written to disk immediately; otherwise the write is deferred (see `batch` and `flush`).
 
         Args:
             key (str): Cache key to update; must be one of the required_keys.
@@ -174,24 +196,194 @@ class CacheReadWrite(CacheReadOnly):
             ValueError: If the key is not allowed for this cache.
             RuntimeError: If writing the updated cache or reloading from disk fails.
         """
+        self.update_values({key: value})
+
+    def update_values(self, updates: Mapping[str, Any]) -> None:
+        """
+        Update several cache values and persist them with a single write.
+
+        All keys are validated before any value changes, so an invalid key leaves the cache untouched.
+
+        Args:
+            updates (Mapping[str, Any]): Keys to update and their new values; every key must be one of the required_keys.
+
+        Returns:
+            None: The updated values are available via get_value after the call completes.
+
+        Raises:
+            ValueError: If any key is not allowed for this cache.
+            RuntimeError: If writing the updated cache or reloading from disk fails.
+        """
         # Only values of existing allowed keys can be updated
-        if key not in self._crw_required_keys:
-            allowed_keys = ", ".join(self._crw_required_keys)
-            raise ValueError(
-                f"Invalid key '{key}' for cache '{self._crw_resource_name}' in file '{self._crw_file_name}'. Allowed keys are: {allowed_keys}."
-            )
+        for key in updates:
+            if key not in self._crw_required_keys:
+                allowed_keys = ", ".join(self._crw_required_keys)
+                raise ValueError(
+                    f"Invalid key '{key}' for cache '{self._crw_resource_name}' in file '{self._crw_file_name}'. Allowed keys are: {allowed_keys}."
+                )
+
+        with self._crw_lock:
+            # Start from current cached state
+            kv_map: dict[str, Any] = self.get_data_map_copy()
+            kv_map.update(updates)
+            self._set_data_map(kv_map)
+            self._crw_dirty = True
+
+            if self._crw_batch_depth > 0:
+                return  # Written once when the outermost batch exits
+
+            if self._crw_flush_delay is not None:
+                self._schedule_flush()
+                return
+
+            self.flush()
+
+    @contextmanager
+    def batch(self) -> Iterator["CacheReadWrite"]:
+        """
+        Group several updates into one transaction that is written to disk once.
+
+        Updates made inside the block are visible through get_value immediately. When the outermost block exits normally, pending updates are flushed with a single atomic write; if it exits with an exception, the in-memory map is rolled back and nothing is written. Nested blocks join the outermost one.
+
+        Entering the outermost block cancels a scheduled debounced write, and flush() does nothing while a block is open, so staged updates never reach the disk before the transaction commits. Updates pending from before the block are written with the commit, or rescheduled after a rollback.
+
+        Example:
+            with cache.batch():
+                cache.update_value("SOURCE_FILES_FOLDER", src)
+                cache.update_value("DESTINATION_FILES_FOLDER", dst)
+
+        Returns:
+            Iterator[CacheReadWrite]: This cache, for use as the `with` target.
 
-        # Start from current cached state
-        kv_map: dict[str, Any] = self.get_data_map_copy()
-        kv_map[key] = value
+        Raises:
+            RuntimeError: If the final write or reload fails.
+        """
+        with self._crw_lock:
+            # Only the outermost block's snapshot is used for a rollback
+            snapshot, was_dirty = self._data_map, self._crw_dirty
+            self._crw_batch_depth += 1
+
+            # A debounced write armed before the block must not fire while updates are staged
+            if self._crw_timer is not None:
+                self._crw_timer.cancel()
+                self._crw_timer = None
 
         try:
-            # Write updated payload
-            self._store_cache_to_disk(kv_map)
+            yield self
+        except BaseException:
+            with self._crw_lock:
+                self._crw_batch_depth -= 1
+                if self._crw_batch_depth == 0:
+                    # Roll back everything staged by this transaction
+                    self._set_data_map(snapshot)
+                    self._crw_dirty = was_dirty
+
+                    # Re-arm the debounced write cancelled on entry for updates made before the block
+                    if was_dirty and self._crw_flush_delay is not None:
+                        self._schedule_flush()
+            raise
+
+        with self._crw_lock:
+            self._crw_batch_depth -= 1
+            if self._crw_batch_depth == 0:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Write pending updates to disk now.
 
-            # Reload cache state so get_value() reflects the new contents
-            super().__init__(self._crw_folder_path, self._crw_resource_name, self._crw_required_keys)
-        except Exception as exc:
-            raise RuntimeError(
-                f"Failed to reload cache from '{self._crw_file_path}'.\n{exc}"
-            ) from exc
+        Cancels any scheduled debounced write. Does nothing when there are no pending updates or while a `batch` block is open; the outermost block writes on exit.
+
+        Returns:
+            None: The cache file matches the in-memory state when the call completes.
+
+        Raises:
+            RuntimeError: If writing the updated cache or reloading from disk fails; the updates stay pending.
+        """
+        with self._crw_lock:
+            if self._crw_batch_depth > 0:
+                return  # Staged updates are written, or rolled back, when the outermost batch exits
+
+            if self._crw_timer is not None:
+                self._crw_timer.cancel()
+                self._crw_timer = None
+
+            if not self._crw_dirty:
+                return
+
+            try:
+                # Write updated payload
+                self._store_cache_to_disk(self.get_data_map_copy())
+
+                # Reload cache state so get_value() reflects the stored contents
+                super().__init__(self._crw_folder_path, self._crw_resource_name, self._crw_required_keys)
+            except Exception as exc:
+                raise RuntimeError(
+                    f"Failed to reload cache from '{self._crw_file_path}'.\n{exc}"
+                ) from exc
+
+            self._crw_dirty = False
+
+    def has_pending_updates(self) -> bool:
+        """
+        Report whether updates are waiting to be written to disk.
+
+        Returns:
+            bool: True if the in-memory map differs from the last write.
+        """
+        with self._crw_lock:
+            return self._crw_dirty
+
+    def _set_data_map(self, kv_map: dict[str, Any]) -> None:
+        """
+        Replace the in-memory map without touching the disk.
+
+        Args:
+            kv_map (dict[str, Any]): New key/value map; owned by the cache afterwards.
+
+        Returns:
+            None
+        """
+        self._data_map = kv_map
+        self._data_view = None  # Rebuilt lazily by get_data_map_view()
+
+    def _schedule_flush(self) -> None:
+        """
+        Restart the debounce timer so the write happens after the last update in a burst.
+
+        Returns:
+            None
+        """
+        if self._crw_timer is not None:
+            self._crw_timer.cancel()
+
+        self._crw_timer = threading.Timer(self._crw_flush_delay, self._flush_from_timer)
+        self._crw_timer.daemon = True  # Never keep the process alive; exit is covered by atexit
+        self._crw_timer.start()
+
+    def _flush_from_timer(self) -> None:
+        """
+        Debounce timer callback; failures leave the updates pending for the next flush.
+
+        Returns:
+            None
+        """
+        try:
+            self.flush()
+        except RuntimeError:
+            pass  # The next update, flush(), or exit hook retries and surfaces the error
+
+
+def _flush_at_exit(cache_ref: "weakref.ReferenceType[CacheReadWrite]") -> None:
+    """
+    Flush a debounced cache at interpreter exit if it is still alive.
+
+    Args:
+        cache_ref (weakref.ReferenceType[CacheReadWrite]): Weak reference to the cache.
+
+    Returns:
+        None
+    """
+    cache = cache_ref()
+    if cache is not None:
+        cache.flush()
@@ -18,6 +18,8 @@ Dependencies:
 
 Notes:
     - Empty change_log indicates no correction was applied
+    - The component type matcher is rebuilt automatically when the lookup table version changes; call `reset_component_type_matcher` after the ignore mask changes
+    - The manufacturer matcher is rebuilt automatically when the lookup table version changes
     - Internal-only module; API may change without notice
 
 License:
@@ -43,15 +45,52 @@ LOG_DESIGNATOR_EXPAND = "Designator range expanded to remove '-' dash."
 LOG_SUBTOTAL_CHANGE = "Sub-total set to the product of Quantity and Designator."
 LOG_MATERIAL_COST_CHANGE = "Material cost set to the sum of sub totals."
 LOG_TOTAL_COST_CHANGE = "Total cost set to the product of material and overhead cost."
+LOG_MANUFACTURER_ALIAS = "Manufacturer alias mapped to canonical name."
 
 ERR_FLOAT_PARSE = "{field} value '{value}' is not a valid floating point number: {reason}"
 
+# Lazily built fuzzy-match index for component types and the lookup table version it was built from
+_component_type_matcher: helper.ComponentTypeMatcher | None = None
+_component_type_matcher_version: str = ""
+# Lazily built alias index for manufacturer names and the lookup table version it was built from
+_manufacturer_matcher: helper.ManufacturerMatcher | None = None
+_manufacturer_matcher_version: str = ""
+
+
+def reset_component_type_matcher() -> None:
+    """
+    Discard the prebuilt component type matcher so the next lookup rebuilds it from the current lookup table and settings.
+    """
+    global _component_type_matcher
+    _component_type_matcher = None
+
+
+def _get_component_type_matcher() -> helper.ComponentTypeMatcher:
+    """
+    Return the shared component type matcher, building it on first use and after the lookup table changed.
+
+    Returns:
+        helper.ComponentTypeMatcher: Index over the component type lookup table and ignore mask.
+    """
+    global _component_type_matcher, _component_type_matcher_version
+
+    # Rebuild when the lookup table was reloaded with different content
+    version = lookup.get_component_type_lookup_version()
+    if _component_type_matcher is None or version != _component_type_matcher_version:
+        ignore_str: tuple[str, ...] = (
+            tuple(app_settings.get_settings().get_value(app_settings.KEYS.COMPONENT_TYPE_STRING_IGNORE_MASK, list))
+        )
+        _component_type_matcher = helper.ComponentTypeMatcher(lookup.get_component_type_lookup_view(), ignore_str)
+        _component_type_matcher_version = version
+
+    return _component_type_matcher
+
 
 def component_type_lookup(row: mdl.Row) -> tuple[str, str]:
     """
     Perform fuzzy lookup to map a raw component type string to a standardized type key.
 
-    This function compares the input string against all known component type variants using both Jaccard and Levenshtein similarity. It ignores specific substrings (e.g., "SMD", "DIP"), and if both metrics produce the same best match above the given threshold, the corresponding canonical component key is returned. If no match passes the threshold, the original input is returned.
+    This function compares the input string against all known component type variants using both Jaccard and Levenshtein similarity. It ignores specific substrings (e.g., "SMD", "DIP"), and if both metrics produce the same best match above the given threshold, the corresponding canonical component key is returned. If no match passes the threshold, the original input is returned. Matching uses a prebuilt index that is memoized per distinct input string.
 
     Args:
         row (mdl.Row): Bom row containing the component type to autocorrect.
@@ -69,35 +108,11 @@ def component_type_lookup(row: mdl.Row) -> tuple[str, str]:
     str_out = str_in
     change_log = ""
 
-    ignore_str: tuple[str, ...] = (
-        tuple(app_settings.get_settings().get_value(app_settings.KEYS.COMPONENT_TYPE_STRING_IGNORE_MASK, list))
-    )
-    lookup_dict: dict[str, list[str]] = lookup.get_component_type_lookup_table()
-
-    # ignore strings such as SMD and DIP if found in component type name as they add not value
-    str_test = str_in
-    for remove_str in ignore_str:
-        str_test = str_test.replace(remove_str, '')
-
-    # Get all values from the component dict
-    value_list = []
-    for value in lookup_dict.values():
-        if isinstance(value, str):
-            value_list.append(value)
-        elif isinstance(value, list):
-            value_list.extend(value)
-    value_list = tuple(value_list)
-
-    # Get the best matched value
-    value1, level1 = helper.jaccard_match(str_test, value_list)
-    value2, level2 = helper.levenshtein_match(str_test, value_list)
-
-    key_matches: list[str] = []
-    if value1 != "" and value2 != "" and value1 == value2:
-        # Get the key of the matched value
-        for key, values in lookup_dict.items():
-            if value1 in values:
-                key_matches.append(key)
+    # Get the best matched value and the keys it belongs to from the prebuilt index
+    match = _get_component_type_matcher().match(str_in)
+    key_matches = match.keys
+    value1, level1 = match.jaccard_value, match.jaccard_level
+    value2, level2 = match.levenshtein_value, match.levenshtein_level
 
     if len(key_matches) == 1 and str_in != key_matches[0]:
         str_out = key_matches[0]
@@ -118,6 +133,67 @@ def component_type_lookup(row: mdl.Row) -> tuple[str, str]:
     return str_out, change_log
 
 
+def reset_manufacturer_matcher() -> None:
+    """
+    Discard the prebuilt manufacturer matcher so the next lookup rebuilds it from the current lookup table.
+    """
+    global _manufacturer_matcher
+    _manufacturer_matcher = None
+
+
+def _get_manufacturer_matcher() -> helper.ManufacturerMatcher:
+    """
+    Return the shared manufacturer matcher, building it on first use and after the lookup table changed.
+
+    Returns:
+        helper.ManufacturerMatcher: Alias index over the manufacturer lookup table.
+    """
+    global _manufacturer_matcher, _manufacturer_matcher_version
+
+    # Rebuild when the lookup table was reloaded with different content
+    version = lookup.get_manufacturer_lookup_version()
+    if _manufacturer_matcher is None or version != _manufacturer_matcher_version:
+        _manufacturer_matcher = helper.ManufacturerMatcher(lookup.get_manufacturer_lookup_view())
+        _manufacturer_matcher_version = version
+
+    return _manufacturer_matcher
+
+
+def manufacturer_lookup(row: mdl.Row) -> tuple[str, str]:
+    """
+    Map a manufacturer name to its canonical form using the manufacturer alias lookup.
+
+    Names are matched exactly on casefolded word tokens, allowing trailing company-form suffixes (e.g., "AVX Corporation" -> "AVX", "Murata Manufacturing Co., Ltd." -> "Murata Manufacturing"). Unknown names are returned unchanged.
+
+    Args:
+        row (mdl.Row): Bom row containing the manufacturer name to autocorrect.
+
+    Returns:
+        tuple[str, str]:
+            - Canonical manufacturer name, or the original input if no alias matches.
+            - Audit log message (empty string if no change).
+
+    Raises:
+        None
+    """
+    str_in = row.manufacturer
+    str_out = str_in
+    change_log = ""
+
+    canonical = _get_manufacturer_matcher().match(str_in)
+
+    if canonical and canonical != str_in:
+        str_out = canonical
+        change_log = TEMPLATE_AUTOCORRECT_MSG.format(
+            field=mdl.RowFields.MANUFACTURER,
+            before=str_in,
+            after=str_out,
+            reason=LOG_MANUFACTURER_ALIAS
+        )
+
+    return str_out, change_log
+
+
 def expand_designators(row: mdl.Row) -> tuple[str, str]:
     """
     Expands designator ranges within the string.
@@ -7,6 +7,9 @@ This module provides:
  - prompt_until_valid: standard CLI loop that shows info on first failure, warns on each invalid entry, and reprompts
  - levenshtein_match: find the closest match using Levenshtein string ratio
  - jaccard_match: find the closest match using character-level Jaccard similarity
+ - ComponentTypeMatcher: prebuilt Jaccard + Levenshtein index over a component type lookup table with memoized results
+ - levenshtein_length_window / jaccard_size_window: length bounds used to skip candidates that cannot reach a threshold
+ - ManufacturerMatcher: exact-match hash plus word-level prefix trie that canonicalizes manufacturer aliases and legal-form suffixes
 
 Example Usage:
     # Preferred usage via package interface:
@@ -18,12 +21,16 @@ Example Usage:
 
 Dependencies:
     - Python >= 3.10
-    - Standard Library: typing
+    - Standard Library: bisect, dataclasses, functools, math, re, sys, typing
+    - External Packages: Levenshtein (imported lazily)
     - Project: src.cli.interfaces (for user prompts and messaging)
 
 Notes:
     - Internal-only utilities; keep prompting, messaging, and tolerance settings centralized for consistent UX across correctors.
     - Pure logic aside from CLI calls in prompt_until_valid; floats_equal parameters (_DIGITS_OF_PRECISION, _EPSILON) define comparison strictness.
+    - ComponentTypeMatcher reproduces `jaccard_match` + `levenshtein_match` results exactly, including tie-breaking, but normalizes the reference strings once.
+    - Pruning is exact: Levenshtein ratio is at most 2*min(len)/(sum of len) and Jaccard similarity is at most min(size)/max(size), so candidates outside the length windows can never reach the threshold.
+    - ManufacturerMatcher is exact, not fuzzy: names are compared as casefolded word tokens, so punctuation and spacing differences ("Co., Ltd" vs "co ltd") do not matter.
     - Recommended thresholds: Levenshtein 0.8–0.9, Jaccard 0.6–0.8 depending on string length and expected similarity.
 
 
@@ -33,15 +40,33 @@ License:
 
 __all__ = []  # Internal-only; not part of public API. Star import from this module gets nothing.
 
-from typing import Callable
-import Levenshtein
+import bisect
+import math
+import re
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable, Mapping
 from src.cli import interfaces as cli
+from src.utils import lazy
+
+Levenshtein = lazy.lazy_import("Levenshtein")  # Imported on the first fuzzy match
 
 JACCARD_THRESHOLD = 0.70
 LEVENSHTEIN_THRESHOLD = 0.85
 
 _DIGITS_OF_PRECISION = 6  # Number of decimal places to round to before comparison.
 _EPSILON = 1e-6  # Acceptable tolerance for equality after rounding. This helps absorb tiny floating-point noise.
+_MATCH_CACHE_SIZE = 4096  # Distinct inputs remembered by each matcher; least recently used entries are evicted first.
+
+# Legal-form words that may trail a known manufacturer name (normalized tokens)
+MANUFACTURER_SUFFIX_TOKENS: frozenset[str] = frozenset({
+    "ab", "ag", "bv", "co", "company", "corp", "corporation", "gmbh", "inc", "incorporated", "kg", "kk",
+    "limited", "llc", "ltd", "nv", "oy", "plc", "pte", "pty", "sa", "sas", "spa", "srl",
+})
+
+_NAME_TOKEN_SPLIT_RE = re.compile(r"[\W_]+")  # Anything that is not a letter or digit separates name tokens
+_TRIE_END = ""  # Trie key marking the end of an alias; never a real token since tokens are non-empty
 
 TEMPLATE_CORRECTION_MSG = "'{field}' changed from '{before}' to '{after}'. {reason}"
 TEMPLATE_CORRECTION_PROMPT = "Enter correct value for '{field}': "
@@ -146,12 +171,52 @@ def prompt_until_valid(data: str, fn: Callable, value: str, field: str) -> str:
     return value_out
 
 
+def levenshtein_length_window(length: int, ratio_threshold: float) -> tuple[int, int]:
+    """
+    Return the reference string lengths for which a Levenshtein ratio above the threshold is still possible.
+
+    The ratio of strings with lengths a and b is at most 2*min(a, b)/(a + b). The window is rounded outward, so it never excludes a reachable length.
+
+    Args:
+        length (int): Length of the normalized test string.
+        ratio_threshold (float): Levenshtein ratio that must be exceeded.
+
+    Returns:
+        tuple[int, int]: Inclusive lower and upper length bounds.
+    """
+    if ratio_threshold <= 0.0:
+        return 0, sys.maxsize
+    lower = math.floor(length * ratio_threshold / (2.0 - ratio_threshold))
+    upper = math.ceil(length * (2.0 - ratio_threshold) / ratio_threshold)
+    return lower, upper
+
+
+def jaccard_size_window(size: int, similarity_threshold: float) -> tuple[int, int]:
+    """
+    Return the character set sizes for which a Jaccard similarity at or above the threshold is still possible.
+
+    The similarity of sets with sizes a and b is at most min(a, b)/max(a, b). The window is rounded outward, so it never excludes a reachable size.
+
+    Args:
+        size (int): Size of the test string character set.
+        similarity_threshold (float): Minimum Jaccard similarity.
+
+    Returns:
+        tuple[int, int]: Inclusive lower and upper size bounds.
+    """
+    if similarity_threshold <= 0.0:
+        return 0, sys.maxsize
+    lower = math.floor(size * similarity_threshold)
+    upper = math.ceil(size / similarity_threshold)
+    return lower, upper
+
+
 def levenshtein_match(test_string: str, reference_strings: tuple[str, ...],
                       ratio_threshold: float = LEVENSHTEIN_THRESHOLD) -> tuple[str, float]:
     """
     Find the best fuzzy match for a test string from a list of reference strings using Levenshtein ratio.
 
-    Both the test string and reference strings are normalized to lowercase and stripped of leading/trailing spaces. The best match must exceed the provided ratio threshold to be returned.
+    Both the test string and reference strings are normalized to lowercase and stripped of leading/trailing spaces. The best match must exceed the provided ratio threshold to be returned. References whose length cannot reach the threshold are skipped without computing the ratio.
 
     Args:
         test_string (str): Input string to match.
@@ -168,12 +233,17 @@ def levenshtein_match(test_string: str, reference_strings: tuple[str, ...],
     best_match: str = ""
     best_ratio: float = 0.0  # start with the lowest possible ratio
     lower_test_string = test_string.lower().strip()
+    min_length, max_length = levenshtein_length_window(len(lower_test_string), ratio_threshold)
+    ratio = Levenshtein.ratio  # Resolve the lazy module once, not per reference
 
     # Loop through each reference string
     for ref_string in reference_strings:
         lower_ref_string = ref_string.lower().strip()
+        # Skip references too short or too long to exceed the threshold
+        if not min_length <= len(lower_ref_string) <= max_length:
+            continue
         # Compute the Levenshtein ratio between the test string and the current reference string
-        match_ratio = Levenshtein.ratio(lower_test_string, lower_ref_string)
+        match_ratio = ratio(lower_test_string, lower_ref_string)
         # TODO debug log print(f'L = {match_ratio:2.2f} {test_string:20} {ref_string:20}')
 
         # If the distance is smaller than the current minimum distance, update the best match
@@ -190,7 +260,7 @@ def jaccard_match(test_string: str, reference_strings: tuple[str, ...], similari
     """
     Find the best fuzzy match for a test string using character-level Jaccard similarity.
 
-    The function compares the character sets of the test string and each reference string, returning the one with the highest similarity above the threshold.
+    The function compares the character sets of the test string and each reference string, returning the one with the highest similarity above the threshold. References whose character set size cannot reach the threshold are skipped before the set operations.
 
     Args:
         test_string (str): The string to match.
@@ -206,11 +276,15 @@ def jaccard_match(test_string: str, reference_strings: tuple[str, ...], similari
     best_match: str = ""
     best_similarity: float = 0.0
     set1 = set(test_string.lower().strip())
+    min_size, max_size = jaccard_size_window(len(set1), similarity_threshold)
 
     # Iterate through each reference string
     for ref_string in reference_strings:
         # Compute Jaccard similarity coefficient
         set2 = set(ref_string.lower().strip())
+        # Skip references whose character set size cannot reach the threshold
+        if not min_size <= len(set2) <= max_size:
+            continue
         intersection = len(set1.intersection(set2))
         union = len(set1.union(set2))
         matching_similarity = 0.0
@@ -225,3 +299,238 @@ def jaccard_match(test_string: str, reference_strings: tuple[str, ...], similari
 
     # Return the best matching reference string
     return best_match, best_similarity
+
+
+@dataclass(frozen=True)
+class ComponentTypeMatch:
+    """
+    Result of matching one raw component type string against the lookup table.
+
+    Attributes:
+        keys (tuple[str, ...]): Canonical keys whose values contain the agreed best match; empty when the metrics disagree or no match passes the thresholds.
+        jaccard_value (str): Best Jaccard match, or "" if none meets the threshold.
+        jaccard_level (float): Jaccard similarity of the best match.
+        levenshtein_value (str): Best Levenshtein match, or "" if none meets the threshold.
+        levenshtein_level (float): Levenshtein ratio of the best match.
+    """
+    keys: tuple[str, ...]
+    jaccard_value: str
+    jaccard_level: float
+    levenshtein_value: str
+    levenshtein_level: float
+
+
+class ComponentTypeMatcher:
+    """
+    Prebuilt fuzzy-match index over a component type lookup table.
+
+    Normalized variants, their character sets (as bitmasks) and the variant-to-key map are built once; results are memoized per distinct input string in a bounded LRU cache, so repeated component types cost a single cache lookup. Variants are also indexed by length and character set size, so only candidates inside the threshold windows are scored.
+
+    Args:
+        lookup_table (Mapping[str, Any]): Canonical key -> variant string or list/tuple of variant strings.
+        ignore_mask (tuple[str, ...]): Substrings removed from the input before matching (e.g., "SMD", "DIP").
+    """
+
+    def __init__(self, lookup_table: Mapping[str, Any], ignore_mask: tuple[str, ...]) -> None:
+        self._ignore_mask: tuple[str, ...] = tuple(ignore_mask)
+
+        # Flatten all variants in table order; order decides ties exactly as in the helper functions
+        variants: list[str] = []
+        for value in lookup_table.values():
+            if isinstance(value, str):
+                variants.append(value)
+            elif isinstance(value, (list, tuple)):
+                variants.extend(value)
+        self._variants: tuple[str, ...] = tuple(variants)
+        self._normalized: tuple[str, ...] = tuple(v.lower().strip() for v in self._variants)
+        # Character sets as bitmasks: intersection and union sizes become integer popcounts
+        self._char_bits: dict[str, int] = {}
+        for reference in self._normalized:
+            for char in reference:
+                self._char_bits.setdefault(char, 1 << len(self._char_bits))
+        self._char_masks: tuple[int, ...] = tuple(self._char_mask(v) for v in self._normalized)
+
+        # Variant positions sorted by length and by character set size, for window pruning
+        self._length_order: tuple[int, ...] = tuple(
+            sorted(range(len(self._normalized)), key=lambda i: len(self._normalized[i])))
+        self._length_keys: list[int] = [len(self._normalized[i]) for i in self._length_order]
+        self._size_order: tuple[int, ...] = tuple(
+            sorted(range(len(self._char_masks)), key=lambda i: self._char_masks[i].bit_count()))
+        self._size_keys: list[int] = [self._char_masks[i].bit_count() for i in self._size_order]
+
+        # Keys whose values contain the variant; `in` keeps substring semantics for string values
+        self._variant_keys: dict[str, tuple[str, ...]] = {
+            variant: tuple(key for key, values in lookup_table.items() if variant in values)
+            for variant in dict.fromkeys(self._variants)
+        }
+        self._cached_match: Callable[[str], ComponentTypeMatch] = lru_cache(maxsize=_MATCH_CACHE_SIZE)(self._match)
+
+    def match(self, value: str) -> ComponentTypeMatch:
+        """
+        Match a raw component type string against the lookup variants.
+
+        Args:
+            value (str): Raw component type string.
+
+        Returns:
+            ComponentTypeMatch: Matched keys and the best Jaccard and Levenshtein candidates.
+        """
+        return self._cached_match(value)
+
+    def _match(self, value: str) -> ComponentTypeMatch:
+        """
+        Compute the match for one input without memoization.
+        """
+        # ignore strings such as SMD and DIP if found in component type name as they add not value
+        test_string = value
+        for remove_str in self._ignore_mask:
+            test_string = test_string.replace(remove_str, '')
+        normalized = test_string.lower().strip()
+
+        # Jaccard: first candidate with the highest similarity at or above the threshold
+        jaccard_value, jaccard_level = "", 0.0
+        test_mask = self._char_mask(normalized)
+        for idx in self._window(self._size_order, self._size_keys,
+                                *jaccard_size_window(test_mask.bit_count(), JACCARD_THRESHOLD)):
+            variant, char_mask = self._variants[idx], self._char_masks[idx]
+            union = (test_mask | char_mask).bit_count()
+            similarity = (test_mask & char_mask).bit_count() / union if union > 0 else 0.0
+            if similarity > jaccard_level and similarity >= JACCARD_THRESHOLD:
+                jaccard_value, jaccard_level = variant, similarity
+
+        # Levenshtein: last candidate with the highest ratio above the threshold
+        levenshtein_value, levenshtein_level = "", 0.0
+        levenshtein_ratio = Levenshtein.ratio  # Resolve the lazy module once, not per candidate
+        for idx in self._window(self._length_order, self._length_keys,
+                                *levenshtein_length_window(len(normalized), LEVENSHTEIN_THRESHOLD)):
+            variant, reference = self._variants[idx], self._normalized[idx]
+            ratio = levenshtein_ratio(normalized, reference)
+            if ratio > LEVENSHTEIN_THRESHOLD and ratio >= levenshtein_level:
+                levenshtein_value, levenshtein_level = variant, ratio
+
+        keys: tuple[str, ...] = ()
+        if jaccard_value != "" and jaccard_value == levenshtein_value:
+            keys = self._variant_keys[jaccard_value]
+
+        return ComponentTypeMatch(
+            keys=keys,
+            jaccard_value=jaccard_value,
+            jaccard_level=jaccard_level,
+            levenshtein_value=levenshtein_value,
+            levenshtein_level=levenshtein_level,
+        )
+
+    def _char_mask(self, value: str) -> int:
+        """
+        Return the character set of a normalized string as a bitmask; characters unknown to the table get bits above all known ones.
+        """
+        mask = 0
+        extra = len(self._char_bits)
+        unknown: dict[str, int] = {}
+        for char in value:
+            bit = self._char_bits.get(char)
+            if bit is None:
+                bit = unknown.setdefault(char, 1 << (extra + len(unknown)))
+            mask |= bit
+        return mask
+
+    @staticmethod
+    def _window(order: tuple[int, ...], keys: list[int], lower: int, upper: int) -> list[int]:
+        """
+        Return the variant positions whose sort key lies within [lower, upper], in original table order.
+        """
+        start = bisect.bisect_left(keys, lower)
+        stop = bisect.bisect_right(keys, upper)
+        return sorted(order[start:stop])
+
+
+def manufacturer_tokens(value: str) -> tuple[str, ...]:
+    """
+    Split a manufacturer name into casefolded word tokens, dropping punctuation and spacing.
+
+    Args:
+        value (str): Raw manufacturer name (e.g., "Murata Mfg. Co., Ltd").
+
+    Returns:
+        tuple[str, ...]: Normalized tokens (e.g., ("murata", "mfg", "co", "ltd")).
+    """
+    return tuple(token for token in _NAME_TOKEN_SPLIT_RE.split(value.casefold()) if token)
+
+
+class ManufacturerMatcher:
+    """
+    Canonicalize manufacturer names with an exact-match hash and a word-level prefix trie.
+
+    Every alias (and each canonical name) is tokenized once. An input is resolved by an O(1) hash lookup of its token sequence; failing that, the trie is walked along the input tokens and the longest alias that is followed only by legal-form suffix tokens (e.g., "Corporation", "Co., Ltd") wins. Both paths are linear in the input length, and results are memoized per distinct input string in a bounded LRU cache.
+
+    Args:
+        lookup_table (Mapping[str, Any]): Canonical name -> alias string or list/tuple of alias strings.
+        suffix_tokens (frozenset[str]): Normalized tokens that may trail a manufacturer name.
+
+    Raises:
+        ValueError: If one normalized alias maps to two different canonical names.
+    """
+
+    def __init__(self, lookup_table: Mapping[str, Any],
+                 suffix_tokens: frozenset[str] = MANUFACTURER_SUFFIX_TOKENS) -> None:
+        self._suffix_tokens: frozenset[str] = suffix_tokens
+        self._exact: dict[tuple[str, ...], str] = {}
+        self._trie: dict[str, Any] = {}
+        self._cached_match: Callable[[str], str] = lru_cache(maxsize=_MATCH_CACHE_SIZE)(self._match)
+
+        for canonical, aliases in lookup_table.items():
+            if isinstance(aliases, str):
+                aliases = (aliases,)
+            for alias in (canonical, *aliases):
+                tokens = manufacturer_tokens(alias)
+                if not tokens:
+                    continue
+                existing = self._exact.setdefault(tokens, canonical)
+                if existing != canonical:
+                    raise ValueError(
+                        f"Manufacturer alias '{alias}' maps to both '{existing}' and '{canonical}'."
+                    )
+                node = self._trie
+                for token in tokens:
+                    node = node.setdefault(token, {})
+                node[_TRIE_END] = canonical
+
+    def match(self, value: str) -> str:
+        """
+        Return the canonical manufacturer name for a raw name.
+
+        Args:
+            value (str): Raw manufacturer name.
+
+        Returns:
+            str: Canonical name, or "" when the name is not a known alias.
+        """
+        return self._cached_match(value)
+
+    def _match(self, value: str) -> str:
+        """
+        Resolve one input without memoization.
+        """
+        tokens = manufacturer_tokens(value)
+
+        # Exact alias hit
+        canonical = self._exact.get(tokens)
+        if canonical is not None:
+            return canonical
+
+        # suffix_only[i] is True when every token from position i on is a legal-form suffix
+        suffix_only = [True] * (len(tokens) + 1)
+        for idx in range(len(tokens) - 1, -1, -1):
+            suffix_only[idx] = suffix_only[idx + 1] and tokens[idx] in self._suffix_tokens
+
+        # Walk the trie along the input; keep the longest alias whose remaining tokens are all suffixes
+        best = ""
+        node = self._trie
+        for idx, token in enumerate(tokens):
+            node = node.get(token)
+            if node is None:
+                break
+            if _TRIE_END in node and suffix_only[idx + 1]:
+                best = node[_TRIE_END]
+
+        return best
@@ -56,6 +56,7 @@ from ._assist import (
 # noinspection PyProtectedMember
 from ._auto import (
     component_type_lookup,
+    manufacturer_lookup,
     expand_designators,
     material_cost,
     sub_total,
@@ -88,6 +89,7 @@ __all__ = [
 
     # auto
     "component_type_lookup",
+    "manufacturer_lookup",
     "expand_designators",
     "material_cost",
     "sub_total",
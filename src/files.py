@@ -1,6 +1,7 @@
 # manage file data
 
 import console
+import hashlib
 import os
 import pandas as pd
 
@@ -94,16 +95,39 @@ def read_raw_excel_file_data(folder, file):
     return xls
 
 
-def get_user_selected_excel_file_sheet(xls) -> pd.DataFrame:
+def get_file_fingerprint(folder, file) -> dict:
+    """
+    Identify the content of a file, e.g. to check that saved checkpoints were made from it.
+
+    Parameters:
+        folder (str): The folder holding the file.
+        file (str): The file name.
+
+    Returns:
+        dict: The file name, its size in bytes and the SHA-256 of its content.
+    """
+
+    file_path = os.path.join(folder, file)
+    with open(file_path, 'rb') as f:
+        sha256 = hashlib.sha256(f.read()).hexdigest()
+
+    return {'file_name': file, 'size': os.path.getsize(file_path), 'sha256': sha256}
+
+
+def get_user_selected_excel_file_sheet(xls, sheet_name=None) -> pd.DataFrame:
 
     # get a list of sheet names
     sheet_names = xls.sheet_names
 
-    # Get which tab to read
-    header_msg = 'available excel sheets'
-    select_msg = 'Enter the number of the sheet to make a selection'
-    user_selection = console.get_user_selection(sheet_names, header_msg=header_msg, select_msg=select_msg)
-    sheet_name = sheet_names[user_selection]
+    if sheet_name is None:
+        # Get which tab to read
+        header_msg = 'available excel sheets'
+        select_msg = 'Enter the number of the sheet to make a selection'
+        user_selection = console.get_user_selection(sheet_names, header_msg=header_msg, select_msg=select_msg)
+        sheet_name = sheet_names[user_selection]
+    elif sheet_name not in sheet_names:
+        # sheet selected up front (e.g., batch run)
+        raise ValueError(f'Sheet "{sheet_name}" not found. Available sheets are {sheet_names}.')
 
     print()
     print(f'Reading sheet... ')
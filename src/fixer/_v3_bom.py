@@ -252,6 +252,7 @@ def _fix_row_auto(change_log: ChangeLog, row: Row) -> Row:
     # Define ordered header cleaning sequence (function, value, attribute)
     cases = [
         (correct.component_type_lookup, RowFields.COMPONENT),
+        (correct.manufacturer_lookup, RowFields.MANUFACTURER),
         (correct.expand_designators, RowFields.DESIGNATOR),
         (correct.sub_total, RowFields.SUB_TOTAL),
     ]
@@ -1,6 +1,9 @@
 # This file has functions to manipulate both rows and columns in a data frame
+import re
+from functools import lru_cache
 from typing import Type
 
+import numpy as np
 import pandas as pd
 
 import columns
@@ -393,8 +396,8 @@ def split_manufacturers_to_separate_rows(
 
     Raises:
     ValueError: If there are multiple or no columns matching the reference strings for manufacturer name or part number.
-                If the number of manufacturer names does not match the number of part numbers.
-                If an error is detected in the data during processing.
+                If the number of manufacturer names does not match the number of part numbers, or a split row has
+                fewer descriptions than manufacturer names; the message lists every offending item.
     """
     # message
     print()
@@ -430,63 +433,77 @@ def split_manufacturers_to_separate_rows(
     # Get the index of the description column
     description_index = columns.get_single_header_index(original_df, 'Description', False)
 
-    # Create an empty data frame with same header
-    updated_df = pd.DataFrame(columns=original_df.columns)
-
-    # read each row on at a time
-    for index, row in original_df.iterrows():
-        # get values we need
-        component_string = row.iloc[component_index]
-        name_string = row.iloc[name_index]
-        description_string = row.iloc[description_index]
-        # part number may be all numbers so force data to string
-        part_number_string = str(row.iloc[part_number_index])
-        name_list = name_string.split('\n')
-        part_number_list = part_number_string.split('\n')
-        description_list = description_string.split('\n')
-        # remove any "" items from the list.
-        name_list = [item for item in name_list if item != ""]
-        part_number_list = [item for item in part_number_list if item != ""]
-        description_list = [item for item in description_list if item != ""]
-
-        # number of manufacturer names must be the same as manufacturer part numbers
+    # Column labels of the fields we need
+    name_hdr = original_df.columns[name_index]
+    part_number_hdr = original_df.columns[part_number_index]
+    description_hdr = original_df.columns[description_index]
+    qty_hdr = original_df.columns[qty_index]
+    price_hdr = original_df.columns[price_index]
+
+    # Split each cell into its "\n" separated values; part numbers may be all numbers so force data to string
+    def _split_cell(value) -> list:
+        return [item for item in value.split('\n') if item != ""]
+
+    name_lists = original_df[name_hdr].map(_split_cell).tolist()
+    part_number_lists = original_df[part_number_hdr].map(lambda value: _split_cell(str(value))).tolist()
+    description_lists = original_df[description_hdr].map(_split_cell).tolist()
+
+    # when component name is in the exception list we don't split the row
+    split_flags = [
+        not any(reference_string.lower() in component_string.lower() for reference_string in exception_list)
+        for component_string in original_df.iloc[:, component_index]
+    ]
+
+    # Validate every row first so all problems are reported together, by item as in the source file
+    errors = []
+    for n_row, (item, name_list, part_number_list, description_list, split_flag) in enumerate(
+            zip(original_df[itemHdr], name_lists, part_number_lists, description_lists, split_flags)):
+        # number of manufacturer names must be the same as manufacturer part numbers; a single part number is shared
         if len(name_list) != len(part_number_list):
-            if len(part_number_list) == 1:
-                for i in range(len(name_list)):
-                    part_number_list.append(part_number_list[0])
-            else:
-                print("*** ERROR *** ")
-                print("Number of part numbers must be one or the same as number of manufacturers")
-                print(f"{len(name_list)} Manufacturer names {name_list}")
-                print(f"{len(part_number_list)} Manufacturer part numbers {part_number_list}")
-                print("Please fix the source data file and retry")
-                exit()
-
-        # when component name is exception list we don't split the row
-        split_flag = True
-        for reference_string in exception_list:
-            if reference_string.lower() in component_string.lower():
-                split_flag = False
-
-        # When we want to split, split the manufacturer names and part numbers into separate rows
-        if not split_flag:
-            updated_df.loc[len(updated_df)] = row
+            if len(part_number_list) != 1:
+                errors.append(f"Item {item}: {len(name_list)} Manufacturer names {name_list} but "
+                              f"{len(part_number_list)} Manufacturer part numbers {part_number_list}")
+                continue
+            part_number_lists[n_row] = part_number_list * len(name_list)
+        # every split row needs a description per manufacturer
+        if split_flag and len(description_list) < len(name_list):
+            errors.append(f"Item {item}: {len(name_list)} Manufacturer names {name_list} but "
+                          f"{len(description_list)} descriptions {description_list}")
+
+    if errors:
+        raise ValueError(
+            "Number of part numbers must be one or the same as number of manufacturers, and each manufacturer "
+            "needs a description. Please fix the source data file and retry.\n" + "\n".join(errors))
+
+    # Rows that are split get one list entry per manufacturer; other rows keep their cells as a single entry.
+    # A split row without any manufacturer produces no rows.
+    expanded_df = original_df.reset_index(drop=True)
+    names, part_numbers, descriptions = [], [], []
+    for n_row, split_flag in enumerate(split_flags):
+        if split_flag:
+            count = len(name_lists[n_row])
+            names.append(name_lists[n_row])
+            part_numbers.append(part_number_lists[n_row][:count])
+            descriptions.append(description_lists[n_row][:count])
         else:
-            for i in range(len(name_list)):
-                new_row = row.copy()
-                new_row.iloc[name_index] = name_list[i]
-                new_row.iloc[part_number_index] = part_number_list[i]
-                new_row.iloc[description_index] = description_list[i]
-                # Except for first occurrence, all other rows have zero quantity
-                if i != 0:
-                    new_row.iloc[qty_index] = 0
-                # If version 3.0, set price to 0 for all rows except the first
-                if bom_template_version == enum_bom_temp_version.v3 and i != 0:
-                    new_row.iloc[price_index] = 0
-                if bom_template_version == enum_bom_temp_version.v3:
-                    new_row.iloc[description_index] = description_list[i]
-                # add row to updated data frame
-                updated_df.loc[len(updated_df)] = new_row
+            names.append([expanded_df.at[n_row, name_hdr]])
+            part_numbers.append([expanded_df.at[n_row, part_number_hdr]])
+            descriptions.append([expanded_df.at[n_row, description_hdr]])
+
+    keep_rows = np.array([len(name_list) > 0 for name_list in names], dtype=bool)
+    expanded_df = expanded_df.astype(object)
+    expanded_df[name_hdr] = pd.Series(names, dtype=object)
+    expanded_df[part_number_hdr] = pd.Series(part_numbers, dtype=object)
+    expanded_df[description_hdr] = pd.Series(descriptions, dtype=object)
+    expanded_df = expanded_df.loc[keep_rows].explode([name_hdr, part_number_hdr, description_hdr])
+
+    # Except for first occurrence, all other rows have zero quantity (and, for version 3.0, zero price)
+    later_rows = (expanded_df.groupby(level=0).cumcount() != 0).to_numpy()
+    expanded_df.loc[later_rows, qty_hdr] = 0
+    if bom_template_version == enum_bom_temp_version.v3:
+        expanded_df.loc[later_rows, price_hdr] = 0
+
+    updated_df = expanded_df.reset_index(drop=True)
 
     # user interface message
     original_row_count = original_df.shape[0]
@@ -557,25 +574,62 @@ def check_qty_matched_ref_des_count(df):
         # Raise an error if no partial match is found
         raise ValueError("Designator column not found.")
 
-    # Get one row at a time
-    for _, row in df.iterrows():
-        # get the quantity
-        count_of_quantity = row.iloc[qty_index]
-        # Count the number of reference designators
-        designator_string = row.iloc[designator_index]
-        count_of_designator = len(designator_string.split(','))
-        # raise an error when counts is integer and does not match
-        if count_of_designator != count_of_quantity and int(count_of_quantity) == float(count_of_quantity):
-            print(f"Quantity does not match number of designators for item {row.iloc[0]}")
-            print('Fix input data file and try again')
-            exit()
+    # Report every mismatching item in one run
+    mismatch_df = find_qty_ref_des_count_mismatch(df, qty_index, designator_index)
+    if not mismatch_df.empty:
+        for item, quantity, designator_count in mismatch_df.itertuples(index=False):
+            print(f"Quantity does not match number of designators for item {item} "
+                  f"(Qty = {quantity}, designators = {designator_count})")
+        print('Fix input data file and try again')
+        raise ValueError(f"Quantity does not match number of designators for {mismatch_df.shape[0]} items.")
 
     # Message
     print(f'Quantity count matches number of reference designators in all {df.shape[0]} rows')
 
 
-def normalize_component_type_label(df):
-    import strings
+def find_qty_ref_des_count_mismatch(df, qty_index, designator_index):
+    """
+    Find every row whose integer-valued quantity differs from its number of reference designators.
+
+    Parameters:
+    - df: pandas DataFrame
+        The DataFrame containing the data to be checked.
+    - qty_index: int
+        Index of the quantity column.
+    - designator_index: int
+        Index of the comma separated reference designator column.
+
+    Returns:
+    - pandas DataFrame: One row per mismatching item with the item (first column), the quantity and the
+      designator count. Rows with a fractional or missing quantity are not checked.
+    """
+    quantity = pd.to_numeric(df.iloc[:, qty_index], errors='coerce').to_numpy(dtype=float)
+    designator_count = df.iloc[:, designator_index].astype(str).str.count(',').to_numpy() + 1
+
+    # Only whole quantities are expected to match the designator count
+    mismatch = (quantity == np.floor(quantity)) & (designator_count != quantity)
+
+    return pd.DataFrame({
+        'item': df.iloc[mismatch, 0].to_numpy(),
+        'quantity': quantity[mismatch],
+        'designator_count': designator_count[mismatch],
+    })
+
+
+def normalize_component_type_label(df, verbose=False):
+    """
+    Replace the component type names with the standard component type keys of `component_dict`.
+
+    Args:
+        df (pandas.DataFrame): BOM with a 'Component' column.
+        verbose (bool): Print the match of every distinct component type name.
+
+    Returns:
+        pandas.DataFrame: BOM with standard component type keys; names without an agreed match are prefixed with '*'.
+
+    Raises:
+        ValueError: If no column matches 'Component'.
+    """
 
     # message
     print()
@@ -598,48 +652,58 @@ def normalize_component_type_label(df):
     else:
         raise ValueError("No partial match found in the header.")  # Raise an error if no partial match is found
 
-    # Create an empty DataFrame to store the updated rows
-    updated_df = pd.DataFrame(columns=df.columns)
+    # Match each distinct component type name once and map the result back to every row
+    normalizer = build_component_type_normalizer(component_dict)
+    component_series = df.iloc[:, type_index]
+    matches = {name: normalizer(name) for name in component_series.unique()}
+
+    updated_df = df.reset_index(drop=True)
+    updated_df.iloc[:, type_index] = component_series.map(lambda name: matches[name][0]).to_numpy()
+
+    # debug message
+    if verbose:
+        for name, (key_match, value_match1, value_match2) in matches.items():
+            print(f'{name:30} -> {key_match:30} [{value_match1}/{value_match2}]')
+
+    # message for how many rows changed
+    is_matched = {name: value_match1 == value_match2 for name, (_, value_match1, value_match2) in matches.items()}
+    count = int(component_series.map(is_matched).sum())
+    print(f"{count} rows updated")
+
+    return updated_df
+
+
+def build_component_type_normalizer(component_types):
+    """
+    Build a matcher from raw component type names to the standard component type keys.
 
-    # Get one row at a time
-    count = 0
-    key_count = 0
-    for _, row in df.iterrows():
-        # Get component type
-        component_type_name = row.iloc[type_index]
+    The variant list and the variant to key index are built once, so the returned matcher only runs the
+    Jaccard and Levenshtein searches for the name it is given.
+
+    Args:
+        component_types (dict): Standard component type keys mapped to their list of name variants.
+
+    Returns:
+        Callable[[str], tuple[str, str, str]]: Matcher returning the standard key (or the name prefixed
+        with '*' when the two searches disagree) and the Jaccard and Levenshtein best matches.
+    """
+    # Flattened variants, and the key of each variant; the last key listing a variant wins
+    value_list = [value for sublist in component_types.values() for value in sublist]
+    key_by_value = {value: key for key, values in component_types.items() for value in values}
+
+    def normalize(component_type_name):
         # ignore SMD, DIP if found in component type name as they add not value
         component_string = component_type_name.replace("SMD", "").replace("DIP", "").replace("ALT", "").replace("SMT", "")
-        # Get all values from the component dict
-        value_list = [value for sublist in component_dict.values() for value in sublist]
         # Get the best matched value
         value_match1 = strings.find_best_match_jaccard(component_string, value_list)
         value_match2 = strings.find_best_match_levenshtein(component_string, value_list)
+
         key_match = "*" + component_type_name
-        if value_match1 == value_match2:
-            # for debug keep track of number of items changed
-            count += 1
-            # Get the key of the matched value
-            for key, values in component_dict.items():
-                if value_match1 in values:
-                    key_match = key
-                    key_count += 1
-                    # raise exception when multiple keys are found
-                    try:
-                        key_count > 1
-                    except Exception as e:
-                        raise ValueError(f"Multiple component match found for {component_type_name}.", e)
-        # replace the component type name in the row
-        row.iloc[type_index] = key_match
-
-        # add row to updated data frame
-        updated_df.loc[len(updated_df)] = row
-        # debug message
-        print(f'{component_type_name:30} -> {key_match:30} [{value_match1}/{value_match2}]')
+        if value_match1 == value_match2 and value_match1 in key_by_value:
+            key_match = key_by_value[value_match1]
+        return key_match, value_match1, value_match2
 
-    # message for how many rows changed
-    print(f"{count} rows updated")
-
-    return updated_df
+    return normalize
 
 
 def drop_rows_with_unwanted_ebom_items(df):
@@ -693,12 +757,13 @@ def primary_above_alternative(df: pd.DataFrame,
     """
     Reorder each component group so the primary component (qty != 0) is first, followed by alternatives (qty == 0).
     For template v2: return the input unchanged.
-    For template v3: while scanning rows in order, whenever a primary appears in a group that already has
-    alternative rows, insert the primary at the top of the group's buffer, then swap the values of
-    [pkgHdr, itemHdr, componentHdr] between the first and second rows of that group to preserve primary
-    metadata if it was carried by the first alternative row.
+    For template v3: within each group, every row after the first with qty != 0 is a primary and moves to the top
+    (later primaries above earlier ones); qty == 0 rows follow the group's first row in their original order. Each
+    such move swaps the values of [pkgHdr, itemHdr, componentHdr] with the row below it, so primary metadata
+    carried by the first alternative row ends up on the top row.
 
-    Grouping keys: (itemHdr, designatorHdr).
+    Grouping keys: (itemHdr, designatorHdr); a group is a run of adjacent rows with equal keys.
+    The reorder is computed with stable sort keys per group instead of rebuilding each group row by row.
 
     Args:
         df: Input DataFrame.
@@ -718,63 +783,38 @@ def primary_above_alternative(df: pd.DataFrame,
     # Only needed for template version 3.0
     if bom_template_version == enum_bom_temp_version.v3:
 
-        # Initialize an empty DataFrame to collect rows (df_temp)
-        df_group = pd.DataFrame(columns=df.columns)
-        df_mod = pd.DataFrame(columns=df.columns)
-
-        # Read each row one at a time
-        for idx, row in df.iterrows():
-
-            # Convert current row label -> position
-            n_row = df.index.get_loc(idx)
-
-            # for first physical row → start a new group
-            if n_row == 0:
-                df_group = pd.DataFrame([row], columns=df.columns)  # copy row to group
-                continue  # no need to do anything else
-
-            # Previous row label (by sequence, not label math)
-            prev_idx = df.index[n_row - 1] # get previous row index label
-            
-            # Detect group change by label
-            same_group = (
-                    df.loc[idx, itemHdr] == df.loc[prev_idx, itemHdr] and
-                    df.loc[idx, designatorHdr] == df.loc[prev_idx, designatorHdr]
-            )
-
-            # When component changes
-            if not same_group:
-                # add group to mdf
-                df_mod = pd.concat([df_mod, df_group], axis=0, ignore_index=True)
-                # Start new group with current row
-                df_group = pd.DataFrame([row], columns=df.columns)
-                continue  # no need to do anything else
-
-            # Within the same group
-            # When we come across an alternative part
-            if row[qtyHdr] == 0:
-                # add current row to the bottom of the group
-                df_group = pd.concat([df_group, pd.DataFrame(row).T], axis=0, ignore_index=True)
-            # When we come across the primary
-            else:
-                # add current row to the top of the group
-                df_group = pd.concat([pd.DataFrame(row).T, df_group], axis=0, ignore_index=True)
-
-                # Primary information may be in the alternative row, so
-                # after adding to the top, if we have at least two rows
-                if len(df_group) > 1:
-                    # Select columns to swap
-                    cols_to_swap = [pkgHdr, itemHdr, componentHdr]
-                    # Swap values between the first and second rows for the selected columns
-                    # Take copies to avoid chained assignment pitfalls
-                    r0 = df_group.loc[0, cols_to_swap].copy()
-                    r1 = df_group.loc[1, cols_to_swap].copy()
-                    df_group.loc[0, cols_to_swap] = r1.values
-                    df_group.loc[1, cols_to_swap] = r0.values
-
-        # After the last group, merge the remaining df_temp into mdf
-        if not df_group.empty:
-            df_mod = pd.concat([df_mod, df_group], axis=0, ignore_index=True)
+        # Early exit
+        if df.empty:
+            print("Done")
+            return pd.DataFrame(columns=df.columns)
+
+        # Run-length group ids: a new group starts wherever item or designator differs from the previous row
+        item = df[itemHdr].to_numpy(dtype=object)
+        designator = df[designatorHdr].to_numpy(dtype=object)
+        group_start = np.ones(len(df), dtype=bool)
+        group_start[1:] = ~((item[1:] == item[:-1]) & (designator[1:] == designator[:-1]))
+        group_id = np.cumsum(group_start) - 1
+
+        # After a group's first row, qty == 0 rows are alternatives (appended below) and any other row is a
+        # primary (inserted at the top), so later primaries end up above earlier ones
+        positions = np.arange(len(df))
+        alternative = (df[qtyHdr].to_numpy(dtype=object) == 0) & ~group_start
+        primary = ~alternative & ~group_start
+
+        # Row order per group: primaries (latest first), the first row, then alternatives in original order
+        section = np.where(primary, 0, np.where(group_start, 1, 2))
+        row_order = np.lexsort((np.where(primary, -positions, positions), section, group_id))
+
+        # Object columns, like the row-by-row concatenation this replaces
+        df_mod = df.iloc[row_order].astype(object).reset_index(drop=True)
+
+        # Each primary inserted at the top swapped [pkg, item, component] with the row below it, which carries
+        # the first row's values up to the top and shifts every primary's values down one place
+        if primary.any():
+            cols_to_swap = [pkgHdr, itemHdr, componentHdr]
+            swap_section = np.where(group_start, 0, np.where(primary, 1, 2))
+            swap_order = np.lexsort((np.where(primary, -positions, positions), swap_section, group_id))
+            df_mod[cols_to_swap] = df[cols_to_swap].iloc[swap_order].to_numpy()
 
         # User interface message
         print("Done")
@@ -819,8 +859,9 @@ def merge_alternative(df_in):
       - Allow CBOM v3.0 (primary + alternatives on separate rows) to appear like CBOM v2.0 (single row),
         by merging alternative-row values into the primary row. A later step can split them back.
 
-    Grouping keys: (itemHdr, designatorHdr).
-    Merged columns: descriptionHdr, manufacturerHdr, partNoHdr.
+    Grouping keys: (itemHdr, designatorHdr); a group is a run of adjacent rows with equal keys.
+    Merged columns: descriptionHdr, manufacturerHdr, partNoHdr. A blank alternative value falls back to the primary's value.
+    All other columns keep the primary row's values.
     """
 
     # message
@@ -832,63 +873,38 @@ def merge_alternative(df_in):
         print("Number of rows in the BOM changed from 0 to 0")
         return df_in.copy()
 
-
-    # Initialize variables to store previous primary item values
-    prev_desc = ''
-    prev_mfg = ''
-    prev_pn = ''
-
-    # Create an empty data frame with same header
-    df_out = pd.DataFrame(columns=df_in.columns)
-    df_group = pd.DataFrame(columns=df_in.columns)
-
-    # read each row on at a time
-    for idx, row in df_in.iterrows():
-
-        # Convert current row label -> position
-        n_row = (df_in.index.get_loc(idx))
-
-        # for first physical row → start a new group
-        if n_row == 0:
-            df_group = row.copy()
-            prev_desc = row[descriptionHdr]
-            prev_mfg = row[manufacturerHdr]
-            prev_pn = row[partNoHdr]
-            continue  # no need to do anything else
-
-        # Previous row label (by sequence, not label math)
-        prev_idx = df_in.index[n_row - 1]  # get previous row index label
-
-        # Detect group change by label
-        group_change = not (
-                df_in.loc[idx, itemHdr] == df_in.loc[prev_idx, itemHdr] and
-                df_in.loc[idx, designatorHdr] == df_in.loc[prev_idx, designatorHdr]
-        )
-
-        if group_change:
-            # add group to output
-            df_out = pd.concat([df_out, pd.DataFrame(df_group).T], axis=0, ignore_index=True)
-            df_group = row.copy()
-            prev_desc = row[descriptionHdr]
-            prev_mfg = row[manufacturerHdr]
-            prev_pn = row[partNoHdr]
-        else:
-            if row[descriptionHdr]:
-                df_group[descriptionHdr] += "\n" + row[descriptionHdr]
-            else:
-                df_group[descriptionHdr] += "\n" + prev_desc
-            if row[manufacturerHdr]:
-                df_group[manufacturerHdr] += "\n" + row[manufacturerHdr]
-            else:
-                df_group[manufacturerHdr] += "\n" + prev_mfg
-
-            if row[partNoHdr]:
-                df_group[partNoHdr] += "\n" + row[partNoHdr]
-            else:
-                df_group[partNoHdr] += "\n" + prev_pn
-
-    # last row merger needs to be done outside the for loop
-    df_out = pd.concat([df_out, pd.DataFrame(df_group).T], axis=0, ignore_index=True)
+    # Run-length group ids: a new group starts wherever item or designator differs from the previous row
+    item = df_in[itemHdr].to_numpy(dtype=object)
+    designator = df_in[designatorHdr].to_numpy(dtype=object)
+    group_start = np.ones(len(df_in), dtype=bool)
+    group_start[1:] = ~((item[1:] == item[:-1]) & (designator[1:] == designator[:-1]))
+    group_id = np.cumsum(group_start) - 1
+
+    # Position of each row's primary (the first row of its group)
+    positions = np.arange(len(df_in))
+    primary_pos = np.maximum.accumulate(np.where(group_start, positions, 0))
+
+    # Only groups with alternatives are joined; rows of single-row groups are left untouched
+    in_joined_group = np.bincount(group_id)[group_id] > 1
+    alternative = in_joined_group & ~group_start
+
+    # Blank alternatives fall back to the primary's value; alternatives get the "\n" delimiter prepended,
+    # so a single string-sum aggregation per group yields the joined text for all merged columns
+    merged_hdrs = [descriptionHdr, manufacturerHdr, partNoHdr]
+    merged = {}
+    for hdr in merged_hdrs:
+        values = df_in[hdr].to_numpy(dtype=object)
+        pieces = values.copy()
+        alt_values = values[alternative]
+        filled = np.where(alt_values.astype(bool), alt_values, values[primary_pos[alternative]])
+        pieces[alternative] = "\n" + filled
+        merged[hdr] = pieces[in_joined_group]
+    joined = pd.DataFrame(merged).groupby(group_id[in_joined_group], sort=False).sum()
+
+    # Primary rows carry every column that is not merged, and the joined text of groups with alternatives
+    df_out = df_in.iloc[group_start.nonzero()[0]].astype(object).reset_index(drop=True)
+    for hdr in merged_hdrs:
+        df_out.loc[joined.index, hdr] = joined[hdr].to_numpy(dtype=object)
 
     # user interface message
     print(f"Number of row in the BOM changed from {df_in.shape[0]} to {df_out.shape[0]}")
@@ -918,12 +934,12 @@ def merge_type_data_with_description(df: pd.DataFrame, bom_template_version: Bom
     return df
 
 
-def select_build(df: pd.DataFrame) -> pd.DataFrame:
+def select_build(df: pd.DataFrame, build_name: str | None = None) -> pd.DataFrame:
     # get all the build names for which data is available in the dataframe
     build_dict = rows.get_build_name_and_column(df)
 
     # delete column when it has unwanted build data
-    df = columns.delete_columns_with_unwanted_build_data(df, build_dict)
+    df = columns.delete_columns_with_unwanted_build_data(df, build_dict, build_name)
 
     return df
 
@@ -963,113 +979,128 @@ def get_bom_columns(df: pd.DataFrame, source_bom_header: list[str]) -> pd.DataFr
     return mdf
 
 
-def cleanup_description(df: pd.DataFrame) -> pd.DataFrame:
-    # user interface message
-    print()
-    print('Cleaning up description column data... ')
+# Column cleaners below apply their whole substitution chain to each distinct cell in one pass over the column.
+# Single character substitutions use a translation table, the rest one alternation regex whose callback
+# dispatches on the matched text. Each cleaner produces exactly the result of applying its chain step by step.
 
-    # remove duplicate spaces
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r'[^\S\r\n]+', ' ', regex=True)
+# Every character matched by '\s' (i.e., str.isspace)
+_WHITESPACE_CHARS = ('\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0        '
+                     '        　')
 
-    # special 'characters' cases...
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r'[，]', ',', regex=True)
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r'[（]', '(', regex=True)
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r'[）]', ')', regex=True)
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r'[；]', ';', regex=True)
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r'[：]', ':', regex=True)
+# Description: Chinese punctuation to ASCII, and semicolon separated data to comma separated
+_DESCRIPTION_TABLE = str.maketrans({'，': ',', '（': '(', '）': ')', '；': ',', '：': ':', ';': ','})
+# Runs of spaces and commas that change: two or more characters, or a single non-space whitespace
+_DESCRIPTION_RUN_REGEX = re.compile(r'(?:[^\S\r\n]|,){2,}|[^\S\r\n ]')
+_HORIZONTAL_WHITESPACE_REGEX = re.compile(r'[^\S\r\n]+')
 
-    # sometimes data is semi-colon separated
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r'[;]', ',', regex=True)
+# Manufacturer: 'MANUFACTURER', 'MANU' or 'MFG' prefix, case-insensitive
+_MANUFACTURER_PREFIX_REGEX = re.compile(r'(?i)^(?:MANUFACTURER|MANU|MFG)')
+_MANUFACTURER_TABLE = str.maketrans({':': ' ', '.': ' '})
+# A run of ASCII and Chinese commas and the character before it (e.g., "Co.,Ltd")
+_MANUFACTURER_COMMA_REGEX = re.compile(r'[^\n]?[,，]+')
+# Duplicate spaces, and line breaks and duplicate commas that become a single comma
+_MANUFACTURER_SEPARATOR_REGEX = re.compile(r' {2,}|[,\n]{2,}|\n')
 
-    # multiple comma, space before and after a comma are replaced by just a comma
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r',{2,}', ',', regex=True)
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r' ,', ',', regex=True)
-    df[descriptionHdr] = df[descriptionHdr].str.replace(r', ', ',', regex=True)
+# Part number: duplicate spaces, and line breaks that become a comma
+_PART_NUMBER_SEPARATOR_REGEX = re.compile(r' {2,}|\n')
 
-    # remove starting and trailing comma
-    df[descriptionHdr] = df[descriptionHdr].str.lstrip(',')
-    df[descriptionHdr] = df[descriptionHdr].str.rstrip(',')
+# Designator: whitespace removed and separators replaced by comma
+_DESIGNATOR_TABLE = str.maketrans({**dict.fromkeys(_WHITESPACE_CHARS), **dict.fromkeys(':;、\'，', ',')})
+_DUPLICATE_COMMA_REGEX = re.compile(r',{2,}')
 
-    # remove starting and trailing space
-    df[descriptionHdr] = df[descriptionHdr].str.lstrip(' ')
-    df[descriptionHdr] = df[descriptionHdr].str.rstrip(' ')
 
-    print('Done.')
-
-    return df
-
-
-def cleanup_designators(df: pd.DataFrame) -> pd.DataFrame:
-    # user interface message
-    print()
-    print('Cleaning up designator column data... ')
-
-    # remove spaces
-    df[designatorHdr] = df[designatorHdr].str.replace(r'\s+', '', regex=True)
-
-    # replace special characters used to separate designators by comma
-    df[designatorHdr] = df[designatorHdr].str.replace(r'[:;、\'，]', ',', regex=True)
-
-    # replace duplicate commas by one comma
-    df[designatorHdr] = df[designatorHdr].str.replace(r',{2,}', ',', regex=True)
+@lru_cache(maxsize=1024)
+def _clean_description_run(run: str) -> str:
+    """
+    Apply the space and comma steps of the description chain to a run of whitespace and commas.
+    """
+    run = _HORIZONTAL_WHITESPACE_REGEX.sub(' ', run)
+    run = _DUPLICATE_COMMA_REGEX.sub(',', run)
+    return run.replace(' ,', ',').replace(', ', ',')
 
-    # remove starting and trailing comma
-    df[designatorHdr] = df[designatorHdr].str.lstrip(',')
-    df[designatorHdr] = df[designatorHdr].str.rstrip(',')
 
-    print('Done.')
+@lru_cache(maxsize=1024)
+def _clean_manufacturer_commas(segment: str) -> str:
+    """
+    Apply the ".," then ".，" replacements of the manufacturer chain to a comma run and its preceding character.
+    """
+    return re.sub(r'.，', ' ', re.sub(r'.,', ' ', segment))
 
-    return df
 
+def clean_description_text(text: str) -> str:
+    """
+    Clean one description cell in a single pass, equivalent to:
+    - remove duplicate spaces
+    - replace Chinese punctuation, and semicolons by comma as sometimes data is semi-colon separated
+    - multiple comma, space before and after a comma are replaced by just a comma
+    - remove starting and trailing comma, then starting and trailing space
+    """
+    text = _DESCRIPTION_RUN_REGEX.sub(lambda match: _clean_description_run(match.group()), text.translate(_DESCRIPTION_TABLE))
+    return text.strip(',').strip(' ')
 
-def cleanup_manufacturer(df: pd.DataFrame) -> pd.DataFrame:
-    # user interface message
-    print()
-    print('Cleaning up manufacturer column data... ')
 
-    # special case when start is with MFG or Manufacturer case-insensitive
-    df[manufacturerHdr] = df[manufacturerHdr].str.replace(r'(?i)^MANUFACTURER', ' ', regex=True)
-    df[manufacturerHdr] = df[manufacturerHdr].str.replace(r'(?i)^MANU', ' ', regex=True)
-    df[manufacturerHdr] = df[manufacturerHdr].str.replace(r'(?i)^MFG', ' ', regex=True)
+def clean_manufacturer_text(text: str) -> str:
+    """
+    Clean one manufacturer cell in a single pass, equivalent to:
+    - special case when start is with MFG or Manufacturer case-insensitive
+    - replace ".," with space. Special case for "Co.,Ltd" to "Co Ltd"
+    - replace colon and dot with space
+    - remove starting and trailing space
+    - elements are comma separated, so line breaks become commas
+    - remove duplicate spaces and replace duplicate commas by one comma
+    """
+    text = _MANUFACTURER_PREFIX_REGEX.sub(' ', text, count=1).translate(_MANUFACTURER_TABLE)
+    text = _MANUFACTURER_COMMA_REGEX.sub(lambda match: _clean_manufacturer_commas(match.group()), text).strip(' ')
+    return _MANUFACTURER_SEPARATOR_REGEX.sub(lambda match: ' ' if match.group()[0] == ' ' else ',', text)
 
-    # replace ".," with space. Special case for "Co.,Ltd" to "Co Ltd"
-    df[manufacturerHdr] = df[manufacturerHdr].str.replace(r'.,', ' ', regex=True)
-    df[manufacturerHdr] = df[manufacturerHdr].str.replace(r'.，', ' ', regex=True)
 
-    # replace colon and dot with space
-    df[manufacturerHdr] = df[manufacturerHdr].str.replace(r'[:.]', ' ', regex=True)
+def clean_designator_text(text: str) -> str:
+    """
+    Clean one designator cell in a single pass, equivalent to:
+    - remove spaces
+    - replace special characters used to separate designators by comma
+    - replace duplicate commas by one comma
+    - remove starting and trailing comma
+    """
+    return _DUPLICATE_COMMA_REGEX.sub(',', text.translate(_DESIGNATOR_TABLE)).strip(',')
 
-    # remove starting and trailing space
-    df[manufacturerHdr] = df[manufacturerHdr].str.lstrip(' ')
-    df[manufacturerHdr] = df[manufacturerHdr].str.rstrip(' ')
 
-    # elements are comma separated
-    df[manufacturerHdr] = df[manufacturerHdr].str.replace(r'\n', ',', regex=True)
+def clean_part_number_text(text: str) -> str:
+    """
+    Clean one part number cell in a single pass, equivalent to:
+    - remove duplicate spaces
+    - elements are comma separated, so line breaks become commas
+    """
+    return _PART_NUMBER_SEPARATOR_REGEX.sub(lambda match: ',' if match.group() == '\n' else ' ', text)
 
-    # remove duplicate spaces
-    df[manufacturerHdr] = df[manufacturerHdr].str.replace(r' {2,}', ' ', regex=True)
-    # replace duplicate commas by one comma
-    df[manufacturerHdr] = df[manufacturerHdr].str.replace(r',{2,}', ',', regex=True)
 
-    print('Done.')
+def clean_text_column(column: pd.Series, clean_cell) -> pd.Series:
+    """
+    Apply a text cleaner to every distinct text value of a column and map the results back in one pass.
 
-    return df
+    Missing values are kept and other non-text values become NaN, as with the pandas string methods.
 
+    Args:
+        column (pd.Series): Column to clean.
+        clean_cell (Callable[[str], str]): Cleaner applied to each distinct text value.
 
-def cleanup_part_number(df: pd.DataFrame) -> pd.DataFrame:
-    # user interface message
-    print()
-    print('Cleaning up part number column data... ')
+    Returns:
+        pd.Series: The cleaned column.
 
-    # remove duplicate spaces
-    df[partNoHdr] = df[partNoHdr].str.replace(r' {2,}', ' ', regex=True)
+    Raises:
+        AttributeError: If the column dtype does not hold text, as with the pandas string methods.
+    """
+    _ = column.str  # validate the column like the chained string methods did
 
-    # elements are comma separated
-    df[partNoHdr] = df[partNoHdr].str.replace(r'\n', ',', regex=True)
+    # BOM columns repeat values (e.g., manufacturers), so each distinct text is cleaned once
+    cleaned = {value: clean_cell(value) for value in column.unique() if isinstance(value, str)}
 
-    print('Done.')
+    def lookup(value):
+        if isinstance(value, str):
+            return cleaned[value]
+        return value if pd.isna(value) else np.nan
 
-    return df
+    return column.map(lookup)
 
 
 def drop_unwanted_db_ebom_description(df: pd.DataFrame) -> pd.DataFrame:
@@ -18,7 +18,7 @@ Example Usage:
 Dependencies:
     - Python >= 3.10
     - Standard Library: typing
-    - External Packages: pandas
+    - External Packages: pandas (type hints only)
 
 Notes:
     - This module is intended for internal use within the importers layer, sitting between controllers and src.utils.excel_io.
@@ -29,13 +29,18 @@ License:
     - Internal Use Only
 """
 
+from __future__ import annotations  # Keeps pandas type hints from importing pandas
+
 __all__ = []  # Internal-only; not part of public API. Star imports from this module export nothing.
 
-import pandas as pd
+from typing import TYPE_CHECKING
 
 from src.utils import file_path
 from src.utils import excel_io
 
+if TYPE_CHECKING:  # pandas is only referenced in type hints; excel_io imports it on first read
+    import pandas as pd
+
 # Module Constants
 EXCEL_FILE_TYPES = (excel_io.EXCEL_FILE_TYPE,)
 
@@ -10,6 +10,7 @@ Example Usage:
     # Direct module usage (acceptable in unit tests or internal scripts only):
     from src.lookups import _component_type_lookup as ct
     table = ct.get_component_type_lookup_table()
+    view = ct.get_component_type_lookup_view()
 
 Dependencies:
     - Python >= 3.10
@@ -18,8 +19,9 @@ Dependencies:
 
 Notes:
     - Internal-only module; not part of the public lookup API surface.
-    - JSON resources are treated as immutable runtime data and cached once per process.
-    - Callers always receive a defensive copy to prevent accidental mutation.
+    - The resource is loaded once per process; afterwards the file size and modification time are checked at most every `_RELOAD_CHECK_INTERVAL_S` seconds and a changed file is reloaded in place, so long-lived processes pick up edited lookup data.
+    - `get_component_type_lookup_version` returns the payload SHA-256 of the loaded data; caches derived from the table store it and rebuild when it changes.
+    - `get_component_type_lookup_table` returns a defensive copy; `get_component_type_lookup_view` returns a shared frozen view (variant lists become tuples) without copying.
     - Intended for parsers, fixers, and validators requiring stable component type mappings.
 
 License:
@@ -27,7 +29,7 @@ License:
 """
 __all__ = []  # Internal-only; not part of public API. Star import from this module gets nothing.
 
-from typing import Final, Any
+from typing import Final, Any, Mapping
 
 from src.common import CacheReadOnly
 from src.utils import folder_path
@@ -39,20 +41,20 @@ COMPONENT_TYPE_FOLDER_PARTS: Final[tuple[str, ...]] = ("src", "resources", "look
 COMPONENT_TYPE_RESOURCE_NAME: Final[str] = "component_type"
 # Define required schema keys for settings validation
 _REQUIRED_KEYS: Final[tuple[str, ...]] = ()
+# Minimum seconds between checks of the resource file for changes
+_RELOAD_CHECK_INTERVAL_S: Final[float] = 1.0
 
 # MODULE VARIABLES
 # Lazily initialized cache for the shared application settings instance.
 _cache: CacheReadOnly | None = None
 
 
-def get_component_type_lookup_table() -> dict[str, Any]:
+def _get_cache() -> CacheReadOnly:
     """
-    Return a defensive copy of the component type lookup table.
-
-    The lookup table is loaded lazily from the runtime resources directory and cached for the lifetime of the process. The returned dictionary is a copy to prevent mutation of shared state.
+    Return the component type lookup cache, loading it on first access and reloading it when the resource file changed.
 
     Returns:
-        dict[str, Any]: Component type lookup mapping.
+        CacheReadOnly: Validated cache of the lookup resource.
 
     Raises:
         RuntimeError: If the lookup resource cannot be loaded or validated.
@@ -77,5 +79,52 @@ def get_component_type_lookup_table() -> dict[str, Any]:
                 f"\n{exc}"
             ) from exc
 
+    # Afterwards, stat the resource file at most once per interval to pick up edits
+    else:
+        _cache.reload_if_due(_RELOAD_CHECK_INTERVAL_S)
+
+    return _cache
+
+
+def get_component_type_lookup_table() -> dict[str, Any]:
+    """
+    Return a defensive copy of the component type lookup table.
+
+    The lookup table is loaded lazily from the runtime resources directory and reloaded when the resource file changes. The returned dictionary is a copy to prevent mutation of shared state.
+
+    Returns:
+        dict[str, Any]: Component type lookup mapping.
+
+    Raises:
+        RuntimeError: If the lookup resource cannot be loaded or validated.
+    """
     # Always return a defensive copy to prevent shared-state mutation
-    return _cache.get_data_map_copy()
+    return _get_cache().get_data_map_copy()
+
+
+def get_component_type_lookup_view() -> Mapping[str, Any]:
+    """
+    Return a frozen, shared view of the component type lookup table.
+
+    The view is read-only (variant lists are tuples) and is built once, so access cost does not grow with the table size.
+
+    Returns:
+        Mapping[str, Any]: Read-only component type lookup mapping.
+
+    Raises:
+        RuntimeError: If the lookup resource cannot be loaded or validated.
+    """
+    return _get_cache().get_data_map_view()
+
+
+def get_component_type_lookup_version() -> str:
+    """
+    Return the version stamp of the loaded component type lookup table.
+
+    Returns:
+        str: Payload SHA-256 of the lookup data; changes whenever the table is reloaded with different content.
+
+    Raises:
+        RuntimeError: If the lookup resource cannot be loaded or validated.
+    """
+    return _get_cache().get_version()
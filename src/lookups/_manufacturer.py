@@ -0,0 +1,124 @@
+"""
+Manufacturer alias lookup loader for BOM normalization.
+
+This module provides read-only access to the manufacturer alias JSON resource used to canonicalize manufacturer names (e.g., "AVX Corporation" -> "AVX") during BOM correction. It lazily loads the lookup table from runtime resources, validates integrity via a read-only cache, and returns either a defensive copy or a shared frozen view.
+
+Example Usage:
+    # Preferred usage via public package interface:
+    # Not applicable; this is an internal module.
+
+    # Direct module usage (acceptable in unit tests or internal scripts only):
+    from src.lookups import _manufacturer as mfg
+    view = mfg.get_manufacturer_lookup_view()
+
+Dependencies:
+    - Python >= 3.10
+    - Standard Library: typing
+    - Internal Packages: src.common.CacheReadOnly, src.utils.folder_path
+
+Notes:
+    - Internal-only module; not part of the public lookup API surface.
+    - Payload maps each canonical manufacturer name to a list of aliases; the canonical name is implicitly its own alias.
+    - The resource is loaded once per process; afterwards the file size and modification time are checked at most every `_RELOAD_CHECK_INTERVAL_S` seconds and a changed file is reloaded in place, so long-lived processes pick up edited lookup data.
+    - `get_manufacturer_lookup_version` returns the payload SHA-256 of the loaded data; caches derived from the table store it and rebuild when it changes.
+
+License:
+    - Internal Use Only
+"""
+__all__ = []  # Internal-only; not part of public API. Star import from this module gets nothing.
+
+from typing import Final, Any, Mapping
+
+from src.common import CacheReadOnly
+from src.utils import folder_path
+
+# MODULE CONSTANTS
+# Where the JSON resource resides in the project
+MANUFACTURER_FOLDER_PARTS: Final[tuple[str, ...]] = ("src", "resources", "lookups",)
+# Name of the JSON resource file
+MANUFACTURER_RESOURCE_NAME: Final[str] = "manufacturer"
+# Define required schema keys for settings validation
+_REQUIRED_KEYS: Final[tuple[str, ...]] = ()
+# Minimum seconds between checks of the resource file for changes
+_RELOAD_CHECK_INTERVAL_S: Final[float] = 1.0
+
+# MODULE VARIABLES
+# Lazily initialized cache for the manufacturer alias resource.
+_cache: CacheReadOnly | None = None
+
+
+def _get_cache() -> CacheReadOnly:
+    """
+    Return the manufacturer lookup cache, loading it on first access and reloading it when the resource file changed.
+
+    Returns:
+        CacheReadOnly: Validated cache of the lookup resource.
+
+    Raises:
+        RuntimeError: If the lookup resource cannot be loaded or validated.
+    """
+    global _cache
+
+    # Lazily initialize the cache on first access
+    if _cache is None:
+        resource_folder = folder_path.construct_folder_path(
+            base_path=folder_path.resolve_project_folder(),
+            subfolders=MANUFACTURER_FOLDER_PARTS
+        )
+        try:
+            _cache = CacheReadOnly(
+                resource_folder=resource_folder,
+                resource_name=MANUFACTURER_RESOURCE_NAME,
+                required_keys=_REQUIRED_KEYS,
+            )
+        except Exception as exc:
+            raise RuntimeError(
+                f"Failed to load manufacturer lookup '{MANUFACTURER_RESOURCE_NAME}' from resource folder '{resource_folder}'."
+                f"\n{exc}"
+            ) from exc
+
+    # Afterwards, stat the resource file at most once per interval to pick up edits
+    else:
+        _cache.reload_if_due(_RELOAD_CHECK_INTERVAL_S)
+
+    return _cache
+
+
+def get_manufacturer_lookup_table() -> dict[str, Any]:
+    """
+    Return a defensive copy of the manufacturer alias lookup table.
+
+    Returns:
+        dict[str, Any]: Canonical manufacturer name -> list of aliases.
+
+    Raises:
+        RuntimeError: If the lookup resource cannot be loaded or validated.
+    """
+    # Always return a defensive copy to prevent shared-state mutation
+    return _get_cache().get_data_map_copy()
+
+
+def get_manufacturer_lookup_view() -> Mapping[str, Any]:
+    """
+    Return a frozen, shared view of the manufacturer alias lookup table.
+
+    Returns:
+        Mapping[str, Any]: Read-only canonical manufacturer name -> tuple of aliases.
+
+    Raises:
+        RuntimeError: If the lookup resource cannot be loaded or validated.
+    """
+    return _get_cache().get_data_map_view()
+
+
+def get_manufacturer_lookup_version() -> str:
+    """
+    Return the version stamp of the loaded manufacturer lookup table.
+
+    Returns:
+        str: Payload SHA-256 of the lookup data; changes whenever the table is reloaded with different content.
+
+    Raises:
+        RuntimeError: If the lookup resource cannot be loaded or validated.
+    """
+    return _get_cache().get_version()
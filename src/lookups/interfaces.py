@@ -7,6 +7,9 @@ Example Usage:
     # Preferred usage via public package interface:
     from src.lookups import interfaces as lookup
     table = lookup.get_component_type_lookup_table()
+    view = lookup.get_component_type_lookup_view()
+    aliases = lookup.get_manufacturer_lookup_view()
+    version = lookup.get_manufacturer_lookup_version()  # Changes when the table is reloaded
 
     # Direct imports of private modules (acceptable only in unit tests):
     # Not applicable. Use public package interface.
@@ -14,10 +17,11 @@ Example Usage:
 Dependencies:
     - Python >= 3.10
     - Standard Library: typing
-    - Internal Modules: src.lookups._component_type
+    - Internal Modules: src.lookups._component_type, src.lookups._manufacturer
 
 Notes:
     - Acts as the sole public access point for lookup resources.
+    - Lookup tables are reloaded in place when their resource file changes; caches derived from a table should compare its version stamp before reuse.
 
 License:
     - Internal Use Only
@@ -28,10 +32,27 @@ from ._component_type import (
     COMPONENT_TYPE_FOLDER_PARTS,
     COMPONENT_TYPE_RESOURCE_NAME,
     get_component_type_lookup_table,
+    get_component_type_lookup_version,
+    get_component_type_lookup_view,
+)
+# noinspection PyProtectedMember
+from ._manufacturer import (
+    MANUFACTURER_FOLDER_PARTS,
+    MANUFACTURER_RESOURCE_NAME,
+    get_manufacturer_lookup_table,
+    get_manufacturer_lookup_version,
+    get_manufacturer_lookup_view,
 )
 
 __all__ = [
     "COMPONENT_TYPE_FOLDER_PARTS",
     "COMPONENT_TYPE_RESOURCE_NAME",
     "get_component_type_lookup_table",
+    "get_component_type_lookup_version",
+    "get_component_type_lookup_view",
+    "MANUFACTURER_FOLDER_PARTS",
+    "MANUFACTURER_RESOURCE_NAME",
+    "get_manufacturer_lookup_table",
+    "get_manufacturer_lookup_version",
+    "get_manufacturer_lookup_view",
 ]
\ No newline at end of file
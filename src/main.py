@@ -10,7 +10,6 @@ Usage:
       to select one of the available options for processing the BOMs.
 """
 
-import application
 import console
 import version
 
@@ -39,6 +38,8 @@ def run_menu() -> bool:
         header_msg = 'main menu'
         select_msg = 'Enter the number of the menu option to execute'
         user_selection = console.get_user_selection(menu_options, header_msg=header_msg, select_msg=select_msg)
+        # import the processing sequences on first use; they pull in pandas, which would delay the menu
+        import application
         # run user selection
         if user_selection == 0:
             application.sequence_cbom_for_cost_walk()
@@ -21,7 +21,7 @@ Example Usage:
 
 Dependencies:
  - Python >= 3.10
- - pandas
+ - pandas (type hints only)
  - src.utils.text_sanitizer
 
 Notes:
@@ -33,12 +33,15 @@ License:
  - Internal Use Only
 """
 
-from typing import Final
+from __future__ import annotations  # Keeps pandas type hints from importing pandas
 
-import pandas as pd
+from typing import Final, TYPE_CHECKING
 
 from src.utils import sanitizer
 
+if TYPE_CHECKING:  # pandas is only referenced in type hints; the caller already holds the DataFrames
+    import pandas as pd
+
 # Module constants
 ROW_INDEX_NOT_FOUND: Final = -1  # Valid dataframe row number be will zero or higher. So pick something that is invalid
 LIST_INDEX_NOT_FOUND: Final = -1  # Valid list number be will zero or higher. So pick something that is invalid
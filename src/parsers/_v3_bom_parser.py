@@ -21,7 +21,7 @@ Example Usage:
 
 Dependencies:
  - Python >= 3.10
- - pandas
+ - pandas (type hints only)
  - src.models.interfaces: Bom, Board, Header, Row
  - src.parsers._common: utility functions for flattening, extraction, and normalization
 
@@ -35,11 +35,16 @@ License:
  - Internal Use Only
 """
 
-import pandas as pd
+from __future__ import annotations  # Keeps pandas type hints from importing pandas
+
+from typing import TYPE_CHECKING
 
 import src.parsers._common as common
 from src.models.interfaces import *
 
+if TYPE_CHECKING:  # pandas is only referenced in type hints; the caller already holds the DataFrames
+    import pandas as pd
+
 
 def _is_cost_bom(boards: list[Board]) -> bool:
     """
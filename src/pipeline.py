@@ -0,0 +1,352 @@
+"""
+Stage pipeline for the BOM processing sequences.
+
+A sequence is declared as a list of stages that are run in order on one DataFrame. The runner times each stage,
+merges adjacent column-only stages into a single pass, drops columns no later stage or the output needs, can save
+and resume from intermediate frames, and can run without console output for batch use.
+
+Saved frames sit next to a run manifest recording the stage list, the last completed stage and the context values
+that identify the run (e.g., sequence and source file fingerprint); a resume is refused when they do not match.
+
+Usage:
+    stages = [frame_stage('delete empty rows', lambda df, context: frames.delete_empty_rows(df)),
+              column_stage('clean up description', frames.descriptionHdr, frames.clean_description_text)]
+    result = run_pipeline(stages, df, {'output_header': [...]}, quiet=True)
+    result.frame, result.timings
+"""
+
+import contextlib
+import io
+import json
+import os
+import re
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+import pandas as pd
+
+import frames
+
+MANIFEST_FILE_NAME = 'manifest.json'
+# checkpoint file names start with the stage index, see checkpoint_path
+_CHECKPOINT_FILE_PATTERN = re.compile(r'(\d+)_.*\.pkl')
+
+
+@dataclass(frozen=True)
+class Stage:
+    """
+    One step of a pipeline.
+
+    Attributes:
+        name (str): Name shown in progress messages and used to resume a run.
+        run (Callable[[pd.DataFrame, dict], pd.DataFrame | None]): Step function; returning None keeps the frame.
+        reads (frozenset[str] | None): Columns the result depends on; None when it depends on every column,
+            which stops columns from being dropped before this stage.
+        cleaners (tuple[tuple[str, Callable[[str], str]], ...]): Column and text cleaner of a column-only stage.
+        members (tuple[str, ...]): Names of the declared stages merged into a fused stage.
+    """
+    name: str
+    run: Callable[[pd.DataFrame, dict], pd.DataFrame | None]
+    reads: frozenset[str] | None = None
+    cleaners: tuple[tuple[str, Callable[[str], str]], ...] = ()
+    members: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class StageTiming:
+    """
+    Duration and frame size after a stage.
+    """
+    name: str
+    seconds: float
+    rows: int
+    columns: int
+
+
+@dataclass
+class PipelineResult:
+    """
+    Final frame, context and per-stage timings of a pipeline run.
+    """
+    frame: pd.DataFrame | None
+    context: dict
+    timings: list[StageTiming] = field(default_factory=list)
+
+
+def frame_stage(name: str, func: Callable[[pd.DataFrame, dict], pd.DataFrame | None],
+                reads: set[str] | None = None) -> Stage:
+    """
+    Declare a stage that transforms, checks or consumes the whole frame.
+
+    Args:
+        name (str): Stage name.
+        func (Callable[[pd.DataFrame, dict], pd.DataFrame | None]): Called with the frame and the context.
+        reads (set[str] | None): Columns the stage depends on; None when it depends on every column.
+
+    Returns:
+        Stage: The stage.
+    """
+    return Stage(name=name, run=func, reads=None if reads is None else frozenset(reads))
+
+
+def column_stage(name: str, column: str, clean_text: Callable[[str], str]) -> Stage:
+    """
+    Declare a stage that cleans the text of a single column; adjacent column stages are run as one pass.
+
+    Args:
+        name (str): Stage name.
+        column (str): Header of the column to clean.
+        clean_text (Callable[[str], str]): Cleaner applied to each text cell.
+
+    Returns:
+        Stage: The stage.
+    """
+    cleaners = ((column, clean_text),)
+    return Stage(name=name, run=lambda df, context: _clean_columns(df, cleaners),
+                 reads=frozenset({column}), cleaners=cleaners)
+
+
+def _clean_columns(df: pd.DataFrame, cleaners: tuple[tuple[str, Callable[[str], str]], ...]) -> pd.DataFrame:
+    """
+    Apply the cleaners in order with one pass per column.
+    """
+    composed: dict[str, list[Callable[[str], str]]] = {}
+    for column, clean_text in cleaners:
+        composed.setdefault(column, []).append(clean_text)
+
+    for column, chain in composed.items():
+        def clean(text, chain=chain):
+            for clean_text in chain:
+                text = clean_text(text)
+            return text
+        df[column] = frames.clean_text_column(df[column], clean)
+    return df
+
+
+def fuse_column_stages(stages: list[Stage]) -> list[Stage]:
+    """
+    Merge runs of adjacent column-only stages into single stages.
+
+    Args:
+        stages (list[Stage]): Declared stages.
+
+    Returns:
+        list[Stage]: Stages with every run of column stages replaced by one stage named after its members.
+    """
+    fused: list[Stage] = []
+    for stage in stages:
+        previous = fused[-1] if fused else None
+        if stage.cleaners and previous is not None and previous.cleaners:
+            cleaners = previous.cleaners + stage.cleaners
+            fused[-1] = Stage(name=f'{previous.name} + {stage.name}',
+                              run=lambda df, context, cleaners=cleaners: _clean_columns(df, cleaners),
+                              reads=previous.reads | stage.reads, cleaners=cleaners,
+                              members=(previous.members or (previous.name,)) + (stage.name,))
+        else:
+            fused.append(stage)
+    return fused
+
+
+def checkpoint_path(checkpoint_dir: str, index: int, name: str) -> str:
+    """
+    Build the file path of the frame saved after a stage.
+
+    Args:
+        checkpoint_dir (str): Folder holding the checkpoints of one run.
+        index (int): Position of the stage in the (fused) stage list.
+        name (str): Stage name.
+
+    Returns:
+        str: Path of the checkpoint file.
+    """
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', name).strip('_').lower()
+    return os.path.join(checkpoint_dir, f'{index:02d}_{slug}.pkl')
+
+
+def _stage_index(stages: list[Stage], name: str) -> int:
+    """
+    Return the position of a stage by its name or, for a fused stage, by the name of one of its members.
+    """
+    for index, stage in enumerate(stages):
+        if name == stage.name or name in stage.members:
+            return index
+    raise ValueError(f"Unknown stage '{name}'. Stages are {[stage.name for stage in stages]}.")
+
+
+def _write_manifest(checkpoint_dir: str, names: list[str], last_completed: int, context: dict,
+                    manifest_keys: tuple[str, ...]) -> None:
+    """
+    Save the run manifest; it is replaced in one step so an interrupted write leaves the previous one.
+    """
+    manifest = {'stages': names,
+                'last_completed': last_completed,
+                'context': {key: context.get(key) for key in manifest_keys}}
+    path = os.path.join(checkpoint_dir, MANIFEST_FILE_NAME)
+    with open(path + '.tmp', 'w', encoding='utf-8') as file:
+        json.dump(manifest, file, indent=4)
+    os.replace(path + '.tmp', path)
+
+
+def _check_manifest(checkpoint_dir: str, names: list[str], start: int, context: dict,
+                    manifest_keys: tuple[str, ...]) -> None:
+    """
+    Refuse to resume from checkpoints saved by another stage list, an unfinished stage or a different run.
+    """
+    path = os.path.join(checkpoint_dir, MANIFEST_FILE_NAME)
+    if not os.path.exists(path):
+        raise FileNotFoundError(f"No run manifest found in '{checkpoint_dir}'.")
+    with open(path, encoding='utf-8') as file:
+        manifest = json.load(file)
+
+    if manifest['stages'] != names:
+        raise ValueError(f"Checkpoints in '{checkpoint_dir}' were saved by a different sequence of stages "
+                         f"{manifest['stages']}.")
+    last_completed = manifest['last_completed']
+    if last_completed < start - 1:
+        raise ValueError(f"Stage '{names[start - 1]}' did not complete in the saved run. "
+                         f"Resume from '{names[last_completed + 1]}' or an earlier stage.")
+
+    # values given for this run must match the ones the checkpoints were saved with
+    mismatches = [f"{key} {manifest['context'].get(key)!r} (given {context[key]!r})"
+                  for key in manifest_keys
+                  if context.get(key) is not None and context[key] != manifest['context'].get(key)]
+    if mismatches:
+        raise ValueError(f"Checkpoints in '{checkpoint_dir}' were saved for a different run: {', '.join(mismatches)}.")
+
+
+def _clear_checkpoints(checkpoint_dir: str, start: int) -> None:
+    """
+    Delete the checkpoints of stages from `start` on, which the new run replaces.
+    """
+    for file_name in os.listdir(checkpoint_dir):
+        match = _CHECKPOINT_FILE_PATTERN.fullmatch(file_name)
+        if match and int(match.group(1)) >= start:
+            os.remove(os.path.join(checkpoint_dir, file_name))
+
+
+def _unused_columns(df: pd.DataFrame, context: dict, remaining: list[Stage]) -> list[str] | None:
+    """
+    Return the columns neither the output header nor a remaining stage needs; None when nothing can be dropped yet.
+    """
+    output_header = context.get('output_header')
+    if output_header is None or df is None or any(stage.reads is None for stage in remaining):
+        return None
+
+    needed = set(output_header).union(*(stage.reads for stage in remaining))
+    unused = [column for column in df.columns if column not in needed]
+    return unused or None
+
+
+def run_pipeline(stages: list[Stage],
+                 df: pd.DataFrame | None = None,
+                 context: dict | None = None,
+                 *,
+                 quiet: bool = False,
+                 fuse: bool = True,
+                 prune: bool = True,
+                 checkpoint_dir: str | None = None,
+                 resume_from: str | None = None,
+                 manifest_keys: tuple[str, ...] = ()) -> PipelineResult:
+    """
+    Run stages in order on a frame.
+
+    Args:
+        stages (list[Stage]): Declared stages.
+        df (pd.DataFrame | None): Input frame; None when the first stage reads it.
+        context (dict | None): Values shared between stages (e.g., 'bom_temp_ver'). A stage setting
+            'output_header' enables dropping unused columns.
+        quiet (bool): Suppress all console output of the stages and the runner.
+        fuse (bool): Merge adjacent column-only stages.
+        prune (bool): Drop unused columns once the output header is known and no remaining stage needs every column.
+        checkpoint_dir (str | None): Save the frame and context after every stage to this folder. A new run deletes
+            the checkpoints of the stages it runs.
+        resume_from (str | None): Name of the stage to start from, using the checkpoint saved by the stage before it.
+            The name of a stage merged into a fused stage resumes from the fused stage.
+        manifest_keys (tuple[str, ...]): Context keys identifying the run (JSON values); they are saved in the
+            manifest and, when set for a resumed run, must match the saved ones.
+
+    Returns:
+        PipelineResult: Final frame, context and per-stage timings.
+
+    Raises:
+        ValueError: If `resume_from` is not a stage name, is given without a checkpoint folder, or the checkpoints
+            were saved by a different stage list, an unfinished stage or a different run.
+        FileNotFoundError: If the manifest or the checkpoint to resume from does not exist.
+    """
+    stages = fuse_column_stages(stages) if fuse else list(stages)
+    context = {} if context is None else context
+    names = [stage.name for stage in stages]
+
+    start = 0
+    saved_pruned = False
+    if resume_from is not None:
+        start = _stage_index(stages, resume_from)
+        if checkpoint_dir is None:
+            raise ValueError("A checkpoint folder is required to resume a pipeline.")
+        if start > 0:
+            _check_manifest(checkpoint_dir, names, start, context, manifest_keys)
+            saved = pd.read_pickle(checkpoint_path(checkpoint_dir, start - 1, names[start - 1]))
+            df = saved['frame']
+            saved_pruned = saved['pruned']
+            # values given for this run (e.g., headless) take precedence over the saved ones
+            for key, value in saved['context'].items():
+                if context.get(key) is None:
+                    context[key] = value
+
+    if checkpoint_dir is not None:
+        os.makedirs(checkpoint_dir, exist_ok=True)
+        _clear_checkpoints(checkpoint_dir, start)
+        _write_manifest(checkpoint_dir, names, start - 1, context, manifest_keys)
+
+    result = PipelineResult(frame=df, context=context)
+    output = io.StringIO() if quiet else None
+    # columns are dropped once; a resumed run keeps the columns the saved run had kept
+    pruned = not prune or saved_pruned
+
+    for index in range(start, len(stages)):
+        stage = stages[index]
+        with contextlib.redirect_stdout(output) if quiet else contextlib.nullcontext():
+            begin = time.perf_counter()
+            if not pruned:
+                # only `df` may refer to the pruned frame, as row filters return slices of it
+                unused = _unused_columns(df, context, stages[index:])
+                if unused is not None:
+                    print(f'Dropped unused columns {unused}')
+                    df = df.drop(columns=unused)
+                    pruned = True
+
+            updated = stage.run(df, context)
+            df = df if updated is None else updated
+            seconds = time.perf_counter() - begin
+
+        if output is not None:
+            output.seek(0)
+            output.truncate()
+
+        rows, columns = df.shape if df is not None else (0, 0)
+        result.timings.append(StageTiming(name=stage.name, seconds=seconds, rows=rows, columns=columns))
+
+        if checkpoint_dir is not None:
+            pd.to_pickle({'frame': df, 'context': context, 'pruned': pruned},
+                         checkpoint_path(checkpoint_dir, index, stage.name))
+            _write_manifest(checkpoint_dir, names, index, context, manifest_keys)
+
+    result.frame = df
+    if not quiet:
+        print_timings(result.timings)
+    return result
+
+
+def print_timings(timings: list[StageTiming]) -> None:
+    """
+    Print the per-stage timings of a run.
+
+    Args:
+        timings (list[StageTiming]): Timings returned by run_pipeline.
+    """
+    print()
+    print('Stage timings:')
+    for timing in timings:
+        print(f'{timing.seconds * 1000:10.1f} ms  {timing.rows:6} x {timing.columns:<3} {timing.name}')
+    print(f'{sum(timing.seconds for timing in timings) * 1000:10.1f} ms  total')
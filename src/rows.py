@@ -1,6 +1,7 @@
 import re
 
 import strings
+import numpy as np
 import pandas as pd
 
 
@@ -17,24 +18,17 @@ def delete_row_when_element_contains_string(original_df, header_index, reference
         pandas.DataFrame: Updated DataFrame with rows removed based on the specified criteria.
     """
 
-    # Create an empty DataFrame to store the updated rows
-    updated_df = pd.DataFrame(columns=original_df.columns)
+    # Nothing to match against: keep every row
+    if not reference_string_list or original_df.empty:
+        return original_df.reset_index(drop=True)
 
-    # Get one row at a time
-    for _, row in original_df.iterrows():
-        # Get string to check
-        string_to_check = row.iloc[header_index]
-        # Check if string to check is in the reference string list
-        match = False
-        for reference_string in reference_string_list:
-            # Compare in a case-insensitive manner
-            if reference_string.lower() in string_to_check.lower():
-                match = True
-        # only add row if the string to check is not in the reference string list
-        if not match:
-            updated_df.loc[len(updated_df)] = row
+    # One alternation of the lower-cased reference strings, matched against the lower-cased column,
+    # compares exactly like `reference.lower() in value.lower()` for each reference
+    pattern = re.compile("|".join(re.escape(reference_string.lower()) for reference_string in reference_string_list))
+    match = original_df.iloc[:, header_index].str.lower().str.contains(pattern, na=False).to_numpy(dtype=bool)
 
-    return updated_df
+    # only keep rows where the string to check contains none of the reference strings
+    return original_df.loc[~match].reset_index(drop=True)
 
 
 def merge_row_data_when_no_found(df, source_column, destination_column):
@@ -120,28 +114,44 @@ def delete_empty_zero_rows(df: pd.DataFrame, column_name: str) -> pd.DataFrame:
 
 
 def duplicate_row_for_multiple_quantity(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Split every row with an integer quantity above one into one row per unit.
 
-    # Quantity column is integer
-    df['Qty'] = df['Qty'].astype(float)
-
-    # Create an empty DataFrame to store the updated rows
-    mdf = pd.DataFrame(columns=df.columns)
-
-    for index, old_row in df.iterrows():
-        # only split integers when greater than one.
-        while old_row['Qty'] > 1 and old_row['Qty'] % 1 == 0:
-            ref_des_list = old_row['Designator'].split(',')
+    Each unit row gets qty 1 and the next designator from the comma-separated list; the last unit row keeps the
+    remaining designators (empty when there are fewer designators than units). Rows with a quantity of one or less,
+    or a fractional quantity, are kept unchanged. Rows are repeated in bulk with `Index.repeat` instead of being
+    appended one at a time.
 
-            new_row = old_row.copy()
-            new_row['Qty'] = 1
-            new_row['Designator'] = ref_des_list[0]
+    Args:
+        df (pd.DataFrame): BOM rows with 'Qty' and 'Designator' columns; 'Qty' is converted to float in place.
 
-            old_row['Qty'] -= 1
-            old_row['Designator'] = ','.join(ref_des_list[1:])
+    Returns:
+        pd.DataFrame: Expanded rows with a 0..n-1 index and a float 'Qty' column.
+    """
 
-            mdf.loc[len(mdf)] = new_row
+    # Quantity column is integer
+    df['Qty'] = df['Qty'].astype(float)
 
-        mdf.loc[len(mdf)] = old_row
+    # only split integers when greater than one.
+    qty = df['Qty'].to_numpy(dtype=float)
+    split = (qty > 1) & (qty % 1 == 0)
+    repeats = np.where(split, qty, 1).astype(np.int64)
+
+    # One output row per unit, repeated by position; each source row starts at the running total of repeats
+    mdf = df.iloc[pd.RangeIndex(len(df)).repeat(repeats)].reset_index(drop=True)
+    starts = np.cumsum(repeats) - repeats
+
+    # Every unit of a split row has quantity one
+    mdf.loc[np.repeat(split, repeats), 'Qty'] = 1.0
+
+    # Split each multi-unit designator list once; every unit takes one designator, the last unit takes the rest
+    designators = mdf['Designator'].to_numpy(dtype=object)
+    for start, count, designator in zip(starts[split], repeats[split], df['Designator'].to_numpy(dtype=object)[split]):
+        ref_des_list = designator.split(',')
+        ref_des_list += [''] * (count - len(ref_des_list))  # Units without a designator get an empty one
+        designators[start:start + count - 1] = ref_des_list[:count - 1]
+        designators[start + count - 1] = ','.join(ref_des_list[count - 1:])
+    mdf['Designator'] = designators
 
     return mdf
 
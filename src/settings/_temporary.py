@@ -26,6 +26,7 @@ Dependencies:
 Notes:
     - This module is internal to the settings subsystem; it is not part of the public API.
     - Required keys are defined at import time and enforced when creating or loading the JSON file.
+    - Default values are resolved on first use, not at import time; `_DEFAULT_TEMP_SETTINGS` is a deferred module attribute.
     - If the backing JSON is missing or invalid, CacheReadWrite creates a new file populated with the default values defined in _DEFAULT_TEMP_SETTINGS.
     - A singleton cache is exposed via get_temp_settings() to minimize disk I/O.
 """
@@ -67,18 +68,54 @@ KEYS: Final[_TemporarySettingsKeys] = _TemporarySettingsKeys()
 # REQUIRED_KEYS drives cache schema validation; values are the JSON key names.
 _REQUIRED_KEYS: Final[tuple[str, ...]] = tuple(sorted(asdict(KEYS).values()))
 
-# Default values for each temporary setting
-_DEFAULT_TEMP_SETTINGS: Final[dict[str, Any]] = {
-    KEYS.DESTINATION_FILES_FOLDER: folder_path.resolve_project_folder(),
-    KEYS.SOURCE_FILES_FOLDER: folder_path.resolve_project_folder(),
-}
-
 _TEMP_FILE_NAME: Final[str] = "temporary_settings"
 
+# Default values for each temporary setting; built on first use because resolving the project folder touches the filesystem
+_default_temp_settings: dict[str, Any] | None = None
+
 # Lazily initialized cache for the shared temporary settings instance. This is intentionally module-global so all callers see a consistent view of temp state.
 _temporary_settings_cache: CacheReadWrite | None = None
 
 
+def _get_default_temp_settings() -> dict[str, Any]:
+    """
+    Build the default temporary settings once and return them.
+
+    Returns:
+        dict[str, Any]: Default value for each temporary setting key.
+    """
+    global _default_temp_settings
+
+    if _default_temp_settings is None:
+        project_folder = folder_path.resolve_project_folder()
+        _default_temp_settings = {
+            KEYS.DESTINATION_FILES_FOLDER: project_folder,
+            KEYS.SOURCE_FILES_FOLDER: project_folder,
+        }
+
+    return _default_temp_settings
+
+
+def __getattr__(name: str) -> Any:
+    """
+    Resolve deferred module attributes on first access.
+
+    `_DEFAULT_TEMP_SETTINGS` is kept as a module attribute for existing callers, but is computed lazily so importing this module does no filesystem work.
+
+    Args:
+        name (str): Attribute name looked up on the module.
+
+    Returns:
+        Any: The deferred attribute value.
+
+    Raises:
+        AttributeError: If the attribute is not a known deferred attribute.
+    """
+    if name == "_DEFAULT_TEMP_SETTINGS":
+        return _get_default_temp_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 def get_temp_settings() -> CacheReadWrite:
     """
     Retrieve the singleton temporary settings cache.
@@ -100,7 +137,7 @@ def get_temp_settings() -> CacheReadWrite:
                 resource_folder_path=folder_path.get_temp_folder(),
                 resource_name=_TEMP_FILE_NAME,
                 required_keys=_REQUIRED_KEYS,
-                default_values=_DEFAULT_TEMP_SETTINGS,
+                default_values=_get_default_temp_settings(),
             )
         except Exception as exc:
             raise RuntimeError(
@@ -1,6 +1,21 @@
 import re
+from dataclasses import dataclass, field
+
 import pandas as pd
 
+# Delimiters between reference designators within one cell
+DESIGNATOR_DELIMITER_PATTERN = r'[,:;]'
+
+# Reference designator pattern
+# Rule:
+# - Start with a letter
+# - Contains letters, digits, plus, minus, underscore
+# - Ends with letter, digit, plus, or minus
+DESIGNATOR_PATTERN = re.compile(r'^[A-Za-z][A-Za-z0-9+\-_]*[A-Za-z0-9+\-]$')
+
+# Designator accepted regardless of the pattern
+PCB_DESIGNATOR = 'PCB'
+
 
 def strip_string(df: pd.DataFrame, string: str, column_index: int) -> pd.DataFrame:
     """
@@ -90,6 +105,94 @@ def round_column_to_precision(dataframe: pd.DataFrame, column_number: int, preci
     return dataframe
 
 
+@dataclass(frozen=True)
+class DesignatorReport:
+    """
+    Result of validating a reference designator column.
+
+    Attributes:
+        designators (pd.Series): Reformatted designator string per row (upper case, comma separated, no padding).
+        changed_rows (list[int]): Row positions whose designator string was reformatted.
+        invalid (list[tuple[int, str]]): Row position and designator of every element failing the pattern.
+        duplicates (list[str]): Every repeated occurrence of a designator, in row order.
+    """
+    designators: pd.Series
+    changed_rows: list[int] = field(default_factory=list)
+    invalid: list[tuple[int, str]] = field(default_factory=list)
+    duplicates: list[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """True when every designator is well-formed and unique."""
+        return not self.invalid and not self.duplicates
+
+
+def find_designator_column(df: pd.DataFrame) -> int:
+    """
+    Find the index of the single column whose header contains 'Designator'.
+
+    Args:
+        df (pd.DataFrame): The DataFrame to search.
+
+    Returns:
+        int: Index of the reference designator column.
+
+    Raises:
+        ValueError: If no column or more than one column matches.
+    """
+    matching_columns = [i for i, header in enumerate(df.columns) if 'Designator' in header]
+
+    # We only expect one match
+    if len(matching_columns) > 1:
+        raise ValueError("More than one column matched the 'Designator' header.")
+    if not matching_columns:
+        raise ValueError("No match found for Ref des column.")
+    return matching_columns[0]
+
+
+def explode_designators(column: pd.Series) -> pd.Series:
+    """
+    Split a designator column into one stripped, upper case designator per element.
+
+    Args:
+        column (pd.Series): Designator strings, several per cell separated by ',', ':' or ';'.
+
+    Returns:
+        pd.Series: One designator per element, indexed by the row position it came from.
+    """
+    parts = column.astype(str).reset_index(drop=True).str.split(DESIGNATOR_DELIMITER_PATTERN, regex=True)
+    return parts.explode().astype(str).str.strip().str.upper()
+
+
+def validate_designator_column(column: pd.Series) -> DesignatorReport:
+    """
+    Reformat, validate and check a designator column for duplicates using column-level string operations.
+
+    Args:
+        column (pd.Series): Designator strings, several per cell separated by ',', ':' or ';'.
+
+    Returns:
+        DesignatorReport: Reformatted designators and every problem found; nothing is raised for bad data.
+    """
+    raw = column.astype(str).reset_index(drop=True)
+    designators = explode_designators(raw)
+
+    # One pattern match over every designator of the board
+    is_valid = designators.str.match(DESIGNATOR_PATTERN) | (designators == PCB_DESIGNATOR)
+    invalid = designators[~is_valid.to_numpy(dtype=bool)]
+
+    # Reformat each cell: upper case, comma separated, no whitespace around delimiters
+    reformatted = raw.str.replace(r'\s*' + DESIGNATOR_DELIMITER_PATTERN + r'\s*', ',', regex=True).str.strip().str.upper()
+    changed = (reformatted != raw).to_numpy()
+
+    return DesignatorReport(
+        designators=reformatted,
+        changed_rows=changed.nonzero()[0].tolist(),
+        invalid=list(zip(invalid.index.tolist(), invalid.tolist())),
+        duplicates=designators[designators.duplicated().to_numpy()].tolist(),
+    )
+
+
 def check_ref_des_name(df: pd.DataFrame) -> pd.DataFrame:
     """
     Check and reformat data in the reference designator column of a DataFrame.
@@ -101,7 +204,8 @@ def check_ref_des_name(df: pd.DataFrame) -> pd.DataFrame:
     DataFrame: The DataFrame with the reference designator column reformatted.
 
     Raises:
-    ValueError: If no match or more than one match is found for the reference designator column.
+    ValueError: If no match or more than one match is found for the reference designator column,
+        or if any reference designator is invalid.
     """
 
     # message
@@ -109,62 +213,22 @@ def check_ref_des_name(df: pd.DataFrame) -> pd.DataFrame:
     print('Checking designator format...')
 
     # Get reference designator column
-    matching_columns = [i for i, header in enumerate(df.columns) if 'Designator' in header]
+    column_index = find_designator_column(df)
+    report = validate_designator_column(df.iloc[:, column_index])
 
-    # We only expect one match
-    if len(matching_columns) == 1:
-        column_index = matching_columns[0]  # Select the first matching column
-        # print("Designator found in column ", column_index)
-    elif len(matching_columns) > 1:
-        # Raise an error if more than one column matches
-        raise ValueError("More than one column matched the 'Designator' raw_string.")
-    else:
-        # Raise an error if no partial match is found
-        raise ValueError("No match found for Ref des column.")
+    if report.invalid:
+        for row, element in report.invalid:
+            print(f'Invalid reference designator in row {row} = "{element}"')
+        raise ValueError(f"Invalid reference designators found in {len({row for row, _ in report.invalid})} rows.")
 
-    # Keep track of number of rows for which reference designators were changed
-    rows_changed_count = 0
-
-    # Loop through each row one at a time
-    for i, (_, row) in enumerate(df.iterrows()):
-        # get reference designator column data as a raw_string
-        raw_string = str(row.iloc[column_index])
-        # split reference designator column data raw_string to a list
-        string_list = re.split(r'[,:;]', raw_string)
-        # Iterate through the list and remove leading and trailing whitespace
-        cleaned_list = [x.strip() for x in string_list]
-        # Iterate through the list and make it upper case
-        uppercase_list = [x.upper() for x in cleaned_list]
-        # Reference designator raw_string pattern
-        # Rule:
-        # - Start with a letter
-        # - Contains letters, digits, plus, minus, underscore
-        # - Ends with letter, digit, plus, or minus
-        pattern = r'^[A-Za-z][A-Za-z0-9+\-_]*[A-Za-z0-9+\-]$'
-        designator_list = []
-        # check each reference designator
-        for element in uppercase_list:
-            if re.match(pattern, element):
-                designator_list.append(element)
-            elif element == 'PCB':
-                designator_list.append(element)
-            else:
-                print(f'Invalid reference designator in row {row} = "{element}"')
-                exit()
-        # Convert the designator list to a comma-separated raw_string
-        designators = ','.join(designator_list)
-
-        # Replace reference designator with reformatted raw_string
-        df.iloc[i, column_index] = designators
-
-        # update number of rows updated count
-        if designators != raw_string:
-            print(f"changed '{raw_string}' to '{designators}'")
-            rows_changed_count += 1
+    # Replace reference designators with the reformatted strings
+    for row in report.changed_rows:
+        print(f"changed '{df.iat[row, column_index]}' to '{report.designators.iat[row]}'")
+    df.iloc[:, column_index] = report.designators.to_numpy()
 
     # debug message
-    print(f'Fixed reference designators in {rows_changed_count} rows')
-    return df  # Moved outside the loop to return after all rows are processed
+    print(f'Fixed reference designators in {len(report.changed_rows)} rows')
+    return df
 
 
 def check_duplicate_ref_des(df: pd.DataFrame) -> None:
@@ -175,7 +239,8 @@ def check_duplicate_ref_des(df: pd.DataFrame) -> None:
     - df (pandas.DataFrame): DataFrame containing reference designators.
 
     Raises:
-    - ValueError: If no matching column is found or if more than one column matches 'Designator' header.
+    - ValueError: If no matching column is found, if more than one column matches 'Designator' header,
+      or if any reference designator is used more than once.
 
     Returns:
     - None
@@ -185,43 +250,14 @@ def check_duplicate_ref_des(df: pd.DataFrame) -> None:
     print('Checking for duplicate reference designators...')
 
     # Get reference designator column index
-    matching_columns = [i for i, header in enumerate(df.columns) if 'Designator' in header]
+    column_index = find_designator_column(df)
+    report = validate_designator_column(df.iloc[:, column_index])
 
-    # We only expect one match
-    if len(matching_columns) == 1:
-        column_index = matching_columns[0]  # Select the first matching column
-        # print("Reference designator data found in column ", column_index)
-    elif len(matching_columns) > 1:
-        raise ValueError(
-            "More than one column matched the 'Designator' header.")  # Raise an error if more than one column matches
-    else:
-        raise ValueError("No match found for Ref des column.")  # Raise an error if no partial match is found
-
-    designator_list = []
-    duplicate_designators = []  # List to store duplicate designators
-
-    # Loop through each row one at a time
-    for index, row in df.iterrows():
-        # get reference designator column data as a string
-        raw_string = str(row.iloc[column_index])
-        # split reference designator column data string to a list using delimiters ',',';',':'
-        string_list = re.split(r'[,:;]', raw_string)
-        # add reference designators to list
-        designator_list.extend(string_list)
-
-    # check for duplicate reference designators
-    seen = set()
-    for item in designator_list:
-        if item in seen:
-            duplicate_designators.append(item)
-        else:
-            seen.add(item)
-
-    if duplicate_designators:
-        print("Duplicates reference designators found:", ', '.join(duplicate_designators))
+    if report.duplicates:
+        print("Duplicates reference designators found:", ', '.join(report.duplicates))
         print("This application can not determine which ref des is correct")
         print("Please fix the data in the excel file and retry.")
-        exit()
+        raise ValueError(f"{len(report.duplicates)} duplicate reference designators found.")
     else:
         print("No duplicates found.")
 
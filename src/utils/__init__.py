@@ -22,10 +22,12 @@ License:
 """
 
 # --- public module namespaces ---
+from . import _bundle_io as bundle_io
 from . import _excel_io as excel_io
 from . import _file_path as file_path
 from . import _folder_path as folder_path
 from . import _json_io as json_io
+from . import _lazy as lazy
 from . import _parser as parser
 from . import _sanitizer as sanitizer
 from . import _text_io as text_io
@@ -33,10 +35,12 @@ from . import _timestamp as timestamp
 
 # --- Combined public symbols ---
 __all__ = [
+    "bundle_io",
     "excel_io",
     "file_path",
     "folder_path",
     "json_io",
+    "lazy",
     "parser",
     "sanitizer",
     "text_io",
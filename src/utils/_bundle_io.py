@@ -0,0 +1,170 @@
+"""
+Public utilities for precompiled binary bundles of JSON resource payloads.
+
+This module provides:
+ - Compilation of a validated JSON payload into a marshal-encoded bundle with an embedded checksum
+ - Fast loading of a bundle with freshness checks against its JSON source file
+ - Path helpers that place a bundle next to its JSON source
+
+Example Usage:
+    # Preferred usage through the public utils namespace:
+    from src.utils import bundle_io
+    bundle_path = bundle_io.bundle_path_for(json_path)
+    bundle_io.save_bundle_file(bundle_path, payload, json_path)
+    payload = bundle_io.load_bundle_payload(bundle_path, json_path)  # None if missing or stale
+    loaded = bundle_io.load_bundle(bundle_path, json_path)  # (payload, version) or None
+
+    # Direct module usage in unit tests:
+    import src.utils._bundle_io as bundle_io
+
+Dependencies:
+ - Python >= 3.10
+ - Standard Library: hashlib, marshal, os, sys, typing
+
+Notes:
+ - JSON stays the source of truth; a bundle is only used while the SHA-256 of the source bytes still matches the one recorded at build time. Modification times are not trusted, since copies, checkouts, and coarse file system clocks can keep them unchanged across edits.
+ - marshal output is specific to the Python minor version, so bundles built by another interpreter version are treated as stale.
+ - A bundle may carry the version stamp of its source (the payload SHA-256 from the JSON metadata) so callers can version the data without reading the JSON.
+ - load_bundle and load_bundle_payload never raise; any missing, stale, or corrupt bundle returns None so callers fall back to JSON.
+
+License:
+ - Internal Use Only
+"""
+__all__ = [
+    "BUNDLE_FILE_EXT",
+    "bundle_path_for",
+    "load_bundle",
+    "load_bundle_payload",
+    "save_bundle_file",
+]
+
+import hashlib
+import marshal
+import os
+import sys
+from typing import Any, Final
+
+# CONSTANTS
+BUNDLE_FILE_EXT = ".bundle"
+
+# Bump when the bundle layout changes so older bundles are ignored
+_BUNDLE_FORMAT: Final[int] = 3
+# marshal data is only guaranteed to round-trip on the same Python minor version
+_PYTHON_VERSION: Final[str] = f"{sys.version_info.major}.{sys.version_info.minor}"
+
+
+def _sha256_file(file_path: str) -> str:
+    """
+    Compute the uppercase hex SHA-256 of a file's raw bytes.
+
+    Args:
+        file_path (str): Path to the file.
+
+    Returns:
+        str: 64-char uppercase hex SHA-256.
+    """
+    with open(file_path, mode="rb") as file:
+        return hashlib.sha256(file.read()).hexdigest().upper()
+
+
+def bundle_path_for(source_path: str) -> str:
+    """
+    Return the bundle path that sits next to a JSON source file.
+
+    Args:
+        source_path (str): Path to the JSON source file.
+
+    Returns:
+        str: Same path with the extension replaced by BUNDLE_FILE_EXT.
+    """
+    return os.path.splitext(source_path)[0] + BUNDLE_FILE_EXT
+
+
+def save_bundle_file(bundle_path: str, payload: dict[str, Any], source_path: str, *, version: str = "") -> None:
+    """
+    Compile a payload into a bundle file bound to its JSON source file.
+
+    Args:
+        bundle_path (str): Destination path of the bundle.
+        payload (dict[str, Any]): Validated JSON payload to compile.
+        source_path (str): JSON source file the payload was read from.
+        version (str): Version stamp of the source data (e.g., its metadata payload SHA-256); empty if unknown.
+
+    Returns:
+        None: This function writes to disk and returns no value.
+
+    Raises:
+        RuntimeError: If the payload cannot be serialized or the bundle cannot be written.
+    """
+    try:
+        payload_bytes = marshal.dumps(payload)
+        bundle = {
+            "format": _BUNDLE_FORMAT,
+            "python": _PYTHON_VERSION,
+            "source_size": os.path.getsize(source_path),
+            "source_sha256": _sha256_file(source_path),
+            "payload_sha256": hashlib.sha256(payload_bytes).hexdigest().upper(),
+            "version": version,
+            "payload": payload_bytes,
+        }
+        with open(bundle_path, mode="wb") as file:
+            file.write(marshal.dumps(bundle))
+    except Exception as err:
+        raise RuntimeError(
+            f"Failed to save bundle file at '{bundle_path}' for source '{source_path}'.\n"
+            f"{type(err).__name__}: {err}"
+        ) from err
+
+
+def load_bundle(bundle_path: str, source_path: str) -> tuple[dict[str, Any], str] | None:
+    """
+    Load a payload and its version stamp from a bundle if it is intact and still matches its JSON source file.
+
+    Args:
+        bundle_path (str): Path to the bundle file.
+        source_path (str): JSON source file the bundle must match.
+
+    Returns:
+        tuple[dict[str, Any], str] | None: The payload and the version stamp recorded at build time, or None if the bundle is missing, stale, or corrupt.
+    """
+    try:
+        with open(bundle_path, mode="rb") as file:
+            bundle = marshal.loads(file.read())
+
+        if bundle["format"] != _BUNDLE_FORMAT or bundle["python"] != _PYTHON_VERSION:
+            return None
+
+        # Freshness: a size change rejects early; otherwise the source bytes must hash to the recorded digest
+        if os.path.getsize(source_path) != bundle["source_size"]:
+            return None
+        if _sha256_file(source_path) != bundle["source_sha256"]:
+            return None
+
+        # Integrity of the embedded payload
+        payload_bytes = bundle["payload"]
+        if hashlib.sha256(payload_bytes).hexdigest().upper() != bundle["payload_sha256"]:
+            return None
+
+        payload = marshal.loads(payload_bytes)
+        version = bundle["version"]
+    except Exception:
+        return None
+
+    if not isinstance(payload, dict) or not isinstance(version, str):
+        return None
+    return payload, version
+
+
+def load_bundle_payload(bundle_path: str, source_path: str) -> dict[str, Any] | None:
+    """
+    Load a payload from a bundle if it is intact and still matches its JSON source file.
+
+    Args:
+        bundle_path (str): Path to the bundle file.
+        source_path (str): JSON source file the bundle must match.
+
+    Returns:
+        dict[str, Any] | None: The payload, or None if the bundle is missing, stale, or corrupt.
+    """
+    loaded = load_bundle(bundle_path, source_path)
+    return loaded[0] if loaded is not None else None
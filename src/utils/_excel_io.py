@@ -19,7 +19,7 @@ Example Usage:
 Dependencies:
  - Python >= 3.9
  - Standard Library: re
- - External Packages: pandas (>= 2.x), openpyxl
+ - External Packages: pandas (>= 2.x, imported lazily), openpyxl
 
 Notes:
  - All cells are coerced to strings; blanks are preserved as "".
@@ -33,6 +33,8 @@ License:
  - Internal Use Only
 """
 
+from __future__ import annotations  # Keeps pandas type hints from importing pandas
+
 __all__ = [
     "EXCEL_FILE_TYPE",
     "map_excel_sheets_to_string_dataframes",
@@ -44,7 +46,9 @@ __all__ = [
 
 import re
 
-import pandas as pd
+from . import _lazy as lazy
+
+pd = lazy.lazy_import("pandas")  # Imported on first workbook read or write
 
 # CONSTANTS
 EXCEL_FILE_TYPE = ".xlsx"
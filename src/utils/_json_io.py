@@ -6,6 +6,7 @@ This module provides:
  - Safe loading and saving of JSON files
  - Deterministic SHA-256 checksums for payload integrity
  - Packet builders that embed UTC metadata, source file names, and payload hashes
+ - Memory-mapped packet loading with in-place checksum verification and a lazily parsed payload
 
 Example Usage:
     # Preferred usage through the public utils namespace:
@@ -18,32 +19,47 @@ Example Usage:
 
 Dependencies:
  - Python >= 3.10
- - Standard Library: json, hashlib, typing
+ - Standard Library: codecs, hashlib, json, mmap, os, re, tempfile, typing
  - Internal: src.utils.timestamp
 
 Notes:
  - Payload keys must be strings and JSON-serializable.
  - Payloads are sorted lexicographically before hashing for stable SHA-256 generation.
+ - Checksum V1 hashes the concatenated str() of keys and values; V2 hashes canonical JSON streamed in chunks (no str() of nested values, memory bounded by one chunk). Packets record V2 in the metadata; packets without a version are verified as V1.
  - File operations wrap underlying exceptions in RuntimeError for clearer diagnostics.
+ - save_json_packet_file writes packets one canonical payload entry per line; load_json_packet_mapped memory-maps such files, verifies a V2 checksum over the mapped bytes without copying, and parses the payload lazily in blocks. Other layouts fall back to a full parse.
+ - save_json_file and save_json_packet_file with atomic=True replace the target via write-and-rename (os.replace) so a crash never leaves a truncated file.
  - Designed as a public-facing utility in the `utils` package.
 
 License:
  - Internal Use Only
 """
 __all__ = [
+    "CHECKSUM_V1",
+    "CHECKSUM_V2",
     "JSON_FILE_EXT",
     "create_json_packet",
     "dict_to_json_string",
     "extract_payload",
+    "extract_payload_checksum",
+    "extract_payload_checksum_version",
     "json_string_to_dict",
     "load_json_file",
+    "load_json_packet_mapped",
+    "MappedJsonPacket",
     "save_json_file",
+    "save_json_packet_file",
     "verify_json_payload_checksum",
 ]
 
 
+import codecs
 import hashlib
 import json
+import mmap
+import os
+import re
+import tempfile
 from typing import Any, TypedDict, Final
 from . import _timestamp as timestamp
 
@@ -60,6 +76,16 @@ class JsonMeta(TypedDict):
 _KEY_UTC: Final[str] = list(JsonMeta.__annotations__.keys())[0]
 _KEY_SOURCE: Final[str] = list(JsonMeta.__annotations__.keys())[1]
 _KEY_SHA256: Final[str] = list(JsonMeta.__annotations__.keys())[2]
+_KEY_SHA256_VERSION: Final[str] = "payload_sha256_version"  # Optional; absent means CHECKSUM_V1
+
+# PAYLOAD CHECKSUM SCHEMES
+CHECKSUM_V1: Final[int] = 1  # SHA-256 over the concatenated str() of sorted keys and values
+CHECKSUM_V2: Final[int] = 2  # SHA-256 over canonical JSON, streamed in chunks
+
+# Canonical JSON: sorted keys, no whitespace, UTF-8 text; encode() uses the C encoder
+_CANONICAL_ENCODER: Final[json.JSONEncoder] = json.JSONEncoder(sort_keys=True, separators=(",", ":"),
+                                                               ensure_ascii=False)
+_CHECKSUM_CHUNK_ENTRIES: Final[int] = 64  # Entries encoded per hash update; small chunks keep memory flat and stay in C
 
 
 # JSON PACKET SCHEMA
@@ -71,6 +97,13 @@ class JsonPkt(TypedDict):
 _KEY_META: Final[str] = list(JsonPkt.__annotations__.keys())[0]
 _KEY_PAYLOAD: Final[str] = list(JsonPkt.__annotations__.keys())[1]
 
+# MAPPABLE PACKET LAYOUT (see save_json_packet_file); raw line breaks never occur inside JSON strings
+_PAYLOAD_START_REGEX: Final[re.Pattern[bytes]] = re.compile(rb'\n[ \t]*"' + _KEY_PAYLOAD.encode() + rb'": (\{)\r?\n')
+_PAYLOAD_END_REGEX: Final[re.Pattern[bytes]] = re.compile(rb'\r?\n[ \t]*(\})\r?\n\}\s*\Z')
+_LINE_BREAK_REGEX: Final[re.Pattern[bytes]] = re.compile(rb'\n[ \t]*')  # Line break plus the next line's indentation
+_TAIL_BYTES: Final[int] = 256  # The payload end pattern is searched in this many trailing bytes only
+_PARSE_BLOCK_BYTES: Final[int] = 1 << 16  # Payload text decoded and parsed at a time
+
 
 def _compute_payload_sha256(payload: dict[str, Any]) -> str:
     """
@@ -103,7 +136,57 @@ def _compute_payload_sha256(payload: dict[str, Any]) -> str:
     return hashlib.sha256(encoded_data_string).hexdigest().upper()
 
 
-def create_json_packet(payload: dict[str, Any], source_file: str) -> dict[str, Any]:
+def _compute_payload_sha256_v2(payload: dict[str, Any]) -> str:
+    """
+    Compute a deterministic SHA-256 over the canonical JSON encoding of a dictionary, streamed in small chunks.
+
+    The digest equals the SHA-256 of `json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)` encoded as UTF-8, but the document is never built in full: sorted entries are encoded a few at a time with the C JSON encoder and fed to the hash, so extra memory is bounded by one chunk.
+
+    Args:
+        payload (dict[str, Any]): Dictionary whose keys and values are included in the checksum.
+
+    Returns:
+        str: 64-char uppercase hex SHA-256.
+    """
+    encode = _CANONICAL_ENCODER.encode
+    digest = hashlib.sha256(b"{")
+
+    # Sorting keys ensures stable order across Python runs
+    keys = sorted(payload.keys())
+    for start in range(0, len(keys), _CHECKSUM_CHUNK_ENTRIES):
+        if start:
+            digest.update(b",")
+        chunk = {key: payload[key] for key in keys[start:start + _CHECKSUM_CHUNK_ENTRIES]}
+        # Strip the chunk's own braces so the hashed bytes form one continuous document
+        digest.update(encode(chunk)[1:-1].encode("utf-8"))
+
+    digest.update(b"}")
+    return digest.hexdigest().upper()
+
+
+def _compute_checksum(payload: dict[str, Any], checksum_version: int) -> str:
+    """
+    Compute the payload SHA-256 with the requested checksum scheme.
+
+    Args:
+        payload (dict[str, Any]): Dictionary whose keys and values are included in the checksum.
+        checksum_version (int): CHECKSUM_V1 or CHECKSUM_V2.
+
+    Returns:
+        str: 64-char uppercase hex SHA-256.
+
+    Raises:
+        ValueError: If the checksum version is not supported.
+    """
+    if checksum_version == CHECKSUM_V1:
+        return _compute_payload_sha256(payload)
+    if checksum_version == CHECKSUM_V2:
+        return _compute_payload_sha256_v2(payload)
+    raise ValueError(f"Unsupported payload checksum version '{checksum_version}'.")
+
+
+def create_json_packet(payload: dict[str, Any], source_file: str, *,
+                       checksum_version: int = CHECKSUM_V1) -> dict[str, Any]:
     """
     Build a deterministic JSON packet with metadata and a sorted payload.
 
@@ -113,7 +196,8 @@ def create_json_packet(payload: dict[str, Any], source_file: str) -> dict[str, A
             "meta": {
                 "generated_at_utc": "<ISO 8601 UTC timestamp>",
                 "source_file_name": "<original filename or identifier>",
-                "payload_sha256": "<SHA-256 of sorted payload>"
+                "payload_sha256": "<SHA-256 of sorted payload>",
+                "payload_sha256_version": 2  # CHECKSUM_V2 packets only
             },
             "payload": { ... }  # shallow copy of the sorted payload
         }
@@ -121,9 +205,13 @@ def create_json_packet(payload: dict[str, Any], source_file: str) -> dict[str, A
     Args:
         payload (dict[str, Any]): Dictionary of data to include under the "payload" key. Keys must be strings and values must be JSON-serializable. The payload is sorted by key prior to hashing and inclusion in the packet.
         source_file (str): Original filename or logical identifier for the data source. Stored in the metadata for traceability.
+        checksum_version (int, optional): Checksum scheme. CHECKSUM_V2 hashes streamed canonical JSON and is recorded in the metadata; CHECKSUM_V1 keeps the original packet layout. Defaults to CHECKSUM_V1.
 
     Returns:
         dict[str, Any]: JSON-ready packet containing metadata and a shallow copy of the sorted payload. Suitable for serialization and integrity validation.
+
+    Raises:
+        ValueError: If the checksum version is not supported.
     """
     # Sort payload
     sorted_payload = {k: payload[k] for k in sorted(payload.keys())}
@@ -131,8 +219,11 @@ def create_json_packet(payload: dict[str, Any], source_file: str) -> dict[str, A
     meta_info = {
         _KEY_UTC: timestamp.now_utc_iso(),
         _KEY_SOURCE: str(source_file),
-        _KEY_SHA256: _compute_payload_sha256(sorted_payload),
+        _KEY_SHA256: _compute_checksum(sorted_payload, checksum_version),
     }
+    if checksum_version != CHECKSUM_V1:
+        # V1 packets carry no version key, so their layout is unchanged
+        meta_info[_KEY_SHA256_VERSION] = checksum_version
     # Return JSON-ready structure with shallow copy of data
     return {_KEY_META: meta_info, _KEY_PAYLOAD: dict(sorted_payload)}
 
@@ -150,8 +241,10 @@ def verify_json_payload_checksum(packet: dict[str, Any]) -> bool:
                 "data": { ... }
             }
 
+    The checksum scheme is read from the metadata; packets without a version key use CHECKSUM_V1.
+
     Returns:
-        bool: True if the computed and stored SHA-256 match; False otherwise.
+        bool: True if the computed and stored SHA-256 match; False otherwise, including for an unknown checksum version.
     """
     # Extract metadata and data
     meta_section = packet[_KEY_META]
@@ -159,9 +252,13 @@ def verify_json_payload_checksum(packet: dict[str, Any]) -> bool:
 
     # Parse stored checksum
     expected_checksum = meta_section[_KEY_SHA256]
+    checksum_version = meta_section.get(_KEY_SHA256_VERSION, CHECKSUM_V1)
 
     # Compute checksum for data
-    actual_checksum = _compute_payload_sha256(data_section)
+    try:
+        actual_checksum = _compute_checksum(data_section, checksum_version)
+    except ValueError:
+        return False  # Unknown scheme; the packet cannot be trusted
 
     # Return comparison result
     return actual_checksum == expected_checksum
@@ -184,6 +281,34 @@ def extract_payload(packet: dict[str, Any]) -> dict[str, Any]:
     return dict(packet[_KEY_PAYLOAD])
 
 
+def extract_payload_checksum(packet: dict[str, Any]) -> str:
+    """
+    Return the payload SHA-256 recorded in a packet's metadata.
+
+    The checksum identifies the payload content, so it doubles as a version stamp for data loaded from the packet.
+
+    Args:
+        packet (dict[str, Any]): JSON packet with a metadata section.
+
+    Returns:
+        str: The stored payload SHA-256 (uppercase hex).
+    """
+    return packet[_KEY_META][_KEY_SHA256]
+
+
+def extract_payload_checksum_version(packet: dict[str, Any]) -> int:
+    """
+    Return the checksum scheme recorded in a packet's metadata.
+
+    Args:
+        packet (dict[str, Any]): JSON packet with a metadata section.
+
+    Returns:
+        int: CHECKSUM_V2 for packets that record it; CHECKSUM_V1 for packets without a version key.
+    """
+    return packet[_KEY_META].get(_KEY_SHA256_VERSION, CHECKSUM_V1)
+
+
 def dict_to_json_string(input_dict: dict[str, Any], *, indent_spaces: int | None = None) -> str:
     """
     Serializes a dictionary of string keys into a JSON-formatted string.
@@ -268,17 +393,56 @@ def load_json_file(file_path: str) -> dict[str, Any]:
         ) from err
 
 
+def _atomic_write(file_path: str, text: str, *, newline: str | None = None) -> None:
+    """
+    Replace a file with new text via write-and-rename.
+
+    The text is written to a temporary file in the target folder, flushed to disk, and renamed over the target with `os.replace`, so readers see either the old or the new file and never a partial one. The temporary file is removed if any step fails.
+
+    Args:
+        file_path (str): Absolute or relative path to the target file.
+        text (str): Complete file content.
+        newline (str | None, optional): Line ending translation as for `open`. Defaults to None.
+
+    Returns:
+        None: This function writes to disk and returns no value.
+
+    Raises:
+        OSError: If the temporary file cannot be created, written, or renamed.
+    """
+    # Temporary file in the target folder, so the rename stays on one file system
+    folder = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(prefix=os.path.basename(file_path) + ".", suffix=".tmp", dir=folder)
+    try:
+        with os.fdopen(fd, mode="w", encoding="utf-8", newline=newline) as file:
+            file.write(text)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, file_path)
+    except BaseException:
+        # Remove the temporary file if the rename did not happen
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
 def save_json_file(file_path: str, data_dict: dict[str, Any], *,
-                   indent_spaces: int | None = 2) -> None:
+                   indent_spaces: int | None = 2, atomic: bool = False) -> None:
     """
     Writes a dictionary to disk as a JSON file.
 
     Serializes a dictionary with string keys and JSON-compatible values and writes it to the given path using UTF-8 encoding. By default, the output is pretty printed with indentation. Raises a descriptive error if the file cannot be created/written or if the data cannot be serialized.
 
+    With `atomic=True` the JSON is written to a temporary file in the same folder, flushed to disk, and renamed over the target, so readers see either the old or the new file and never a partial one.
+
     Args:
         file_path (str): Absolute or relative path to the target JSON file.
         data_dict (dict[str, Any]): Dictionary to serialize and save.
         indent_spaces (int | None, optional): Number of spaces used for indentation. Set to None for compact output. Defaults to 2.
+        atomic (bool, optional): Replace the target via write-and-rename. Defaults to False.
 
     Returns:
         None: This function writes to disk and returns no value.
@@ -287,10 +451,15 @@ def save_json_file(file_path: str, data_dict: dict[str, Any], *,
         RuntimeError: If the file cannot be created, opened, or written, or if serialization fails (e.g., due to non-serializable values).
     """
     try:
-        # Open destination for writing (overwrites if the file exists)
-        with open(file_path, mode="w", encoding="utf-8") as file:
-            # Serialize the dictionary to JSON with optional pretty printing
-            json.dump(data_dict, file, indent=indent_spaces, ensure_ascii=False)  # type: ignore[arg-type]
+        if not atomic:
+            # Open destination for writing (overwrites if the file exists)
+            with open(file_path, mode="w", encoding="utf-8") as file:
+                # Serialize the dictionary to JSON with optional pretty printing
+                json.dump(data_dict, file, indent=indent_spaces, ensure_ascii=False)  # type: ignore[arg-type]
+            return
+
+        # Serialize first so a bad payload never touches the file system
+        _atomic_write(file_path, json.dumps(data_dict, indent=indent_spaces, ensure_ascii=False))
     except Exception as err:
         # Surface a clear, actionable error while preserving the original exception
         raise RuntimeError(
@@ -298,3 +467,273 @@ def save_json_file(file_path: str, data_dict: dict[str, Any], *,
             f"file may be locked, or data contains non-serializable types.\n"
             f"{type(err).__name__}: {err}"
         ) from err
+
+
+def _format_packet_text(packet: dict[str, Any], indent_spaces: int) -> str:
+    """
+    Render a packet in the mappable layout: indented metadata, then one canonical payload entry per line.
+
+    Args:
+        packet (dict[str, Any]): Packet built by `create_json_packet`.
+        indent_spaces (int): Number of spaces used for indentation.
+
+    Returns:
+        str: JSON text of the packet.
+    """
+    pad = " " * indent_spaces
+    encode = _CANONICAL_ENCODER.encode
+    payload = packet[_KEY_PAYLOAD]
+
+    # Metadata block exactly as json.dumps would indent it, without the closing brace
+    head = json.dumps({_KEY_META: packet[_KEY_META]}, indent=indent_spaces, ensure_ascii=False)[:-2]
+    entries = ",\n".join(f"{pad}{pad}{encode(key)}:{encode(payload[key])}" for key in sorted(payload.keys()))
+    body = f"\n{entries}" if entries else ""
+
+    return f'{head},\n{pad}"{_KEY_PAYLOAD}": {{{body}\n{pad}}}\n}}\n'
+
+
+def save_json_packet_file(file_path: str, packet: dict[str, Any], *,
+                          indent_spaces: int = 4, atomic: bool = False) -> None:
+    """
+    Writes a JSON packet in the layout that `load_json_packet_mapped` can verify without parsing.
+
+    The metadata is pretty printed as usual; the payload is written one canonical entry (sorted keys, compact separators) per line. The file is ordinary JSON and stays readable and diff-friendly. For CHECKSUM_V2 packets the payload lines, with indentation and line breaks removed, are exactly the bytes the checksum covers.
+
+    Args:
+        file_path (str): Absolute or relative path to the target JSON file.
+        packet (dict[str, Any]): Packet built by `create_json_packet`.
+        indent_spaces (int, optional): Number of spaces used for indentation. Defaults to 4.
+        atomic (bool, optional): Replace the target via write-and-rename. Defaults to False.
+
+    Returns:
+        None: This function writes to disk and returns no value.
+
+    Raises:
+        RuntimeError: If the packet cannot be serialized or the file cannot be written.
+    """
+    try:
+        text = _format_packet_text(packet, indent_spaces)
+
+        if not atomic:
+            with open(file_path, mode="w", encoding="utf-8", newline="\n") as file:
+                file.write(text)
+            return
+
+        _atomic_write(file_path, text, newline="\n")
+    except Exception as err:
+        raise RuntimeError(
+            f"Failed to save JSON packet at '{file_path}' — directory may not exist, "
+            f"file may be locked, or data contains non-serializable types.\n"
+            f"{type(err).__name__}: {err}"
+        ) from err
+
+
+class MappedJsonPacket:
+    """
+    JSON packet backed by a read-only memory map of its file.
+
+    When the file uses the `save_json_packet_file` layout, only the small metadata block is parsed up front; a CHECKSUM_V2 payload is verified by hashing the mapped payload lines in place, and the payload is parsed on first access, a block of lines at a time once verified. Any other layout falls back to parsing the whole mapped file once. The map is released after the payload is parsed or on `close()`.
+
+    Args:
+        file_path (str): Absolute or relative path to the JSON packet file.
+
+    Returns:
+        MappedJsonPacket: The opened packet; use as a context manager to release the map.
+
+    Raises:
+        RuntimeError: If the file cannot be opened, mapped, or parsed.
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self._file_path = file_path
+        self._map: mmap.mmap | None = None
+        self._span: tuple[int, int] | None = None  # Payload object byte range in the mappable layout
+        self._meta: dict[str, Any] = {}
+        self._payload: dict[str, Any] | None = None
+        self._canonical_lines: bool = False  # Set once the payload lines are verified as canonical entries
+
+        try:
+            with open(file_path, mode="rb") as file:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+            start = _PAYLOAD_START_REGEX.search(self._map)
+            # The end pattern is anchored to the end of the file, so only the tail needs scanning
+            tail = max(start.start(1), len(self._map) - _TAIL_BYTES) if start is not None else 0
+            end = _PAYLOAD_END_REGEX.search(self._map, tail) if start is not None else None
+            if start is not None and end is not None:
+                # Metadata is everything before the payload key; drop the separator and close the object
+                head = self._map[:start.start()].rstrip()
+                self._meta = json.loads(head.removesuffix(b",") + b"}")[_KEY_META]
+                self._span = (start.start(1), end.end(1))
+            else:
+                # Unknown layout: parse the whole file once, decoding straight from the map
+                packet = json.loads(codecs.utf_8_decode(self._map)[0])
+                self._meta, self._payload = packet[_KEY_META], packet[_KEY_PAYLOAD]
+                self._release()
+        except Exception as err:
+            self._release()
+            raise RuntimeError(
+                f"Failed to load JSON file from '{file_path}' — file may be missing, unreadable, or contain invalid JSON.\n"
+                f"{type(err).__name__}: {err}"
+            ) from err
+
+    @property
+    def meta(self) -> dict[str, Any]:
+        """
+        Packet metadata.
+
+        Returns:
+            dict[str, Any]: The metadata mapping.
+        """
+        return self._meta
+
+    @property
+    def payload_sha256(self) -> str:
+        """
+        Payload SHA-256 recorded in the metadata; available without parsing the payload.
+
+        Returns:
+            str: The stored payload SHA-256 (uppercase hex).
+        """
+        return self._meta[_KEY_SHA256]
+
+    @property
+    def payload(self) -> dict[str, Any]:
+        """
+        Packet payload, parsed from the mapped bytes on first access.
+
+        Returns:
+            dict[str, Any]: The payload mapping; shared, so copy before mutating.
+
+        Raises:
+            RuntimeError: If the payload cannot be parsed.
+        """
+        if self._payload is None:
+            start, end = self._span
+            try:
+                if self._canonical_lines:
+                    self._payload = self._parse_payload_lines()
+                else:
+                    # Decode straight from the map: no intermediate bytes copy of the payload
+                    self._payload = json.loads(codecs.utf_8_decode(memoryview(self._map)[start:end])[0])
+            except Exception as err:
+                raise RuntimeError(
+                    f"Failed to parse JSON payload from '{self._file_path}'.\n{type(err).__name__}: {err}"
+                ) from err
+            finally:
+                self._release()
+
+        return self._payload
+
+    def verify_checksum(self) -> bool:
+        """
+        Verify the payload SHA-256 stored in the metadata.
+
+        CHECKSUM_V2 payloads in the mappable layout are hashed line by line from the map, without parsing or copying. Everything else, including a V2 payload whose lines are not canonical, is verified with `verify_json_payload_checksum` on the parsed payload.
+
+        Returns:
+            bool: True if the computed and stored SHA-256 match; False otherwise.
+        """
+        if self._payload is None and self._meta.get(_KEY_SHA256_VERSION) == CHECKSUM_V2:
+            if self._mapped_sha256() == self._meta[_KEY_SHA256]:
+                self._canonical_lines = True  # One entry per line; the payload can be parsed in blocks
+                return True
+            # Payload lines are not canonical (e.g., pretty printed by save_json_file); verify the parsed payload
+
+        return verify_json_payload_checksum({_KEY_META: self._meta, _KEY_PAYLOAD: self.payload})
+
+    def _mapped_sha256(self) -> str:
+        """
+        Hash the mapped payload with line breaks and line indentation removed.
+
+        Canonical JSON holds no raw line breaks, so what remains is exactly the canonical payload document.
+
+        Returns:
+            str: 64-char uppercase hex SHA-256.
+        """
+        start, end = self._span
+        view = memoryview(self._map)
+        digest = hashlib.sha256()
+        try:
+            # Hash the bytes between line breaks (with the indentation that follows them) straight from the map
+            for line_break in _LINE_BREAK_REGEX.finditer(self._map, start, end):
+                stop = line_break.start()
+                if self._map[stop - 1] == 0x0D:
+                    stop -= 1  # CRLF checkout; canonical JSON never holds a raw carriage return
+                digest.update(view[start:stop])
+                start = line_break.end()
+            digest.update(view[start:end])
+        finally:
+            view.release()
+
+        return digest.hexdigest().upper()
+
+    def _parse_payload_lines(self) -> dict[str, Any]:
+        """
+        Parse a verified one-entry-per-line payload in blocks of whole lines.
+
+        Only one block of text exists at a time, so peak memory is the parsed payload plus one block instead of the payload plus its full decoded text.
+
+        Returns:
+            dict[str, Any]: The parsed payload.
+        """
+        start, end = self._span
+        start += 1  # Skip the payload's opening brace
+        end -= 1  # Exclude the payload's closing brace
+        view = memoryview(self._map)
+        payload: dict[str, Any] = {}
+        try:
+            while start < end:
+                # Extend each block to the end of a line so no entry is split
+                stop = self._map.find(b"\n", min(start + _PARSE_BLOCK_BYTES, end), end)
+                stop = end if stop < 0 else stop
+                text = codecs.utf_8_decode(view[start:stop])[0].strip().strip(",")
+                if text:
+                    payload.update(json.loads("{" + text + "}"))
+                start = stop + 1
+        finally:
+            view.release()
+
+        return payload
+
+    def _release(self) -> None:
+        """
+        Close the memory map if it is still open.
+
+        Returns:
+            None
+        """
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+
+    def close(self) -> None:
+        """
+        Release the memory map without parsing the payload.
+
+        Returns:
+            None
+        """
+        self._release()
+
+    def __enter__(self) -> "MappedJsonPacket":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self._release()
+
+
+def load_json_packet_mapped(file_path: str) -> MappedJsonPacket:
+    """
+    Open a JSON packet file through a read-only memory map.
+
+    Args:
+        file_path (str): Absolute or relative path to the JSON packet file.
+
+    Returns:
+        MappedJsonPacket: Packet exposing metadata, checksum verification, and a lazily parsed payload.
+
+    Raises:
+        RuntimeError: If the file cannot be opened, mapped, or parsed.
+    """
+    return MappedJsonPacket(file_path)
@@ -0,0 +1,112 @@
+"""
+Deferred imports for heavy third-party packages.
+
+This module provides a small proxy that stands in for a module and imports it on first attribute access, so importing an `interfaces` package does not pay for pandas or Levenshtein until one of their functions is actually called.
+
+Example Usage:
+    # Preferred usage via public package interface:
+    from src.utils import lazy
+    pd = lazy.lazy_import("pandas")
+    frame = pd.DataFrame()  # pandas is imported here, not at module import
+
+    # Direct module usage (acceptable in unit tests or internal scripts only):
+    import src.utils._lazy as lazy
+    proxy = lazy.lazy_import("Levenshtein")
+    loaded = lazy.is_loaded(proxy)
+
+Dependencies:
+    - Python >= 3.10
+    - Standard Library: importlib, threading
+
+Notes:
+    - Modules using a proxy in type annotations must enable `from __future__ import annotations` so signatures do not trigger the import.
+    - Import errors surface at first use rather than at module import; the original ImportError is re-raised unchanged.
+    - Attributes assigned on the proxy (e.g., by `unittest.mock.patch.object`) shadow the real module attribute for callers using the proxy only.
+    - The first import is guarded by a lock so concurrent first use imports the module once.
+
+License:
+    - Internal Use Only
+"""
+
+__all__ = [
+    "LazyModule",
+    "is_loaded",
+    "lazy_import",
+]
+
+import importlib
+import threading
+from types import ModuleType
+
+
+class LazyModule:
+    """
+    Proxy that imports the named module on first attribute access and forwards all lookups to it.
+
+    Args:
+        module_name (str): Absolute name of the module to import (e.g., "pandas").
+
+    Returns:
+        LazyModule: A proxy whose attributes resolve against the imported module.
+
+    Raises:
+        ImportError: On first attribute access, if the module cannot be imported.
+    """
+
+    def __init__(self, module_name: str):
+        # Stored in the proxy's own __dict__, so __getattr__ never forwards these names
+        self._lazy_name = module_name
+        self._lazy_module: ModuleType | None = None
+        self._lazy_lock = threading.Lock()
+
+    def _load(self) -> ModuleType:
+        """
+        Import the target module once and return it.
+
+        Returns:
+            ModuleType: The imported module.
+        """
+        module = self._lazy_module
+        if module is None:
+            with self._lazy_lock:
+                if self._lazy_module is None:
+                    self._lazy_module = importlib.import_module(self._lazy_name)
+                module = self._lazy_module
+        return module
+
+    def __getattr__(self, name: str):
+        # Only called for attributes missing from the proxy itself, i.e., everything of the target module
+        return getattr(self._load(), name)
+
+    def __dir__(self) -> list[str]:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state = "loaded" if self._lazy_module is not None else "not loaded"
+        return f"<LazyModule {self._lazy_name!r} ({state})>"
+
+
+def lazy_import(module_name: str) -> LazyModule:
+    """
+    Create a proxy that defers importing a module until it is first used.
+
+    Args:
+        module_name (str): Absolute name of the module to import.
+
+    Returns:
+        LazyModule: Proxy for the module.
+    """
+    return LazyModule(module_name)
+
+
+def is_loaded(proxy: LazyModule) -> bool:
+    """
+    Report whether a proxy has already imported its module.
+
+    Args:
+        proxy (LazyModule): Proxy created by `lazy_import`.
+
+    Returns:
+        bool: True once the target module has been imported through the proxy.
+    """
+    return proxy._lazy_module is not None
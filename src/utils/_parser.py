@@ -9,19 +9,24 @@ Example Usage:
     if parser.is_integer("42"):
         value =parser.parse_to_integer("42")
 
+    # Non-raising and bulk parsing for hot loops:
+    qty = parser.try_parse_to_float(row.qty)  # None if invalid
+    values, valid = parser.parse_many_to_float(["1.5", "", "abc"])  # [1.5, 0.0, 0.0], [True, False, False]
+
     # Direct module usage (acceptable in unit tests or internal scripts only):
     import src.utils._parser as parser
     iso_date = parse_to_iso_date_string("6/8/2025")
 
 Dependencies:
  - Python >= 3.9
- - Standard Library: datetime, math, typing
+ - Standard Library: datetime, functools, math, re, typing
 
 Notes:
     - This module enforces strict parsing rules to avoid ambiguous cases (e.g., '1.0' is not treated as an integer).
-    - Date parsing normalizes inputs to ISO format and ignores trailing time parts.
+    - Date parsing normalizes inputs to ISO format and ignores trailing time parts. Common shapes are converted by sniffing the separator and component lengths; other inputs go through `strptime`. Results are memoized per input string.
     - Designed to be used in BOM parsing, field validation, and data cleaning pipelines where type consistency is critical.
     - Use `is_*` functions for fast validation; use `parse_to_*` functions when a typed value is required.
+    - Float and integer parsing of strings is memoized in a bounded LRU cache, since BOM cells repeat heavily; `try_parse_to_*` and `parse_many_to_float` report invalid input without raising, so hot loops do not pay for exceptions and error messages on blank or malformed cells.
 
 License:
  - Internal Use Only
@@ -39,11 +44,62 @@ __all__ = [
     "parse_to_integer",
     "parse_to_iso_date_string",
     "parse_to_non_empty_string",
+    "parse_many_to_float",
+    "try_parse_to_float",
+    "try_parse_to_integer",
 ]
 
 import math
-from datetime import datetime
-from typing import Final
+import re
+from datetime import date, datetime
+from functools import lru_cache
+from typing import Final, Iterable
+
+# Distinct strings remembered by the numeric parsers; BOM columns repeat a small set of values
+_NUMERIC_CACHE_SIZE: Final[int] = 4096
+# Distinct date strings remembered by the date parser
+_DATE_CACHE_SIZE: Final[int] = 1024
+
+_ISO_DATE_FORMAT: Final[str] = "%Y-%m-%d"  # Always return canonical ISO date
+_SUPPORTED_DATE_FORMATS: Final[tuple[str, ...]] = ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y")
+# ASCII-only shapes the fast path decides without strptime; everything else falls back to strptime
+_ISO_SHAPE_REGEX: Final[re.Pattern[str]] = re.compile(r"([0-9]{4})-([0-9]{1,2})-([0-9]{1,2})\Z")
+_SLASH_SHAPE_REGEX: Final[re.Pattern[str]] = re.compile(r"([0-9]{1,2})/([0-9]{1,2})/([0-9]{4})\Z")
+
+
+@lru_cache(maxsize=_NUMERIC_CACHE_SIZE)
+def _cached_float(input_str: str) -> float | None:
+    """
+    Parse a string to a finite float, or None if `parse_to_float` would reject it.
+
+    Args:
+        input_str (str): String to parse.
+
+    Returns:
+        float | None: The finite float value, or None for invalid, NaN, or infinite input.
+    """
+    try:
+        value = float(input_str)
+    except ValueError:
+        return None
+    return value if math.isfinite(value) else None
+
+
+@lru_cache(maxsize=_NUMERIC_CACHE_SIZE)
+def _cached_integer(input_str: str) -> int | None:
+    """
+    Parse a string to an integer, or None if `parse_to_integer` would reject it.
+
+    Args:
+        input_str (str): String to parse.
+
+    Returns:
+        int | None: The integer value, or None for invalid input.
+    """
+    try:
+        return int(input_str)
+    except ValueError:
+        return None
 
 
 def is_valid_date_string(date_str: str) -> bool:
@@ -56,11 +112,7 @@ def is_valid_date_string(date_str: str) -> bool:
     Returns:
         bool: True if the string can be parsed to a valid date string, False otherwise.
     """
-    try:
-        parse_to_iso_date_string(date_str)
-        return True
-    except ValueError:
-        return False
+    return _cached_iso_date(str(date_str)) is not None
 
 
 def is_strict_empty_string(input_str: str) -> bool:
@@ -90,11 +142,7 @@ def is_float(input_str: str) -> bool:
     Returns:
         bool: True if the string can be parsed to a float, False otherwise.
     """
-    try:
-        parse_to_float(input_str)
-        return True
-    except ValueError:
-        return False
+    return try_parse_to_float(input_str) is not None
 
 
 def is_integer(input_str: str) -> bool:
@@ -107,11 +155,7 @@ def is_integer(input_str: str) -> bool:
     Returns:
         bool: True if the string can be parsed to an integer, False otherwise.
     """
-    try:
-        parse_to_integer(input_str)
-        return True
-    except ValueError:
-        return False
+    return try_parse_to_integer(input_str) is not None
 
 
 def is_non_empty_string(input_str: str) -> bool:
@@ -131,31 +175,48 @@ def is_non_empty_string(input_str: str) -> bool:
         return False
 
 
-def parse_to_iso_date_string(date_str: str) -> str:
+def _sniff_iso_date(date_component: str) -> str | None:
     """
-    Convert a string into a canonical ISO date string.
-
-    The function attempts to parse the input against multiple date formats, optionally ignoring a trailing time component (separated by "T" or space). On success, it normalizes the output into a zero-padded ISO date string ("YYYY-MM-DD"). Non-zero-padded input is accepted.
+    Convert a date in one of the common unambiguous shapes without `strptime`.
 
-    Supported formats:
-        - YYYY-MM-DD (e.g., "2025-8-6", "2025-08-06")
-        - DD/MM/YYYY (e.g., "6/8/2025", "06/08/2025")
-        - MM/DD/YYYY (e.g., "8/6/2025", "08/06/2025")
+    Picks the format from the separator and component lengths ("YYYY-M-D" or "D/M/YYYY") and validates the calendar date directly. For slash dates DD/MM/YYYY is tried before MM/DD/YYYY, exactly like the `strptime` fallback.
 
     Args:
-        date_str (str): Input string to parse.
+        date_component (str): Date part of the input, without a trailing time part.
 
     Returns:
-        str: Canonical ISO date string in "YYYY-MM-DD" format.
+        str | None: Canonical ISO date string, or None if the shape is not recognized or no format yields a valid date; the caller then falls back to `strptime`.
+    """
+    match = _ISO_SHAPE_REGEX.match(date_component)
+    if match:
+        candidates = ((int(match[1]), int(match[2]), int(match[3])),)
+    else:
+        match = _SLASH_SHAPE_REGEX.match(date_component)
+        if not match:
+            return None
+        first, second, year = int(match[1]), int(match[2]), int(match[3])
+        candidates = ((year, second, first), (year, first, second))  # DD/MM/YYYY, then MM/DD/YYYY
+
+    for year, month, day in candidates:
+        try:
+            # Format like the strptime path so the output is identical, including years below 1000
+            return date(year, month, day).strftime(_ISO_DATE_FORMAT)
+        except ValueError:
+            continue
+    return None
 
-    Raises:
-        ValueError: If the input cannot be parsed as a valid date in the supported formats.
+
+@lru_cache(maxsize=_DATE_CACHE_SIZE)
+def _cached_iso_date(raw_input: str) -> str | None:
     """
-    _ISO_DATE_FORMAT: Final[str] = "%Y-%m-%d"  # Always return canonical ISO date
-    _SUPPORTED_DATE_FORMATS: Final[tuple[str, ...]] = ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y")
+    Convert a date string into a canonical ISO date string, or None if `parse_to_iso_date_string` would reject it.
 
-    raw_input: str = str(date_str)
+    Args:
+        raw_input (str): Input string, possibly with a trailing time part.
 
+    Returns:
+        str | None: Canonical ISO date string, or None if the input is not a valid date in the supported formats.
+    """
     # Remove trailing time part if present (e.g., "2025-08-06T12:00" → "2025-08-06")
     date_component: str = raw_input
     for separator in ("T", " "):
@@ -163,6 +224,11 @@ def parse_to_iso_date_string(date_str: str) -> str:
             date_component = raw_input.split(separator, 1)[0]
             break
 
+    # Fast path for the common shapes; anything it cannot decide goes through strptime
+    iso_date = _sniff_iso_date(date_component)
+    if iso_date is not None:
+        return iso_date
+
     # Attempt parsing, accept non-zero-padded input
     for fmt in _SUPPORTED_DATE_FORMATS:
         try:
@@ -172,6 +238,35 @@ def parse_to_iso_date_string(date_str: str) -> str:
         except ValueError:
             continue
 
+    return None
+
+
+def parse_to_iso_date_string(date_str: str) -> str:
+    """
+    Convert a string into a canonical ISO date string.
+
+    The function attempts to parse the input against multiple date formats, optionally ignoring a trailing time component (separated by "T" or space). On success, it normalizes the output into a zero-padded ISO date string ("YYYY-MM-DD"). Non-zero-padded input is accepted.
+
+    Supported formats:
+        - YYYY-MM-DD (e.g., "2025-8-6", "2025-08-06")
+        - DD/MM/YYYY (e.g., "6/8/2025", "06/08/2025")
+        - MM/DD/YYYY (e.g., "8/6/2025", "08/06/2025")
+
+    Formats are tried in the order listed, so "6/8/2025" is read as 6 August. Common shapes are converted without `strptime` and results are memoized per input string.
+
+    Args:
+        date_str (str): Input string to parse.
+
+    Returns:
+        str: Canonical ISO date string in "YYYY-MM-DD" format.
+
+    Raises:
+        ValueError: If the input cannot be parsed as a valid date in the supported formats.
+    """
+    iso_date = _cached_iso_date(str(date_str))
+    if iso_date is not None:
+        return iso_date
+
     raise ValueError(
         f"'{date_str}' is not a valid date format. "
         f"Supported formats are YYYY-MM-DD, DD/MM/YYYY, MM/DD/YYYY. "
@@ -217,6 +312,11 @@ def parse_to_integer(input_str: str) -> int:
     Raises:
         ValueError: If the string is not a valid integer representation.
     """
+    # Fast path: valid strings are served from the cache without raising
+    value = try_parse_to_integer(input_str)
+    if value is not None:
+        return value
+
     try:
         # int() naturally rejects float-like strings such as "1.0"
         return int(input_str)
@@ -242,6 +342,11 @@ def parse_to_float(input_str: str) -> float:
     Raises:
         ValueError: If the string is not a valid float representation or if the parsed value is NaN or infinite.
     """
+    # Fast path: valid strings are served from the cache without raising
+    value = try_parse_to_float(input_str)
+    if value is not None:
+        return value
+
     try:
         # Attempt parsing (captures bad syntax like "1.2.3" or non-numeric)
         value = float(input_str)
@@ -258,6 +363,70 @@ def parse_to_float(input_str: str) -> float:
     return value
 
 
+def try_parse_to_integer(input_str: str) -> int | None:
+    """
+    Parse a string to an integer without raising.
+
+    Accepts and rejects exactly the inputs `parse_to_integer` does; strings are memoized.
+
+    Args:
+        input_str (str): String to parse as an integer.
+
+    Returns:
+        int | None: The parsed integer value, or None if the input is not a valid integer representation.
+    """
+    # Only exact strings are cached: equal keys of other types (1, 1.0, True) must not share entries
+    if type(input_str) is str:
+        return _cached_integer(input_str)
+    try:
+        return int(input_str)
+    except (ValueError, TypeError):
+        return None
+
+
+def try_parse_to_float(input_str: str) -> float | None:
+    """
+    Parse a string to a finite float without raising.
+
+    Accepts and rejects exactly the inputs `parse_to_float` does, including the NaN and infinity rejection; strings are memoized.
+
+    Args:
+        input_str (str): String to parse as a float.
+
+    Returns:
+        float | None: The parsed finite float value, or None if the input is invalid, NaN, or infinite.
+    """
+    # Only exact strings are cached: equal keys of other types (1, 1.0, True) must not share entries
+    if type(input_str) is str:
+        return _cached_float(input_str)
+    try:
+        value = float(input_str)
+    except (ValueError, TypeError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def parse_many_to_float(values: Iterable[str]) -> tuple[list[float], list[bool]]:
+    """
+    Parse a sequence of strings to finite floats in one pass.
+
+    Each value is accepted or rejected exactly like `parse_to_float`; invalid values do not raise but are reported in the validity mask.
+
+    Args:
+        values (Iterable[str]): Strings to parse, e.g., one BOM column.
+
+    Returns:
+        tuple[list[float], list[bool]]: Parsed values (0.0 where invalid) and a mask that is True where the value is valid.
+    """
+    parsed: list[float] = []
+    valid: list[bool] = []
+    for value in values:
+        number = try_parse_to_float(value)
+        parsed.append(0.0 if number is None else number)
+        valid.append(number is not None)
+    return parsed, valid
+
+
 def parse_to_non_empty_string(input_str: str) -> str:
     """
     Parse a string to a not empty string.
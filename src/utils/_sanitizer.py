@@ -20,6 +20,7 @@ Example Usage:
 Dependencies:
     - Python >= 3.10
     - Standard Library: re
+    - External Packages: pandas (imported lazily)
 
 Notes:
     - Functions are side-effect free and operate purely on and return string values.
@@ -37,7 +38,10 @@ __all__ = [
 ]
 
 import re
-import pandas as pd
+
+from . import _lazy as lazy
+
+pd = lazy.lazy_import("pandas")  # Imported on first null check of a non-string value
 
 # CHARACTER CONSTANTS
 EMPTY_STRING = ''  # No character
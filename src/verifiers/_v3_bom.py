@@ -10,17 +10,19 @@ Example Usage:
     # Direct module usage (acceptable in unit tests or internal scripts only):
     from src.verifiers import _v3_bom as verify
     verify.verify_v3_bom(bom)
+    failures = verify.collect_v3_bom_failures(bom)
 
 Dependencies:
     - Python >= 3.10
-    - Standard Library: None
+    - Standard Library: dataclasses, typing
     - Internal Modules:
         * src.approve.interfaces  (field + logic verification)
         * src.models.interfaces   (BOM, Board, Row, Header models)
 
 Notes:
-    - Fail-fast: the first ValueError halts verification with contextual details.
-    - Unexpected exceptions are wrapped in RuntimeError with function context.
+    - Fail-fast: `verify_v3_bom` halts on the first ValueError with contextual details.
+    - Collect-all: `collect_v3_bom_failures` evaluates every rule in one pass and returns a structured report; its first entry is the error the fail-fast mode would raise.
+    - Unexpected exceptions are wrapped in RuntimeError with function context in both modes.
 
 License:
     Internal Use Only.
@@ -28,10 +30,40 @@ License:
 
 __all__ = []  # Internal-only; not part of public API. Star import from this module gets nothing
 
+from dataclasses import dataclass
+from typing import Callable
+
 from src.approve import interfaces as approve
 from src.models import interfaces as model
 
 
+@dataclass(frozen=True)
+class VerificationFailure:
+    """
+    A single rule violation reported by collect-all verification.
+
+    Attributes:
+        board (str): Sheet name of the board that failed.
+        row (int | None): One-based row number within the board; None for header rules.
+        field (str): Excel label of the field the rule reports on.
+        rule (str): Name of the `approve` function that failed.
+        message (str): Rule violation text raised by the `approve` function.
+    """
+    board: str
+    row: int | None
+    field: str
+    rule: str
+    message: str
+
+    def __str__(self) -> str:
+        """
+        Return a single-line, pipe-separated representation: "board | section | field | rule | message".
+        """
+        section = model.Header.__name__ if self.row is None else f"{model.Row.__name__}: {self.row}"
+        message = " ".join(self.message.split())
+        return f"{self.board} | {section} | {self.field} | {self.rule} | {message}"
+
+
 def verify_v3_bom(bom: model.Bom) -> None:
     """
     Run all Version 3 BOM verification on the given BOM instance.
@@ -75,6 +107,200 @@ def verify_v3_bom(bom: model.Bom) -> None:
     return
 
 
+def collect_v3_bom_failures(bom: model.Bom) -> tuple[VerificationFailure, ...]:
+    """
+    Run all Version 3 BOM verification and collect every rule violation in one pass.
+
+    Evaluates the same field-level and logic-level rules as `verify_v3_bom`, in the same order, but records each ValueError as a `VerificationFailure` instead of stopping. Numeric row logic is evaluated per board with the vectorized `approve.board_*` validators.
+
+    Args:
+        bom (model.Bom): Parsed BOM object containing boards, headers, and rows to be verified.
+
+    Returns:
+        tuple[VerificationFailure, ...]: All rule violations in verification order; empty if the BOM passes.
+
+    Raises:
+        RuntimeError: If an unexpected exception occurs during verification.
+    """
+    failures: list[VerificationFailure] = []
+
+    try:
+        for board in bom.boards:
+            failures.extend(_collect_board_failures(board))
+    except Exception as ex:
+        raise RuntimeError(
+            f"Unexpected error during verification of file '{bom.file_name}'"
+            f"\n{ex}"
+        ) from ex
+
+    return tuple(failures)
+
+
+def _collect_board_failures(board: model.Board) -> list[VerificationFailure]:
+    """
+    Collect all rule violations of a single board in verification order.
+
+    Args:
+        board (model.Board): Board whose rows and header are being verified.
+
+    Returns:
+        list[VerificationFailure]: Violations for rows (in row order), then header logic, then header values.
+
+    Raises:
+        RuntimeError: If an unexpected exception occurs inside a verification function.
+    """
+    failures: list[VerificationFailure] = []
+
+    # Evaluate numeric row logic for the whole board at once, keyed by (row index, rule)
+    numerics = approve.parse_board_numerics(board.rows)
+    board_violations: dict[tuple[int, str], str] = {}
+    for board_fn in (
+            approve.board_unit_price_specified,
+            approve.board_subtotal_zero,
+            approve.board_sub_total_calculation,
+    ):
+        for violation in board_fn(numerics):
+            board_violations[(violation.row_index, violation.rule)] = violation.message
+
+    for row_index, row in enumerate(board.rows):
+        row_number = row_index + 1
+
+        # Field-level rules
+        for fn, label, value in _row_value_cases(row):
+            message = _call_collect(fn, value)
+            if message:
+                failures.append(VerificationFailure(board.sheet_name, row_number, label, fn.__name__, message))
+
+        # Logic-level rules; numeric rules come from the board-level evaluation
+        for fn, label in _row_logic_cases():
+            if fn.__name__ in _BOARD_EVALUATED_RULES:
+                message = board_violations.get((row_index, fn.__name__), "")
+            else:
+                message = _call_collect(fn, row)
+            if message:
+                failures.append(VerificationFailure(board.sheet_name, row_number, label, fn.__name__, message))
+
+    # Header logic that depends on the full set of rows
+    message = _call_collect(approve.board_material_cost_calculation, numerics, board.header)
+    if message:
+        failures.append(VerificationFailure(
+            board.sheet_name, None, model.HeaderFields.MATERIAL_COST, approve.material_cost_calculation.__name__,
+            message))
+    message = _call_collect(approve.total_cost_calculation, board.header)
+    if message:
+        failures.append(VerificationFailure(
+            board.sheet_name, None, model.HeaderFields.TOTAL_COST, approve.total_cost_calculation.__name__, message))
+
+    # Header field-level rules
+    for fn, label, value in _header_value_cases(board.header):
+        message = _call_collect(fn, value)
+        if message:
+            failures.append(VerificationFailure(board.sheet_name, None, label, fn.__name__, message))
+
+    return failures
+
+
+def _call_collect(fn: Callable, *args) -> str:
+    """
+    Call a verification function and return its violation message instead of raising.
+
+    Args:
+        fn (Callable): Verification function that raises ValueError on violation.
+        *args: Arguments forwarded to the verification function.
+
+    Returns:
+        str: The ValueError message, or an empty string when the rule passes.
+
+    Raises:
+        RuntimeError: If the verification function raises anything other than ValueError.
+    """
+    try:
+        fn(*args)
+    except ValueError as error:
+        return str(error)
+    except Exception as ex:
+        raise RuntimeError(
+            f"Unexpected error during verification at '{fn.__name__}'"
+            f"\n{ex}"
+        ) from ex
+    return ""
+
+
+def _header_value_cases(header: model.Header) -> list[tuple[Callable, str, str]]:
+    """
+    Pair each header field with its verification function and Excel label.
+
+    Args:
+        header (model.Header): Header instance whose fields are being verified.
+
+    Returns:
+        list[tuple[Callable, str, str]]: (verification function, field label, field value) in verification order.
+    """
+    return [
+        (approve.model_number, model.HeaderFields.MODEL_NUMBER, header.model_no),
+        (approve.board_name, model.HeaderFields.BOARD_NAME, header.board_name),
+        (approve.board_supplier, model.HeaderFields.BOARD_SUPPLIER, header.manufacturer),
+        (approve.build_stage, model.HeaderFields.BUILD_STAGE, header.build_stage),
+        (approve.bom_date, model.HeaderFields.BOM_DATE, header.date),
+        (approve.material_cost, model.HeaderFields.MATERIAL_COST, header.material_cost),
+        (approve.overhead_cost, model.HeaderFields.OVERHEAD_COST, header.overhead_cost),
+        (approve.total_cost, model.HeaderFields.TOTAL_COST, header.total_cost),
+    ]
+
+
+def _row_value_cases(row: model.Row) -> list[tuple[Callable, str, str]]:
+    """
+    Pair each row field with its verification function and Excel label.
+
+    Args:
+        row (model.Row): Row instance whose fields are being verified.
+
+    Returns:
+        list[tuple[Callable, str, str]]: (verification function, field label, field value) in verification order.
+    """
+    return [
+        (approve.item, model.RowFields.ITEM, row.item),
+        (approve.component_type, model.RowFields.COMPONENT, row.component_type),
+        (approve.device_package, model.RowFields.PACKAGE, row.device_package),
+        (approve.description, model.RowFields.DESCRIPTION, row.description),
+        (approve.units, model.RowFields.UNITS, row.unit),
+        (approve.classification, model.RowFields.CLASSIFICATION, row.classification),
+        (approve.mfg_name, model.RowFields.MANUFACTURER, row.manufacturer),
+        (approve.mfg_part_no, model.RowFields.MFG_PART_NO, row.mfg_part_number),
+        (approve.ul_vde_number, model.RowFields.UL_VDE_NUMBER, row.ul_vde_number),
+        (approve.validated_at, model.RowFields.VALIDATED_AT, row.validated_at),
+        (approve.quantity, model.RowFields.QTY, row.qty),
+        (approve.designator, model.RowFields.DESIGNATOR, row.designator),
+        (approve.unit_price, model.RowFields.UNIT_PRICE, row.unit_price),
+        (approve.sub_total, model.RowFields.SUB_TOTAL, row.sub_total),
+    ]
+
+
+def _row_logic_cases() -> list[tuple[Callable, str]]:
+    """
+    Pair each row logic verification function with the Excel label of the field it reports on.
+
+    Returns:
+        list[tuple[Callable, str]]: (verification function, field label) in verification order.
+    """
+    return [
+        (approve.designator_required, model.RowFields.DESIGNATOR),
+        (approve.designator_count, model.RowFields.DESIGNATOR),
+        (approve.quantity_zero, model.RowFields.QTY),
+        (approve.unit_price_specified, model.RowFields.UNIT_PRICE),
+        (approve.subtotal_zero, model.RowFields.SUB_TOTAL),
+        (approve.sub_total_calculation, model.RowFields.SUB_TOTAL),
+    ]
+
+
+# Row logic rules evaluated once per board by the vectorized `approve.board_*` validators
+_BOARD_EVALUATED_RULES: frozenset[str] = frozenset({
+    approve.unit_price_specified.__name__,
+    approve.subtotal_zero.__name__,
+    approve.sub_total_calculation.__name__,
+})
+
+
 def _verify_header_value(header: model.Header) -> None:
     """
     Run field-level verification on BOM header values.
@@ -93,19 +319,8 @@ def _verify_header_value(header: model.Header) -> None:
         RuntimeError: If an unexpected exception occurs inside a header
             verification function.
     """
-    # Pair each header field with its corresponding verification function.
-    cases = [
-        (approve.model_number, header.model_no),
-        (approve.board_name, header.board_name),
-        (approve.board_supplier, header.manufacturer),
-        (approve.build_stage, header.build_stage),
-        (approve.bom_date, header.date),
-        (approve.material_cost, header.material_cost),
-        (approve.overhead_cost, header.overhead_cost),
-        (approve.total_cost, header.total_cost),
-    ]
     # Run each field-level verification and wrap failures with function context.
-    for fn, value in cases:
+    for fn, _, value in _header_value_cases(header):
         try:
             fn(value)
         except ValueError as error:
@@ -180,25 +395,8 @@ def _verify_row_value(row: model.Row) -> None:
         RuntimeError: If an unexpected exception occurs inside a row field
             verification function.
     """
-    cases = [
-        (approve.item, row.item),
-        (approve.component_type, row.component_type),
-        (approve.device_package, row.device_package),
-        (approve.description, row.description),
-        (approve.units, row.unit),
-        (approve.classification, row.classification),
-        (approve.mfg_name, row.manufacturer),
-        (approve.mfg_part_no, row.mfg_part_number),
-        (approve.ul_vde_number, row.ul_vde_number),
-        (approve.validated_at, row.validated_at),
-        (approve.quantity, row.qty),
-        (approve.designator, row.designator),
-        (approve.unit_price, row.unit_price),
-        (approve.sub_total, row.sub_total),
-    ]
-
     # Run each row-level field verification and wrap failures with function context.
-    for fn, value in cases:
+    for fn, _, value in _row_value_cases(row):
         try:
             fn(value)
         except ValueError as error:
@@ -234,17 +432,8 @@ def _verify_row_logic(row: model.Row) -> None:
         RuntimeError: If an unexpected exception occurs inside a row logic
             verification function.
     """
-    cases = [
-        approve.designator_required,
-        approve.designator_count,
-        approve.quantity_zero,
-        approve.unit_price_specified,
-        approve.subtotal_zero,
-        approve.sub_total_calculation,
-    ]
-
     # Run each row-level logic verification and wrap failures with function context.
-    for fn in cases:
+    for fn, _ in _row_logic_cases():
         try:
             fn(row)
         except ValueError as error:
@@ -1,12 +1,14 @@
 """
 Public interface façade for BOM verification workflows.
 
-This module exposes a curated, stable surface over the `verifiers` package so callers can run BOM verification without depending on internal layout. Currently it provides the version-3 BOM verifier.
+This module exposes a curated, stable surface over the `verifiers` package so callers can run BOM verification without depending on internal layout. Currently it provides the version-3 BOM verifier in fail-fast and collect-all modes.
 
 Example Usage:
     # Preferred usage via package interface:
     from src.verifiers import interfaces as verify
     verify.v3_bom(bom)
+    for failure in verify.v3_bom_failures(bom):
+        print(failure)
 
     # Direct module usage (acceptable in tests or internal tools only):
     from src.verifiers.interfaces import v3_bom
@@ -30,7 +32,13 @@ License:
 
 # noinspection PyProtectedMember
 from ._v3_bom import verify_v3_bom as v3_bom
+# noinspection PyProtectedMember
+from ._v3_bom import collect_v3_bom_failures as v3_bom_failures
+# noinspection PyProtectedMember
+from ._v3_bom import VerificationFailure
 
 __all__ = [
     "v3_bom",
+    "v3_bom_failures",
+    "VerificationFailure",
 ]
@@ -0,0 +1,260 @@
+"""
+Unit tests for the board-level vectorized logic validators.
+
+This module verifies that each board-level rule:
+ - Reports exactly the rows, and the messages, that the per-row validators in `_logic` would raise for
+ - Skips rows whose numeric fields are unparsable
+ - Keeps the material cost aggregate identical to the per-row accumulation
+
+Example Usage:
+    # Preferred run from project root:
+    python -m unittest tests/approve/test__board.py
+
+    # Discover all tests:
+    python -m unittest discover -s tests
+
+Dependencies:
+    - Python >= 3.10
+    - Standard Library: unittest, dataclasses, random
+    - External Packages: None
+
+Notes:
+    - Equivalence tests compare against the per-row validators instead of hard-coded messages.
+    - Half-step values (e.g., 0.5 x 0.123457) are included to exercise the rounding-boundary re-check.
+
+License:
+    - Internal Use Only
+"""
+
+import random
+import unittest
+from dataclasses import replace
+
+# noinspection PyProtectedMember
+from src.approve import _board as board  # Direct internal import — acceptable in tests
+# noinspection PyProtectedMember
+from src.approve import _logic as logic  # Reference implementation
+from tests.fixtures import v3_bom as bfx
+
+
+def _expected_violations(rows, fn) -> list[tuple[int, str]]:
+    """
+    Run a per-row validator over all rows and collect (row index, message) for each raise.
+    """
+    expected = []
+    for idx, row in enumerate(rows):
+        try:
+            fn(row)
+        except ValueError as e:
+            expected.append((idx, str(e)))
+    return expected
+
+
+def _random_rows(count: int, seed: int) -> tuple:
+    """
+    Build a deterministic set of rows mixing valid, invalid, zero, and half-step numeric values.
+    """
+    rng = random.Random(seed)
+    cells = ("", "abc", "nan", "inf", "0", "0.0", "-1", "1", "2", "0.5", "3", "400", "0.123457", "0.0617285",
+             "0.0078125", "0.1", "0.2", "0.3", "0.6", "1.2", "1e308")
+    rows = []
+    for _ in range(count):
+        qty = rng.choice(cells)
+        unit_price = rng.choice(cells)
+        if rng.random() < 0.5:
+            # Often make the sub-total the exact product so both pass and fail paths are exercised
+            try:
+                sub_total = repr(float(qty) * float(unit_price))
+            except ValueError:
+                sub_total = rng.choice(cells)
+        else:
+            sub_total = rng.choice(cells)
+        rows.append(replace(bfx.ROW_A_1, qty=qty, unit_price=unit_price, sub_total=sub_total))
+    return tuple(rows)
+
+
+class TestParseBoardNumerics(unittest.TestCase):
+    """
+    Unit tests for `parse_board_numerics`.
+    """
+
+    def test_masks(self):
+        """
+        Should mark unparsable, NaN, and infinite cells invalid and store 0.0 for them.
+        """
+        # ARRANGE
+        rows = (
+            replace(bfx.ROW_A_1, qty="2", unit_price="", sub_total="nan"),
+            replace(bfx.ROW_A_1, qty="x", unit_price="0.5", sub_total="inf"),
+        )
+
+        # ACT
+        numerics = board.parse_board_numerics(rows)
+
+        # ASSERT
+        with self.subTest("Qty", Out=numerics.qty.tolist()):
+            self.assertEqual(numerics.qty.tolist(), [2.0, 0.0])
+            self.assertEqual(numerics.qty_valid.tolist(), [True, False])
+        with self.subTest("Unit price", Out=numerics.unit_price.tolist()):
+            self.assertEqual(numerics.unit_price.tolist(), [0.0, 0.5])
+            self.assertEqual(numerics.unit_price_valid.tolist(), [False, True])
+        with self.subTest("Sub-total", Out=numerics.sub_total_valid.tolist()):
+            self.assertEqual(numerics.sub_total_valid.tolist(), [False, False])
+
+    def test_empty(self):
+        """
+        Should return empty arrays for a board without rows.
+        """
+        # ACT
+        numerics = board.parse_board_numerics(())
+
+        # ASSERT
+        with self.subTest(Out=len(numerics.qty), Exp=0):
+            self.assertEqual(len(numerics.qty), 0)
+
+
+class TestRowRules(unittest.TestCase):
+    """
+    Equivalence tests for the board-level row rules against the per-row validators.
+    """
+
+    CASES = (
+        (board.board_sub_total_calculation, logic.sub_total_calculation),
+        (board.board_subtotal_zero, logic.subtotal_zero),
+        (board.board_unit_price_specified, logic.unit_price_specified),
+    )
+
+    def test_fixtures(self):
+        """
+        Should report no violations for valid fixture boards and the same violations as per-row rules for bad ones.
+        """
+        # ARRANGE
+        boards = (bfx.BOARD_A, bfx.BOARD_B1, bfx.BOARD_B2, bfx.BOARD_A_BAD_MATH, bfx.BOARD_A_BAD_VALUE)
+
+        for bom_board in boards:
+            numerics = board.parse_board_numerics(bom_board.rows)
+            for board_fn, row_fn in self.CASES:
+                expected = _expected_violations(bom_board.rows, row_fn)
+
+                # ACT
+                result = [(v.row_index, v.message) for v in board_fn(numerics)]
+
+                # ASSERT
+                with self.subTest(board_fn.__name__, Sheet=bom_board.sheet_name, Out=result, Exp=expected):
+                    self.assertEqual(result, expected)
+
+    def test_random_rows(self):
+        """
+        Should match the per-row validators on a large mix of valid, invalid, and rounding-boundary values.
+        """
+        # ARRANGE
+        rows = _random_rows(count=2000, seed=26)
+        numerics = board.parse_board_numerics(rows)
+
+        for board_fn, row_fn in self.CASES:
+            expected = _expected_violations(rows, row_fn)
+
+            # ACT
+            violations = board_fn(numerics)
+            result = [(v.row_index, v.message) for v in violations]
+
+            # ASSERT
+            with self.subTest(board_fn.__name__, Out=len(result), Exp=len(expected)):
+                self.assertEqual(result, expected)
+            with self.subTest("Rule name", Fn=board_fn.__name__):
+                self.assertTrue(all(v.rule == row_fn.__name__ for v in violations))
+
+    def test_half_step(self):
+        """
+        Should apply the scalar rounding rule when the product lies on a rounding half-step.
+        """
+        # ARRANGE
+        rows = (
+            replace(bfx.ROW_A_1, qty="0.5", unit_price="0.123457", sub_total="0.061728"),
+            replace(bfx.ROW_A_1, qty="0.5", unit_price="0.123457", sub_total="0.061729"),
+        )
+        expected = _expected_violations(rows, logic.sub_total_calculation)
+
+        # ACT
+        result = [(v.row_index, v.message) for v in
+                  board.board_sub_total_calculation(board.parse_board_numerics(rows))]
+
+        # ASSERT
+        with self.subTest(Out=result, Exp=expected):
+            self.assertEqual(result, expected)
+
+
+class TestBoardMaterialCostCalculation(unittest.TestCase):
+    """
+    Unit tests for `board_material_cost_calculation`.
+    """
+
+    def test_valid(self):
+        """
+        Should pass silently when the material cost equals the aggregate of sub-totals.
+        """
+        # ARRANGE
+        boards = (bfx.BOARD_A, bfx.BOARD_B1, bfx.BOARD_B2)
+
+        for bom_board in boards:
+            # ACT
+            try:
+                board.board_material_cost_calculation(board.parse_board_numerics(bom_board.rows), bom_board.header)
+                result = None
+            except ValueError as e:
+                result = type(e).__name__
+
+            # ASSERT
+            with self.subTest(Sheet=bom_board.sheet_name, Out=result, Exp=None):
+                self.assertIsNone(result)
+
+    def test_invalid(self):
+        """
+        Should raise the same ValueError as the per-row implementation when the material cost is wrong.
+        """
+        # ARRANGE
+        header = replace(bfx.BOARD_A.header, material_cost="999")
+        rows = bfx.BOARD_A.rows
+        try:
+            logic.material_cost_calculation(rows, header)
+            expected = ""
+        except ValueError as e:
+            expected = str(e)
+
+        # ACT
+        try:
+            board.board_material_cost_calculation(board.parse_board_numerics(rows), header)
+            result = ""
+        except ValueError as e:
+            result = str(e)
+
+        # ASSERT
+        with self.subTest(Out=result, Exp=expected):
+            self.assertNotEqual(result, "")
+            self.assertEqual(result, expected)
+
+    def test_ignore(self):
+        """
+        Should skip validation when no sub-total or the material cost cannot be parsed.
+        """
+        # ARRANGE
+        cases = (
+            (tuple(replace(r, sub_total="") for r in bfx.BOARD_A.rows), bfx.BOARD_A.header),
+            (bfx.BOARD_A.rows, replace(bfx.BOARD_A.header, material_cost="abc")),
+        )
+
+        for rows, header in cases:
+            # ACT
+            try:
+                board.board_material_cost_calculation(board.parse_board_numerics(rows), header)
+                result = None
+            except ValueError as e:
+                result = type(e).__name__
+
+            # ASSERT
+            with self.subTest(Out=result, Exp=None):
+                self.assertIsNone(result)
+
+
+if __name__ == '__main__':
+    unittest.main()
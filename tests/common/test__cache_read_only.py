@@ -29,6 +29,7 @@ import tempfile
 import unittest
 from typing import Any
 from unittest.mock import patch
+from src.utils import bundle_io
 from src.utils import folder_path
 from src.utils import json_io
 
@@ -193,6 +194,213 @@ class TestCacheReadOnly(_Asserts, _TestFixture):
         self.assert_equal(actual=actual_error, expected=expected_error)
 
 
+class TestBundle(_Asserts, _TestFixture):
+    """
+    Unit tests for loading through a precompiled bundle.
+    """
+
+    def _paths(self) -> tuple[str, str]:
+        """
+        Return the JSON resource path and its bundle path.
+        """
+        resource_path = os.path.join(self.cache_folder, TEST_VALID_RESOURCE_NAME + json_io.JSON_FILE_EXT)
+        return resource_path, bundle_io.bundle_path_for(resource_path)
+
+    def test_fresh_bundle_used(self):
+        """
+        Should load the payload and version stamp from a fresh bundle without parsing the JSON file.
+        """
+        # ARRANGE
+        resource_path, bundle_path = self._paths()
+        bundle_io.save_bundle_file(bundle_path, TEST_VALID_JSON, resource_path, version="V-BUNDLE")
+
+        with patch.object(cro.json_io, "load_json_packet_mapped") as p_load:
+            # ACT
+            cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+
+        # ASSERT
+        self.assert_equal(actual=cache.get_data_map_copy(), expected=TEST_VALID_JSON)
+        self.assert_equal(actual=cache.get_version(), expected="V-BUNDLE")
+        with self.subTest("JSON not parsed", Calls=p_load.call_count):
+            self.assertEqual(p_load.call_count, 0)
+
+    def test_unversioned_bundle_ignored(self):
+        """
+        Should fall back to the JSON file when the bundle carries no version stamp.
+        """
+        # ARRANGE
+        resource_path, bundle_path = self._paths()
+        bundle_io.save_bundle_file(bundle_path, {"B_String": "OLD", "C_List": []}, resource_path)
+        expected_version = json_io.load_json_file(resource_path)["meta_data"]["payload_sha256"]
+
+        # ACT
+        cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+
+        # ASSERT
+        self.assert_equal(actual=cache.get_data_map_copy(), expected=TEST_VALID_JSON)
+        self.assert_equal(actual=cache.get_version(), expected=expected_version)
+
+    def test_stale_bundle_ignored(self):
+        """
+        Should fall back to the JSON file when the bundle no longer matches it.
+        """
+        # ARRANGE
+        resource_path, bundle_path = self._paths()
+        bundle_io.save_bundle_file(bundle_path, {"B_String": "OLD", "C_List": []}, resource_path)
+        # Rewrite the JSON with a different payload so the bundle is stale
+        updated = dict(TEST_VALID_JSON, B_String="NEW VALUE")
+        json_io.save_json_file(resource_path, json_io.create_json_packet(updated, source_file="x.json"))
+
+        # ACT
+        cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+
+        # ASSERT
+        self.assert_equal(actual=cache.get_value("B_String", str), expected="NEW VALUE")
+
+
+class TestReloadIfChanged(_Asserts, _TestFixture):
+    """
+    Unit tests for version stamps and in-place reloading of changed resources.
+    """
+
+    def _rewrite(self, payload: dict[str, Any]) -> str:
+        """
+        Rewrite the valid resource with a new payload and move its modification time forward; return the file path.
+        """
+        resource_path = os.path.join(self.cache_folder, TEST_VALID_RESOURCE_NAME + json_io.JSON_FILE_EXT)
+        stamp_ns = os.stat(resource_path).st_mtime_ns + 1_000_000_000
+        json_io.save_json_file(resource_path, json_io.create_json_packet(payload, source_file="x.json"))
+        os.utime(resource_path, ns=(stamp_ns, stamp_ns))
+        return resource_path
+
+    def test_version_is_payload_checksum(self):
+        """
+        Should stamp the loaded data with the payload SHA-256 from the resource metadata.
+        """
+        # ARRANGE
+        resource_path = os.path.join(self.cache_folder, TEST_VALID_RESOURCE_NAME + json_io.JSON_FILE_EXT)
+        expected = json_io.extract_payload_checksum(json_io.load_json_file(resource_path))
+
+        # ACT
+        cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+
+        # ASSERT
+        self.assert_equal(actual=cache.get_version(), expected=expected)
+
+    def test_unchanged(self):
+        """
+        Should report no change and keep the data when the file is untouched.
+        """
+        # ARRANGE
+        cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+        view = cache.get_data_map_view()
+
+        with patch.object(cro, "_load_versioned_resource") as p_load:
+            # ACT
+            changed = cache.has_source_changed()
+            reloaded = cache.reload_if_changed()
+
+        # ASSERT
+        self.assert_equal(actual=(changed, reloaded), expected=(False, False))
+        with self.subTest("Not reparsed", Calls=p_load.call_count):
+            self.assertEqual(p_load.call_count, 0)
+        with self.subTest("View kept"):
+            self.assertIs(cache.get_data_map_view(), view)
+
+    def test_changed(self):
+        """
+        Should reload new data in place and change the version stamp when the file changes.
+        """
+        # ARRANGE
+        cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+        old_version = cache.get_version()
+        _ = cache.get_data_map_view()
+        updated = dict(TEST_VALID_JSON, B_String="NEW VALUE")
+        self._rewrite(updated)
+
+        # ACT
+        changed = cache.has_source_changed()
+        reloaded = cache.reload_if_changed()
+
+        # ASSERT
+        self.assert_equal(actual=(changed, reloaded), expected=(True, True))
+        self.assert_equal(actual=cache.get_data_map_view()["B_String"], expected="NEW VALUE")
+        with self.subTest("Version changed"):
+            self.assertNotEqual(cache.get_version(), old_version)
+        with self.subTest("Change consumed"):
+            self.assertFalse(cache.has_source_changed())
+
+    def test_touched_same_content(self):
+        """
+        Should keep the data and version when the file is rewritten with identical content.
+        """
+        # ARRANGE
+        cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+        old_version = cache.get_version()
+        self._rewrite(TEST_VALID_JSON)
+
+        # ACT
+        reloaded = cache.reload_if_changed()
+
+        # ASSERT
+        self.assert_equal(actual=reloaded, expected=False)
+        self.assert_equal(actual=cache.get_version(), expected=old_version)
+
+    def test_invalid_update_keeps_data(self):
+        """
+        Should keep serving the previous data when the changed file fails validation, until it changes again.
+        """
+        # ARRANGE
+        cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+        old_version = cache.get_version()
+        self._rewrite({"A_Char": "missing required keys"})
+
+        # ACT
+        reloaded = cache.reload_if_changed()
+        retried = cache.has_source_changed()
+
+        # ASSERT
+        self.assert_equal(actual=(reloaded, retried), expected=(False, False))
+        self.assert_equal(actual=cache.get_data_map_copy(), expected=TEST_VALID_JSON)
+        self.assert_equal(actual=cache.get_version(), expected=old_version)
+
+    def test_missing_file(self):
+        """
+        Should not report a change when the file was removed; the loaded data stays in use.
+        """
+        # ARRANGE
+        cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+        os.remove(os.path.join(self.cache_folder, TEST_VALID_RESOURCE_NAME + json_io.JSON_FILE_EXT))
+
+        # ACT
+        reloaded = cache.reload_if_changed()
+
+        # ASSERT
+        self.assert_equal(actual=reloaded, expected=False)
+        self.assert_equal(actual=cache.get_data_map_copy(), expected=TEST_VALID_JSON)
+
+
+    def test_reload_if_due(self):
+        """
+        Should check the file only once the interval since the load or the previous check has passed.
+        """
+        # ARRANGE
+        cache = cro.CacheReadOnly(self.cache_folder, TEST_VALID_RESOURCE_NAME, TEST_VALID_REQ_KEYS)
+        self._rewrite(dict(TEST_VALID_JSON, B_String="NEW VALUE"))
+
+        with patch.object(cro.time, "monotonic") as p_clock:
+            p_clock.return_value = cache._last_check_s + 0.5
+
+            # ACT
+            throttled = cache.reload_if_due(1.0)
+            p_clock.return_value += 1.0
+            due = cache.reload_if_due(1.0)
+            again = cache.reload_if_due(1.0)
+
+        # ASSERT
+        self.assert_equal(actual=(throttled, due, again), expected=(False, True, False))
+        self.assert_equal(actual=cache.get_data_map_view()["B_String"], expected="NEW VALUE")
+
 class TestExtractUppercaseKeys(unittest.TestCase):
     """
     Unit tests for the `extract_uppercase_keys` helper function.
@@ -338,6 +546,79 @@ class TestGetDataMapCopy(_Asserts, _TestFixture):
         self.assert_equal(actual=fresh, expected=TEST_VALID_JSON)
 
 
+class TestGetDataMapView(_Asserts, _TestFixture):
+    """
+    Unit tests for get_data_map_view.
+    """
+
+    def _cache(self) -> cro.CacheReadOnly:
+        """
+        Build a cache over the valid test resource.
+        """
+        with patch.object(folder_path, "resolve_project_folder") as p_root:
+            p_root.return_value = self.tmp_project_root
+            return cro.CacheReadOnly(
+                self.cache_folder,
+                TEST_VALID_RESOURCE_NAME,
+                TEST_VALID_REQ_KEYS,
+            )
+
+    def test_valid(self):
+        """
+        Should return a mapping equal to the payload with lists frozen to tuples.
+        """
+        # ARRANGE
+        cache = self._cache()
+        expected_map = {"A_Char": "A", "B_String": "ABC123!@#", "C_List": ("1", "ABC")}
+
+        # ACT
+        actual_map = dict(cache.get_data_map_view())
+
+        # ASSERT
+        self.assert_equal(actual=actual_map, expected=expected_map)
+
+    def test_read_only_and_shared(self):
+        """
+        Should reject mutation and return the same view object on every call.
+        """
+        # ARRANGE
+        cache = self._cache()
+        view = cache.get_data_map_view()
+
+        # ACT
+        try:
+            view["B_String"] = "MUTATED"  # type: ignore[index]
+            actual = ""
+        except TypeError as err:
+            actual = type(err).__name__
+
+        # ASSERT
+        self.assert_equal(actual=actual, expected=TypeError.__name__)
+        with self.subTest("Shared"):
+            self.assertIs(cache.get_data_map_view(), view)
+        with self.subTest("Copy unaffected"):
+            self.assertEqual(cache.get_data_map_copy(), TEST_VALID_JSON)
+
+    def test_freeze_nested(self):
+        """
+        Should freeze nested dictionaries and lists recursively.
+        """
+        # ARRANGE
+        data = {"outer": {"inner": [1, {"deep": [2]}]}}
+
+        # ACT
+        frozen = cro._freeze(data)
+
+        # ASSERT
+        with self.subTest("Nested mapping"):
+            with self.assertRaises(TypeError):
+                frozen["outer"]["inner"] = ()
+        with self.subTest("Nested tuple", Out=frozen["outer"]["inner"][1]["deep"]):
+            self.assertEqual(frozen["outer"]["inner"][1]["deep"], (2,))
+        with self.subTest("Source unchanged", Out=data):
+            self.assertEqual(data, {"outer": {"inner": [1, {"deep": [2]}]}})
+
+
 class TestGetKeys(_Asserts, _TestFixture):
     """
     Unit tests for get_keys.
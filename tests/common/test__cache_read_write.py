@@ -6,6 +6,7 @@ This module verifies that CacheReadWrite:
     - Populates required keys and default values on initialization
     - Provides correct key/value access through get_value() and get_keys()
     - Persists updates via set_value() and enforces allowed keys
+    - Writes batched and debounced updates once, atomically, and rolls back failed batches
     - Maintains a clean, isolated environment through temp-folder fixtures
 
 Example Usage:
@@ -17,7 +18,7 @@ Example Usage:
 
 Dependencies:
     - Python >= 3.10
-    - Standard Library: unittest, tempfile, shutil, os
+    - Standard Library: unittest, tempfile, shutil, os, time
     - External Packages: None
     - Internal Modules Under Test: src.common._cache_read_write, src.utils.folder_path, src.utils.json_io
 
@@ -32,6 +33,7 @@ License:
 import os
 import shutil
 import tempfile
+import time
 import unittest
 from dataclasses import dataclass, asdict
 
@@ -279,5 +281,218 @@ class TestCacheReadWrite(_Fixture):
             self.assertEqual(actual_error, expected_error)
 
 
+class TestBatchedPersistence(_Fixture):
+    """
+    Unit tests for batched and debounced persistence in CacheReadWrite.
+    """
+
+    NEW_VALUES: dict[str, Any] = {
+        _KEYS.TEST_LIST: ['Boston', 'New York', 'Dallas'],
+        _KEYS.TEST_STRING: "List of cities",
+    }
+
+    def _cache(self, flush_delay_seconds: float | None = None) -> crw.CacheReadWrite:
+        """
+        Build a cache over the fixture file.
+        """
+        return crw.CacheReadWrite(
+            resource_folder_path=self.temp_folder,
+            resource_name=_TEST_RESOURCE_NAME,
+            required_keys=_TEST_REQ_KEYS,
+            default_values=_TEST_DEFAULT_VALUES,
+            flush_delay_seconds=flush_delay_seconds,
+        )
+
+    def _disk_payload(self) -> dict[str, Any]:
+        """
+        Read the payload currently stored on disk.
+        """
+        return json_io.extract_payload(json_io.load_json_file(self.resource_path))
+
+    def test_update_values_single_write(self) -> None:
+        """
+        Should apply all updates with a single write to disk.
+        """
+        # ARRANGE
+        settings = self._cache()
+
+        # ACT
+        with patch.object(crw.json_io, "save_json_file", wraps=json_io.save_json_file) as p_save:
+            settings.update_values(self.NEW_VALUES)
+
+        # ASSERT
+        with self.subTest("Writes", Out=p_save.call_count, Exp=1):
+            self.assertEqual(p_save.call_count, 1)
+        with self.subTest("Disk", Out=self._disk_payload()):
+            self.assertEqual(self._disk_payload(), self.NEW_VALUES)
+
+    def test_update_values_invalid_key(self) -> None:
+        """
+        Should raise ValueError and leave every value unchanged when any key is invalid.
+        """
+        # ARRANGE
+        settings = self._cache()
+        updates = {_KEYS.TEST_STRING: "changed", "NOT_A_VALID_KEY": 1}
+
+        # ACT
+        with self.assertRaises(ValueError):
+            settings.update_values(updates)
+
+        # ASSERT
+        actual = settings.get_value(_KEYS.TEST_STRING, str)
+        with self.subTest(Out=actual, Exp=_TEST_DEFAULT_VALUES[_KEYS.TEST_STRING]):
+            self.assertEqual(actual, _TEST_DEFAULT_VALUES[_KEYS.TEST_STRING])
+
+    def test_batch_commit(self) -> None:
+        """
+        Should expose updates immediately, defer the write, and write once when the outermost batch exits.
+        """
+        # ARRANGE
+        settings = self._cache()
+
+        with patch.object(crw.json_io, "save_json_file", wraps=json_io.save_json_file) as p_save:
+            # ACT
+            with settings.batch():
+                settings.update_value(_KEYS.TEST_LIST, self.NEW_VALUES[_KEYS.TEST_LIST])
+                with settings.batch():
+                    settings.update_value(_KEYS.TEST_STRING, self.NEW_VALUES[_KEYS.TEST_STRING])
+                in_memory = settings.get_value(_KEYS.TEST_STRING, str)
+                writes_inside = p_save.call_count
+                pending_inside = settings.has_pending_updates()
+
+        # ASSERT
+        with self.subTest("Visible in batch", Out=in_memory):
+            self.assertEqual(in_memory, self.NEW_VALUES[_KEYS.TEST_STRING])
+        with self.subTest("No write in batch", Out=writes_inside):
+            self.assertEqual(writes_inside, 0)
+            self.assertTrue(pending_inside)
+        with self.subTest("Single write", Out=p_save.call_count):
+            self.assertEqual(p_save.call_count, 1)
+        with self.subTest("Disk", Out=self._disk_payload()):
+            self.assertEqual(self._disk_payload(), self.NEW_VALUES)
+            self.assertFalse(settings.has_pending_updates())
+
+    def test_batch_rollback(self) -> None:
+        """
+        Should discard staged updates and write nothing when the batch raises.
+        """
+        # ARRANGE
+        settings = self._cache()
+        before = self._disk_payload()
+
+        # ACT
+        with self.assertRaises(KeyError):
+            with settings.batch():
+                settings.update_value(_KEYS.TEST_STRING, "discarded")
+                raise KeyError("abort")
+
+        # ASSERT
+        actual = settings.get_value(_KEYS.TEST_STRING, str)
+        with self.subTest("Memory", Out=actual):
+            self.assertEqual(actual, _TEST_DEFAULT_VALUES[_KEYS.TEST_STRING])
+        with self.subTest("Disk", Out=self._disk_payload()):
+            self.assertEqual(self._disk_payload(), before)
+        with self.subTest("Pending"):
+            self.assertFalse(settings.has_pending_updates())
+
+    def test_failed_write_keeps_file(self) -> None:
+        """
+        Should raise RuntimeError, keep the previous file intact, and leave no temporary file when serialization fails.
+        """
+        # ARRANGE
+        settings = self._cache()
+        before = self._disk_payload()
+
+        # ACT
+        with self.assertRaises(RuntimeError):
+            settings.update_value(_KEYS.TEST_STRING, object())
+
+        # ASSERT
+        with self.subTest("Disk", Out=self._disk_payload()):
+            self.assertEqual(self._disk_payload(), before)
+        with self.subTest("Folder", Out=os.listdir(self.temp_folder)):
+            self.assertEqual(os.listdir(self.temp_folder), [os.path.basename(self.resource_path)])
+
+    def test_debounced_flush(self) -> None:
+        """
+        Should defer writes until flush when a flush delay is set.
+        """
+        # ARRANGE
+        settings = self._cache(flush_delay_seconds=60.0)
+        before = self._disk_payload()
+
+        # ACT
+        settings.update_values(self.NEW_VALUES)
+        disk_before_flush = self._disk_payload()
+        settings.flush()
+
+        # ASSERT
+        with self.subTest("Deferred", Out=disk_before_flush):
+            self.assertEqual(disk_before_flush, before)
+        with self.subTest("Flushed", Out=self._disk_payload()):
+            self.assertEqual(self._disk_payload(), self.NEW_VALUES)
+
+    def test_debounced_timer(self) -> None:
+        """
+        Should write pending updates once the flush delay elapses.
+        """
+        # ARRANGE
+        settings = self._cache(flush_delay_seconds=0.01)
+
+        # ACT
+        settings.update_values(self.NEW_VALUES)
+        timer = settings._crw_timer
+        timer.join(timeout=5.0)
+
+        # ASSERT
+        with self.subTest("Disk", Out=self._disk_payload()):
+            self.assertEqual(self._disk_payload(), self.NEW_VALUES)
+        with self.subTest("Pending"):
+            self.assertFalse(settings.has_pending_updates())
+
+    def _run_batch_rollback_after_flush(self, flush_delay_seconds: float | None) -> None:
+        """
+        Raise inside a batch after the flush delay elapsed and flush() was called, then check disk against memory.
+        """
+        # ARRANGE
+        settings = self._cache(flush_delay_seconds=flush_delay_seconds)
+        settings.update_value(_KEYS.TEST_STRING, "before batch")  # Written now, or armed to write later
+
+        # ACT
+        with self.assertRaises(KeyError):
+            with settings.batch():
+                settings.update_value(_KEYS.TEST_LIST, ["staged"])
+                time.sleep(0.1)  # Past the flush delay armed before the batch
+                settings.flush()
+                disk_in_batch = self._disk_payload()
+                raise KeyError("abort")
+
+        # Let the re-armed debounced write of the pre-batch update complete
+        timer = settings._crw_timer
+        if timer is not None:
+            timer.join(timeout=5.0)
+
+        # ASSERT
+        with self.subTest("No write in batch", Out=disk_in_batch):
+            self.assertNotEqual(disk_in_batch[_KEYS.TEST_LIST], ["staged"])
+        with self.subTest("Disk equals memory", Out=self._disk_payload(), Exp=settings.get_data_map_copy()):
+            self.assertEqual(self._disk_payload(), settings.get_data_map_copy())
+        with self.subTest("Pre-batch update kept", Out=self._disk_payload()[_KEYS.TEST_STRING]):
+            self.assertEqual(self._disk_payload()[_KEYS.TEST_STRING], "before batch")
+        with self.subTest("Pending"):
+            self.assertFalse(settings.has_pending_updates())
+
+    def test_batch_rollback_after_scheduled_flush(self) -> None:
+        """
+        Should not let a debounced write armed before the batch store staged updates that are then rolled back.
+        """
+        self._run_batch_rollback_after_flush(flush_delay_seconds=0.05)
+
+    def test_batch_rollback_after_explicit_flush(self) -> None:
+        """
+        Should ignore flush() inside a batch so a rollback leaves disk equal to memory.
+        """
+        self._run_batch_rollback_after_flush(flush_delay_seconds=None)
+
 if __name__ == '__main__':
     unittest.main()
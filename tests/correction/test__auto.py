@@ -49,6 +49,11 @@ class TestComponentTypeLookup(unittest.TestCase):
             "IC": ["Integrated Circuit"],
         }
         self.ignore_str = ["SMD", "Surface Mount"]
+        # Each test patches its own lookup table, so discard any prebuilt matcher
+        auto.reset_component_type_matcher()
+
+    def tearDown(self):
+        auto.reset_component_type_matcher()
 
     def test_match(self):
         """
@@ -59,7 +64,7 @@ class TestComponentTypeLookup(unittest.TestCase):
         expected_out = "Capacitor"
 
         with (
-            patch.object(lookup, "get_component_type_lookup_table") as p_data_map,
+            patch.object(lookup, "get_component_type_lookup_view") as p_data_map,
             patch.object(auto.app_settings, "get_settings") as p_get_settings,
         ):
             p_data_map.return_value = self.lookup_dict
@@ -83,7 +88,7 @@ class TestComponentTypeLookup(unittest.TestCase):
         row = replace(bfx.ROW_A_1, component_type="Unknown Part")
 
         with (
-            patch.object(lookup, "get_component_type_lookup_table") as p_data_map,
+            patch.object(lookup, "get_component_type_lookup_view") as p_data_map,
             patch.object(auto.app_settings, "get_settings") as p_get_settings,
         ):
             p_data_map.return_value = self.lookup_dict
@@ -105,7 +110,7 @@ class TestComponentTypeLookup(unittest.TestCase):
         row = replace(bfx.ROW_A_1, component_type="Zener")
 
         with (
-            patch.object(lookup, "get_component_type_lookup_table") as p_data_map,
+            patch.object(lookup, "get_component_type_lookup_view") as p_data_map,
             patch.object(auto.app_settings, "get_settings") as p_get_settings,
         ):
             p_data_map.return_value = self.lookup_dict
@@ -126,7 +131,7 @@ class TestComponentTypeLookup(unittest.TestCase):
         row = replace(bfx.ROW_A_1, component_type="Surface Mount MCU Integrated Circuit")
 
         with (
-            patch.object(lookup, "get_component_type_lookup_table") as p_data_map,
+            patch.object(lookup, "get_component_type_lookup_view") as p_data_map,
             patch.object(auto.app_settings, "get_settings") as p_get_settings,
         ):
             p_data_map.return_value = self.lookup_dict
@@ -147,7 +152,7 @@ class TestComponentTypeLookup(unittest.TestCase):
         expected = "IC"
 
         with (
-            patch.object(lookup, "get_component_type_lookup_table") as p_data_map,
+            patch.object(lookup, "get_component_type_lookup_view") as p_data_map,
             patch.object(auto.app_settings, "get_settings") as p_get_settings,
         ):
             p_data_map.return_value = self.lookup_dict
@@ -163,6 +168,127 @@ class TestComponentTypeLookup(unittest.TestCase):
             self.assertIn(mdl.RowFields.COMPONENT, log)
 
 
+class TestManufacturerLookup(unittest.TestCase):
+    """
+    Unit tests for the `manufacturer_lookup` function.
+    """
+
+    def setUp(self):
+        self.lookup_view = {
+            "AVX": ("AVX Corporation", "Kyocera AVX"),
+            "Murata": ("Murata Manufacturing",),
+        }
+        # Each test patches its own lookup table, so discard any prebuilt matcher
+        auto.reset_manufacturer_matcher()
+
+    def tearDown(self):
+        auto.reset_manufacturer_matcher()
+
+    def test_match(self):
+        """
+        Should return the canonical name and a log for aliases and company-form suffix variants.
+        """
+        # ARRANGE
+        cases = (
+            ("AVX Corporation", "AVX"),
+            ("kyocera avx", "AVX"),
+            ("Murata Manufacturing Co., Ltd.", "Murata"),
+            ("MURATA Inc", "Murata"),
+        )
+
+        for value, expected in cases:
+            row = replace(bfx.ROW_A_1, manufacturer=value)
+            with patch.object(lookup, "get_manufacturer_lookup_view") as p_view:
+                p_view.return_value = self.lookup_view
+                # ACT
+                result, log = auto.manufacturer_lookup(row)
+
+            # ASSERT
+            with self.subTest("Output", In=value, Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+            with self.subTest("Log", Out=log):
+                self.assertIn(value, log)
+                self.assertIn(mdl.RowFields.MANUFACTURER, log)
+
+    def test_no_change(self):
+        """
+        Should return the input unchanged with an empty log for canonical and unknown names.
+        """
+        # ARRANGE
+        cases = ("AVX", "Murata", "Unknown Corp", "AVX Resistor", "")
+
+        for value in cases:
+            row = replace(bfx.ROW_A_1, manufacturer=value)
+            with patch.object(lookup, "get_manufacturer_lookup_view") as p_view:
+                p_view.return_value = self.lookup_view
+                # ACT
+                result, log = auto.manufacturer_lookup(row)
+
+            # ASSERT
+            with self.subTest("Output", In=value, Out=result):
+                self.assertEqual(result, value)
+            with self.subTest("Log", Out=log):
+                self.assertEqual(log, "")
+
+    def test_shipped_aliases(self):
+        """
+        Should map spelling and legal-form variants to the canonical names of the shipped lookup table only.
+        """
+        # ARRANGE
+        cases = (
+            ("Yageo", "YAGEO"),
+            ("Yageo Corp", "YAGEO"),
+            ("Vishay", "Vishay Intertechnology"),
+            ("Murata Mfg. Co., Ltd.", "Murata Manufacturing"),
+            ("ON Semiconductor Corporation", "onsemi"),
+            ("ST Micro", "STMicroelectronics"),
+            ("Delta Electronics, Inc.", "Delta Electronics"),
+            ("Delta", "Delta"),  # not an alias, names are not completed from a prefix
+            ("STMicro", "STMicro"),
+        )
+
+        for value, expected in cases:
+            row = replace(bfx.ROW_A_1, manufacturer=value)
+
+            # ACT
+            result, _ = auto.manufacturer_lookup(row)
+
+            # ASSERT
+            with self.subTest("Output", In=value, Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
+    def test_rebuild_on_version_change(self):
+        """
+        Should reuse the matcher while the lookup version is unchanged and rebuild it when the version changes.
+        """
+        # ARRANGE
+        row = replace(bfx.ROW_A_1, manufacturer="Kyocera AVX")
+        updated_view = {"Kyocera": ("Kyocera AVX",)}
+
+        with (
+            patch.object(lookup, "get_manufacturer_lookup_view") as p_view,
+            patch.object(lookup, "get_manufacturer_lookup_version") as p_version,
+        ):
+            p_view.return_value = self.lookup_view
+            p_version.return_value = "V1"
+            # ACT
+            first, _ = auto.manufacturer_lookup(row)
+            p_view.return_value = updated_view
+            same_version, _ = auto.manufacturer_lookup(row)
+            p_version.return_value = "V2"
+            new_version, _ = auto.manufacturer_lookup(row)
+
+        # ASSERT
+        with self.subTest("First build", Out=first):
+            self.assertEqual(first, "AVX")
+        with self.subTest("Same version reused", Out=same_version):
+            self.assertEqual(same_version, "AVX")
+        with self.subTest("New version rebuilt", Out=new_version):
+            self.assertEqual(new_version, "Kyocera")
+        with self.subTest("Builds", Calls=p_view.call_count):
+            self.assertEqual(p_view.call_count, 2)
+
+
 class TestExpandDesignators(unittest.TestCase):
     """
     Unit tests for the `expand_designators` function.
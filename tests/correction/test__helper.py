@@ -10,22 +10,29 @@ Example Usage:
 
 Dependencies:
     - Python >= 3.10
-    - Standard Library: unittest, unittest.mock
+    - Standard Library: random, string, unittest, unittest.mock
+    - External Packages: Levenshtein
     - Project: src.cli.interfaces (patched)
 
 Notes:
     - Tests simulate CLI calls with patched prompt, info, and warning functions to count invocations.
     - prompt_until_valid tests cover single-pass, one-prompt, and multi-prompt scenarios for validator return logic.
     - Floating-point equality tests explicitly target edge rounding and epsilon boundaries.
+    - ComponentTypeMatcher tests compare against `jaccard_match` + `levenshtein_match` on the packaged lookup table.
 
 License:
     - Internal Use Only
 """
 
+import random
+import string
 import unittest
 from unittest.mock import patch
 
+import Levenshtein
+
 from src.cli import interfaces as cli
+from src.lookups import interfaces as lookup
 
 # noinspection PyProtectedMember
 import src.correction._helper as helper  # Direct internal import — acceptable in tests
@@ -435,5 +442,349 @@ class TestJaccardMatch(unittest.TestCase):
             self.assertEqual(result, expected)
 
 
+def _reference_keys(lookup_table: dict, ignore_mask: tuple[str, ...], value: str) -> tuple[str, ...]:
+    """
+    Resolve matching keys with the plain helper functions, as component type lookup did before the prebuilt index.
+    """
+    test_string = value
+    for remove_str in ignore_mask:
+        test_string = test_string.replace(remove_str, '')
+    variants = []
+    for item in lookup_table.values():
+        if isinstance(item, str):
+            variants.append(item)
+        elif isinstance(item, list):
+            variants.extend(item)
+    value1, _ = helper.jaccard_match(test_string, tuple(variants))
+    value2, _ = helper.levenshtein_match(test_string, tuple(variants))
+    if value1 != "" and value2 != "" and value1 == value2:
+        return tuple(key for key, values in lookup_table.items() if value1 in values)
+    return ()
+
+
+class TestComponentTypeMatcher(unittest.TestCase):
+    """
+    Unit tests for `ComponentTypeMatcher`.
+    """
+
+    def test_matches_reference(self):
+        """
+        Should resolve the same keys and candidates as `jaccard_match` + `levenshtein_match`.
+        """
+        # ARRANGE
+        table = lookup.get_component_type_lookup_table()
+        mask = ("SMD", "DIP")
+        matcher = helper.ComponentTypeMatcher(table, mask)
+        variants = [v for item in table.values() for v in ([item] if isinstance(item, str) else item)]
+        inputs = variants + [v.upper() for v in variants] + [" " + v[:-1] for v in variants] + [
+            "SMD " + v for v in variants] + ["", "xyz", "Resistr", "Capacitr DIP", "MCU", "LED"]
+
+        for value in inputs:
+            expected = _reference_keys(table, mask, value)
+            variants_tuple = tuple(variants)
+
+            # ACT
+            result = matcher.match(value)
+
+            # ASSERT
+            with self.subTest("Keys", In=value, Out=result.keys, Exp=expected):
+                self.assertEqual(result.keys, expected)
+            with self.subTest("Candidates", In=value):
+                stripped = value.replace("SMD", "").replace("DIP", "")
+                self.assertEqual((result.jaccard_value, result.jaccard_level),
+                                 helper.jaccard_match(stripped, variants_tuple))
+                self.assertEqual((result.levenshtein_value, result.levenshtein_level),
+                                 helper.levenshtein_match(stripped, variants_tuple))
+
+    def test_frozen_view(self):
+        """
+        Should give the same results when built from the frozen lookup view instead of the copied table.
+        """
+        # ARRANGE
+        table = lookup.get_component_type_lookup_table()
+        from_table = helper.ComponentTypeMatcher(table, ())
+        from_view = helper.ComponentTypeMatcher(lookup.get_component_type_lookup_view(), ())
+        inputs = list(table.keys()) + ["Resistr", "MCU", "xyz"]
+
+        for value in inputs:
+            # ACT
+            result = from_view.match(value)
+
+            # ASSERT
+            with self.subTest(In=value, Out=result.keys):
+                self.assertEqual(result, from_table.match(value))
+
+    def test_substring_values(self):
+        """
+        Should keep substring semantics for keys whose value is a single string.
+        """
+        # ARRANGE
+        table = {"Diode": "SMD Zener Diode", "Zener": ["Zener"], "IC": ["Integrated Circuit"]}
+        matcher = helper.ComponentTypeMatcher(table, ())
+
+        # ACT
+        result = matcher.match("Zener")
+
+        # ASSERT
+        with self.subTest(Out=result.keys):
+            self.assertEqual(result.keys, ("Diode", "Zener"))
+
+    def test_memoized(self):
+        """
+        Should return the cached result for a repeated input without recomputing.
+        """
+        # ARRANGE
+        matcher = helper.ComponentTypeMatcher({"IC": ["Integrated Circuit"]}, ())
+        first = matcher.match("Integrated Circuit")
+
+        with patch.object(helper.Levenshtein, "ratio") as p_ratio:
+            # ACT
+            second = matcher.match("Integrated Circuit")
+
+        # ASSERT
+        with self.subTest("Same result", Out=second.keys):
+            self.assertIs(second, first)
+            self.assertEqual(second.keys, ("IC",))
+        with self.subTest("Not recomputed", Calls=p_ratio.call_count):
+            self.assertEqual(p_ratio.call_count, 0)
+
+    def test_memo_bounded(self):
+        """
+        Should evict the least recently used input once the cache is full.
+        """
+        # ARRANGE
+        with patch.object(helper, "_MATCH_CACHE_SIZE", 2):
+            matcher = helper.ComponentTypeMatcher({"IC": ["Integrated Circuit"]}, ())
+        first = matcher.match("Integrated Circuit")
+        matcher.match("Resistor")
+        matcher.match("Capacitor")
+
+        # ACT
+        second = matcher.match("Integrated Circuit")
+
+        # ASSERT
+        with self.subTest("Recomputed", Out=second.keys):
+            self.assertIsNot(second, first)
+            self.assertEqual(second, first)
+        with self.subTest("Size", Out=matcher._cached_match.cache_info().currsize):
+            self.assertEqual(matcher._cached_match.cache_info().currsize, 2)
+
+
+def _brute_levenshtein(test_string: str, references: tuple[str, ...], threshold: float) -> tuple[str, float]:
+    """
+    Score every reference without pruning, as `levenshtein_match` did before length windows.
+    """
+    best, best_ratio = "", 0.0
+    for ref in references:
+        ratio = Levenshtein.ratio(test_string.lower().strip(), ref.lower().strip())
+        if ratio > threshold and ratio >= best_ratio:
+            best, best_ratio = ref, ratio
+    return best, best_ratio
+
+
+def _brute_jaccard(test_string: str, references: tuple[str, ...], threshold: float) -> tuple[str, float]:
+    """
+    Score every reference without pruning, as `jaccard_match` did before size windows.
+    """
+    best, best_similarity = "", 0.0
+    set1 = set(test_string.lower().strip())
+    for ref in references:
+        set2 = set(ref.lower().strip())
+        union = len(set1 | set2)
+        similarity = len(set1 & set2) / union if union > 0 else 0.0
+        if similarity > best_similarity and similarity >= threshold:
+            best, best_similarity = ref, similarity
+    return best, best_similarity
+
+
+class TestPruning(unittest.TestCase):
+    """
+    Unit tests for the length-window pruning of `levenshtein_match` and `jaccard_match`.
+    """
+
+    def setUp(self):
+        rng = random.Random(30)
+        alphabet = string.ascii_lowercase[:8] + " "
+        words = ["".join(rng.choice(alphabet) for _ in range(rng.randint(0, 14))) for _ in range(200)]
+        # Add near-duplicates so many candidates sit close to the thresholds
+        words += [w[:-1] + rng.choice(alphabet) for w in words if w]
+        self.references = tuple(words)
+        self.inputs = words[:60] + ["", " ", "abc", "abcdefgh abcdefgh"]
+
+    def test_windows_cover_reachable(self):
+        """
+        Should include every length or size for which the bound can still reach the threshold.
+        """
+        # ARRANGE
+        missed = []
+
+        # ACT
+        for threshold in (0.5, 0.7, 0.85, 0.99):
+            for n in range(0, 40):
+                lev_lo, lev_hi = helper.levenshtein_length_window(n, threshold)
+                jac_lo, jac_hi = helper.jaccard_size_window(n, threshold)
+                for m in range(0, 80):
+                    if (n + m == 0 or 2 * min(n, m) / (n + m) > threshold) and not lev_lo <= m <= lev_hi:
+                        missed.append(("Levenshtein", threshold, n, m))
+                    if (max(n, m) > 0 and min(n, m) / max(n, m) >= threshold) and not jac_lo <= m <= jac_hi:
+                        missed.append(("Jaccard", threshold, n, m))
+
+        # ASSERT
+        with self.subTest(Out=missed[:5]):
+            self.assertEqual(missed, [])
+
+    def test_match_unchanged(self):
+        """
+        Should return the same match and level as scoring every reference.
+        """
+        for threshold in (0.0, 0.5, helper.LEVENSHTEIN_THRESHOLD, helper.JACCARD_THRESHOLD):
+            # ACT
+            lev = [helper.levenshtein_match(v, self.references, threshold) for v in self.inputs]
+            jac = [helper.jaccard_match(v, self.references, threshold) for v in self.inputs]
+
+            # ASSERT
+            with self.subTest("Levenshtein", T=threshold):
+                self.assertEqual(lev, [_brute_levenshtein(v, self.references, threshold) for v in self.inputs])
+            with self.subTest("Jaccard", T=threshold):
+                self.assertEqual(jac, [_brute_jaccard(v, self.references, threshold) for v in self.inputs])
+
+    def test_matcher_unchanged(self):
+        """
+        Should resolve the same candidates as the helper functions on a large alias table.
+        """
+        # ARRANGE
+        table = {f"K{i}": [ref] for i, ref in enumerate(self.references)}
+        matcher = helper.ComponentTypeMatcher(table, ())
+
+        for value in self.inputs:
+            # ACT
+            result = matcher.match(value)
+
+            # ASSERT
+            with self.subTest(In=value):
+                self.assertEqual((result.jaccard_value, result.jaccard_level),
+                                 _brute_jaccard(value, self.references, helper.JACCARD_THRESHOLD))
+                self.assertEqual((result.levenshtein_value, result.levenshtein_level),
+                                 _brute_levenshtein(value, self.references, helper.LEVENSHTEIN_THRESHOLD))
+
+
+class TestManufacturerTokens(unittest.TestCase):
+    """
+    Unit tests for `manufacturer_tokens`.
+    """
+
+    def test_tokens(self):
+        """
+        Should casefold and split on anything that is not a letter or digit.
+        """
+        cases = (
+            ("Murata Mfg. Co., Ltd", ("murata", "mfg", "co", "ltd")),
+            ("  Würth_Elektronik  ", ("würth", "elektronik")),
+            ("Kyocera-AVX", ("kyocera", "avx")),
+            ("", ()),
+        )
+        for value, expected in cases:
+            # ACT
+            result = helper.manufacturer_tokens(value)
+
+            # ASSERT
+            with self.subTest(In=value, Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
+
+class TestManufacturerMatcher(unittest.TestCase):
+    """
+    Unit tests for `ManufacturerMatcher`.
+    """
+
+    def setUp(self):
+        self.table = {
+            "TE Connectivity": ["TE Connectivity Ltd"],
+            "Texas Instruments": "Texas Instruments Inc",
+            "Vishay Intertechnology": ["Vishay"],
+        }
+
+    def test_match(self):
+        """
+        Should resolve exact aliases and aliases followed only by legal-form suffixes.
+        """
+        # ARRANGE
+        matcher = helper.ManufacturerMatcher(self.table)
+        cases = (
+            ("te connectivity", "TE Connectivity"),
+            ("TE Connectivity Ltd.", "TE Connectivity"),
+            ("TE Connectivity Ltd. GmbH", "TE Connectivity"),
+            ("Tyco Electronics Corporation", ""),
+            ("TE", ""),
+            ("Texas Instruments Incorporated", "Texas Instruments"),
+            ("Vishay, Inc.", "Vishay Intertechnology"),
+            ("Vishay Dale Electronics, LLC", ""),
+            ("Vishay Semiconductors", ""),
+            ("Ltd", ""),
+            ("", ""),
+        )
+
+        for value, expected in cases:
+            # ACT
+            result = matcher.match(value)
+
+            # ASSERT
+            with self.subTest(In=value, Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
+    def test_conflicting_alias(self):
+        """
+        Should raise ValueError when one alias maps to two canonical names.
+        """
+        # ARRANGE
+        table = {"A Corp": ["Alpha"], "Alpha Inc": ["ALPHA"]}
+
+        # ACT
+        try:
+            helper.ManufacturerMatcher(table)
+            result = ""
+        except ValueError as err:
+            result = type(err).__name__
+
+        # ASSERT
+        with self.subTest(Out=result):
+            self.assertEqual(result, ValueError.__name__)
+
+    def test_memo_bounded(self):
+        """
+        Should keep at most the configured number of distinct inputs in the memo.
+        """
+        # ARRANGE
+        with patch.object(helper, "_MATCH_CACHE_SIZE", 2):
+            matcher = helper.ManufacturerMatcher(self.table)
+        inputs = ("TE Connectivity Ltd", "Vishay Inc", "Texas Instruments Inc", "Unknown Corp")
+
+        # ACT
+        results = [matcher.match(value) for value in inputs]
+        info = matcher._cached_match.cache_info()
+
+        # ASSERT
+        with self.subTest("Results", Out=results):
+            self.assertEqual(results, ["TE Connectivity", "Vishay Intertechnology", "Texas Instruments", ""])
+        with self.subTest("Size", Out=info.currsize):
+            self.assertEqual(info.currsize, 2)
+
+    def test_packaged_resource(self):
+        """
+        Should build from the packaged resource and map every alias to its canonical name.
+        """
+        # ARRANGE
+        view = lookup.get_manufacturer_lookup_view()
+
+        # ACT
+        matcher = helper.ManufacturerMatcher(view)
+
+        # ASSERT
+        for canonical, aliases in view.items():
+            for alias in (canonical, *aliases):
+                with self.subTest(In=alias, Exp=canonical):
+                    self.assertEqual(matcher.match(alias), canonical)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -27,6 +27,8 @@ from unittest.mock import patch
 from src.lookups import interfaces as lookup  # for patch
 from src.cli import interfaces as cli # for patch at interface
 from src.correction import interfaces as correct # Module under test
+# noinspection PyProtectedMember
+from src.correction import _auto as auto  # for matcher reset
 from tests.fixtures import v3_bom as bfx # Fixtures for module test
 
 
@@ -93,6 +95,15 @@ class TestInterface(_Asserts):
     Unit tests for the public `src.correction.interfaces` façade.
     """
 
+    def setUp(self):
+        # Lookup tests patch their own lookup tables, so discard any prebuilt matcher
+        auto.reset_component_type_matcher()
+        auto.reset_manufacturer_matcher()
+
+    def tearDown(self):
+        auto.reset_component_type_matcher()
+        auto.reset_manufacturer_matcher()
+
     def test_model_number_good(self):
         """
         Should return the existing header.model_no unchanged and produce no log.
@@ -749,7 +760,7 @@ class TestInterface(_Asserts):
         }
         expected = "IC"
 
-        with patch.object(lookup, "get_component_type_lookup_table") as p_data_map:
+        with patch.object(lookup, "get_component_type_lookup_view") as p_data_map:
             p_data_map.return_value = lookup_dict
             # ACT
             result, log = fn(row)
@@ -772,7 +783,7 @@ class TestInterface(_Asserts):
         expected = "Silicon Diode"
 
 
-        with patch.object(lookup, "get_component_type_lookup_table") as p_data_map:
+        with patch.object(lookup, "get_component_type_lookup_view") as p_data_map:
             p_data_map.return_value = lookup_dict
             # ACT
             result, log = fn(row)
@@ -781,6 +792,24 @@ class TestInterface(_Asserts):
         self.assert_equal(actual=result, expected=expected, msg=fn.__name__)
         self.assert_empty(actual=log)
 
+    def test_manufacturer_lookup_match(self):
+        """
+        Should map row.manufacturer to its canonical name and emit a log on an alias match.
+        """
+        # ARRANGE
+        fn = correct.manufacturer_lookup
+        row = replace(bfx.ROW_B2_5, manufacturer="Texas Instruments Incorporated")
+        expected = "Texas Instruments"
+
+        with patch.object(lookup, "get_manufacturer_lookup_view") as p_view:
+            p_view.return_value = {"Texas Instruments": ("TI",)}
+            # ACT
+            result, log = fn(row)
+
+        # ASSERT
+        self.assert_equal(actual=result, expected=expected, msg=fn.__name__)
+        self.assert_contains(container=log, member=expected)
+
     def test_expand_designators_change(self):
         """
         Should expand a designator range (e.g., R5-R10) and emit a log when expanded.
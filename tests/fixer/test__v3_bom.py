@@ -451,15 +451,16 @@ class TestFixRowAuto(unittest.TestCase):
         """
         # ARRANGE
         cases = [
-            (mdl.RowFields.COMPONENT, replace(bf.ROW_A_1, component_type="SMD Resistor")),
-            (mdl.RowFields.DESIGNATOR, replace(bf.ROW_A_1, designator="R1-R2")),
-            (mdl.RowFields.SUB_TOTAL, replace(bf.ROW_A_1, sub_total="999")),
+            (mdl.RowFields.COMPONENT, replace(bf.ROW_A_1, component_type="SMD Resistor"), bf.ROW_A_1),
+            (mdl.RowFields.MANUFACTURER, replace(bf.ROW_A_2_ALT, manufacturer="Murata Mfg. Co., Ltd."), bf.ROW_A_2_ALT),
+            (mdl.RowFields.DESIGNATOR, replace(bf.ROW_A_1, designator="R1-R2"), bf.ROW_A_1),
+            (mdl.RowFields.SUB_TOTAL, replace(bf.ROW_A_1, sub_total="999"), bf.ROW_A_1),
         ]
 
-        for label, row_in in cases:
+        for label, row_in, row_exp in cases:
             self.setUp()
             attr_name = mdl.Row.get_attr_name_by_label(label)
-            prompt_response = getattr(bf.ROW_A_1, attr_name)
+            prompt_response = getattr(row_exp, attr_name)
 
             with (
                 patch.object(cli, "prompt_for_string_value") as p_prompt,
@@ -472,7 +473,7 @@ class TestFixRowAuto(unittest.TestCase):
                 row_out = fb._fix_row_auto(self.log, row_in)
                 str_in = getattr(row_in, attr_name)
                 str_out = getattr(row_out, attr_name)
-                str_exp = getattr(bf.ROW_A_1, attr_name)
+                str_exp = getattr(row_exp, attr_name)
                 log_list = self.log.render()
 
                 # ASSERT
@@ -39,14 +39,14 @@ ROW_A_1: Final[Row] = Row(
 ROW_A_1_ALT1: Final[Row] = Row(
     item="", component_type="ALT1", device_package="0603",
     description="2k,1%,0603", unit="PCS", classification="A",
-    manufacturer="Yageo", mfg_part_number="RC0603FR-072KL", ul_vde_number="UL123",
+    manufacturer="YAGEO", mfg_part_number="RC0603FR-072KL", ul_vde_number="UL123",
     validated_at="EB0", qty="0", designator="R1,R2", unit_price="0.09", sub_total="0.0"
 )
 
 ROW_A_1_ALT2: Final[Row] = Row(
     item="", component_type="ALT2", device_package="0603",
     description="2k,1%,0603", unit="PCS", classification="A",
-    manufacturer="Vishay", mfg_part_number="CRCW06032K00FKEAC", ul_vde_number="UL124",
+    manufacturer="Vishay Intertechnology", mfg_part_number="CRCW06032K00FKEAC", ul_vde_number="UL124",
     validated_at="EB0/EB1", qty="0", designator="R1,R2", unit_price="0.11", sub_total="0.0"
 )
 
@@ -60,7 +60,7 @@ ROW_A_2: Final[Row] = Row(
 ROW_A_2_ALT: Final[Row] = Row(
     item="", component_type="ALT", device_package="0805",
     description="10uF,20%,25V,0805", unit="PCS", classification="B",
-    manufacturer="Murata", mfg_part_number="GRM21BR61C106KE15L", ul_vde_number="UL202",
+    manufacturer="Murata Manufacturing", mfg_part_number="GRM21BR61C106KE15L", ul_vde_number="UL202",
     validated_at="MP", qty="0", designator="C1,C2,C3", unit_price="0.25", sub_total="0.0"
 )
 
@@ -230,21 +230,21 @@ BOARD_B1: Final[Board] = Board(
 ROW_B2_1: Final[Row] = Row(
     item="1", component_type="Resistor", device_package="0603",
     description="4.7k,1%,0603", unit="PCS", classification="A",
-    manufacturer="Yageo", mfg_part_number="RC0603FR-074K7L", ul_vde_number="UL101",
+    manufacturer="YAGEO", mfg_part_number="RC0603FR-074K7L", ul_vde_number="UL101",
     validated_at="MP", qty="6", designator="R5,R6,R7,R8,R9,R10", unit_price="0.02", sub_total="0.12"
 )
 
 ROW_B2_2: Final[Row] = Row(
     item="2", component_type="Capacitor", device_package="0805",
     description="1uF,10%,25V,0805", unit="PCS", classification="B",
-    manufacturer="Murata", mfg_part_number="GRM21BR71C105KA01L", ul_vde_number="UL202",
+    manufacturer="Murata Manufacturing", mfg_part_number="GRM21BR71C105KA01L", ul_vde_number="UL202",
     validated_at="MP", qty="4", designator="C3,C4,C5,C6", unit_price="0.05", sub_total="0.2"
 )
 
 ROW_B2_3: Final[Row] = Row(
     item="3", component_type="Diode", device_package="SMA",
     description="Schottky,1A,40V", unit="PCS", classification="A",
-    manufacturer="OnSemi", mfg_part_number="SS14", ul_vde_number="UL303",
+    manufacturer="onsemi", mfg_part_number="SS14", ul_vde_number="UL303",
     validated_at="MP", qty="2", designator="D1,D2", unit_price="0.15", sub_total="0.3"
 )
 
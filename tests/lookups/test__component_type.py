@@ -12,7 +12,7 @@ Example Usage:
 
 Dependencies:
     - Python >= 3.10
-    - Standard Library: unittest, tempfile, shutil, importlib, unittest.mock
+    - Standard Library: unittest, tempfile, shutil, importlib, os, unittest.mock
     - External Packages: None
 
 Notes:
@@ -26,6 +26,7 @@ License:
 """
 
 import importlib
+import os
 import shutil
 import tempfile
 import unittest
@@ -53,6 +54,7 @@ class TestGetComponentTypeLookupTable(unittest.TestCase):
     }
 
     tmp_project_root: str | None = None
+    resource_path: str = ""
 
     def setUp(self):
         """
@@ -74,6 +76,7 @@ class TestGetComponentTypeLookupTable(unittest.TestCase):
         # Build resource file paths and names
         resource_filename = ct.COMPONENT_TYPE_RESOURCE_NAME + util.json_io.JSON_FILE_EXT
         resource_path = util.file_path.construct_file_path(runtime_dir, resource_filename)
+        self.resource_path = resource_path
 
         # Wrap the payload in the standard packet envelope expected by the loader
         resource_packet = json_io.create_json_packet(
@@ -110,6 +113,60 @@ class TestGetComponentTypeLookupTable(unittest.TestCase):
         with self.subTest(Out=actual_map, Exp=expected_map):
             self.assertDictEqual(actual_map, expected_map)
 
+    def test_view(self):
+        """
+        Should return a read-only view equal to the table, with variant lists as tuples, shared across calls.
+        """
+        # ARRANGE
+        expected_map = {k: tuple(v) if isinstance(v, list) else v for k, v in self.TEST_JSON_DATA.items()}
+
+        with patch.object(folder_path, "resolve_project_folder") as p_root:
+            p_root.return_value = self.tmp_project_root
+
+            # ACT
+            view = ct.get_component_type_lookup_view()
+            again = ct.get_component_type_lookup_view()
+
+        # ASSERT
+        with self.subTest("Content", Out=dict(view), Exp=expected_map):
+            self.assertDictEqual(dict(view), expected_map)
+        with self.subTest("Shared"):
+            self.assertIs(view, again)
+        with self.subTest("Read-only"):
+            with self.assertRaises(TypeError):
+                view["Alpha"] = "X"  # type: ignore[index]
+
+    def test_hot_reload(self):
+        """
+        Should serve the reloaded table and a new version once the resource file changes on disk.
+        """
+        # ARRANGE
+        updated_map = {"Alpha": "A2"}
+
+        with patch.object(folder_path, "resolve_project_folder") as p_root:
+            p_root.return_value = self.tmp_project_root
+            old_version = ct.get_component_type_lookup_version()
+
+            # Rewrite the resource and move its modification time forward
+            stamp_ns = os.stat(self.resource_path).st_mtime_ns + 1_000_000_000
+            json_io.save_json_file(self.resource_path, json_io.create_json_packet(updated_map, source_file="x.json"))
+            os.utime(self.resource_path, ns=(stamp_ns, stamp_ns))
+
+            # ACT
+            throttled_map = ct.get_component_type_lookup_table()
+            with patch.object(ct, "_RELOAD_CHECK_INTERVAL_S", 0.0):
+                actual_map = ct.get_component_type_lookup_table()
+                new_version = ct.get_component_type_lookup_version()
+
+        # ASSERT
+        with self.subTest("Within check interval", Out=throttled_map, Exp=self.TEST_JSON_DATA):
+            self.assertDictEqual(throttled_map, self.TEST_JSON_DATA)
+        with self.subTest("Reloaded", Out=actual_map, Exp=updated_map):
+            self.assertDictEqual(actual_map, updated_map)
+        with self.subTest("Version", Old=old_version, New=new_version):
+            self.assertNotEqual(new_version, old_version)
+            self.assertEqual(new_version, json_io.extract_payload_checksum(json_io.load_json_file(self.resource_path)))
+
     def test_raise(self):
         """
         Should raise RuntimeError when the underlying lookup cache construction fails.
@@ -0,0 +1,195 @@
+"""
+Integration-style unit tests for the manufacturer alias lookup loader.
+
+This module validates the happy-path behavior and error handling of the manufacturer alias lookup API, ensuring JSON-backed lookup tables are loaded correctly from the runtime resource layout and exposed as plain dictionaries or frozen views.
+
+Example Usage:
+    # Preferred usage via project-root invocation:
+    python -m unittest tests/lookups/test__manufacturer.py
+
+    # Direct discovery (runs all tests, including this module):
+    python -m unittest discover -s tests
+
+Dependencies:
+    - Python >= 3.10
+    - Standard Library: unittest, tempfile, shutil, importlib, os, unittest.mock
+    - External Packages: None
+
+Notes:
+    - Tests are integration-oriented and exercise the real filesystem layout using a temporary project root.
+    - Only the project-root resolution is patched to keep behavior close to production.
+    - The lookup loader is treated as a pure read-only interface returning a dict or read-only mapping on success.
+    - Construction-time failures from the underlying cache are expected to be wrapped as RuntimeError.
+
+License:
+    - Internal Use Only
+"""
+
+import importlib
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import src.utils as util
+from src.utils import folder_path
+from src.utils import json_io
+
+# noinspection PyProtectedMember
+from src.lookups import _manufacturer as ct  # Module under test
+
+
+class TestGetManufacturerLookupTable(unittest.TestCase):
+    """
+    Unit tests for the manufacturer lookup table and view accessors.
+    """
+
+    TEST_JSON_DATA = {
+        "AVX": ["AVX Corporation", "Kyocera AVX"],
+        "Murata": ["Murata Manufacturing"],
+        "TI": "Texas Instruments",
+    }
+
+    tmp_project_root: str | None = None
+    resource_path: str = ""
+
+    def setUp(self):
+        """
+        Prepare a temporary project root and write a single manufacturer JSON packet.
+        """
+        # Reload module to reset the module-level cache to None
+        importlib.reload(ct)
+
+        # Create an isolated project root; removed in tearDown()
+        self.tmp_project_root = tempfile.mkdtemp(prefix="runtime_tmp_")
+
+        # Mirror the on-disk runtime layout used by production code
+        runtime_dir = folder_path.construct_folder_path(
+            self.tmp_project_root,
+            ct.MANUFACTURER_FOLDER_PARTS,
+        )
+        folder_path.create_folder_if_missing(runtime_dir)
+
+        # Build resource file paths and names
+        resource_filename = ct.MANUFACTURER_RESOURCE_NAME + util.json_io.JSON_FILE_EXT
+        resource_path = util.file_path.construct_file_path(runtime_dir, resource_filename)
+        self.resource_path = resource_path
+
+        # Wrap the payload in the standard packet envelope expected by the loader
+        resource_packet = json_io.create_json_packet(
+            self.TEST_JSON_DATA,
+            source_file=resource_filename,
+        )
+
+        # Persist the packet where CacheReadOnly will look for it
+        json_io.save_json_file(resource_path, resource_packet)
+
+    def tearDown(self):
+        """
+        Remove the temporary project root and all generated files.
+        """
+        # Best-effort cleanup to avoid leaking temp files on test failures
+        if self.tmp_project_root is not None:
+            shutil.rmtree(self.tmp_project_root, ignore_errors=True)
+
+        # Drop the cache of the temporary table so later tests load the packaged resource
+        importlib.reload(ct)
+
+    def test_happy_path(self):
+        """
+        Should return a dictionary of manufacturer aliases when the runtime resource is valid.
+        """
+        # ARRANGE
+        expected_map = self.TEST_JSON_DATA
+
+        # Force CacheReadOnly to resolve its root under the temporary project root
+        with patch.object(folder_path, "resolve_project_folder") as p_root:
+            p_root.return_value = self.tmp_project_root
+
+            # ACT
+            actual_map = ct.get_manufacturer_lookup_table()
+
+        # ASSERT
+        with self.subTest(Out=actual_map, Exp=expected_map):
+            self.assertDictEqual(actual_map, expected_map)
+
+    def test_view(self):
+        """
+        Should return a read-only view equal to the table, with variant lists as tuples, shared across calls.
+        """
+        # ARRANGE
+        expected_map = {k: tuple(v) if isinstance(v, list) else v for k, v in self.TEST_JSON_DATA.items()}
+
+        with patch.object(folder_path, "resolve_project_folder") as p_root:
+            p_root.return_value = self.tmp_project_root
+
+            # ACT
+            view = ct.get_manufacturer_lookup_view()
+            again = ct.get_manufacturer_lookup_view()
+
+        # ASSERT
+        with self.subTest("Content", Out=dict(view), Exp=expected_map):
+            self.assertDictEqual(dict(view), expected_map)
+        with self.subTest("Shared"):
+            self.assertIs(view, again)
+        with self.subTest("Read-only"):
+            with self.assertRaises(TypeError):
+                view["AVX"] = "X"  # type: ignore[index]
+
+    def test_hot_reload(self):
+        """
+        Should serve the reloaded table and a new version once the resource file changes on disk.
+        """
+        # ARRANGE
+        updated_map = {"TDK": ["TDK Corporation"]}
+
+        with patch.object(folder_path, "resolve_project_folder") as p_root:
+            p_root.return_value = self.tmp_project_root
+            old_version = ct.get_manufacturer_lookup_version()
+
+            # Rewrite the resource and move its modification time forward
+            stamp_ns = os.stat(self.resource_path).st_mtime_ns + 1_000_000_000
+            json_io.save_json_file(self.resource_path, json_io.create_json_packet(updated_map, source_file="x.json"))
+            os.utime(self.resource_path, ns=(stamp_ns, stamp_ns))
+
+            # ACT
+            throttled_map = ct.get_manufacturer_lookup_table()
+            with patch.object(ct, "_RELOAD_CHECK_INTERVAL_S", 0.0):
+                actual_map = ct.get_manufacturer_lookup_table()
+                new_version = ct.get_manufacturer_lookup_version()
+
+        # ASSERT
+        with self.subTest("Within check interval", Out=throttled_map, Exp=self.TEST_JSON_DATA):
+            self.assertDictEqual(throttled_map, self.TEST_JSON_DATA)
+        with self.subTest("Reloaded", Out=actual_map, Exp=updated_map):
+            self.assertDictEqual(actual_map, updated_map)
+        with self.subTest("Version", Old=old_version, New=new_version):
+            self.assertNotEqual(new_version, old_version)
+            self.assertEqual(new_version, json_io.extract_payload_checksum(json_io.load_json_file(self.resource_path)))
+
+    def test_raise(self):
+        """
+        Should raise RuntimeError when the underlying lookup cache construction fails.
+        """
+        # ARRANGE
+        expected_error = RuntimeError.__name__
+
+        # Replace CacheReadOnly with a stub that always raises an error
+        with patch.object(ct, "CacheReadOnly") as mock_cache_ctor:
+            mock_cache_ctor.side_effect = ValueError("boom")
+
+            # ACT
+            try:
+                _ = ct.get_manufacturer_lookup_table()
+                actual_error = ""
+            except Exception as exc:  # noqa: BLE001
+                actual_error = type(exc).__name__
+
+        # ASSERT
+        with self.subTest(Out=actual_error, Exp=expected_error):
+            self.assertEqual(actual_error, expected_error)
+
+
+if __name__ == '__main__':
+    unittest.main()
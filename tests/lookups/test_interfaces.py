@@ -44,6 +44,7 @@ class TestInterfaces(unittest.TestCase):
 
         # ACT
         out_map = lookup.get_component_type_lookup_table()
+        out_view = lookup.get_component_type_lookup_view()
         folder_parts = lookup.COMPONENT_TYPE_FOLDER_PARTS
         resource_name = lookup.COMPONENT_TYPE_RESOURCE_NAME
 
@@ -51,6 +52,8 @@ class TestInterfaces(unittest.TestCase):
         with self.subTest("Lookup table"):
             self.assertIsInstance(out_map, dict)
             self.assertGreater(len(out_map), 0)
+        with self.subTest("Lookup view"):
+            self.assertEqual(set(out_view.keys()), set(out_map.keys()))
         with self.subTest("Folder parts"):
             self.assertIsInstance(folder_parts, tuple)
             self.assertGreater(len(folder_parts), 0)
@@ -59,5 +62,24 @@ class TestInterfaces(unittest.TestCase):
             self.assertGreater(len(resource_name), 0)
 
 
+    def test_manufacturer(self):
+        """
+        Should expose a populated manufacturer alias lookup and related constants via the public interfaces API.
+        """
+        # ACT
+        out_map = lookup.get_manufacturer_lookup_table()
+        out_view = lookup.get_manufacturer_lookup_view()
+
+        # ASSERT
+        with self.subTest("Lookup table"):
+            self.assertIsInstance(out_map, dict)
+            self.assertGreater(len(out_map), 0)
+        with self.subTest("Lookup view"):
+            self.assertEqual(set(out_view.keys()), set(out_map.keys()))
+        with self.subTest("Constants"):
+            self.assertIsInstance(lookup.MANUFACTURER_FOLDER_PARTS, tuple)
+            self.assertEqual(lookup.MANUFACTURER_RESOURCE_NAME, "manufacturer")
+
+
 if __name__ == '__main__':
     unittest.main()
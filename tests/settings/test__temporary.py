@@ -7,6 +7,7 @@ This module verifies that:
     - get_value retrieves cache entries from the JSON-backed cache
     - update_value persists updated entries to disk
     - get_temp_settings() returns a singleton cache instance that can reload persisted values
+    - _DEFAULT_TEMP_SETTINGS is built on first access rather than at import time
 
 Example Usage:
     # Preferred usage via project-root invocation:
@@ -155,5 +156,50 @@ class TestGetCacheReferenceSingleton(_Fixture):
             self.assertEqual(actual_value, updated_value)
 
 
+class TestDeferredDefaults(unittest.TestCase):
+    """
+    Unit tests for the lazily built default temporary settings.
+    """
+
+    def setUp(self) -> None:
+        """
+        Reset the deferred defaults so each test observes the first access.
+        """
+        ts._default_temp_settings = None
+
+    def tearDown(self) -> None:
+        """
+        Reset the deferred defaults so later tests rebuild them unpatched.
+        """
+        ts._default_temp_settings = None
+
+    def test_built_once_on_access(self) -> None:
+        """
+        Should resolve the project folder on first attribute access only, and reuse the result afterwards.
+        """
+        # ARRANGE
+        with patch.object(folder_path, "resolve_project_folder", return_value="/project") as p_root:
+            # ACT
+            first = ts._DEFAULT_TEMP_SETTINGS
+            second = ts._DEFAULT_TEMP_SETTINGS
+
+        # ASSERT
+        with self.subTest("Values", Out=first):
+            self.assertEqual(first, {ts.KEYS.DESTINATION_FILES_FOLDER: "/project",
+                                     ts.KEYS.SOURCE_FILES_FOLDER: "/project"})
+        with self.subTest("Shared"):
+            self.assertIs(first, second)
+        with self.subTest("Resolved once", Calls=p_root.call_count):
+            self.assertEqual(p_root.call_count, 1)
+
+    def test_unknown_attribute(self) -> None:
+        """
+        Should raise AttributeError for attributes that are not deferred.
+        """
+        # ACT / ASSERT
+        with self.assertRaises(AttributeError):
+            _ = ts._NOT_A_SETTING
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,190 @@
+"""
+Sequence-level tests for the BOM processing sequences run headless.
+
+Example Usage:
+    # Preferred usage via project-root invocation:
+    python -m unittest tests/test_application.py
+
+    # Direct discovery (runs all tests, including this module):
+    python -m unittest discover -s tests
+
+Dependencies:
+    - Python >= 3.10
+    - Standard Library: contextlib, io, os, shutil, sys, tempfile, unittest, unittest.mock, warnings
+    - External Packages: pandas, openpyxl
+    - Project Modules: src.application, src.paths
+
+Notes:
+    - Input workbooks are the parser test workbooks in tests/parsers/test_data; outputs are written to a temporary folder.
+    - Golden outputs in tests/test_data/sequences are the written workbooks read back as text, named '<sequence> <input>.csv'.
+    - The legacy modules in src import each other by bare name, so the src folder is put on the import path.
+
+License:
+    - Internal Use Only
+"""
+
+import contextlib
+import io
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+import warnings
+from unittest.mock import patch
+
+import pandas as pd
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(TESTS_DIR), 'src'))
+
+import application  # Module under test
+import paths  # for patch
+
+INPUT_DIR = os.path.join(TESTS_DIR, 'parsers', 'test_data')
+GOLDEN_DIR = os.path.join(TESTS_DIR, 'test_data', 'sequences')
+
+
+class TestSequences(unittest.TestCase):
+    """
+    Run every sequence headless on the test workbooks and compare the written output with the golden outputs.
+    """
+
+    def setUp(self):
+        self.output_dir = tempfile.mkdtemp()
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.patches = [
+            patch.object(paths, 'get_path_to_input_file_folder', return_value=INPUT_DIR),
+            patch.object(paths, 'get_path_to_outputs_folder', return_value=self.output_dir),
+        ]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        shutil.rmtree(self.output_dir, ignore_errors=True)
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+
+    def _read_output(self, result) -> pd.DataFrame:
+        """
+        Read back the workbook a sequence wrote, as text.
+        """
+        file_name = result.context['output_file_type'].value + result.context['file_name']
+        return pd.read_excel(os.path.join(self.output_dir, file_name), dtype=str)
+
+    def test_golden_outputs(self):
+        """
+        Should write the golden output for every sequence and input workbook, without writing to a slice of a frame.
+        """
+        # ARRANGE
+        cases = (
+            ('Version3BomSample.xlsx', {}),
+            ('IsVersion3BomTemplate.xlsx', {}),
+            ('IsVersion2BomTemplate.xlsx', {'build_name': 'P1'}),
+            ('Version3BomMultiBoard.xlsx', {'sheet_name': 'Board2'}),
+        )
+
+        for file_name, options in cases:
+            for sequence, run in application.sequences.items():
+                if (sequence, file_name) == ('cost-walk', 'IsVersion2BomTemplate.xlsx'):
+                    continue  # stops at the designator check, see test_invalid_designators
+                golden_path = os.path.join(GOLDEN_DIR, f'{sequence} {os.path.splitext(file_name)[0]}.csv')
+                expected = pd.read_csv(golden_path, dtype=str)
+
+                # ACT
+                with warnings.catch_warnings():
+                    warnings.simplefilter('error', pd.errors.SettingWithCopyWarning)
+                    result = run(file_name=file_name, headless=True, **options)
+                actual = self._read_output(result)
+
+                # ASSERT
+                with self.subTest(Sequence=sequence, File=file_name):
+                    pd.testing.assert_frame_equal(actual, expected)
+
+    def test_invalid_designators(self):
+        """
+        Should raise ValueError for the cost walk of a BOM with invalid reference designators.
+        """
+        # ACT
+        try:
+            application.sequences['cost-walk'](file_name='IsVersion2BomTemplate.xlsx', build_name='P1', headless=True)
+            result = ""
+        except ValueError as err:
+            result = str(err)
+
+        # ASSERT
+        with self.subTest(Out=result):
+            self.assertEqual(result, "Invalid reference designators found in 1 rows.")
+
+    def test_headless_requires_file_name(self):
+        """
+        Should raise ValueError for a headless run without a file name, unless it resumes after the first stage.
+        """
+        # ARRANGE
+        run = application.sequences['cbom-db']
+        run(file_name='Version3BomSample.xlsx', headless=True, checkpoint_dir=self.checkpoint_dir)
+        cases = (
+            ("New run", None, "File name is required to run headless."),
+            ("Resume from first stage", 'read source sheet', "File name is required to run headless."),
+            ("Resume after first stage", 'select build', ""),
+        )
+
+        for label, resume_from, expected in cases:
+            # ACT
+            try:
+                run(headless=True, checkpoint_dir=self.checkpoint_dir, resume_from=resume_from)
+                result = ""
+            except ValueError as err:
+                result = str(err)
+
+            # ASSERT
+            with self.subTest(label, Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
+    def test_resume(self):
+        """
+        Should resume from a checkpoint with the same output, and refuse checkpoints made from another file.
+        """
+        # ARRANGE
+        run = application.sequences['cbom-db']
+        full = run(file_name='Version3BomSample.xlsx', headless=True, checkpoint_dir=self.checkpoint_dir)
+        resume_from = 'clean up manufacturer'  # merged into a fused stage
+
+        # ACT
+        resumed = run(file_name='Version3BomSample.xlsx', headless=True, checkpoint_dir=self.checkpoint_dir,
+                      resume_from=resume_from)
+        try:
+            run(file_name='IsVersion3BomTemplate.xlsx', headless=True, checkpoint_dir=self.checkpoint_dir,
+                resume_from=resume_from)
+            other_file = ""
+        except ValueError as err:
+            other_file = type(err).__name__
+
+        # ASSERT
+        with self.subTest("Resumed output"):
+            pd.testing.assert_frame_equal(resumed.frame, full.frame)
+        with self.subTest("Other file", Out=other_file):
+            self.assertEqual(other_file, ValueError.__name__)
+
+    def test_main_reports_error(self):
+        """
+        Should print a ValueError raised by a sequence and exit with status 1 instead of raising it.
+        """
+        # ARRANGE
+        output = io.StringIO()
+        argv = ['cost-walk', 'Version3BomMultiBoard.xlsx']
+
+        # ACT
+        with contextlib.redirect_stdout(output), self.assertRaises(SystemExit) as exit_info:
+            application.main(argv)
+
+        # ASSERT
+        with self.subTest("Exit status", Out=exit_info.exception.code):
+            self.assertEqual(exit_info.exception.code, 1)
+        with self.subTest("Message", Out=output.getvalue()):
+            self.assertIn("Sheet name is required for workbooks with multiple sheets", output.getvalue())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,246 @@
+import contextlib
+import io
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# The legacy modules in src import each other by bare name, as when run from the src folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import frames
+from src.enumeration import BomTempVer, SourceFileType
+
+
+class TestQtyRefDesCount(unittest.TestCase):
+    def setUp(self):
+        # Test data: whole, fractional, missing and text quantities
+        self.df = pd.DataFrame({
+            'Item': [1, 2, 3, 4, 5, 6],
+            'Qty': [2, 3, 0.5, 1.0, np.nan, '2'],
+            'Designator': ['R1,R2', 'C1', 'U1', 'D1,D2', 'X1', 'Q1,Q2'],
+        })
+
+    def test_find_qty_ref_des_count_mismatch(self):
+        # Call the function
+        result_df = frames.find_qty_ref_des_count_mismatch(self.df, 1, 2)
+        # Expected result: fractional and missing quantities are not checked
+        expected_df = pd.DataFrame({'item': [2, 4], 'quantity': [3.0, 1.0], 'designator_count': [1, 2]})
+        # Check result
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_find_qty_ref_des_count_mismatch_none(self):
+        # Call the function on the matching rows only
+        result_df = frames.find_qty_ref_des_count_mismatch(self.df.iloc[[0, 2, 4, 5]], 1, 2)
+        # Check result
+        self.assertTrue(result_df.empty)
+
+    def test_check_qty_matched_ref_des_count_reports_all(self):
+        # Call the function and check result; both mismatching items are counted in one error
+        with self.assertRaises(ValueError) as error:
+            frames.check_qty_matched_ref_des_count(self.df)
+        self.assertEqual(str(error.exception), "Quantity does not match number of designators for 2 items.")
+
+    def test_check_qty_matched_ref_des_count_passes(self):
+        # Call the function and check result
+        self.assertIsNone(frames.check_qty_matched_ref_des_count(self.df.iloc[[0, 2, 4, 5]]))
+
+    def test_check_qty_matched_ref_des_count_missing_column(self):
+        # Test data and expected error messages
+        cases = [
+            (self.df.drop(columns='Qty'), "No partial match found in the header."),
+            (self.df.drop(columns='Designator'), "Designator column not found."),
+        ]
+        for df, message in cases:
+            with self.subTest(message=message):
+                # Call the function and check result
+                with self.assertRaises(ValueError) as error:
+                    frames.check_qty_matched_ref_des_count(df)
+                self.assertEqual(str(error.exception), message)
+
+
+class TestSplitManufacturersToSeparateRows(unittest.TestCase):
+    def setUp(self):
+        # Test data: resistors are not split for version 2.0, the diode has no manufacturer
+        self.df = pd.DataFrame({
+            'Item': [1, 2, 3],
+            'Component': ['Res', 'IC', 'Diode'],
+            'Description': ['d1\nd2', 'u1\nu2', 'x'],
+            'Manufacturer': ['A\nB', 'M1\nM2', ''],
+            'Manufacturer P/N': ['P1', 'N1\nN2', 'X'],
+            'Qty': [2, 1, 1],
+            'U/P RMB W/O VAT': [1.5, 3.0, 0.2],
+        })
+
+    def _split(self, df, version):
+        return frames.split_manufacturers_to_separate_rows(df, version, BomTempVer, SourceFileType.CB, SourceFileType)
+
+    def test_split_version_3(self):
+        # Call the function
+        result_df = self._split(self.df, BomTempVer.v3)
+        # Expected result: a single part number is shared, alternatives have zero quantity and price
+        expected = [
+            [1, 'Res', 'd1', 'A', 'P1', 2, 1.5],
+            [1, 'Res', 'd2', 'B', 'P1', 0, 0],
+            [2, 'IC', 'u1', 'M1', 'N1', 1, 3.0],
+            [2, 'IC', 'u2', 'M2', 'N2', 0, 0],
+        ]
+        # Check result
+        self.assertEqual(result_df.values.tolist(), expected)
+        self.assertEqual(list(result_df.columns), list(self.df.columns))
+
+    def test_split_version_2(self):
+        # Call the function
+        result_df = self._split(self.df, BomTempVer.v2)
+        # Expected result: exception list rows are kept intact, alternatives keep their price
+        expected = [
+            [1, 'Res', 'd1\nd2', 'A\nB', 'P1', 2, 1.5],
+            [2, 'IC', 'u1', 'M1', 'N1', 1, 3.0],
+            [2, 'IC', 'u2', 'M2', 'N2', 0, 3.0],
+        ]
+        # Check result
+        self.assertEqual(result_df.values.tolist(), expected)
+
+    def test_split_reports_every_bad_row(self):
+        # Test data: too many part numbers in the first row, too few descriptions in the second
+        df = self.df.copy()
+        df.loc[0, 'Manufacturer P/N'] = 'P1\nP2\nP3'
+        df.loc[1, 'Description'] = 'u1'
+        # Call the function and check result
+        with self.assertRaises(ValueError) as error:
+            self._split(df, BomTempVer.v3)
+        message = str(error.exception)
+        self.assertIn("Item 1: 2 Manufacturer names ['A', 'B'] but 3 Manufacturer part numbers", message)
+        self.assertIn("Item 2: 2 Manufacturer names ['M1', 'M2'] but 1 descriptions ['u1']", message)
+
+
+class TestMergeAlternative(unittest.TestCase):
+    def test_merge_alternative_blank_filled_from_primary(self):
+        # Test data: the first alternative has no description, the second no manufacturer
+        df = pd.DataFrame({
+            'Item': [1, 1, 1, 2],
+            'Designator': ['R1', 'R1', 'R1', 'C1'],
+            'Description': ['d1', '', 'd3', 'c1'],
+            'Manufacturer': ['A', 'B', '', 'X'],
+            'Manufacturer P/N': ['p1', 'p2', 'p3', 'x1'],
+            'Qty': [1, 0, 0, 2],
+        })
+        # Call the function
+        result_df = frames.merge_alternative(df)
+        # Expected result: blank alternative values repeat the primary value
+        expected = [
+            [1, 'R1', 'd1\nd1\nd3', 'A\nB\nA', 'p1\np2\np3', 1],
+            [2, 'C1', 'c1', 'X', 'x1', 2],
+        ]
+        # Check result
+        self.assertEqual(result_df.values.tolist(), expected)
+
+
+    def test_merge_alternative_single_rows_untouched(self):
+        # Test data: groups without alternatives hold a number and a missing value
+        df = pd.DataFrame({
+            'Item': [1, 1, 2, 3],
+            'Designator': ['R1', 'R1', 'C1', 'U1'],
+            'Description': ['d1', 'd2', 5.0, np.nan],
+            'Manufacturer': ['A', 'B', 'X', 7],
+            'Manufacturer P/N': ['p1', 'p2', 'x1', 'u1'],
+            'Qty': [1, 0, 2, 1],
+        })
+        # Call the function
+        with contextlib.redirect_stdout(io.StringIO()):
+            result_df = frames.merge_alternative(df)
+        # Expected result: only the group with an alternative is joined
+        expected = [
+            [1, 'R1', 'd1\nd2', 'A\nB', 'p1\np2', 1],
+            [2, 'C1', 5.0, 'X', 'x1', 2],
+            [3, 'U1', np.nan, 7, 'u1', 1],
+        ]
+        # Check result
+        pd.testing.assert_frame_equal(result_df, pd.DataFrame(expected, columns=df.columns, dtype=object))
+
+class TestPrimaryAboveAlternative(unittest.TestCase):
+    def setUp(self):
+        # Test data: the group starts with an alternative and holds two primaries
+        self.df = pd.DataFrame({
+            'Item': [1, 1, 1, 1, 2],
+            'Component': ['compA', 'compB', 'compC', 'compD', 'compE'],
+            'Device Package': ['pkgA', 'pkgB', 'pkgC', 'pkgD', 'pkgE'],
+            'Description': ['alt-first', 'primary-1', 'alt-2', 'primary-2', 'single'],
+            'Designator': ['R1', 'R1', 'R1', 'R1', 'C1'],
+            'Qty': [0, 1, 0, 2, 1],
+        })
+
+    def test_primary_above_alternative_several_primaries(self):
+        # Call the function
+        result_df = frames.primary_above_alternative(self.df, BomTempVer.v3, BomTempVer)
+        # Expected result: later primaries above earlier ones, then the first row, then the alternatives;
+        # package and component values of the first row stay on the top row
+        self.assertEqual(result_df['Description'].tolist(), ['primary-2', 'primary-1', 'alt-first', 'alt-2', 'single'])
+        self.assertEqual(result_df['Qty'].tolist(), [2, 1, 0, 0, 1])
+        self.assertEqual(result_df['Device Package'].tolist(), ['pkgA', 'pkgD', 'pkgB', 'pkgC', 'pkgE'])
+        self.assertEqual(result_df['Component'].tolist(), ['compA', 'compD', 'compB', 'compC', 'compE'])
+
+    def test_primary_above_alternative_version_2(self):
+        # Call the function and check result: version 2.0 is returned unchanged
+        pd.testing.assert_frame_equal(frames.primary_above_alternative(self.df, BomTempVer.v2, BomTempVer), self.df)
+
+
+class TestNormalizeComponentType(unittest.TestCase):
+    def test_build_component_type_normalizer(self):
+        # Test data: 'Res' is listed under two keys
+        normalize = frames.build_component_type_normalizer({'Resistor': ['Res', 'Resistor'], 'Fuse': ['Res', 'Fuse']})
+        # Call the function and check result: the last key listing a variant wins, SMD is ignored,
+        # and a name the two searches disagree on is marked with '*'
+        self.assertEqual(normalize('Res'), ('Fuse', 'Res', 'Res'))
+        self.assertEqual(normalize('SMD Resistor'), ('Resistor', 'Resistor', 'Resistor'))
+        self.assertEqual(normalize('Qwzx')[0], '*Qwzx')
+
+    def test_normalize_component_type_label_verbose(self):
+        # Test data
+        df = pd.DataFrame({'Item': [1, 2, 3], 'Component': ['Resistor', 'Resistor', 'Qwzx']})
+        for verbose in (False, True):
+            with self.subTest(verbose=verbose):
+                output = io.StringIO()
+                # Call the function
+                with contextlib.redirect_stdout(output):
+                    result_df = frames.normalize_component_type_label(df.copy(), verbose=verbose)
+                # Check result: each distinct name is printed once, and only when verbose
+                self.assertEqual(result_df['Component'].tolist(), ['Resistor', 'Resistor', '*Qwzx'])
+                self.assertIn('2 rows updated', output.getvalue())
+                self.assertEqual(output.getvalue().count('-> Resistor'), 1 if verbose else 0)
+                self.assertEqual(output.getvalue().count('-> *Qwzx'), 1 if verbose else 0)
+
+
+class TestCleanManufacturerText(unittest.TestCase):
+    def test_clean_manufacturer_text(self):
+        # Test data and expected result; ".," is replaced before ".，", so mixed comma runs are cleaned in that order
+        cases = [
+            ('Murata Mfg. Co.,Ltd', 'Murata Mfg Co Ltd'),
+            ('Yageo Co.,，Ltd', 'Yageo Co Ltd'),
+            ('Co.，Ltd', 'Co Ltd'),
+            ('TDK，，Corp', 'TD ，Corp'),
+            ('Abc.,,Def', 'Abc ,Def'),
+            ('Ab,,，Cd', 'A Cd'),
+            ('MFG: Samsung', 'Samsung'),
+            ('A\nB', 'A,B'),
+            ('A  B', 'A B'),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                # Call the function and check result
+                self.assertEqual(frames.clean_manufacturer_text(text), expected)
+
+    def test_clean_manufacturer_column(self):
+        # Test data: repeated names, a missing cell and a number
+        column = pd.Series(['Yageo Co.,，Ltd', np.nan, 'Yageo Co.,，Ltd', 5])
+        # Call the function
+        result = frames.clean_text_column(column, frames.clean_manufacturer_text)
+        # Check result: missing cells are kept, other non-text values become NaN like the pandas string methods
+        self.assertEqual(result.iloc[[0, 2]].tolist(), ['Yageo Co Ltd', 'Yageo Co Ltd'])
+        self.assertTrue(result.iloc[[1, 3]].isna().all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,334 @@
+"""
+Unit tests for the stage pipeline that runs the BOM processing sequences.
+
+Example Usage:
+    # Preferred usage via project-root invocation:
+    python -m unittest tests/test_pipeline.py
+
+    # Direct discovery (runs all tests, including this module):
+    python -m unittest discover -s tests
+
+Dependencies:
+    - Python >= 3.10
+    - Standard Library: contextlib, io, json, os, shutil, sys, tempfile, unittest
+    - External Packages: pandas
+    - Project Modules: src.pipeline
+
+Notes:
+    - The legacy modules in src import each other by bare name, so the src folder is put on the import path.
+    - Checkpoint tests write to a temporary folder created in setUp and removed in tearDown.
+
+License:
+    - Internal Use Only
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import sys
+import tempfile
+import unittest
+
+import pandas as pd
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import pipeline  # Module under test
+
+
+def _add_total(df, context):
+    df['total'] = df['qty'] * df['price']
+    return df
+
+
+class TestFuseColumnStages(unittest.TestCase):
+    """
+    Unit tests for `fuse_column_stages`.
+    """
+
+    def test_fuse_adjacent(self):
+        """
+        Should merge each run of adjacent column stages and keep frame stages in place.
+        """
+        # ARRANGE
+        stages = [
+            pipeline.column_stage('strip a', 'a', str.strip),
+            pipeline.column_stage('upper a', 'a', str.upper),
+            pipeline.column_stage('lower b', 'b', str.lower),
+            pipeline.frame_stage('frame', lambda df, context: None),
+            pipeline.column_stage('strip b', 'b', str.strip),
+        ]
+
+        # ACT
+        fused = pipeline.fuse_column_stages(stages)
+
+        # ASSERT
+        with self.subTest("Names", Out=[stage.name for stage in fused]):
+            self.assertEqual([stage.name for stage in fused],
+                             ['strip a + upper a + lower b', 'frame', 'strip b'])
+        with self.subTest("Members", Out=fused[0].members):
+            self.assertEqual(fused[0].members, ('strip a', 'upper a', 'lower b'))
+            self.assertEqual(fused[2].members, ())
+        with self.subTest("Reads", Out=fused[0].reads):
+            self.assertEqual(fused[0].reads, frozenset({'a', 'b'}))
+
+    def test_fused_cleaners_in_order(self):
+        """
+        Should apply the cleaners of a fused stage in declaration order and keep missing cells.
+        """
+        # ARRANGE
+        stages = [
+            pipeline.column_stage('strip', 'a', str.strip),
+            pipeline.column_stage('tag', 'a', lambda text: f'<{text}>'),
+        ]
+        df = pd.DataFrame({'a': [' x ', None, 'y']})
+
+        # ACT
+        fused = pipeline.fuse_column_stages(stages)
+        result = fused[0].run(df, {})
+
+        # ASSERT
+        with self.subTest(Out=result['a'].tolist()):
+            self.assertEqual(len(fused), 1)
+            self.assertEqual(result['a'].iloc[0], '<x>')
+            self.assertTrue(pd.isna(result['a'].iloc[1]))
+            self.assertEqual(result['a'].iloc[2], '<y>')
+
+
+class TestUnusedColumns(unittest.TestCase):
+    """
+    Unit tests for `_unused_columns`.
+    """
+
+    def setUp(self):
+        self.df = pd.DataFrame({'qty': [1], 'price': [2.0], 'note': ['x'], 'item': [1]})
+
+    def test_drop_unused(self):
+        """
+        Should return the columns neither the output header nor a remaining stage reads.
+        """
+        # ARRANGE
+        remaining = [pipeline.frame_stage('total', _add_total, reads={'qty', 'price'})]
+
+        # ACT
+        result = pipeline._unused_columns(self.df, {'output_header': ['item']}, remaining)
+
+        # ASSERT
+        with self.subTest(Out=result):
+            self.assertEqual(result, ['note'])
+
+    def test_no_drop(self):
+        """
+        Should keep every column before a stage that reads all columns, without an output header, or when all are used.
+        """
+        # ARRANGE
+        cases = (
+            ("Barrier", {'output_header': ['item']},
+             [pipeline.frame_stage('total', _add_total, reads={'qty', 'price'}),
+              pipeline.frame_stage('all', lambda df, context: None)]),
+            ("No output header", {}, [pipeline.frame_stage('total', _add_total, reads={'qty', 'price'})]),
+            ("All used", {'output_header': ['item', 'note']},
+             [pipeline.frame_stage('total', _add_total, reads={'qty', 'price'})]),
+        )
+
+        for label, context, remaining in cases:
+            # ACT
+            result = pipeline._unused_columns(self.df, context, remaining)
+
+            # ASSERT
+            with self.subTest(label, Out=result):
+                self.assertIsNone(result)
+
+
+class TestRunPipeline(unittest.TestCase):
+    """
+    Unit tests for `run_pipeline`.
+    """
+
+    def setUp(self):
+        self.checkpoint_dir = tempfile.mkdtemp()
+        self.calls = []
+
+    def tearDown(self):
+        shutil.rmtree(self.checkpoint_dir, ignore_errors=True)
+
+    def _stages(self, fail_at: str = '') -> list[pipeline.Stage]:
+        """
+        Build a small sequence that records the stages it runs and can fail at a named stage.
+        """
+        def step(name, func):
+            def run(df, context):
+                self.calls.append(name)
+                if name == fail_at:
+                    raise ValueError(f"{name} failed")
+                print(f'running {name}')
+                return func(df, context)
+            return run
+
+        def read(df, context):
+            context['output_header'] = ['item', 'desc', 'total']
+            return pd.DataFrame({'item': [1, 2], 'desc': [' a ', 'b '], 'qty': [2, 3], 'price': [1.5, 2.0],
+                                 'note': ['x', 'y']})
+
+        return [
+            pipeline.frame_stage('read', step('read', read)),
+            pipeline.column_stage('strip desc', 'desc', str.strip),
+            pipeline.column_stage('upper desc', 'desc', str.upper),
+            pipeline.frame_stage('total', step('total', _add_total), reads={'qty', 'price'}),
+            pipeline.frame_stage('check', step('check', lambda df, context: None), reads={'item'}),
+        ]
+
+    def test_run(self):
+        """
+        Should run every stage, time each one, and drop the columns the output does not need.
+        """
+        # ARRANGE
+        stages = self._stages()
+
+        # ACT
+        result = pipeline.run_pipeline(stages, quiet=True)
+
+        # ASSERT
+        with self.subTest("Frame", Out=result.frame.to_dict('list')):
+            self.assertEqual(result.frame.to_dict('list'),
+                             {'item': [1, 2], 'desc': ['A', 'B'], 'qty': [2, 3], 'price': [1.5, 2.0],
+                              'total': [3.0, 6.0]})
+        with self.subTest("Timings", Out=[timing.name for timing in result.timings]):
+            self.assertEqual([timing.name for timing in result.timings],
+                             ['read', 'strip desc + upper desc', 'total', 'check'])
+
+    def test_quiet(self):
+        """
+        Should print nothing when quiet, and the stage output and timings otherwise.
+        """
+        for quiet in (True, False):
+            # ARRANGE
+            output = io.StringIO()
+
+            # ACT
+            with contextlib.redirect_stdout(output):
+                pipeline.run_pipeline(self._stages(), quiet=quiet)
+
+            # ASSERT
+            with self.subTest(Quiet=quiet, Out=output.getvalue()):
+                if quiet:
+                    self.assertEqual(output.getvalue(), '')
+                else:
+                    self.assertIn('running read', output.getvalue())
+                    self.assertIn('Stage timings:', output.getvalue())
+
+    def test_checkpoint_round_trip(self):
+        """
+        Should save a frame and the manifest after every stage, and resume with the same result without rerunning earlier stages.
+        """
+        # ARRANGE
+        full = pipeline.run_pipeline(self._stages(), quiet=True, checkpoint_dir=self.checkpoint_dir,
+                                     manifest_keys=('sequence',))
+        self.calls.clear()
+
+        # ACT
+        resumed = pipeline.run_pipeline(self._stages(), context={'sequence': None}, quiet=True,
+                                        checkpoint_dir=self.checkpoint_dir, resume_from='total',
+                                        manifest_keys=('sequence',))
+        with open(os.path.join(self.checkpoint_dir, pipeline.MANIFEST_FILE_NAME), encoding='utf-8') as file:
+            manifest = json.load(file)
+
+        # ASSERT
+        with self.subTest("Checkpoints", Out=sorted(os.listdir(self.checkpoint_dir))):
+            self.assertEqual(sorted(os.listdir(self.checkpoint_dir)),
+                             ['00_read.pkl', '01_strip_desc_upper_desc.pkl', '02_total.pkl', '03_check.pkl',
+                              pipeline.MANIFEST_FILE_NAME])
+        with self.subTest("Manifest", Out=manifest):
+            self.assertEqual(manifest['last_completed'], 3)
+            self.assertEqual(manifest['stages'], ['read', 'strip desc + upper desc', 'total', 'check'])
+        with self.subTest("Frame"):
+            pd.testing.assert_frame_equal(resumed.frame, full.frame)
+        with self.subTest("Context", Out=resumed.context):
+            self.assertEqual(resumed.context['output_header'], ['item', 'desc', 'total'])
+        with self.subTest("Stages run", Out=self.calls):
+            self.assertEqual(self.calls, ['total', 'check'])
+
+    def test_resume_from_fused_member(self):
+        """
+        Should resume from the fused stage a declared column stage was merged into.
+        """
+        # ARRANGE
+        pipeline.run_pipeline(self._stages(), quiet=True, checkpoint_dir=self.checkpoint_dir)
+        self.calls.clear()
+
+        # ACT
+        result = pipeline.run_pipeline(self._stages(), quiet=True, checkpoint_dir=self.checkpoint_dir,
+                                       resume_from='upper desc')
+
+        # ASSERT
+        with self.subTest(Out=[timing.name for timing in result.timings]):
+            self.assertEqual([timing.name for timing in result.timings], ['strip desc + upper desc', 'total', 'check'])
+            self.assertEqual(result.frame['desc'].tolist(), ['A', 'B'])
+
+    def test_new_run_clears_checkpoints(self):
+        """
+        Should delete the checkpoints of an earlier run when a new run starts, so they cannot be resumed.
+        """
+        # ARRANGE
+        pipeline.run_pipeline(self._stages(), quiet=True, checkpoint_dir=self.checkpoint_dir)
+
+        # ACT
+        with self.assertRaises(ValueError):
+            pipeline.run_pipeline(self._stages(fail_at='total'), quiet=True, checkpoint_dir=self.checkpoint_dir)
+
+        # ASSERT
+        with self.subTest(Out=sorted(os.listdir(self.checkpoint_dir))):
+            self.assertEqual(sorted(os.listdir(self.checkpoint_dir)),
+                             ['00_read.pkl', '01_strip_desc_upper_desc.pkl', pipeline.MANIFEST_FILE_NAME])
+
+    def test_resume_refused(self):
+        """
+        Should raise when the checkpoints belong to another run, stage list, or stop before the resume point.
+        """
+        # ARRANGE
+        with self.assertRaises(ValueError):
+            pipeline.run_pipeline(self._stages(fail_at='total'), context={'sequence': 'cost-walk'}, quiet=True,
+                                  checkpoint_dir=self.checkpoint_dir, manifest_keys=('sequence',))
+        cases = (
+            ("Unfinished stage", self._stages(), {'sequence': 'cost-walk'}, 'check', ValueError),
+            ("Other run", self._stages(), {'sequence': 'cbom-db'}, 'total', ValueError),
+            ("Other stages", self._stages()[:-1], {}, 'total', ValueError),
+            ("Unknown stage", self._stages(), {}, 'missing', ValueError),
+            ("No checkpoint folder", self._stages(), {}, 'total', ValueError),
+        )
+
+        for label, stages, context, resume_from, expected in cases:
+            checkpoint_dir = None if label == "No checkpoint folder" else self.checkpoint_dir
+
+            # ACT
+            try:
+                pipeline.run_pipeline(stages, context=context, quiet=True, checkpoint_dir=checkpoint_dir,
+                                      resume_from=resume_from, manifest_keys=('sequence',))
+                result = ""
+            except Exception as err:
+                result = type(err).__name__
+
+            # ASSERT
+            with self.subTest(label, Out=result, Exp=expected.__name__):
+                self.assertEqual(result, expected.__name__)
+
+    def test_resume_without_manifest(self):
+        """
+        Should raise FileNotFoundError when the checkpoint folder holds no run manifest.
+        """
+        # ACT
+        try:
+            pipeline.run_pipeline(self._stages(), quiet=True, checkpoint_dir=self.checkpoint_dir, resume_from='total')
+            result = ""
+        except Exception as err:
+            result = type(err).__name__
+
+        # ASSERT
+        with self.subTest(Out=result):
+            self.assertEqual(result, FileNotFoundError.__name__)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+import os
+import sys
+import unittest
+
+import numpy as np
+import pandas as pd
+
+# The legacy modules in src import each other by bare name, as when run from the src folder
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+import rows
+
+
+class TestDuplicateRowForMultipleQuantity(unittest.TestCase):
+    def test_duplicate_row_for_multiple_quantity(self):
+        # Test data: more designators than units, a single unit, a fractional quantity, fewer designators than units
+        df = pd.DataFrame({
+            'Item': [1, 2, 3, 4],
+            'Qty': [3, 1, 2.5, 2],
+            'Designator': ['R1,R2,R3,R4', 'C1', 'U1,U2', 'D1'],
+        })
+        # Call the function
+        result_df = rows.duplicate_row_for_multiple_quantity(df)
+        # Expected result: the last unit keeps the remaining designators, or none when they ran out
+        expected_df = pd.DataFrame({
+            'Item': [1, 1, 1, 2, 3, 4, 4],
+            'Qty': [1.0, 1.0, 1.0, 1.0, 2.5, 1.0, 1.0],
+            'Designator': ['R1', 'R2', 'R3,R4', 'C1', 'U1,U2', 'D1', ''],
+        })
+        # Check result
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_duplicate_row_for_multiple_quantity_float_qty(self):
+        # Test data: quantities read as text or whole floats
+        df = pd.DataFrame({'Qty': ['2', 2.0], 'Designator': ['R1,R2', 'C1,C2']})
+        # Call the function
+        result_df = rows.duplicate_row_for_multiple_quantity(df)
+        # Check result
+        self.assertEqual(result_df['Qty'].dtype, float)
+        self.assertEqual(result_df['Designator'].tolist(), ['R1', 'R2', 'C1', 'C2'])
+
+
+class TestDeleteRowWhenElementContainsString(unittest.TestCase):
+    def test_delete_row_when_element_contains_string(self):
+        # Test data: matching is case-insensitive, missing cells and non-matching rows are kept
+        df = pd.DataFrame({
+            'Item': [1, 2, 3, 4, 5],
+            'Description': ['Glue A', np.nan, 'Resistor', 'SOLDER paste', 'Wire (R+)'],
+        }, index=[10, 11, 12, 13, 14])
+        # Call the function
+        result_df = rows.delete_row_when_element_contains_string(df, 1, ['glue', 'Solder', '(r+)'])
+        # Expected result: reference strings are literal text, not patterns
+        expected_df = pd.DataFrame({'Item': [2, 3], 'Description': [np.nan, 'Resistor']})
+        # Check result
+        pd.testing.assert_frame_equal(result_df, expected_df)
+
+    def test_delete_row_when_element_contains_string_nothing_to_match(self):
+        # Test data
+        df = pd.DataFrame({'Description': ['Glue', np.nan]}, index=[5, 6])
+        # Call the function and check result: an empty list keeps every row with a fresh index
+        pd.testing.assert_frame_equal(rows.delete_row_when_element_contains_string(df, 0, []),
+                                      df.reset_index(drop=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,6 +1,8 @@
 import unittest
 import pandas as pd
 from src.strings import strip_match_from_string
+from src.strings import (DesignatorReport, check_duplicate_ref_des, check_ref_des_name, explode_designators,
+                         find_designator_column, validate_designator_column)
 
 class TestStripMatchFromString(unittest.TestCase):
     def test_strip_match_from_string_basic_removal(self):
@@ -99,5 +101,99 @@ class TestStripMatchFromString(unittest.TestCase):
         pd.testing.assert_frame_equal(result_df, expected_df)
 
 
+class TestFindDesignatorColumn(unittest.TestCase):
+    def test_find_designator_column_single_match(self):
+        # Test data
+        df = pd.DataFrame(columns=['Item', 'Ref Designator', 'Qty'])
+        # Call the function and check result
+        self.assertEqual(find_designator_column(df), 1)
+
+    def test_find_designator_column_no_or_several_matches(self):
+        # Test data and expected error messages
+        cases = [
+            (['Item', 'Qty'], "No match found for Ref des column."),
+            (['Designator', 'Qty', 'Old Designator'], "More than one column matched the 'Designator' header."),
+        ]
+        for columns, message in cases:
+            with self.subTest(columns=columns):
+                # Call the function and check result
+                with self.assertRaises(ValueError) as error:
+                    find_designator_column(pd.DataFrame(columns=columns))
+                self.assertEqual(str(error.exception), message)
+
+
+class TestExplodeDesignators(unittest.TestCase):
+    def test_explode_designators_delimiters_and_whitespace(self):
+        # Test data; the index is not a range, results are keyed by row position
+        column = pd.Series(['r1, R2', 'C1;c2 : C3'], index=[10, 11])
+        # Call the function
+        result = explode_designators(column)
+        # Check result
+        self.assertEqual(result.tolist(), ['R1', 'R2', 'C1', 'C2', 'C3'])
+        self.assertEqual(result.index.tolist(), [0, 0, 1, 1, 1])
+
+
+class TestValidateDesignatorColumn(unittest.TestCase):
+    def test_validate_designator_column_reformat(self):
+        # Test data
+        column = pd.Series(['r1, R2', 'C1;C2 : C3', 'U1', ' q1 '])
+        # Call the function
+        report = validate_designator_column(column)
+        # Check result
+        self.assertIsInstance(report, DesignatorReport)
+        self.assertEqual(report.designators.tolist(), ['R1,R2', 'C1,C2,C3', 'U1', 'Q1'])
+        self.assertEqual(report.changed_rows, [0, 1, 3])
+        self.assertEqual(report.invalid, [])
+        self.assertEqual(report.duplicates, [])
+        self.assertTrue(report.is_valid)
+
+    def test_validate_designator_column_invalid_and_duplicates(self):
+        # Test data: '1R' starts with a digit, 'X_' ends with an underscore, 'R' is too short, R1 repeats twice
+        column = pd.Series(['R1,R2', '1R,r1', 'PCB', 'X_,R', 'R1'])
+        # Call the function
+        report = validate_designator_column(column)
+        # Check result
+        self.assertEqual(report.invalid, [(1, '1R'), (3, 'X_'), (3, 'R')])
+        self.assertEqual(report.duplicates, ['R1', 'R1'])
+        self.assertFalse(report.is_valid)
+
+    def test_validate_designator_column_pcb(self):
+        # Test data: the board itself is listed with the 'PCB' designator
+        column = pd.Series(['PCB', 'pcb', 'R1'])
+        # Call the function
+        report = validate_designator_column(column)
+        # Check result: accepted as a designator, but still only once
+        self.assertEqual(report.invalid, [])
+        self.assertEqual(report.duplicates, ['PCB'])
+
+
+class TestCheckRefDes(unittest.TestCase):
+    def test_check_ref_des_name_reformats(self):
+        # Test data
+        df = pd.DataFrame({'Item': [1, 2], 'Designator': ['r1; R2', 'C1']})
+        # Call the function
+        result_df = check_ref_des_name(df)
+        # Check result
+        self.assertEqual(result_df['Designator'].tolist(), ['R1,R2', 'C1'])
+
+    def test_check_ref_des_name_invalid(self):
+        # Test data: two invalid designators in one row
+        df = pd.DataFrame({'Designator': ['R1', '1R, 2R', 'C1']})
+        # Call the function and check result
+        with self.assertRaises(ValueError) as error:
+            check_ref_des_name(df)
+        self.assertEqual(str(error.exception), "Invalid reference designators found in 1 rows.")
+
+    def test_check_duplicate_ref_des(self):
+        # Test data
+        df = pd.DataFrame({'Designator': ['R1,R2', 'R2', 'C1']})
+        # Call the function and check result
+        with self.assertRaises(ValueError) as error:
+            check_duplicate_ref_des(df)
+        self.assertEqual(str(error.exception), "1 duplicate reference designators found.")
+        # No error without duplicates
+        self.assertIsNone(check_duplicate_ref_des(pd.DataFrame({'Designator': ['R1,R2', 'C1']})))
+
+
 if __name__ == "__main__":
     unittest.main()
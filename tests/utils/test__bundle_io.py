@@ -0,0 +1,205 @@
+"""
+Unit tests for binary resource bundle utilities.
+
+This module validates building and loading of precompiled resource bundles:
+    - bundle_path_for: Place a bundle next to its JSON source
+    - save_bundle_file / load_bundle_payload: Round-trip a payload through a bundle
+    - Freshness: Bundles are ignored once the JSON source changes
+    - Integrity: Corrupt or foreign-version bundles are ignored instead of raising
+
+Example Usage:
+    # Preferred usage — run all tests in this module:
+    python -m unittest tests/utils/test__bundle_io.py
+
+Dependencies:
+ - Python >= 3.10
+ - Standard Library: unittest, marshal, os, tempfile, shutil, unittest.mock
+
+Notes:
+    - Tests follow the Arrange–Act–Assert pattern with `subTest` assertions for clearer output on mismatches.
+    - Temporary files and directories are created in setUp/tearDown to ensure isolation between tests.
+
+License:
+ - Internal Use Only
+"""
+
+import marshal
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# noinspection PyProtectedMember
+import src.utils._bundle_io as bio
+
+
+class TestBundleIo(unittest.TestCase):
+    """
+    Unit tests for `save_bundle_file` and `load_bundle_payload`.
+    """
+
+    PAYLOAD = {"A": "1", "List": ["x", "y"], "Nested": {"k": [1, 2.5, None, True]}}
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.source_path = os.path.join(self.temp_dir, "resource.json")
+        with open(self.source_path, "w", encoding="utf-8") as f:
+            f.write('{"payload_data": "source"}')
+        self.bundle_path = bio.bundle_path_for(self.source_path)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_bundle_path_for(self):
+        """
+        Should replace the JSON extension with the bundle extension.
+        """
+        # ACT
+        result = bio.bundle_path_for(os.path.join("a", "b.json"))
+
+        # ASSERT
+        with self.subTest(Out=result):
+            self.assertEqual(result, os.path.join("a", "b" + bio.BUNDLE_FILE_EXT))
+
+    def test_round_trip(self):
+        """
+        Should return the same payload that was compiled.
+        """
+        # ARRANGE
+        bio.save_bundle_file(self.bundle_path, self.PAYLOAD, self.source_path)
+
+        # ACT
+        result = bio.load_bundle_payload(self.bundle_path, self.source_path)
+
+        # ASSERT
+        with self.subTest(Out=result, Exp=self.PAYLOAD):
+            self.assertEqual(result, self.PAYLOAD)
+
+    def test_version_round_trip(self):
+        """
+        Should return the payload together with the version stamp it was compiled with.
+        """
+        cases = ("ABC123", "")
+
+        for version in cases:
+            # ARRANGE
+            bio.save_bundle_file(self.bundle_path, self.PAYLOAD, self.source_path, version=version)
+
+            # ACT
+            result = bio.load_bundle(self.bundle_path, self.source_path)
+
+            # ASSERT
+            with self.subTest(Version=version, Out=result):
+                self.assertEqual(result, (self.PAYLOAD, version))
+
+    def test_touched_source_still_fresh(self):
+        """
+        Should accept the bundle when only the source modification time changed.
+        """
+        # ARRANGE
+        bio.save_bundle_file(self.bundle_path, self.PAYLOAD, self.source_path)
+        stat = os.stat(self.source_path)
+        os.utime(self.source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+        # ACT
+        result = bio.load_bundle_payload(self.bundle_path, self.source_path)
+
+        # ASSERT
+        with self.subTest(Out=result):
+            self.assertEqual(result, self.PAYLOAD)
+
+    def test_stale(self):
+        """
+        Should return None when the source content changes, with or without a size change.
+        """
+        cases = ('{"payload_data": "SOURCE"}', '{"payload_data": "changed size"}')
+
+        for content in cases:
+            # ARRANGE
+            bio.save_bundle_file(self.bundle_path, self.PAYLOAD, self.source_path)
+            stat = os.stat(self.source_path)
+            with open(self.source_path, "w", encoding="utf-8") as f:
+                f.write(content)
+            os.utime(self.source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            # ACT
+            result = bio.load_bundle_payload(self.bundle_path, self.source_path)
+
+            # ASSERT
+            with self.subTest(Content=content, Out=result):
+                self.assertIsNone(result)
+
+    def test_stale_with_unchanged_mtime(self):
+        """
+        Should return None when the source content changes but its size and modification time are kept.
+        """
+        # ARRANGE
+        bio.save_bundle_file(self.bundle_path, self.PAYLOAD, self.source_path)
+        stat = os.stat(self.source_path)
+        with open(self.source_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        with open(self.source_path, "w", encoding="utf-8") as f:
+            f.write(content.swapcase())
+        os.utime(self.source_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        # ACT
+        result = bio.load_bundle_payload(self.bundle_path, self.source_path)
+
+        # ASSERT
+        with self.subTest(Out=result):
+            self.assertIsNone(result)
+
+    def test_invalid_bundles(self):
+        """
+        Should return None for missing, corrupt, tampered, or foreign-version bundles.
+        """
+        # ARRANGE
+        bio.save_bundle_file(self.bundle_path, self.PAYLOAD, self.source_path)
+        with open(self.bundle_path, "rb") as f:
+            good = marshal.loads(f.read())
+
+        tampered = dict(good, payload=marshal.dumps({"A": "evil"}))
+        foreign = dict(good, python="2.7")
+        cases = (
+            ("Missing", None),
+            ("Corrupt", b"not a bundle"),
+            ("Tampered", marshal.dumps(tampered)),
+            ("Foreign version", marshal.dumps(foreign)),
+        )
+
+        for name, data in cases:
+            if data is None:
+                os.remove(self.bundle_path)
+            else:
+                with open(self.bundle_path, "wb") as f:
+                    f.write(data)
+
+            # ACT
+            result = bio.load_bundle_payload(self.bundle_path, self.source_path)
+
+            # ASSERT
+            with self.subTest(name, Out=result):
+                self.assertIsNone(result)
+
+    def test_save_raises(self):
+        """
+        Should raise RuntimeError when the payload cannot be serialized.
+        """
+        # ARRANGE
+        expected = RuntimeError.__name__
+
+        # ACT
+        try:
+            bio.save_bundle_file(self.bundle_path, {"bad": object()}, self.source_path)
+            result = ""
+        except Exception as err:
+            result = type(err).__name__
+
+        # ASSERT
+        with self.subTest(Out=result, Exp=expected):
+            self.assertEqual(result, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
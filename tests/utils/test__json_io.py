@@ -32,6 +32,7 @@ License:
 """
 
 import copy
+import hashlib
 import json
 import os
 import shutil
@@ -131,6 +132,75 @@ class TestComputePayloadSha256(unittest.TestCase):
             self.assertEqual(result, expected)
 
 
+class TestComputePayloadSha256V2(unittest.TestCase):
+    """
+    Unit tests for `_compute_payload_sha256_v2`.
+    """
+
+    @staticmethod
+    def _canonical_sha256(data: dict) -> str:
+        """
+        Reference digest: SHA-256 of the whole canonical JSON document.
+        """
+        text = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        return hashlib.sha256(text.encode("utf-8")).hexdigest().upper()
+
+    def test_value(self):
+        """
+        Should match a known SHA-256 of the canonical JSON text.
+        """
+        # ARRANGE
+        data = {"b": "2", "a": "1"}
+        expected = hashlib.sha256(b'{"a":"1","b":"2"}').hexdigest().upper()
+
+        # ACT
+        result = jio._compute_payload_sha256_v2(data)
+
+        # ASSERT
+        with self.subTest(Out=result, Exp=expected):
+            self.assertEqual(result, expected)
+
+    def test_matches_canonical_document(self):
+        """
+        Should equal the digest of the full canonical document for empty, nested, Unicode, and multi-chunk payloads.
+        """
+        # ARRANGE
+        many = {f"K{i:04d}": [f"alias {i}", {"n": i, "ok": i % 2 == 0}] for i in range(jio._CHECKSUM_CHUNK_ENTRIES * 3 + 5)}
+        cases = (
+            {},
+            {"z": None, "a": 1.5, "m": True},
+            {"Δ": "é", "nested": {"b": [1, 2], "a": {"y": "x"}}},
+            many,
+        )
+
+        for data in cases:
+            # ACT
+            result = jio._compute_payload_sha256_v2(data)
+            expected = self._canonical_sha256(data)
+
+            # ASSERT
+            with self.subTest(Size=len(data), Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
+    def test_distinguishes_v1_collisions(self):
+        """
+        Should tell apart payloads that the v1 concatenation scheme cannot.
+        """
+        # ARRANGE
+        data_a = {"a": "1b2"}
+        data_b = {"a": "1", "b": "2"}
+
+        # ACT
+        v1_equal = jio._compute_payload_sha256(data_a) == jio._compute_payload_sha256(data_b)
+        v2_equal = jio._compute_payload_sha256_v2(data_a) == jio._compute_payload_sha256_v2(data_b)
+
+        # ASSERT
+        with self.subTest("V1", Out=v1_equal):
+            self.assertTrue(v1_equal)
+        with self.subTest("V2", Out=v2_equal):
+            self.assertFalse(v2_equal)
+
+
 class TestCreateJsonPacket(unittest.TestCase):
     """
     Unit test for the `create_json_packet` function.
@@ -204,6 +274,28 @@ class TestCreateJsonPacket(unittest.TestCase):
         with self.subTest(Out=actual_key_order, Exp=expected_key_order):
             self.assertEqual(actual_key_order, expected_key_order)
 
+    def test_checksum_version(self):
+        """
+        Should record the version only for V2 packets and reject unknown versions.
+        """
+        # ARRANGE
+        payload = {"b": [1, 2], "a": "x"}
+
+        # ACT
+        v1 = jio.create_json_packet(payload, "example.json")
+        v2 = jio.create_json_packet(payload, "example.json", checksum_version=jio.CHECKSUM_V2)
+
+        # ASSERT
+        with self.subTest("V1 layout", Out=v1[jio._KEY_META]):
+            self.assertNotIn(jio._KEY_SHA256_VERSION, v1[jio._KEY_META])
+            self.assertEqual(v1[jio._KEY_META][jio._KEY_SHA256], jio._compute_payload_sha256(payload))
+        with self.subTest("V2 layout", Out=v2[jio._KEY_META]):
+            self.assertEqual(v2[jio._KEY_META][jio._KEY_SHA256_VERSION], jio.CHECKSUM_V2)
+            self.assertEqual(v2[jio._KEY_META][jio._KEY_SHA256], jio._compute_payload_sha256_v2(payload))
+        with self.subTest("Unknown"):
+            with self.assertRaises(ValueError):
+                jio.create_json_packet(payload, "example.json", checksum_version=99)
+
 
 class TestDictToJsonString(unittest.TestCase):
     """
@@ -616,6 +708,84 @@ class TestSaveJsonFile(unittest.TestCase):
         with self.subTest(Out=result, Exp=expected_error):
             self.assertEqual(result, expected_error)
 
+    def test_atomic_replace(self):
+        """
+        Should replace an existing file with the same text as a direct write and leave no temporary file.
+        """
+        # ARRANGE
+        jio.save_json_file(self.file_path, {"old": 1})
+        data = {"name": "Zoë", "items": [1, 2]}
+        expected_text = json.dumps(data, indent=2, ensure_ascii=False)
+
+        # ACT
+        jio.save_json_file(self.file_path, data, atomic=True)
+
+        # ASSERT
+        with open(self.file_path, mode="r", encoding="utf-8") as f:
+            written_text = f.read()
+        with self.subTest("Text", Out=written_text, Exp=expected_text):
+            self.assertEqual(written_text, expected_text)
+        with self.subTest("Folder", Out=os.listdir(self.tmpdir)):
+            self.assertEqual(os.listdir(self.tmpdir), ["out.json"])
+
+    def test_atomic_failure_keeps_file(self):
+        """
+        Should raise RuntimeError, keep the previous file unchanged, and clean up when serialization fails.
+        """
+        # ARRANGE
+        jio.save_json_file(self.file_path, {"old": 1})
+        with open(self.file_path, mode="r", encoding="utf-8") as f:
+            expected_text = f.read()
+
+        # ACT
+        try:
+            jio.save_json_file(self.file_path, {"callback": lambda x: x}, atomic=True)
+            result = ""  # No exception raised (unexpected)
+        except Exception as e:
+            result = type(e).__name__
+
+        # ASSERT
+        with open(self.file_path, mode="r", encoding="utf-8") as f:
+            written_text = f.read()
+        with self.subTest("Error", Out=result, Exp=RuntimeError.__name__):
+            self.assertEqual(result, RuntimeError.__name__)
+        with self.subTest("Unchanged", Out=written_text, Exp=expected_text):
+            self.assertEqual(written_text, expected_text)
+        with self.subTest("Folder", Out=os.listdir(self.tmpdir)):
+            self.assertEqual(os.listdir(self.tmpdir), ["out.json"])
+
+
+    def test_atomic_rename_failure_removes_temp_file(self):
+        """
+        Should raise RuntimeError, keep the previous file, and remove the temporary file when the rename fails, for
+        both `save_json_file` and `save_json_packet_file`.
+        """
+        # ARRANGE
+        cases = (
+            ("save_json_file", lambda: jio.save_json_file(self.file_path, {"new": 1}, atomic=True)),
+            ("save_json_packet_file",
+             lambda: jio.save_json_packet_file(self.file_path, jio.create_json_packet({"new": 1}, "p"), atomic=True)),
+        )
+
+        for label, save in cases:
+            jio.save_json_file(self.file_path, {"old": 1})
+            with patch.object(jio.os, "replace", side_effect=OSError("locked")):
+                # ACT
+                try:
+                    save()
+                    result = ""
+                except Exception as e:
+                    result = type(e).__name__
+
+            # ASSERT
+            with open(self.file_path, mode="r", encoding="utf-8") as f:
+                written = json.load(f)
+            with self.subTest(label, Out=result, Exp=RuntimeError.__name__):
+                self.assertEqual(result, RuntimeError.__name__)
+            with self.subTest(label, Out=written):
+                self.assertEqual(written, {"old": 1})
+            with self.subTest(label, Out=os.listdir(self.tmpdir)):
+                self.assertEqual(os.listdir(self.tmpdir), ["out.json"])
 
 class TestVerifyJsonPayloadChecksum(unittest.TestCase):
     """
@@ -695,6 +865,224 @@ class TestVerifyJsonPayloadChecksum(unittest.TestCase):
             self.assertEqual(result, expected)
 
 
+    def test_versions(self):
+        """
+        Should verify V1 and V2 packets, detect tampering in either, and reject unknown versions.
+        """
+        # ARRANGE
+        data = {"a": "1", "b": ["x", {"y": 2}]}
+        cases = []
+        for version in (jio.CHECKSUM_V1, jio.CHECKSUM_V2):
+            packet = jio.create_json_packet(data, "example.json", checksum_version=version)
+            tampered = {jio._KEY_META: packet[jio._KEY_META], jio._KEY_PAYLOAD: dict(data, b=["x", {"y": 3}])}
+            cases.append((f"V{version}", packet, True))
+            cases.append((f"V{version} tampered", tampered, False))
+        unknown = jio.create_json_packet(data, "example.json", checksum_version=jio.CHECKSUM_V2)
+        unknown[jio._KEY_META][jio._KEY_SHA256_VERSION] = 99
+        cases.append(("Unknown version", unknown, False))
+
+        for name, packet, expected in cases:
+            # ACT
+            result = jio.verify_json_payload_checksum(packet)
+
+            # ASSERT
+            with self.subTest(name, Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
+
+class TestMappedJsonPacket(unittest.TestCase):
+    """
+    Unit tests for `save_json_packet_file` and `load_json_packet_mapped`.
+    """
+
+    PAYLOAD = {"b": ["x", "y\nz"], "a": {"k": 1, "Δ": "é"}, "c": None}
+
+    def setUp(self):
+        """Create a temporary directory for test artifacts."""
+        self.tmpdir = tempfile.mkdtemp(prefix="mapped_json_test_")
+        self.file_path = os.path.join(self.tmpdir, "packet.json")
+
+    def tearDown(self):
+        """Remove any temporary files/directories created during tests."""
+        shutil.rmtree(self.tmpdir, ignore_errors=True)
+
+    def _rewrite(self, old: str, new: str, newline: str = "\n") -> None:
+        """Replace text in the packet file, optionally converting line endings."""
+        with open(self.file_path, mode="r", encoding="utf-8", newline="") as f:
+            text = f.read().replace(old, new)
+        with open(self.file_path, mode="w", encoding="utf-8", newline="") as f:
+            f.write(text.replace("\n", newline))
+
+    def test_layout_is_plain_json(self):
+        """
+        Should write ordinary JSON with one payload entry per line.
+        """
+        # ARRANGE
+        packet = jio.create_json_packet(self.PAYLOAD, "packet.json", checksum_version=jio.CHECKSUM_V2)
+
+        # ACT
+        jio.save_json_packet_file(self.file_path, packet)
+
+        # ASSERT
+        with open(self.file_path, mode="r", encoding="utf-8") as f:
+            text = f.read()
+        with self.subTest("Round trip"):
+            self.assertEqual(json.loads(text), packet)
+        with self.subTest("Entry lines", Out=text):
+            self.assertIn('        "a":{"k":1,"Δ":"é"},\n', text)
+
+    def test_round_trip(self):
+        """
+        Should verify and return the payload for both checksum versions, empty payloads, and CRLF line endings.
+        """
+        cases = []
+        for version in (jio.CHECKSUM_V1, jio.CHECKSUM_V2):
+            for payload in ({}, self.PAYLOAD, {f"K{i:04d}": [f"alias {i}"] for i in range(3000)}):
+                for newline in ("\n", "\r\n"):
+                    cases.append((version, payload, newline))
+
+        for version, payload, newline in cases:
+            # ARRANGE
+            jio.save_json_packet_file(self.file_path, jio.create_json_packet(payload, "p", checksum_version=version))
+            self._rewrite("", "", newline)
+
+            # ACT
+            with jio.load_json_packet_mapped(self.file_path) as packet:
+                verified = packet.verify_checksum()
+                result = packet.payload
+
+            # ASSERT
+            with self.subTest(Version=version, Size=len(payload), Newline=repr(newline)):
+                self.assertTrue(verified)
+                self.assertEqual(result, payload)
+
+    def test_payload_sha256(self):
+        """
+        Should expose the stored payload checksum without parsing the payload.
+        """
+        # ARRANGE
+        packet_in = jio.create_json_packet(self.PAYLOAD, "p", checksum_version=jio.CHECKSUM_V2)
+        jio.save_json_packet_file(self.file_path, packet_in)
+        expected = jio.extract_payload_checksum(packet_in)
+
+        # ACT
+        with jio.load_json_packet_mapped(self.file_path) as packet:
+            result = packet.payload_sha256
+            parsed = packet._payload is not None
+
+        # ASSERT
+        with self.subTest(Out=result, Exp=expected):
+            self.assertEqual(result, expected)
+        with self.subTest("Payload not parsed"):
+            self.assertFalse(parsed)
+
+    def test_verified_in_place(self):
+        """
+        Should verify a V2 packet without parsing the payload.
+        """
+        # ARRANGE
+        packet = jio.create_json_packet(self.PAYLOAD, "p", checksum_version=jio.CHECKSUM_V2)
+        jio.save_json_packet_file(self.file_path, packet)
+
+        with jio.load_json_packet_mapped(self.file_path) as mapped:
+            with patch.object(jio, "verify_json_payload_checksum") as p_verify:
+                # ACT
+                verified = mapped.verify_checksum()
+
+            # ASSERT
+            with self.subTest("Verified"):
+                self.assertTrue(verified)
+            with self.subTest("No parse", Calls=p_verify.call_count):
+                self.assertEqual(p_verify.call_count, 0)
+            with self.subTest("Meta", Out=mapped.meta):
+                self.assertEqual(mapped.meta, packet[jio._KEY_META])
+
+    def test_shipped_resources(self):
+        """
+        Should verify the shipped runtime resources in place, as written by tools_json_builder.
+        """
+        # ARRANGE
+        project_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        resources = (
+            ("src", "resources", "settings", "application.json"),
+            ("src", "resources", "lookups", "component_type.json"),
+            ("src", "resources", "lookups", "manufacturer.json"),
+        )
+
+        for parts in resources:
+            with jio.load_json_packet_mapped(os.path.join(project_root, *parts)) as mapped:
+                with patch.object(jio, "verify_json_payload_checksum") as p_verify:
+                    # ACT
+                    verified = mapped.verify_checksum()
+                payload = mapped.payload
+
+            # ASSERT
+            with self.subTest(parts[-1], Version=mapped.meta.get(jio._KEY_SHA256_VERSION)):
+                self.assertTrue(verified)
+                self.assertEqual(p_verify.call_count, 0)
+                self.assertTrue(payload)
+
+    def test_tampered(self):
+        """
+        Should fail verification when a payload value was edited.
+        """
+        # ARRANGE
+        for version in (jio.CHECKSUM_V1, jio.CHECKSUM_V2):
+            jio.save_json_packet_file(self.file_path, jio.create_json_packet(self.PAYLOAD, "p", checksum_version=version))
+            self._rewrite('"x"', '"X"')
+
+            # ACT
+            with jio.load_json_packet_mapped(self.file_path) as packet:
+                result = packet.verify_checksum()
+
+            # ASSERT
+            with self.subTest(Version=version, Out=result):
+                self.assertFalse(result)
+
+    def test_other_layouts(self):
+        """
+        Should load and verify packets written by `save_json_file`, pretty printed or compact.
+        """
+        # ARRANGE
+        for version in (jio.CHECKSUM_V1, jio.CHECKSUM_V2):
+            for indent in (4, None):
+                packet = jio.create_json_packet(self.PAYLOAD, "p", checksum_version=version)
+                jio.save_json_file(self.file_path, packet, indent_spaces=indent)
+
+                # ACT
+                with jio.load_json_packet_mapped(self.file_path) as mapped:
+                    verified = mapped.verify_checksum()
+                    result = mapped.payload
+
+                # ASSERT
+                with self.subTest(Version=version, Indent=indent):
+                    self.assertTrue(verified)
+                    self.assertEqual(result, self.PAYLOAD)
+
+    def test_raise(self):
+        """
+        Should raise RuntimeError for missing, empty, or invalid files.
+        """
+        # ARRANGE
+        cases = (("Missing", None), ("Empty", ""), ("Invalid", "{not json"))
+
+        for name, content in cases:
+            if content is not None:
+                with open(self.file_path, mode="w", encoding="utf-8") as f:
+                    f.write(content)
+
+            # ACT
+            try:
+                jio.load_json_packet_mapped(self.file_path)
+                result = ""
+            except Exception as e:
+                result = type(e).__name__
+
+            # ASSERT
+            with self.subTest(name, Out=result, Exp=RuntimeError.__name__):
+                self.assertEqual(result, RuntimeError.__name__)
+
+
 class TestExtractPayload(unittest.TestCase):
     """
     Unit tests for `extract_payload`.
@@ -754,6 +1142,38 @@ class TestExtractPayload(unittest.TestCase):
         with self.subTest(Out=packet[jio._KEY_PAYLOAD]["x"], Exp=original_top_level["x"]):
             self.assertEqual(packet[jio._KEY_PAYLOAD]["x"], original_top_level["x"])
 
+    def test_extract_checksum(self):
+        """
+        Should return the payload checksum stored in the packet metadata.
+        """
+        # ARRANGE
+        packet = jio.create_json_packet({"a": "1"}, "p")
+        expected = packet[jio._KEY_META][jio._KEY_SHA256]
+
+        # ACT
+        result = jio.extract_payload_checksum(packet)
+
+        # ASSERT
+        with self.subTest(Out=result, Exp=expected):
+            self.assertEqual(result, expected)
+
+    def test_extract_checksum_version(self):
+        """
+        Should return the checksum version stored in the packet metadata, or V1 when none is stored.
+        """
+        # ARRANGE
+        cases = ((jio.CHECKSUM_V1, jio.CHECKSUM_V1), (jio.CHECKSUM_V2, jio.CHECKSUM_V2))
+
+        for version, expected in cases:
+            packet = jio.create_json_packet({"a": "1"}, "p", checksum_version=version)
+
+            # ACT
+            result = jio.extract_payload_checksum_version(packet)
+
+            # ASSERT
+            with self.subTest(Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
     def test_accepts_mapping_convertible_value(self):
         """
         Should accept a `payload['data']` value that can be converted to a dict (e.g., list of pairs).
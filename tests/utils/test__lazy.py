@@ -0,0 +1,132 @@
+"""
+Unit tests for deferred module imports.
+
+This module validates:
+    - lazy_import: The target module is imported on first attribute access only
+    - LazyModule: Attributes resolve against the real module and can be patched on the proxy
+    - Package imports: Interface packages do not import pandas, NumPy, or Levenshtein eagerly
+
+Example Usage:
+    # Preferred usage — run all tests in this module:
+    python -m unittest tests/utils/test__lazy.py
+
+Dependencies:
+ - Python >= 3.10
+ - Standard Library: json, os, subprocess, sys, unittest, unittest.mock
+
+Notes:
+    - Tests follow the Arrange–Act–Assert pattern with `subTest` assertions for clearer output on mismatches.
+    - Package import checks run in a fresh interpreter, since the test process has already imported the heavy packages.
+
+License:
+ - Internal Use Only
+"""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+from unittest.mock import patch
+
+# noinspection PyProtectedMember
+import src.utils._lazy as lazy
+
+
+class TestLazyImport(unittest.TestCase):
+    """
+    Unit tests for `lazy_import` and `LazyModule`.
+    """
+
+    def test_deferred_until_access(self):
+        """
+        Should import the module on first attribute access and forward lookups to it.
+        """
+        # ARRANGE
+        proxy = lazy.lazy_import("json")
+
+        # ACT
+        before = lazy.is_loaded(proxy)
+        result = proxy.dumps([1])
+        after = lazy.is_loaded(proxy)
+
+        # ASSERT
+        with self.subTest("Before", Out=before):
+            self.assertFalse(before)
+        with self.subTest("Result", Out=result):
+            self.assertEqual(result, json.dumps([1]))
+        with self.subTest("After", Out=after):
+            self.assertTrue(after)
+        with self.subTest("Same function"):
+            self.assertIs(proxy.dumps, json.dumps)
+
+    def test_missing_module(self):
+        """
+        Should raise ImportError on first use, not on proxy creation, when the module does not exist.
+        """
+        # ARRANGE
+        proxy = lazy.lazy_import("src.no_such_module")
+
+        # ACT / ASSERT
+        with self.assertRaises(ImportError):
+            _ = proxy.anything
+        with self.subTest("Not loaded"):
+            self.assertFalse(lazy.is_loaded(proxy))
+
+    def test_patch_on_proxy(self):
+        """
+        Should let `patch.object` replace an attribute on the proxy and restore it afterwards.
+        """
+        # ARRANGE
+        proxy = lazy.lazy_import("json")
+
+        # ACT
+        with patch.object(proxy, "dumps", return_value="patched"):
+            patched = proxy.dumps([1])
+        restored = proxy.dumps([1])
+
+        # ASSERT
+        with self.subTest("Patched", Out=patched):
+            self.assertEqual(patched, "patched")
+        with self.subTest("Restored", Out=restored):
+            self.assertEqual(restored, "[1]")
+
+
+class TestDeferredPackages(unittest.TestCase):
+    """
+    Import the interface packages in a fresh interpreter and check the heavy packages stay unloaded.
+    """
+
+    PACKAGES = (
+        "src.utils",
+        "src.settings",
+        "src.importers.interfaces",
+        "src.parsers.interfaces",
+        "src.correction.interfaces",
+    )
+    HEAVY = ("pandas", "numpy", "Levenshtein")
+
+    def test_not_imported(self):
+        """
+        Should not import pandas, NumPy, or Levenshtein when an interface package is imported.
+        """
+        # ARRANGE
+        probe = (
+            f"import json, sys\n"
+            f"import {', '.join(self.PACKAGES)}\n"
+            f"print(json.dumps([n for n in {self.HEAVY!r} if n in sys.modules]))\n"
+        )
+
+        # ACT
+        repo_root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        result = subprocess.run([sys.executable, "-c", probe], capture_output=True, text=True, check=True,
+                                cwd=repo_root)
+        loaded = json.loads(result.stdout)
+
+        # ASSERT
+        with self.subTest(Out=loaded, Exp=[]):
+            self.assertEqual(loaded, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,7 +9,7 @@ Example Usage (from project root):
 
 Dependencies:
     - Python >= 3.9
-    - Standard Library: unittest
+    - Standard Library: datetime, unittest, unittest.mock
     - Internal: src.utils.parser
 
 Notes:
@@ -22,6 +22,8 @@ License:
 """
 
 import unittest
+from datetime import datetime
+from unittest.mock import patch
 
 # noinspection PyProtectedMember
 import src.utils._parser as parser
@@ -361,6 +363,74 @@ class TestParseToIsoDateString(unittest.TestCase):
                 self.assertEqual(result, expected)
 
 
+    def test_ambiguous_slash_dates(self):
+        """
+        Should read slash dates as DD/MM/YYYY first and as MM/DD/YYYY only when the day-first reading is invalid.
+        """
+        # ARRANGE
+        cases = {
+            "6/8/2025": "2025-08-06",  # both readings valid: day first wins
+            "12/1/2025": "2025-01-12",
+            "2/13/2025": "2025-02-13",  # month 13 invalid: month first
+            "29/2/2024": "2024-02-29",  # leap day
+        }
+
+        for value, expected in cases.items():
+            # ACT
+            result = parser.parse_to_iso_date_string(value)
+            # ASSERT
+            with self.subTest(In=value, Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
+    def test_sniffed_without_strptime(self):
+        """
+        Should convert common date shapes without calling `strptime`, and memoize results per input string.
+        """
+        # ARRANGE
+        parser._cached_iso_date.cache_clear()
+        values = ("2025-8-6", "06/08/2025", "2/13/2025T10:00")
+
+        with patch.object(parser, "datetime") as p_datetime:
+            # ACT
+            results = [parser.parse_to_iso_date_string(v) for v in values * 3]
+
+        info = parser._cached_iso_date.cache_info()
+
+        # ASSERT
+        with self.subTest("Results", Out=results[:3]):
+            self.assertEqual(results[:3], ["2025-08-06", "2025-08-06", "2025-02-13"])
+        with self.subTest("No strptime", Calls=p_datetime.strptime.call_count):
+            self.assertEqual(p_datetime.strptime.call_count, 0)
+        with self.subTest("Memoized", Misses=info.misses, Hits=info.hits):
+            self.assertEqual((info.misses, info.hits), (3, 6))
+
+    def test_matches_strptime(self):
+        """
+        Should return exactly what the sequential `strptime` formats return, for valid and invalid inputs.
+        """
+        # ARRANGE
+        parts = ("0", "00", "1", "09", "12", "13", "29", "31", "32", "2024", "0999", "0000")
+        values = [f"{a}{sep}{b}{sep}{c}" for a in parts for b in parts for c in parts for sep in "-/"]
+
+        for value in values:
+            expected = None
+            for fmt in ("%Y-%m-%d", "%d/%m/%Y", "%m/%d/%Y"):
+                try:
+                    expected = datetime.strptime(value, fmt).strftime("%Y-%m-%d")
+                    break
+                except ValueError:
+                    continue
+
+            # ACT
+            try:
+                result = parser.parse_to_iso_date_string(value)
+            except ValueError:
+                result = None
+
+            # ASSERT
+            with self.subTest(In=value, Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
 class TestParseToEmptyString(unittest.TestCase):
     """
     Unit tests for the `parse_to_empty_string` function.
@@ -596,5 +666,140 @@ class TestParseToInteger(unittest.TestCase):
                 self.assertEqual(result, expected)
 
 
+
+# Mixed inputs: valid, malformed, blank, non-finite, and non-string values
+_NUMERIC_INPUTS = [
+    "-1e3", "-2.5", "0", "+0.0", "0007", "42", " 7 ", "1_000", "3.14", "1e5000",
+    "abc", "1..2", "", " ", "NaN", "nan", "inf", "-inf",
+    None, [], {}, 1, 1.5, True,
+]
+
+
+def _reference(parse, value):
+    """
+    Return the result of a raising parser, or None if it raises ValueError.
+    """
+    try:
+        return parse(value)
+    except ValueError:
+        return None
+
+
+class TestTryParseToFloat(unittest.TestCase):
+    """
+    Unit tests for the `try_parse_to_float` function.
+    """
+
+    def test_matches_parse_to_float(self):
+        """
+        Should accept and reject exactly the inputs `parse_to_float` does, on first and cached calls.
+        """
+        for value in _NUMERIC_INPUTS:
+            # ARRANGE
+            expected = _reference(parser.parse_to_float, value)
+
+            # ACT
+            first = parser.try_parse_to_float(value)
+            again = parser.try_parse_to_float(value)
+
+            # ASSERT
+            with self.subTest(In=value, Out=(first, again), Exp=expected):
+                self.assertEqual((first, again), (expected, expected))
+
+    def test_error_message_unchanged(self):
+        """
+        Should keep the detailed error message of `parse_to_float` for rejected strings.
+        """
+        cases = (("abc", "not a valid float"), ("inf", "not a finite float"))
+
+        for value, expected in cases:
+            # ACT
+            with self.assertRaises(ValueError) as ctx:
+                parser.parse_to_float(value)
+
+            # ASSERT
+            with self.subTest(In=value, Out=str(ctx.exception), Exp=expected):
+                self.assertIn(expected, str(ctx.exception))
+
+
+class TestTryParseToInteger(unittest.TestCase):
+    """
+    Unit tests for the `try_parse_to_integer` function.
+    """
+
+    def test_matches_parse_to_integer(self):
+        """
+        Should accept and reject exactly the inputs `parse_to_integer` does, on first and cached calls.
+        """
+        for value in _NUMERIC_INPUTS:
+            # ARRANGE
+            expected = _reference(parser.parse_to_integer, value)
+
+            # ACT
+            first = parser.try_parse_to_integer(value)
+            again = parser.try_parse_to_integer(value)
+
+            # ASSERT
+            with self.subTest(In=value, Out=(first, again), Exp=expected):
+                self.assertEqual((first, again), (expected, expected))
+                self.assertIs(type(first), type(expected))
+
+
+class TestParseManyToFloat(unittest.TestCase):
+    """
+    Unit tests for the `parse_many_to_float` function.
+    """
+
+    def test_values_and_mask(self):
+        """
+        Should return parsed values with 0.0 for invalid entries and a matching validity mask.
+        """
+        # ARRANGE
+        expected_values = [0.0 if (v := _reference(parser.parse_to_float, x)) is None else v for x in _NUMERIC_INPUTS]
+        expected_valid = [_reference(parser.parse_to_float, x) is not None for x in _NUMERIC_INPUTS]
+
+        # ACT
+        values, valid = parser.parse_many_to_float(_NUMERIC_INPUTS)
+
+        # ASSERT
+        with self.subTest("Values", Out=values, Exp=expected_values):
+            self.assertEqual(values, expected_values)
+        with self.subTest("Mask", Out=valid, Exp=expected_valid):
+            self.assertEqual(valid, expected_valid)
+
+    def test_empty_and_generator(self):
+        """
+        Should accept any iterable, including an empty one.
+        """
+        cases = (
+            ([], ([], [])),
+            ((str(i) for i in range(3)), ([0.0, 1.0, 2.0], [True, True, True])),
+        )
+
+        for values, expected in cases:
+            # ACT
+            result = parser.parse_many_to_float(values)
+
+            # ASSERT
+            with self.subTest(Out=result, Exp=expected):
+                self.assertEqual(result, expected)
+
+    def test_repeated_strings_cached(self):
+        """
+        Should parse each distinct string once when a column repeats values.
+        """
+        # ARRANGE
+        parser._cached_float.cache_clear()
+        column = ["1.5", "", "x"] * 100
+
+        # ACT
+        parser.parse_many_to_float(column)
+        info = parser._cached_float.cache_info()
+
+        # ASSERT
+        with self.subTest(Misses=info.misses, Hits=info.hits):
+            self.assertEqual(info.misses, 3)
+            self.assertEqual(info.hits, 297)
+
 if __name__ == "__main__":
     unittest.main()
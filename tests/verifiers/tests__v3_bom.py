@@ -16,6 +16,7 @@ Dependencies:
 Notes:
     - Tests rely on static fixtures to represent valid and invalid BOM structures.
     - Tests assert fail-fast behavior and wrapped exception types.
+    - Collect-all tests compare the report against the fail-fast verifier instead of hard-coded messages.
     - Only error type is asserted; full message text is not validated.
     - Internal-only test suite for the BOM parsing and approval pipeline.
 
@@ -409,5 +410,119 @@ class TestVerifyV3Bom(unittest.TestCase):
             self.assertEqual(actual, expected)
 
 
+class TestCollectV3BomFailures(unittest.TestCase):
+    """
+    Unit tests for `collect_v3_bom_failures`.
+    """
+
+    def test_happy_path(self):
+        """
+        Should return an empty report when the BOM is valid.
+        """
+        # ARRANGE
+        boms = (bfx.BOM_A, bfx.BOM_B)
+
+        for bom in boms:
+            # ACT
+            actual = verify.collect_v3_bom_failures(bom)
+
+            # ASSERT
+            with self.subTest("Empty report", Out=actual):
+                self.assertEqual(actual, ())
+
+    def test_collects_all(self):
+        """
+        Should report every violation with board, row, field, and rule instead of stopping at the first one.
+        """
+        # ARRANGE
+        rows = list(bfx.BOARD_A.rows)
+        rows[0] = replace(rows[0], item="x")
+        rows[3] = replace(rows[3], sub_total="999")
+        board = replace(
+            bfx.BOARD_A,
+            rows=tuple(rows),
+            header=replace(bfx.BOARD_A.header, model_no=vfx.MODEL_NO_BAD[0]),
+        )
+        bom = replace(bfx.BOM_A, boards=(board,))
+        expected = [
+            (board.sheet_name, 1, verify.model.RowFields.ITEM, approve.item.__name__),
+            (board.sheet_name, 4, verify.model.RowFields.SUB_TOTAL, approve.sub_total_calculation.__name__),
+            (board.sheet_name, None, verify.model.HeaderFields.MATERIAL_COST,
+             approve.material_cost_calculation.__name__),
+            (board.sheet_name, None, verify.model.HeaderFields.MODEL_NUMBER, approve.model_number.__name__),
+        ]
+
+        # ACT
+        failures = verify.collect_v3_bom_failures(bom)
+        actual = [(f.board, f.row, f.field, f.rule) for f in failures]
+
+        # ASSERT
+        with self.subTest("Report", Out=actual, Expected=expected):
+            self.assertEqual(actual, expected)
+        with self.subTest("Messages"):
+            self.assertTrue(all(f.message for f in failures))
+
+    def test_first_matches_fail_fast(self):
+        """
+        Should report first the same violation that the fail-fast verifier raises.
+        """
+        # ARRANGE
+        boms = (bfx.BOM_A_BAD_MATH, bfx.BOM_A_BAD_VALUE, bfx.BOM_A_BAD_FORMATTING)
+
+        for bom in boms:
+            try:
+                verify.verify_v3_bom(bom)
+                expected = ""
+            except ValueError as error:
+                expected = str(error.__cause__.__cause__)
+
+            # ACT
+            failures = verify.collect_v3_bom_failures(bom)
+            actual = failures[0].message if failures else ""
+
+            # ASSERT
+            with self.subTest("First failure", Out=actual, Expected=expected):
+                self.assertEqual(actual, expected)
+
+    def test_str(self):
+        """
+        Should render a single pipe-separated line with the row or header section.
+        """
+        # ARRANGE
+        cases = (
+            (verify.VerificationFailure("S", 3, "Qty", "quantity", "bad\nvalue"),
+             "S | Row: 3 | Qty | quantity | bad value"),
+            (verify.VerificationFailure("S", None, "Total", "total_cost", "bad"),
+             "S | Header | Total | total_cost | bad"),
+        )
+
+        for failure, expected in cases:
+            # ACT
+            actual = str(failure)
+
+            # ASSERT
+            with self.subTest(Out=actual, Expected=expected):
+                self.assertEqual(actual, expected)
+
+    def test_unexpected_error(self):
+        """
+        Should raise RuntimeError when a verification function raises a non-ValueError exception.
+        """
+        # ARRANGE
+        expected = RuntimeError.__name__
+
+        with patch.object(approve, "item", side_effect=_raise_type_error):
+            # ACT
+            try:
+                verify.collect_v3_bom_failures(bfx.BOM_A)
+                actual = ""
+            except Exception as ex:
+                actual = type(ex).__name__
+
+        # ASSERT
+        with self.subTest("Raise exception", Out=actual, Expected=expected):
+            self.assertEqual(actual, expected)
+
+
 if __name__ == '__main__':
     unittest.main()
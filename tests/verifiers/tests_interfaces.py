@@ -85,5 +85,37 @@ class TestVerifyV3Bom(unittest.TestCase):
             self.assertEqual(actual, expected)
 
 
+class TestV3BomFailures(unittest.TestCase):
+    """
+    Unit tests for `v3_bom_failures`.
+    """
+
+    def test_report(self):
+        """
+        Should return an empty report for a valid BOM and header failures for a bad material cost.
+        """
+        # ARRANGE
+        bad_bom = replace(
+            bfx.BOM_A,
+            boards=(
+                replace(
+                    bfx.BOARD_A,
+                    header=replace(bfx.BOARD_A.header, material_cost="99.99"),
+                ),
+            ),
+        )
+
+        # ACT
+        good = verify.v3_bom_failures(bfx.BOM_A)
+        bad = verify.v3_bom_failures(bad_bom)
+
+        # ASSERT
+        with self.subTest("Valid BOM", Out=good):
+            self.assertEqual(good, ())
+        with self.subTest("Invalid BOM", Out=bad):
+            self.assertEqual([f.rule for f in bad], ["material_cost_calculation", "total_cost_calculation"])
+            self.assertTrue(all(isinstance(f, verify.VerificationFailure) and f.row is None for f in bad))
+
+
 if __name__ == "__main__":
     unittest.main()
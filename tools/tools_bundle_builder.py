@@ -0,0 +1,113 @@
+"""
+Build precompiled binary bundles of the runtime JSON resources for faster startup.
+
+This tool:
+  - Loads each runtime JSON resource listed by the JSON builder
+  - Verifies the payload checksum stored in the JSON metadata
+  - Compiles the payload into a marshal-encoded bundle next to the JSON file, with an embedded checksum
+  - Produces exit codes suitable for CI/build and packaging pipelines
+
+Typical uses:
+  - Final packaging step before building the frozen executable
+  - Refreshing bundles after JSON resources were edited and rebuilt with tools_json_builder.py
+
+Behavior:
+  - JSON remains the source of truth. Bundles record the size and SHA-256 of their JSON source; the runtime ignores a bundle whose source no longer matches and falls back to JSON.
+  - A JSON file with an invalid checksum is rejected; run tools_json_builder.py first.
+  - Bundles are Python-version specific; rebuild them with the interpreter used for packaging.
+
+Exit codes:
+  -  0  — all bundles built successfully
+  - -1  — one or more bundles failed to build
+
+Example Usage:
+    # Preferred usage via package/module import:
+    Not applicable. Not for use with other modules.
+
+    # Direct CLI usage from the repository root:
+    python tools/tools_bundle_builder.py
+
+Dependencies:
+  - Python >= 3.10
+  - Standard Library: sys
+  - Internal Modules: project utilities for file discovery, JSON I/O and bundle I/O; tools_json_builder target list
+
+Notes:
+  - Intended for internal build-time use only; not part of the public application API.
+  - Bundle files (*.bundle) are build artifacts and are not committed.
+
+License:
+ - Internal Use Only
+"""
+
+import sys
+
+from src.utils import folder_path as folder
+from src.utils import file_path as file
+from src.utils import json_io as json
+from src.utils import bundle_io as bundle
+
+from tools_json_builder import TARGET_JSON_FILES
+
+# CONSTANTS
+SUCCESS: int = 0
+FAILURE: int = -1
+
+
+def main() -> int:
+    """
+    Compile a bundle for every configured JSON resource.
+
+    Returns:
+        int: SUCCESS (0) if all bundles are built, FAILURE (-1) if any bundle fails.
+
+    Raises:
+        None: All exceptions are handled internally and reflected in the returned status code.
+    """
+    project_root = folder.resolve_project_folder()
+
+    overall_success = True
+
+    print(f"🛠️ Building resource bundles from project location {project_root}")
+
+    for target in TARGET_JSON_FILES:
+
+        print(f"- - 🧪 Processing {target.file_stem}")
+        try:
+            # Compose full path for the configured JSON source and its bundle
+            file_name = target.file_stem + target.file_extension
+            folder_path = folder.construct_folder_path(project_root, target.folder_parts)
+            file_path = file.construct_file_path(folder_path, file_name)
+            bundle_path = bundle.bundle_path_for(file_path)
+
+            # Verify source file exists
+            file.assert_file_path(file_path)
+
+            # Only compile payloads whose checksum is valid
+            json_package = json.load_json_file(file_path)
+            if not json.verify_json_payload_checksum(json_package):
+                raise RuntimeError(f"Checksum mismatch in {file_path}. Run tools_json_builder.py first.")
+            payload_map = json.extract_payload(json_package)
+            version = json.extract_payload_checksum(json_package)
+
+            bundle.save_bundle_file(bundle_path, payload_map, file_path, version=version)
+
+            # Read back to prove the runtime will accept the bundle
+            if bundle.load_bundle(bundle_path, file_path) != (payload_map, version):
+                raise RuntimeError(f"Bundle verification failed for {bundle_path}.")
+            print(f"- - ✅ Built {target.file_stem}{bundle.BUNDLE_FILE_EXT}.")
+
+        except Exception as ex:
+            print(f'- - ⚠️ Error processing {target.file_stem}. {type(ex).__name__}: {ex}', file=sys.stderr)
+            overall_success = False
+
+    if overall_success:
+        print("🎉 All resource bundles built successfully.")
+    else:
+        print("❌ Some bundles failed to build. See errors above.", file=sys.stderr)
+
+    return SUCCESS if overall_success else FAILURE
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
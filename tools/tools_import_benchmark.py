@@ -0,0 +1,231 @@
+"""
+Measure application startup import cost.
+
+This tool:
+  - Imports each target module in a fresh interpreter with `python -X importtime`
+  - Reports the cumulative import time of the target and its heaviest direct imports
+  - Reports whether heavy third-party packages were imported eagerly
+  - Produces exit codes suitable for CI/build and packaging pipelines
+
+Typical uses:
+  - Checking that the menu entry points still start in well under a second
+  - Catching a module-level `import pandas` that slipped back into an interface package
+
+Behavior:
+  - Each target runs in its own subprocess so earlier imports never hide later ones.
+  - Timings are taken from the interpreter's own `-X importtime` report, not wall clock.
+  - A target fails when its cumulative import time exceeds the budget or it imports a deferred package.
+
+Exit codes:
+  -  0  — all targets are within budget and import no deferred package
+  - -1  — one or more targets exceeded the budget or failed to import
+
+Example Usage:
+    # Preferred usage via package/module import:
+    Not applicable. Not for use with other modules.
+
+    # Direct CLI usage from the repository root:
+    python tools/tools_import_benchmark.py
+    python tools/tools_import_benchmark.py --budget-ms 500 src.cli.interfaces
+
+Dependencies:
+  - Python >= 3.10
+  - Standard Library: argparse, dataclasses, os, subprocess, sys
+
+Notes:
+  - Intended for internal build-time use only; not part of the public application API.
+  - The legacy menu (src/main.py) uses top-level imports, so it is measured with `src` on the module path.
+  - Timings vary with disk cache state; the first run after boot is slower than later runs.
+
+License:
+ - Internal Use Only
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from dataclasses import dataclass
+
+# CONSTANTS
+SUCCESS: int = 0
+FAILURE: int = -1
+
+DEFAULT_BUDGET_MS: float = 250.0  # Per-target cumulative import budget
+TOP_DEPENDENCIES: int = 3  # Number of heaviest direct imports listed per target
+
+# Packages that must only be imported when first used
+DEFERRED_PACKAGES: tuple[str, ...] = ("pandas", "numpy", "Levenshtein")
+
+
+@dataclass(frozen=True)
+class ImportTarget:
+    """
+    Immutable descriptor for a module whose import cost is measured.
+
+    Args:
+        module (str): Module name passed to `import`.
+        path_parts (tuple[str, ...]): Folder parts, relative to the repository root, prepended to the module path.
+
+    Returns:
+        ImportTarget: A frozen dataclass describing a measured module.
+
+    Raises:
+        None
+    """
+    module: str
+    path_parts: tuple[str, ...] = ()
+
+
+@dataclass(frozen=True)
+class ImportReport:
+    """
+    Parsed `-X importtime` result for a single target.
+
+    Args:
+        target (ImportTarget): The measured module.
+        total_us (int): Cumulative import time of the target in microseconds.
+        heaviest (tuple[tuple[str, int], ...]): Heaviest direct imports and their cumulative time in microseconds.
+        deferred_loaded (tuple[str, ...]): Deferred packages that were imported eagerly.
+
+    Returns:
+        ImportReport: A frozen dataclass holding the measurement.
+
+    Raises:
+        None
+    """
+    target: ImportTarget
+    total_us: int
+    heaviest: tuple[tuple[str, int], ...]
+    deferred_loaded: tuple[str, ...]
+
+
+TARGETS: tuple[ImportTarget, ...] = (
+    ImportTarget("main", ("src",)),
+    ImportTarget("src.cli.interfaces"),
+    ImportTarget("src.menus.interfaces"),
+    ImportTarget("src.settings"),
+    ImportTarget("src.utils"),
+    ImportTarget("src.importers.interfaces"),
+    ImportTarget("src.parsers.interfaces"),
+    ImportTarget("src.correction.interfaces"),
+)
+
+
+def parse_importtime(stderr: str, module: str) -> tuple[int, dict[str, int]]:
+    """
+    Parse the `-X importtime` report of the measured module.
+
+    The report lists every module after its own imports, indented by nesting depth, so the lines between the previous top-level entry and the measured module form its import tree.
+
+    Args:
+        stderr (str): Standard error of an interpreter started with `-X importtime`.
+        module (str): Name of the measured top-level module.
+
+    Returns:
+        tuple[int, dict[str, int]]: Cumulative time of the module and the cumulative time of each module it imports directly, in microseconds.
+
+    Raises:
+        ValueError: If the report does not contain the measured module.
+    """
+    children: dict[str, int] = {}
+    for line in stderr.splitlines():
+        # Format: "import time: <self> | <cumulative> | <indented name>"
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[1].strip().isdigit():
+            continue  # Column header line
+
+        depth = (len(fields[2]) - len(fields[2].lstrip()) - 1) // 2
+        name, cumulative = fields[2].strip(), int(fields[1])
+        if depth == 0:
+            if name == module:
+                return cumulative, children
+            children = {}  # Tree of an unrelated top-level import (e.g., site)
+        elif depth == 1:
+            children[name] = cumulative
+
+    raise ValueError(f"Import report does not contain '{module}'.")
+
+
+def measure(target: ImportTarget, repo_root: str) -> ImportReport:
+    """
+    Import a target in a fresh interpreter and parse its import report.
+
+    Args:
+        target (ImportTarget): The module to measure.
+        repo_root (str): Absolute path of the repository root.
+
+    Returns:
+        ImportReport: Timing and deferred package information for the target.
+
+    Raises:
+        RuntimeError: If the target cannot be imported.
+    """
+    search_path = [os.path.join(repo_root, *target.path_parts), repo_root]
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(search_path))
+    probe = f"import sys, {target.module}; print(','.join(n for n in {DEFERRED_PACKAGES!r} if n in sys.modules))"
+
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", probe],
+                            capture_output=True, text=True, cwd=repo_root, env=env)
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to import '{target.module}'.\n{result.stderr.strip().splitlines()[-1:]}")
+
+    total_us, children = parse_importtime(result.stderr, target.module)
+    heaviest = tuple(sorted(children.items(), key=lambda item: item[1], reverse=True)[:TOP_DEPENDENCIES])
+    deferred_loaded = tuple(name for name in result.stdout.strip().split(",") if name)
+
+    return ImportReport(target=target, total_us=total_us, heaviest=heaviest, deferred_loaded=deferred_loaded)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """
+    Measure every target and print a summary.
+
+    Args:
+        argv (list[str] | None): Command line arguments; defaults to `sys.argv[1:]`.
+
+    Returns:
+        int: SUCCESS when all targets pass, otherwise FAILURE.
+    """
+    parser = argparse.ArgumentParser(description="Measure application startup import cost.")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS,
+                        help="cumulative import budget per target in milliseconds")
+    parser.add_argument("modules", nargs="*", help="modules to measure instead of the default targets")
+    args = parser.parse_args(argv)
+
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    targets = tuple(ImportTarget(m) for m in args.modules) or TARGETS
+
+    print(f"⏱️ Measuring import time (budget {args.budget_ms:.0f} ms per target)")
+    success = True
+    for target in targets:
+        try:
+            report = measure(target, repo_root)
+        except Exception as ex:
+            success = False
+            print(f"- - ⚠️ {target.module}: {type(ex).__name__}: {ex}", file=sys.stderr)
+            continue
+
+        total_ms = report.total_us / 1000.0
+        passed = total_ms <= args.budget_ms and not report.deferred_loaded
+        success = success and passed
+
+        status = "✅" if passed else "❌"
+        print(f"- - {status} {target.module}: {total_ms:.1f} ms")
+        for name, us in report.heaviest:
+            print(f"- - - {name}: {us / 1000.0:.1f} ms")
+        if report.deferred_loaded:
+            print(f"- - - imported eagerly: {', '.join(report.deferred_loaded)}", file=sys.stderr)
+
+    if success:
+        print("🎉 All targets are within the startup budget.")
+        return SUCCESS
+
+    print("❌ Some targets exceeded the startup budget. See details above.", file=sys.stderr)
+    return FAILURE
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -14,7 +14,8 @@ Typical uses:
 Behavior:
   - Input files must be valid JSON. Invalid JSON will raise during load.
   - JSON directory must already exist; this tool does not create directories.
-  - If existing JSON file payload checksum is valid, updates to the file are skipped.
+  - If existing JSON file payload checksum is valid and already CHECKSUM_V2, updates to the file are skipped.
+  - Files with a valid CHECKSUM_V1 checksum are rewritten as CHECKSUM_V2 in the mappable one-entry-per-line layout.
   - If existing JSON file is unreadable/invalid, an error is generated and script aborted
 
 Exit codes:
@@ -37,7 +38,8 @@ Notes:
   - Intended for internal build-time use only; not part of the public application API.
   - Input JSON files must already exist; this tool does not create directories.
   - Payloads must be JSON objects. Other values are rejected.
-  - If an existing JSON file already contains a valid checksum and unchanged payload, regeneration is skipped.
+  - If an existing JSON file already contains a valid CHECKSUM_V2 checksum and unchanged payload, regeneration is skipped.
+  - CHECKSUM_V2 files are verified in place by the runtime loader (json_io.load_json_packet_mapped) without parsing.
   - Console output is optimized for CI logs and developer visibility.
 
 
@@ -84,7 +86,8 @@ SUCCESS: int = 0
 FAILURE: int = -1
 TARGET_JSON_FILES: tuple[FileLocation, ...] = (
     FileLocation(app_settings.FOLDER_PARTS, app_settings.RESOURCE_NAME, json.JSON_FILE_EXT),
-    FileLocation(lookup.FOLDER_PARTS, lookup.COMPONENT_TYPE_FILE_NAME, json.JSON_FILE_EXT),
+    FileLocation(lookup.COMPONENT_TYPE_FOLDER_PARTS, lookup.COMPONENT_TYPE_RESOURCE_NAME, json.JSON_FILE_EXT),
+    FileLocation(lookup.MANUFACTURER_FOLDER_PARTS, lookup.MANUFACTURER_RESOURCE_NAME, json.JSON_FILE_EXT),
 )
 
 
@@ -127,14 +130,16 @@ def main() -> int:
             # Verify source file exists
             file.assert_file_path(file_path)
 
-            # Try to load existing package; skip regeneration when checksum matches
+            # Try to load existing package; skip regeneration when checksum matches and is in the current format
             payload_map = None
             try:
                 json_package = json.load_json_file(file_path)
                 payload_map = json.extract_payload(json_package)
                 if json.verify_json_payload_checksum(json_package):
-                    print(f"- - ⏭️ Skipping {target.file_stem}. No change detected.")
-                    continue
+                    if json.extract_payload_checksum_version(json_package) == json.CHECKSUM_V2:
+                        print(f"- - ⏭️ Skipping {target.file_stem}. No change detected.")
+                        continue
+                    print(f"- - 🔁 Upgrading {target.file_stem} to checksum version {json.CHECKSUM_V2}.")
             except FileNotFoundError:
                 # No prior file: proceed to create
                 pass
@@ -146,9 +151,9 @@ def main() -> int:
                 raise RuntimeError(f"JSON invalid at {file_path}. {type(ex).__name__}: {ex}")
 
             # Persist the new JSON package with metadata and checksum
-            payload = json.create_json_packet(payload_map, file_name)
+            payload = json.create_json_packet(payload_map, file_name, checksum_version=json.CHECKSUM_V2)
             try:
-                json.save_json_file(file_path, payload, indent_spaces=4)
+                json.save_json_packet_file(file_path, payload, indent_spaces=4)
                 print(f"- - ✅ Updated {target.file_stem}.")
             except Exception as ex:
                 raise RuntimeError(f"JSON write failed at {file_path}. {type(ex).__name__}: {ex}")